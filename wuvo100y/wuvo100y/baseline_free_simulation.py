@@ -1,55 +1,14 @@
 # BASELINE-FREE SIMULATION: Home Screen vs Wildcard (No Emotion Baselines)
 # Testing the new approach where first comparison is truly unknown vs known
 
-import math
+from rating_core import set_trace_hook, wildcard_adjust_rating
+from rating_core.engines import DEFAULT_BASELINE, EMOTION_BASELINES
+from rating_core.output import ROUND, SCENARIO, SUMMARY, emit, emit_record, get_reporter, parse_output_args
 
-# Wildcard's exact adjustRating function
-def wildcard_adjust_rating(winner_rating, loser_rating, winner_won, winner_games_played=0, loser_games_played=0):
-    """Wildcard's exact ELO logic"""
-    
-    # Calculate K-factor (Wildcard's logic)
-    def calculate_k_factor(games_played):
-        if games_played < 5:
-            return 0.5
-        elif games_played < 10:
-            return 0.25
-        elif games_played < 20:
-            return 0.125
-        return 0.1
-    
-    rating_difference = abs(winner_rating - loser_rating)
-    expected_win_probability = 1 / (1 + math.pow(10, (loser_rating - winner_rating) / 4))
-    
-    winner_k = calculate_k_factor(winner_games_played)
-    loser_k = calculate_k_factor(loser_games_played)
-    
-    winner_increase = max(0.1, winner_k * (1 - expected_win_probability))
-    loser_decrease = max(0.1, loser_k * (1 - expected_win_probability))
-    
-    # Underdog bonus
-    if winner_rating < loser_rating:
-        winner_increase *= 1.2
-    
-    # Major upset bonus
-    is_major_upset = winner_rating < loser_rating and rating_difference > 3.0
-    if is_major_upset:
-        winner_increase += 3.0
-        print(f"🚨 MAJOR UPSET! Winner ({winner_rating}) defeated Loser ({loser_rating}). +3.0 bonus!")
-    
-    # Apply limits
-    MAX_RATING_CHANGE = 0.7
-    if not is_major_upset:
-        winner_increase = min(MAX_RATING_CHANGE, winner_increase)
-        loser_decrease = min(MAX_RATING_CHANGE, loser_decrease)
-    
-    new_winner_rating = winner_rating + winner_increase
-    new_loser_rating = loser_rating - loser_decrease
-    
-    # Bounds enforcement
-    new_winner_rating = round(min(10, max(1, new_winner_rating)) * 10) / 10
-    new_loser_rating = round(min(10, max(1, new_loser_rating)) * 10) / 10
-    
-    return new_winner_rating, new_loser_rating
+def print_major_upset(trace):
+    """Console trace for the major upset bonus"""
+    if trace.is_major_upset:
+        emit(ROUND, f"🚨 MAJOR UPSET! Winner ({trace.winner_rating}) defeated Loser ({trace.loser_rating}). +3.0 bonus!")
 
 # Home Screen's NEW Baseline-Free Unknown vs Known approach
 def home_screen_baseline_free(opponents, results):
@@ -71,7 +30,7 @@ def home_screen_baseline_free(opponents, results):
     # Round to nearest 0.1
     current_rating = round(derived_rating * 10) / 10
     
-    print(f"HOME Round 1 (Unknown vs Known): {current_rating}")
+    emit(ROUND, f"HOME Round 1 (Unknown vs Known): {current_rating}")
     
     # SUBSEQUENT COMPARISONS: Known vs Known using Wildcard logic
     for i in range(1, len(opponents)):
@@ -97,20 +56,14 @@ def home_screen_baseline_free(opponents, results):
             )
             current_rating = new_loser_rating
         
-        print(f"HOME Round {i+1} (Known vs Known): {current_rating}")
+        emit(ROUND, f"HOME Round {i+1} (Known vs Known): {current_rating}")
     
     return current_rating
 
 # Original Wildcard simulation (still uses emotion baselines for comparison)
 def wildcard_simulation_with_baseline(emotion, opponents, results):
     """Simulate how Wildcard would handle with emotion baselines (for comparison)"""
-    emotion_baselines = {
-        'LOVED': 8.5,
-        'LIKED': 7.0,
-        'AVERAGE': 5.5,
-        'DISLIKED': 3.0
-    }
-    current_rating = emotion_baselines.get(emotion, 7.0)
+    current_rating = EMOTION_BASELINES.get(emotion, DEFAULT_BASELINE)
     
     for i, (opponent_rating, new_movie_won) in enumerate(zip(opponents, results)):
         if new_movie_won:
@@ -132,7 +85,7 @@ def wildcard_simulation_with_baseline(emotion, opponents, results):
             )
             current_rating = new_loser_rating
         
-        print(f"WILDCARD Round {i+1}: {current_rating}")
+        emit(ROUND, f"WILDCARD Round {i+1}: {current_rating}")
     
     return current_rating
 
@@ -168,52 +121,93 @@ test_scenarios = [
     }
 ]
 
-print("🎬 BASELINE-FREE SIMULATION")
-print("=" * 60)
-print("Comparing emotion baseline approach vs baseline-free approach")
-print("=" * 60)
+def run_baseline_free_simulation(scenarios=None):
+    """Compare the emotion-baseline and baseline-free approaches on each scenario"""
+    if scenarios is None:
+        scenarios = test_scenarios
+    
+    emit(SUMMARY, "🎬 BASELINE-FREE SIMULATION")
+    emit(SUMMARY, "=" * 60)
+    emit(SUMMARY, "Comparing emotion baseline approach vs baseline-free approach")
+    emit(SUMMARY, "=" * 60)
 
-for i, scenario in enumerate(test_scenarios, 1):
-    print(f"\n🎭 TEST {i}: {scenario['name']}")
-    print(f"Description: {scenario['description']}")
-    print(f"Emotion: {scenario['emotion']}")
-    print(f"Opponents: {scenario['opponents']}")
-    print(f"Results: {['WIN' if r else 'LOSS' for r in scenario['results']]}")
-    print()
-    
-    # Run Wildcard with emotion baseline (old approach)
-    print("WILDCARD (WITH emotion baseline):")
-    wildcard_baseline = wildcard_simulation_with_baseline(
-        scenario['emotion'], 
-        scenario['opponents'], 
-        scenario['results']
-    )
-    
-    print("\nHOME SCREEN (NO emotion baseline):")
-    home_baseline_free = home_screen_baseline_free(
-        scenario['opponents'], 
-        scenario['results']
+    total_difference = 0
+    max_difference = 0
+
+    for i, scenario in enumerate(scenarios, 1):
+        emit(SCENARIO, f"\n🎭 TEST {i}: {scenario['name']}")
+        emit(SCENARIO, f"Description: {scenario['description']}")
+        emit(SCENARIO, f"Emotion: {scenario['emotion']}")
+        emit(SCENARIO, f"Opponents: {scenario['opponents']}")
+        emit(SCENARIO, f"Results: {['WIN' if r else 'LOSS' for r in scenario['results']]}")
+        emit(SCENARIO)
+        
+        # Run Wildcard with emotion baseline (old approach)
+        emit(SCENARIO, "WILDCARD (WITH emotion baseline):")
+        wildcard_baseline = wildcard_simulation_with_baseline(
+            scenario['emotion'], 
+            scenario['opponents'], 
+            scenario['results']
+        )
+        
+        emit(SCENARIO, "\nHOME SCREEN (NO emotion baseline):")
+        home_baseline_free = home_screen_baseline_free(
+            scenario['opponents'], 
+            scenario['results']
+        )
+        
+        difference = abs(wildcard_baseline - home_baseline_free)
+        emit(SCENARIO, f"\n📊 COMPARISON:")
+        emit(SCENARIO, f"   Wildcard (with baseline): {wildcard_baseline}")
+        emit(SCENARIO, f"   Home Screen (baseline-free): {home_baseline_free}")
+        emit(SCENARIO, f"   Difference: {difference:.1f}")
+        
+        # Analysis
+        if difference < 1.0:
+            emit(SCENARIO, "   ✅ Results are reasonably close")
+        elif difference < 2.0:
+            emit(SCENARIO, "   ⚠️  Moderate difference - expected due to baseline removal")
+        else:
+            emit(SCENARIO, "   🚨 Large difference - may need adjustment")
+        
+        emit(SCENARIO, "-" * 60)
+        
+        total_difference += difference
+        max_difference = max(max_difference, difference)
+        emit_record(
+            SCENARIO, 'scenario',
+            name=scenario['name'],
+            emotion=scenario['emotion'],
+            opponents=scenario['opponents'],
+            results=scenario['results'],
+            wildcard=wildcard_baseline,
+            home=home_baseline_free,
+            difference=difference
+        )
+
+    summary = dict(
+        scenarios=len(scenarios),
+        average_difference=total_difference / len(scenarios),
+        maximum_difference=max_difference
     )
-    
-    difference = abs(wildcard_baseline - home_baseline_free)
-    print(f"\n📊 COMPARISON:")
-    print(f"   Wildcard (with baseline): {wildcard_baseline}")
-    print(f"   Home Screen (baseline-free): {home_baseline_free}")
-    print(f"   Difference: {difference:.1f}")
-    
-    # Analysis
-    if difference < 1.0:
-        print("   ✅ Results are reasonably close")
-    elif difference < 2.0:
-        print("   ⚠️  Moderate difference - expected due to baseline removal")
-    else:
-        print("   🚨 Large difference - may need adjustment")
-    
-    print("-" * 60)
+    emit_record(SUMMARY, 'summary', **summary)
+
+    emit(SUMMARY, "\n🎯 ANALYSIS:")
+    emit(SUMMARY, "The baseline-free approach will naturally produce different results")
+    emit(SUMMARY, "because it derives ratings purely from comparison outcomes,")
+    emit(SUMMARY, "while the baseline approach starts with predetermined emotion ratings.")
+    emit(SUMMARY, "\nThis is the intended behavior - no more emotion bias!")
+    emit(SUMMARY, "The first comparison outcome now determines the initial rating.")
+    
+    return summary
+
+
+def main(argv=None):
+    parse_output_args("Emotion baseline vs baseline-free simulation", argv)
+    if get_reporter().text_enabled(ROUND):
+        set_trace_hook(print_major_upset)
+    return run_baseline_free_simulation()
+
 
-print("\n🎯 ANALYSIS:")
-print("The baseline-free approach will naturally produce different results")
-print("because it derives ratings purely from comparison outcomes,")
-print("while the baseline approach starts with predetermined emotion ratings.")
-print("\nThis is the intended behavior - no more emotion bias!")
-print("The first comparison outcome now determines the initial rating.")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# BATCH THROUGHPUT BENCHMARK
+# Comparisons per second: scalar wildcard_adjust_rating vs rating_core batch engine
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rating_core import wildcard_adjust_rating  # noqa: E402
+from rating_core.batch import adjust_ratings_batch  # noqa: E402
+
+
+def make_inputs(n, seed=42):
+    rng = np.random.default_rng(seed)
+    winners = rng.integers(10, 101, n) / 10
+    losers = rng.integers(10, 101, n) / 10
+    winner_games = rng.integers(0, 30, n)
+    loser_games = rng.integers(0, 30, n)
+    return winners, losers, winner_games, loser_games
+
+
+def bench_scalar(n):
+    winners, losers, winner_games, loser_games = (a.tolist() for a in make_inputs(n))
+    start = time.perf_counter()
+    for w, l, wg, lg in zip(winners, losers, winner_games, loser_games):
+        wildcard_adjust_rating(w, l, True, wg, lg)
+    return n / (time.perf_counter() - start)
+
+
+def bench_batch(n):
+    inputs = make_inputs(n)
+    start = time.perf_counter()
+    adjust_ratings_batch(*inputs)
+    return n / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    print("⚡ BATCH THROUGHPUT BENCHMARK")
+    print("=" * 60)
+    scalar_rate = bench_scalar(200_000)
+    print(f"Scalar: {scalar_rate:,.0f} comparisons/sec")
+    for n in (10_000, 1_000_000, 10_000_000):
+        batch_rate = bench_batch(n)
+        print(f"Batch (n={n:,}): {batch_rate:,.0f} comparisons/sec ({batch_rate / scalar_rate:.1f}x)")
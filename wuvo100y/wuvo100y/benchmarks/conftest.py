@@ -0,0 +1,36 @@
+# BENCHMARK FIXTURES: Make the scripts importable and keep their output out of the timings
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rating_core import set_trace_hook  # noqa: E402
+from rating_core.output import SILENT, Reporter, set_reporter  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def silent_output():
+    """No console output or trace hooks while timing"""
+    previous_reporter = set_reporter(Reporter(verbosity=SILENT))
+    previous_hook = set_trace_hook(None)
+    yield
+    set_trace_hook(previous_hook)
+    set_reporter(previous_reporter)
+
+
+@pytest.fixture
+def throughput(benchmark):
+    """Run the benchmark and record items/sec (from the mean round time) in the JSON output"""
+
+    def run(function, items, unit, *args):
+        result = benchmark(function, *args)
+        benchmark.extra_info['items'] = items
+        # No stats under --benchmark-disable: the function ran once as a smoke test
+        if benchmark.stats is not None:
+            benchmark.extra_info[f'{unit}_per_sec'] = items / benchmark.stats.stats.mean
+        return result
+
+    return run
@@ -0,0 +1,89 @@
+# QUANTILE MAINTENANCE BENCHMARK
+# Emotion percentile buckets after every rating change: full re-sort vs GridQuantiles at 10k titles
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rating_core.engines import EMOTIONS  # noqa: E402
+from rating_core.opponents import PERCENTILE_RANGES  # noqa: E402
+from rating_core.population import Population  # noqa: E402
+from rating_core.quantiles import CATEGORY_PERCENTILES, GridQuantiles, grid_index  # noqa: E402
+from rating_core.transitions import RATING_GRID  # noqa: E402
+
+TITLES = 10_000
+
+
+def make_changes(n, seed=42):
+    rng = np.random.default_rng(seed)
+    ratings = rng.integers(10, 101, TITLES) / 10
+    return ratings, rng.integers(0, TITLES, n), np.array(RATING_GRID)[rng.integers(0, len(RATING_GRID), n)]
+
+
+def bench_resort(n):
+    """Re-sort the library after each change, like calculateDynamicRatingCategories"""
+    ratings, movies, new_ratings = make_changes(n)
+    ratings = ratings.tolist()
+    start = time.perf_counter()
+    for movie, rating in zip(movies.tolist(), new_ratings.tolist()):
+        ratings[movie] = rating
+        ordered = sorted(ratings)
+        [ordered[int(len(ordered) * fraction)] for fraction in CATEGORY_PERCENTILES]
+    return n / (time.perf_counter() - start)
+
+
+def bench_quantiles(n):
+    ratings, movies, new_ratings = make_changes(n)
+    quantiles = GridQuantiles(1)
+    quantiles.add(np.zeros(TITLES, dtype=np.int64), grid_index(ratings))
+    row = np.zeros(1, dtype=np.int64)
+    start = time.perf_counter()
+    for movie, rating in zip(movies.tolist(), new_ratings.tolist()):
+        quantiles.move(row, grid_index(ratings[movie:movie + 1]), grid_index([rating]))
+        ratings[movie] = rating
+        quantiles.category_boundaries(0)
+    return n / (time.perf_counter() - start)
+
+
+def sorted_select_opponents(population, users, emotion_codes, count=3):
+    """Population.select_opponents as it was before the quantile trees: argsort every library"""
+    keys = np.where(population.rated[users], population.ratings[users], -np.inf)
+    order = np.argsort(-keys, axis=1, kind='stable')
+    sizes = population.rated[users].sum(axis=1)
+    low = np.array([PERCENTILE_RANGES[e][0] for e in EMOTIONS])[emotion_codes]
+    high = np.array([PERCENTILE_RANGES[e][1] for e in EMOTIONS])[emotion_codes]
+    start = (low * sizes).astype(np.int64)
+    stop = np.minimum(np.maximum((high * sizes).astype(np.int64), start + 1), sizes)
+    ranks = np.empty((len(users), count), dtype=np.int64)
+    ranks[:, 0] = start + (population.rng.random(len(users)) * (stop - start)).astype(np.int64)
+    population._fill_distinct_ranks(ranks, sizes, 1)
+    return np.take_along_axis(order, ranks, axis=1)
+
+
+def bench_select_opponents(users, select, calls=20):
+    """Opponent picks per second for `users` libraries holding half the catalog"""
+    population = Population(users, TITLES, seed=0, initial_library=TITLES // 2)
+    rows = np.arange(users)
+    emotions = rows % 4
+    start = time.perf_counter()
+    for _ in range(calls):
+        select(population, rows, emotions)
+    return calls * users / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    print(f"📊 QUANTILE MAINTENANCE BENCHMARK ({TITLES:,} titles)")
+    print("=" * 60)
+    resort_rate = bench_resort(500)
+    print(f"Full re-sort: {resort_rate:,.0f} rating changes/sec")
+    quantile_rate = bench_quantiles(5_000)
+    print(f"GridQuantiles: {quantile_rate:,.0f} rating changes/sec ({quantile_rate / resort_rate:.1f}x)")
+    for users in (20, 200):
+        sorted_rate = bench_select_opponents(users, sorted_select_opponents)
+        tree_rate = bench_select_opponents(users, Population.select_opponents)
+        print(f"select_opponents ({users} users): argsort {sorted_rate:,.0f}/sec, "
+              f"trees {tree_rate:,.0f}/sec ({tree_rate / sorted_rate:.1f}x)")
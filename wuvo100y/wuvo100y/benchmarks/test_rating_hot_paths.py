@@ -0,0 +1,124 @@
+# HOT PATH BENCHMARKS: pytest-benchmark suite for the rating engines and opponent selection
+# Save a baseline, then compare later runs against it (fails on a >10% slower mean):
+#   python -m pytest benchmarks --benchmark-autosave
+#   python -m pytest benchmarks --benchmark-autosave --benchmark-compare --benchmark-compare-fail=mean:10%
+# Results land in .benchmarks/ as JSON; extra_info holds comparisons/sec or selections/sec
+
+import random
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from homescreen_workflow_simulation import simulate_opponent_selection  # noqa: E402
+from rating_core import wildcard_adjust_rating  # noqa: E402
+from rating_core.engines import (  # noqa: E402
+    EMOTIONS,
+    home_screen_system,
+    home_screen_unknown_vs_known,
+    wildcard_simulation,
+)
+from rating_core.kernels import HAVE_NUMBA, kernel_simulate  # noqa: E402
+from rating_core.opponents import OpponentIndex  # noqa: E402
+from rating_core.quantiles import CATEGORY_PERCENTILES, GridQuantiles, grid_index  # noqa: E402
+from rating_core.scenarios import generate_scenarios  # noqa: E402
+
+SIZES = [100, 1_000, 10_000]
+ROUNDS = [3, 10]
+LIBRARY_SIZES = [16, 1_000, 10_000]
+SELECTIONS = 200
+
+
+def make_comparisons(n, seed=42):
+    rng = random.Random(seed)
+    return [
+        (rng.randint(10, 100) / 10, rng.randint(10, 100) / 10, rng.randint(0, 30), rng.randint(0, 30))
+        for _ in range(n)
+    ]
+
+
+def make_library(n, seed=42):
+    rng = random.Random(seed)
+    return [{'id': i, 'title': f'Movie {i}', 'rating': rng.randint(10, 100) / 10} for i in range(n)]
+
+
+@pytest.mark.parametrize('n', SIZES)
+def test_wildcard_adjust_rating(throughput, n):
+    comparisons = make_comparisons(n)
+
+    def run():
+        for winner, loser, winner_games, loser_games in comparisons:
+            wildcard_adjust_rating(winner, loser, True, winner_games, loser_games)
+
+    throughput(run, n, 'comparisons')
+
+
+@pytest.mark.parametrize('engine', [home_screen_unknown_vs_known, home_screen_system, wildcard_simulation],
+                         ids=['home_screen_unknown_vs_known', 'home_screen_system', 'wildcard_simulation'])
+@pytest.mark.parametrize('rounds', ROUNDS)
+@pytest.mark.parametrize('n', SIZES)
+def test_engine(throughput, engine, rounds, n):
+    scenarios = [(s['emotion'], s['opponents'], s['results']) for s in generate_scenarios(n, seed=42, rounds=rounds)]
+
+    def run():
+        for emotion, opponents, results in scenarios:
+            engine(emotion, opponents, results)
+
+    # Every round is one wildcard_adjust_rating comparison
+    throughput(run, n * rounds, 'comparisons')
+
+
+@pytest.mark.parametrize('jit', [False, True], ids=['python', 'numba'])
+@pytest.mark.parametrize('rounds', ROUNDS)
+@pytest.mark.parametrize('n', SIZES)
+def test_battle_loop_kernel(throughput, n, rounds, jit):
+    if jit and not HAVE_NUMBA:
+        pytest.skip("numba not installed")
+    scenarios = list(generate_scenarios(n, seed=42, rounds=rounds))
+    emotions = [s['emotion'] for s in scenarios]
+    opponents = [s['opponents'] for s in scenarios]
+    results = [s['results'] for s in scenarios]
+    kernel_simulate(emotions[:1], opponents[:1], results[:1], jit=jit)  # compile outside the timing
+
+    def run():
+        kernel_simulate(emotions, opponents, results, 'wildcard', jit=jit)
+
+    throughput(run, n * rounds, 'comparisons')
+
+
+@pytest.mark.parametrize('indexed', [False, True], ids=['list', 'index'])
+@pytest.mark.parametrize('library_size', LIBRARY_SIZES)
+def test_simulate_opponent_selection(throughput, library_size, indexed):
+    library = make_library(library_size)
+    if indexed:
+        library = OpponentIndex(library)
+    emotions = [EMOTIONS[i % len(EMOTIONS)] for i in range(SELECTIONS)]
+
+    def run():
+        random.seed(0)
+        for emotion in emotions:
+            simulate_opponent_selection(emotion, library)
+
+    throughput(run, SELECTIONS, 'selections')
+
+
+@pytest.mark.parametrize('maintained', [False, True], ids=['resort', 'quantiles'])
+@pytest.mark.parametrize('library_size', LIBRARY_SIZES)
+def test_category_boundaries_after_change(throughput, library_size, maintained):
+    ratings = [movie['rating'] for movie in make_library(library_size)]
+    rng = random.Random(0)
+    changes = [(rng.randrange(library_size), rng.randint(10, 100) / 10) for _ in range(SELECTIONS)]
+    quantiles = GridQuantiles(1)
+    quantiles.add([0] * library_size, grid_index(ratings))
+
+    def run():
+        for movie, rating in changes:
+            if maintained:
+                quantiles.move([0], grid_index([ratings[movie]]), grid_index([rating]))
+                quantiles.category_boundaries(0)
+            else:
+                ordered = sorted(ratings[:movie] + [rating] + ratings[movie + 1:])
+                [ordered[int(len(ordered) * fraction)] for fraction in CATEGORY_PERCENTILES]
+            ratings[movie] = rating
+
+    throughput(run, SELECTIONS, 'changes')
@@ -1,68 +1,21 @@
 # COMPREHENSIVE SIMULATION: Home Screen vs Wildcard Rating Systems
 # Testing 3 movies each with identical scenarios and devil's advocate review
 
-import math
+from rating_core import set_trace_hook, wildcard_adjust_rating
+from rating_core.engines import DEFAULT_BASELINE, EMOTION_BASELINES
+from rating_core.output import ROUND, SCENARIO, SUMMARY, emit, emit_record, get_reporter, parse_output_args
 
-# Wildcard's exact adjustRating function
-def wildcard_adjust_rating(winner_rating, loser_rating, winner_won, winner_games_played=0, loser_games_played=0):
-    """Wildcard's exact ELO logic"""
-    
-    # Calculate K-factor (Wildcard's logic)
-    def calculate_k_factor(games_played):
-        if games_played < 5:
-            return 0.5
-        elif games_played < 10:
-            return 0.25
-        elif games_played < 20:
-            return 0.125
-        return 0.1
-    
-    rating_difference = abs(winner_rating - loser_rating)
-    expected_win_probability = 1 / (1 + math.pow(10, (loser_rating - winner_rating) / 4))
-    
-    winner_k = calculate_k_factor(winner_games_played)
-    loser_k = calculate_k_factor(loser_games_played)
-    
-    winner_increase = max(0.1, winner_k * (1 - expected_win_probability))
-    loser_decrease = max(0.1, loser_k * (1 - expected_win_probability))
-    
-    # Underdog bonus
-    if winner_rating < loser_rating:
-        winner_increase *= 1.2
-    
-    # Major upset bonus
-    is_major_upset = winner_rating < loser_rating and rating_difference > 3.0
-    if is_major_upset:
-        winner_increase += 3.0
-        print(f"🚨 WILDCARD MAJOR UPSET! Winner ({winner_rating}) defeated Loser ({loser_rating}). +3.0 bonus!")
-    
-    # Apply limits
-    MAX_RATING_CHANGE = 0.7
-    if not is_major_upset:
-        winner_increase = min(MAX_RATING_CHANGE, winner_increase)
-        loser_decrease = min(MAX_RATING_CHANGE, loser_decrease)
-    
-    new_winner_rating = winner_rating + winner_increase
-    new_loser_rating = loser_rating - loser_decrease
-    
-    # Bounds enforcement
-    new_winner_rating = round(min(10, max(1, new_winner_rating)) * 10) / 10
-    new_loser_rating = round(min(10, max(1, new_loser_rating)) * 10) / 10
-    
-    return new_winner_rating, new_loser_rating
+def print_major_upset(trace):
+    """Console trace for the major upset bonus"""
+    if trace.is_major_upset:
+        emit(ROUND, f"🚨 WILDCARD MAJOR UPSET! Winner ({trace.winner_rating}) defeated Loser ({trace.loser_rating}). +3.0 bonus!")
 
 # Home Screen's Unknown vs Known approach
 def home_screen_unknown_vs_known(emotion, opponents, results):
     """Home Screen's Unknown vs Known then Known vs Known approach"""
     
     # Use emotion as a baseline for the unknown movie in the comparison
-    emotion_baselines = {
-        'LOVED': 8.5,
-        'LIKED': 7.0,
-        'AVERAGE': 5.5,
-        'DISLIKED': 3.0
-    }
-    emotion_baseline = emotion_baselines.get(emotion, 7.0)
+    emotion_baseline = EMOTION_BASELINES.get(emotion, DEFAULT_BASELINE)
     
     # FIRST COMPARISON: Unknown vs Known
     opponent_rating = opponents[0]
@@ -89,7 +42,7 @@ def home_screen_unknown_vs_known(emotion, opponents, results):
         )
         current_rating = new_loser_rating
     
-    print(f"HOME Round 1 (Unknown vs Known): {current_rating}")
+    emit(ROUND, f"HOME Round 1 (Unknown vs Known): {current_rating}")
     
     # SUBSEQUENT COMPARISONS: Known vs Known
     for i in range(1, len(opponents)):
@@ -115,20 +68,14 @@ def home_screen_unknown_vs_known(emotion, opponents, results):
             )
             current_rating = new_loser_rating
         
-        print(f"HOME Round {i+1} (Known vs Known): {current_rating}")
+        emit(ROUND, f"HOME Round {i+1} (Known vs Known): {current_rating}")
     
     return current_rating
 
 # Wildcard simulation (for comparison)
 def wildcard_simulation(emotion, opponents, results):
     """Simulate how Wildcard would handle the same scenario"""
-    emotion_baselines = {
-        'LOVED': 8.5,
-        'LIKED': 7.0,
-        'AVERAGE': 5.5,
-        'DISLIKED': 3.0
-    }
-    current_rating = emotion_baselines.get(emotion, 7.0)
+    current_rating = EMOTION_BASELINES.get(emotion, DEFAULT_BASELINE)
     
     for i, (opponent_rating, new_movie_won) in enumerate(zip(opponents, results)):
         if new_movie_won:
@@ -150,58 +97,52 @@ def wildcard_simulation(emotion, opponents, results):
             )
             current_rating = new_loser_rating
         
-        print(f"WILDCARD Round {i+1}: {current_rating}")
+        emit(ROUND, f"WILDCARD Round {i+1}: {current_rating}")
     
     return current_rating
 
 # Devil's Advocate Review Function
 def devils_advocate_review(movie_name, emotion, opponents, results, wildcard_result, home_result):
     """Critical review to catch any discrepancies"""
-    print(f"\n🔍 DEVIL'S ADVOCATE REVIEW: {movie_name}")
-    print("=" * 50)
+    emit(SCENARIO, f"\n🔍 DEVIL'S ADVOCATE REVIEW: {movie_name}")
+    emit(SCENARIO, "=" * 50)
     
     # Check 1: Are we using the same starting emotion?
-    emotion_baselines = {
-        'LOVED': 8.5,
-        'LIKED': 7.0,
-        'AVERAGE': 5.5,
-        'DISLIKED': 3.0
-    }
-    expected_start = emotion_baselines.get(emotion, 7.0)
-    print(f"✓ Emotion baseline check: {emotion} = {expected_start}")
+    expected_start = EMOTION_BASELINES.get(emotion, DEFAULT_BASELINE)
+    emit(SCENARIO, f"✓ Emotion baseline check: {emotion} = {expected_start}")
     
     # Check 2: Are the opponents identical?
-    print(f"✓ Opponent ratings: {opponents}")
+    emit(SCENARIO, f"✓ Opponent ratings: {opponents}")
     
     # Check 3: Are the results identical?
     result_str = ['WIN' if r else 'LOSS' for r in results]
-    print(f"✓ Battle results: {result_str}")
+    emit(SCENARIO, f"✓ Battle results: {result_str}")
     
     # Check 4: Compare final ratings
     difference = abs(wildcard_result - home_result)
-    print(f"✓ Final ratings - Wildcard: {wildcard_result}, Home: {home_result}")
-    print(f"✓ Difference: {difference}")
+    emit(SCENARIO, f"✓ Final ratings - Wildcard: {wildcard_result}, Home: {home_result}")
+    emit(SCENARIO, f"✓ Difference: {difference}")
     
     # Check 5: Flag significant discrepancies
     if difference > 0.5:
-        print("🚨 SIGNIFICANT DISCREPANCY DETECTED!")
-        print("   This requires investigation:")
-        print(f"   - Wildcard logic may differ from Home Screen logic")
-        print(f"   - K-factor calculations might be inconsistent")
-        print(f"   - Underdog/upset bonuses might be applied differently")
+        emit(SCENARIO, "🚨 SIGNIFICANT DISCREPANCY DETECTED!")
+        emit(SCENARIO, "   This requires investigation:")
+        emit(SCENARIO, f"   - Wildcard logic may differ from Home Screen logic")
+        emit(SCENARIO, f"   - K-factor calculations might be inconsistent")
+        emit(SCENARIO, f"   - Underdog/upset bonuses might be applied differently")
     elif difference > 0.1:
-        print("⚠️  MINOR DISCREPANCY DETECTED")
-        print("   Small difference likely due to rounding or sequential vs pairwise logic")
+        emit(SCENARIO, "⚠️  MINOR DISCREPANCY DETECTED")
+        emit(SCENARIO, "   Small difference likely due to rounding or sequential vs pairwise logic")
     else:
-        print("✅ RATINGS MATCH PERFECTLY!")
+        emit(SCENARIO, "✅ RATINGS MATCH PERFECTLY!")
     
     # Check 6: Validate emotion appropriateness
     if emotion == 'LOVED' and wildcard_result < 7.0:
-        print("🤔 LOGIC CHECK: LOVED movie ended up below 7.0 - is this realistic?")
+        emit(SCENARIO, "🤔 LOGIC CHECK: LOVED movie ended up below 7.0 - is this realistic?")
     elif emotion == 'DISLIKED' and wildcard_result > 6.0:
-        print("🤔 LOGIC CHECK: DISLIKED movie ended up above 6.0 - is this realistic?")
+        emit(SCENARIO, "🤔 LOGIC CHECK: DISLIKED movie ended up above 6.0 - is this realistic?")
     
-    print("=" * 50)
+    emit(SCENARIO, "=" * 50)
 
 # Test scenarios
 test_scenarios = [
@@ -233,76 +174,112 @@ test_scenarios = [
     }
 ]
 
-print("🎬 COMPREHENSIVE SIMULATION: Home Screen vs Wildcard")
-print("=" * 60)
-print("Testing 3 movies with identical scenarios")
-print("Each movie faces 3 opponents with predetermined results")
-print("Devil's advocate will review each comparison for discrepancies")
-print("=" * 60)
+def run_comprehensive_simulation(scenarios=None):
+    """Run every scenario through both systems with a devil's advocate review"""
+    if scenarios is None:
+        scenarios = test_scenarios
+    
+    emit(SUMMARY, "🎬 COMPREHENSIVE SIMULATION: Home Screen vs Wildcard")
+    emit(SUMMARY, "=" * 60)
+    emit(SUMMARY, "Testing 3 movies with identical scenarios")
+    emit(SUMMARY, "Each movie faces 3 opponents with predetermined results")
+    emit(SUMMARY, "Devil's advocate will review each comparison for discrepancies")
+    emit(SUMMARY, "=" * 60)
 
-total_difference = 0
-max_difference = 0
+    total_difference = 0
+    max_difference = 0
 
-for i, scenario in enumerate(test_scenarios, 1):
-    print(f"\n🎭 TEST {i}: {scenario['name']}")
-    print(f"Description: {scenario['description']}")
-    print(f"Emotion: {scenario['emotion']}")
-    print(f"Opponents: {scenario['opponents']}")
-    print(f"Results: {['WIN' if r else 'LOSS' for r in scenario['results']]}")
-    print()
-    
-    # Run Wildcard simulation
-    print("WILDCARD SYSTEM:")
-    wildcard_final = wildcard_simulation(
-        scenario['emotion'], 
-        scenario['opponents'], 
-        scenario['results']
-    )
-    
-    print("\nHOME SCREEN SYSTEM:")
-    home_final = home_screen_unknown_vs_known(
-        scenario['emotion'], 
-        scenario['opponents'], 
-        scenario['results']
-    )
-    
-    # Devil's advocate review
-    devils_advocate_review(
-        scenario['name'],
-        scenario['emotion'],
-        scenario['opponents'],
-        scenario['results'],
-        wildcard_final,
-        home_final
+    for i, scenario in enumerate(scenarios, 1):
+        emit(SCENARIO, f"\n🎭 TEST {i}: {scenario['name']}")
+        emit(SCENARIO, f"Description: {scenario['description']}")
+        emit(SCENARIO, f"Emotion: {scenario['emotion']}")
+        emit(SCENARIO, f"Opponents: {scenario['opponents']}")
+        emit(SCENARIO, f"Results: {['WIN' if r else 'LOSS' for r in scenario['results']]}")
+        emit(SCENARIO)
+        
+        # Run Wildcard simulation
+        emit(SCENARIO, "WILDCARD SYSTEM:")
+        wildcard_final = wildcard_simulation(
+            scenario['emotion'], 
+            scenario['opponents'], 
+            scenario['results']
+        )
+        
+        emit(SCENARIO, "\nHOME SCREEN SYSTEM:")
+        home_final = home_screen_unknown_vs_known(
+            scenario['emotion'], 
+            scenario['opponents'], 
+            scenario['results']
+        )
+        
+        # Devil's advocate review
+        devils_advocate_review(
+            scenario['name'],
+            scenario['emotion'],
+            scenario['opponents'],
+            scenario['results'],
+            wildcard_final,
+            home_final
+        )
+        
+        # Track differences
+        difference = abs(wildcard_final - home_final)
+        total_difference += difference
+        max_difference = max(max_difference, difference)
+        
+        emit_record(
+            SCENARIO, 'scenario',
+            name=scenario['name'],
+            emotion=scenario['emotion'],
+            opponents=scenario['opponents'],
+            results=scenario['results'],
+            wildcard=wildcard_final,
+            home=home_final,
+            difference=difference
+        )
+        
+        emit(SCENARIO, f"\n📊 FINAL RESULT: Wildcard={wildcard_final}, Home={home_final}, Diff={difference:.1f}")
+        emit(SCENARIO, "=" * 60)
+
+    # Final summary
+    summary = dict(
+        scenarios=len(scenarios),
+        average_difference=total_difference / len(scenarios),
+        maximum_difference=max_difference
     )
-    
-    # Track differences
-    difference = abs(wildcard_final - home_final)
-    total_difference += difference
-    max_difference = max(max_difference, difference)
-    
-    print(f"\n📊 FINAL RESULT: Wildcard={wildcard_final}, Home={home_final}, Diff={difference:.1f}")
-    print("=" * 60)
+    emit_record(SUMMARY, 'summary', **summary)
+
+    emit(SUMMARY, f"\n🏆 COMPREHENSIVE ANALYSIS SUMMARY")
+    emit(SUMMARY, "=" * 60)
+    emit(SUMMARY, f"Total movies tested: {len(scenarios)}")
+    emit(SUMMARY, f"Average difference: {total_difference/len(scenarios):.2f}")
+    emit(SUMMARY, f"Maximum difference: {max_difference:.2f}")
+
+    if max_difference < 0.1:
+        emit(SUMMARY, "✅ PERFECT ALIGNMENT - Both systems produce nearly identical results")
+    elif max_difference < 0.5:
+        emit(SUMMARY, "✅ EXCELLENT ALIGNMENT - Minor differences within acceptable range")
+    elif max_difference < 1.0:
+        emit(SUMMARY, "⚠️  GOOD ALIGNMENT - Some differences but generally consistent")
+    else:
+        emit(SUMMARY, "🚨 SIGNIFICANT DIFFERENCES - Systems may have fundamental inconsistencies")
+
+    emit(SUMMARY, "\n🎯 DEVIL'S ADVOCATE CONCLUSION:")
+    emit(SUMMARY, "If differences exist, they likely stem from:")
+    emit(SUMMARY, "1. Sequential rating evolution (Home) vs pairwise comparisons (Wildcard)")
+    emit(SUMMARY, "2. Different K-factor progression based on games played")
+    emit(SUMMARY, "3. Timing of when bonuses are applied during the rating process")
+    emit(SUMMARY, "4. Rounding differences in complex calculations")
+    
+    return summary
+
 
-# Final summary
-print(f"\n🏆 COMPREHENSIVE ANALYSIS SUMMARY")
-print("=" * 60)
-print(f"Total movies tested: {len(test_scenarios)}")
-print(f"Average difference: {total_difference/len(test_scenarios):.2f}")
-print(f"Maximum difference: {max_difference:.2f}")
+def main(argv=None):
+    parse_output_args("Comprehensive Home Screen vs Wildcard simulation", argv)
+    if get_reporter().text_enabled(ROUND):
+        set_trace_hook(print_major_upset)
+    return run_comprehensive_simulation()
 
-if max_difference < 0.1:
-    print("✅ PERFECT ALIGNMENT - Both systems produce nearly identical results")
-elif max_difference < 0.5:
-    print("✅ EXCELLENT ALIGNMENT - Minor differences within acceptable range")
-elif max_difference < 1.0:
-    print("⚠️  GOOD ALIGNMENT - Some differences but generally consistent")
-else:
-    print("🚨 SIGNIFICANT DIFFERENCES - Systems may have fundamental inconsistencies")
 
-print("\n🎯 DEVIL'S ADVOCATE CONCLUSION:")
-print("If differences exist, they likely stem from:")
-print("1. Sequential rating evolution (Home) vs pairwise comparisons (Wildcard)")
-print("2. Different K-factor progression based on games played")
-print("3. Timing of when bonuses are applied during the rating process")
-print("4. Rounding differences in complex calculations")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
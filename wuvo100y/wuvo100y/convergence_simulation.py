@@ -0,0 +1,78 @@
+# CONVERGENCE SIMULATION: Comparisons a user must make before each engine's rating settles
+# Replaces the fixed three rounds with battles against a hidden true rating until a stopping rule fires
+
+import argparse
+import time
+
+from rating_core.convergence import (CONVERGENCE_ENGINES, STOPPING_RULES, convergence_simulate, convergence_summary,
+                                     draw_population)
+from rating_core.output import SCENARIO, SUMMARY, add_output_arguments, configure_output, emit, emit_record
+
+
+def positive_int(text):
+    """'40' -> 40; zero movies or comparisons leaves nothing to summarize"""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value {text!r}")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def run_convergence(movies=200_000, engines=CONVERGENCE_ENGINES, rules=STOPPING_RULES, max_comparisons=40,
+                    noise_scale=2.0, target_width=2.0, seed=0):
+    """{engine: {rule: convergence_summary}} for one shared population and battle sequence"""
+    emotion_codes, true_ratings = draw_population(movies, seed)
+    summaries = {}
+    for engine in engines:
+        results = convergence_simulate(engine, emotion_codes, true_ratings, rules, max_comparisons,
+                                       noise_scale, target_width, seed)
+        summaries[engine] = {rule: convergence_summary(result, true_ratings, max_comparisons)
+                             for rule, result in results.items()}
+        for rule, summary in summaries[engine].items():
+            emit(SCENARIO, f"   {engine} / {rule}: comparisons histogram {summary['histogram']}")
+            emit_record(SCENARIO, 'distribution', engine=engine, rule=rule, **summary)
+    return summaries
+
+
+def print_summary(summaries, elapsed, movies):
+    emit(SUMMARY, "=" * 80)
+    emit(SUMMARY, "🏆 CONVERGENCE SUMMARY")
+    emit(SUMMARY, "=" * 80)
+    emit(SUMMARY, f"{'engine':<18}{'rule':<15}{'mean':>7}{'median':>8}{'p90':>6}{'p99':>6}{'converged':>11}{'|err|':>8}")
+    for engine, rules in summaries.items():
+        for rule, s in rules.items():
+            emit(SUMMARY, f"{engine:<18}{rule:<15}{s['mean_comparisons']:>7.2f}{s['median_comparisons']:>8.0f}"
+                          f"{s['p90_comparisons']:>6.0f}{s['p99_comparisons']:>6.0f}{s['converged_fraction']:>11.1%}"
+                          f"{s['mean_absolute_error']:>8.3f}")
+    emit(SUMMARY, f"\n⏱️  {elapsed:.2f}s → {movies * len(summaries) / elapsed:,.0f} movies/sec")
+    emit_record(SUMMARY, 'summary', elapsed=elapsed, movies=movies, engines=summaries)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Comparisons-to-convergence per engine and stopping rule")
+    parser.add_argument('--movies', type=positive_int, default=200_000)
+    parser.add_argument('--engines', nargs='+', choices=CONVERGENCE_ENGINES, default=list(CONVERGENCE_ENGINES))
+    parser.add_argument('--rules', nargs='+', choices=STOPPING_RULES, default=list(STOPPING_RULES))
+    parser.add_argument('--max-comparisons', type=positive_int, default=40)
+    parser.add_argument('--noise-scale', type=float, default=2.0,
+                        help="true-rating gap at which the better movie wins 10 times out of 11")
+    parser.add_argument('--target-width', type=float, default=2.0, help="95%% interval width for the ci_width rule")
+    parser.add_argument('--seed', type=int, default=0)
+    add_output_arguments(parser)
+    args = parser.parse_args(argv)
+    configure_output(args)
+
+    emit(SUMMARY, "📉🎬 CONVERGENCE SIMULATION: comparisons until a stopping rule fires")
+    emit(SUMMARY, f"{args.movies:,} movies, up to {args.max_comparisons} comparisons, noise scale {args.noise_scale}, seed {args.seed}")
+
+    start = time.perf_counter()
+    summaries = run_convergence(args.movies, args.engines, args.rules, args.max_comparisons,
+                                args.noise_scale, args.target_width, args.seed)
+    print_summary(summaries, time.perf_counter() - start, args.movies)
+    return summaries
+
+
+if __name__ == "__main__":
+    main()
@@ -1,61 +1,20 @@
 # EXTENDED SIMULATION: Home Screen vs Wildcard Round 2
 # Testing edge cases and extreme scenarios
 
-import math
+import argparse
+
+from rating_core import wildcard_adjust_rating
+from rating_core.cache import ResultCache, fingerprint, get_result_cache
+from rating_core.engines import DEFAULT_BASELINE, EMOTION_BASELINES
+from rating_core.output import ROUND, SCENARIO, SUMMARY, add_output_arguments, configure_output, emit, emit_record, get_reporter
 
-# Wildcard's exact adjustRating function
-def wildcard_adjust_rating(winner_rating, loser_rating, winner_won, winner_games_played=0, loser_games_played=0):
-    """Wildcard's exact ELO logic"""
-    
-    # Calculate K-factor (Wildcard's logic)
-    def calculate_k_factor(games_played):
-        if games_played < 5:
-            return 0.5
-        elif games_played < 10:
-            return 0.25
-        elif games_played < 20:
-            return 0.125
-        return 0.1
-    
-    rating_difference = abs(winner_rating - loser_rating)
-    expected_win_probability = 1 / (1 + math.pow(10, (loser_rating - winner_rating) / 4))
-    
-    winner_k = calculate_k_factor(winner_games_played)
-    loser_k = calculate_k_factor(loser_games_played)
-    
-    winner_increase = max(0.1, winner_k * (1 - expected_win_probability))
-    loser_decrease = max(0.1, loser_k * (1 - expected_win_probability))
-    
-    # Underdog bonus
-    if winner_rating < loser_rating:
-        winner_increase *= 1.2
-    
-    # Major upset bonus
-    is_major_upset = winner_rating < loser_rating and rating_difference > 3.0
-    if is_major_upset:
-        winner_increase += 3.0
-    
-    # Apply limits
-    MAX_RATING_CHANGE = 0.7
-    if not is_major_upset:
-        winner_increase = min(MAX_RATING_CHANGE, winner_increase)
-        loser_decrease = min(MAX_RATING_CHANGE, loser_decrease)
-    
-    new_winner_rating = winner_rating + winner_increase
-    new_loser_rating = loser_rating - loser_decrease
-    
-    # Bounds enforcement
-    new_winner_rating = round(min(10, max(1, new_winner_rating)) * 10) / 10
-    new_loser_rating = round(min(10, max(1, new_loser_rating)) * 10) / 10
-    
-    return new_winner_rating, new_loser_rating
 
 # HOME SCREEN: Baseline-Free Unknown vs Known approach
 def home_screen_system(opponents, results, show_details=True):
     """Current Home Screen implementation (baseline-free)"""
     
     if show_details:
-        print("  🏠 HOME SCREEN:")
+        emit(ROUND, "  🏠 HOME SCREEN:")
     
     # FIRST COMPARISON: Unknown vs Known
     opponent_rating = opponents[0]
@@ -69,7 +28,7 @@ def home_screen_system(opponents, results, show_details=True):
     current_rating = round(derived_rating * 10) / 10
     
     if show_details:
-        print(f"    R1: {'WIN' if new_movie_won else 'LOSS'} vs {opponent_rating} → {current_rating}")
+        emit(ROUND, f"    R1: {'WIN' if new_movie_won else 'LOSS'} vs {opponent_rating} → {current_rating}")
     
     # SUBSEQUENT COMPARISONS: Known vs Known
     for i in range(1, len(opponents)):
@@ -88,7 +47,7 @@ def home_screen_system(opponents, results, show_details=True):
             current_rating = new_loser_rating
         
         if show_details:
-            print(f"    R{i+1}: {'WIN' if new_movie_won else 'LOSS'} vs {opponent_rating} → {current_rating}")
+            emit(ROUND, f"    R{i+1}: {'WIN' if new_movie_won else 'LOSS'} vs {opponent_rating} → {current_rating}")
     
     return current_rating
 
@@ -97,18 +56,12 @@ def wildcard_system(emotion, opponents, results, show_details=True):
     """Original Wildcard system with emotion baselines"""
     
     if show_details:
-        print("  🃏 WILDCARD:")
+        emit(ROUND, "  🃏 WILDCARD:")
     
-    emotion_baselines = {
-        'LOVED': 8.5,
-        'LIKED': 7.0,
-        'AVERAGE': 5.5,
-        'DISLIKED': 3.0
-    }
-    current_rating = emotion_baselines.get(emotion, 7.0)
+    current_rating = EMOTION_BASELINES.get(emotion, DEFAULT_BASELINE)
     
     if show_details:
-        print(f"    Start: {emotion} baseline → {current_rating}")
+        emit(ROUND, f"    Start: {emotion} baseline → {current_rating}")
     
     for i, (opponent_rating, new_movie_won) in enumerate(zip(opponents, results)):
         if new_movie_won:
@@ -123,7 +76,7 @@ def wildcard_system(emotion, opponents, results, show_details=True):
             current_rating = new_loser_rating
         
         if show_details:
-            print(f"    R{i+1}: {'WIN' if new_movie_won else 'LOSS'} vs {opponent_rating} → {current_rating}")
+            emit(ROUND, f"    R{i+1}: {'WIN' if new_movie_won else 'LOSS'} vs {opponent_rating} → {current_rating}")
     
     return current_rating
 
@@ -187,110 +140,177 @@ extended_scenarios = [
     }
 ]
 
-print("🎬🔥 EXTENDED SIMULATION: Round 2")
-print("=" * 80)
-print("Testing edge cases and extreme scenarios")
-print("=" * 80)
+def rate_scenario(cache, scenario, show_details=False):
+    """(home_result, wildcard_result) through the result cache
 
-total_differences = []
-home_higher_count = 0
-wildcard_higher_count = 0
-identical_count = 0
+    Round-by-round output needs the real run, so show_details always computes.
+    """
+    emotion, opponents, results = scenario['emotion'], scenario['opponents'], scenario['results']
+    home_key = fingerprint('baseline_free', emotion, opponents, results)
+    wildcard_key = fingerprint('wildcard', emotion, opponents, results)
+    if show_details:
+        cache.put(home_key, home_screen_system(opponents, results, True))
+        cache.put(wildcard_key, wildcard_system(emotion, opponents, results, True))
+    home_result = cache.get_or_compute(home_key, lambda: home_screen_system(opponents, results, False))
+    wildcard_result = cache.get_or_compute(wildcard_key, lambda: wildcard_system(emotion, opponents, results, False))
+    return home_result, wildcard_result
 
-for i, scenario in enumerate(extended_scenarios, 1):
-    print(f"\n🎭 TEST {i}: {scenario['name']}")
-    print(f"📝 {scenario['description']}")
-    print(f"😀 Emotion: {scenario['emotion']} | 🥊 Opponents: {scenario['opponents']}")
-    print(f"⚔️  Results: {['WIN' if r else 'LOSS' for r in scenario['results']]}")
-    print()
-    
-    # Run both systems
-    home_result = home_screen_system(scenario['opponents'], scenario['results'])
-    wildcard_result = wildcard_system(scenario['emotion'], scenario['opponents'], scenario['results'])
-    
-    # Analysis
-    difference = abs(home_result - wildcard_result)
-    total_differences.append(difference)
-    
-    print(f"\n📊 RESULTS:")
-    print(f"   🏠 Home Screen: {home_result:.1f}")
-    print(f"   🃏 Wildcard:    {wildcard_result:.1f}")
-    print(f"   📏 Difference:  {difference:.1f}")
-    
-    # Categorize results
-    if difference == 0.0:
-        print("   ✅ IDENTICAL!")
-        identical_count += 1
-    elif home_result > wildcard_result:
-        print(f"   📈 Home Screen +{difference:.1f} higher")
-        home_higher_count += 1
-    else:
-        print(f"   📈 Wildcard +{difference:.1f} higher")
-        wildcard_higher_count += 1
-    
-    # Impact analysis
-    if difference >= 3.0:
-        print("   🚨 MASSIVE DIFFERENCE - Systems fundamentally disagree")
-    elif difference >= 2.0:
-        print("   ⚠️  LARGE DIFFERENCE - Significant philosophical gap")
-    elif difference >= 1.0:
-        print("   📊 MODERATE DIFFERENCE - Expected variance")
-    elif difference >= 0.5:
-        print("   👍 MINOR DIFFERENCE - Close alignment")
-    else:
-        print("   ✨ VERY CLOSE - Nearly identical")
+
+def run_extended_simulation(scenarios=None, cache=None):
+    """Run the edge-case scenarios and print the pattern analysis"""
+    if scenarios is None:
+        scenarios = extended_scenarios
+    if cache is None:
+        cache = get_result_cache()
     
-    print("=" * 80)
+    show_rounds = get_reporter().text_enabled(ROUND)
 
-# Summary statistics
-avg_difference = sum(total_differences) / len(total_differences)
-max_difference = max(total_differences)
-min_difference = min(total_differences)
+    emit(SUMMARY, "🎬🔥 EXTENDED SIMULATION: Round 2")
+    emit(SUMMARY, "=" * 80)
+    emit(SUMMARY, "Testing edge cases and extreme scenarios")
+    emit(SUMMARY, "=" * 80)
 
-print(f"\n🏆 EXTENDED SIMULATION SUMMARY")
-print("=" * 80)
-print(f"📊 Total scenarios tested: {len(extended_scenarios)}")
-print(f"📈 Home Screen rated higher: {home_higher_count}")
-print(f"📈 Wildcard rated higher: {wildcard_higher_count}")
-print(f"⚖️  Identical results: {identical_count}")
-print(f"📏 Average difference: {avg_difference:.2f}")
-print(f"📏 Maximum difference: {max_difference:.1f}")
-print(f"📏 Minimum difference: {min_difference:.1f}")
+    total_differences = []
+    home_higher_count = 0
+    wildcard_higher_count = 0
+    identical_count = 0
 
-# Pattern analysis
-print(f"\n🔍 PATTERN ANALYSIS:")
+    for i, scenario in enumerate(scenarios, 1):
+        emit(SCENARIO, f"\n🎭 TEST {i}: {scenario['name']}")
+        emit(SCENARIO, f"📝 {scenario['description']}")
+        emit(SCENARIO, f"😀 Emotion: {scenario['emotion']} | 🥊 Opponents: {scenario['opponents']}")
+        emit(SCENARIO, f"⚔️  Results: {['WIN' if r else 'LOSS' for r in scenario['results']]}")
+        emit(SCENARIO)
+        
+        # Run both systems
+        home_result, wildcard_result = rate_scenario(cache, scenario, show_rounds)
+        
+        # Analysis
+        difference = abs(home_result - wildcard_result)
+        total_differences.append(difference)
+        
+        emit(SCENARIO, f"\n📊 RESULTS:")
+        emit(SCENARIO, f"   🏠 Home Screen: {home_result:.1f}")
+        emit(SCENARIO, f"   🃏 Wildcard:    {wildcard_result:.1f}")
+        emit(SCENARIO, f"   📏 Difference:  {difference:.1f}")
+        
+        # Categorize results
+        if difference == 0.0:
+            emit(SCENARIO, "   ✅ IDENTICAL!")
+            identical_count += 1
+        elif home_result > wildcard_result:
+            emit(SCENARIO, f"   📈 Home Screen +{difference:.1f} higher")
+            home_higher_count += 1
+        else:
+            emit(SCENARIO, f"   📈 Wildcard +{difference:.1f} higher")
+            wildcard_higher_count += 1
+        
+        # Impact analysis
+        if difference >= 3.0:
+            emit(SCENARIO, "   🚨 MASSIVE DIFFERENCE - Systems fundamentally disagree")
+        elif difference >= 2.0:
+            emit(SCENARIO, "   ⚠️  LARGE DIFFERENCE - Significant philosophical gap")
+        elif difference >= 1.0:
+            emit(SCENARIO, "   📊 MODERATE DIFFERENCE - Expected variance")
+        elif difference >= 0.5:
+            emit(SCENARIO, "   👍 MINOR DIFFERENCE - Close alignment")
+        else:
+            emit(SCENARIO, "   ✨ VERY CLOSE - Nearly identical")
+        
+        emit_record(
+            SCENARIO, 'scenario',
+            name=scenario['name'],
+            emotion=scenario['emotion'],
+            opponents=scenario['opponents'],
+            results=scenario['results'],
+            home=home_result,
+            wildcard=wildcard_result,
+            difference=difference
+        )
+        emit(SCENARIO, "=" * 80)
 
-# Analyze by emotion
-emotions_analysis = {}
-for i, scenario in enumerate(extended_scenarios):
-    emotion = scenario['emotion']
-    if emotion not in emotions_analysis:
-        emotions_analysis[emotion] = {'count': 0, 'total_diff': 0, 'home_higher': 0, 'wildcard_higher': 0}
-    
-    emotions_analysis[emotion]['count'] += 1
-    emotions_analysis[emotion]['total_diff'] += total_differences[i]
-    
-    home_result = home_screen_system(scenario['opponents'], scenario['results'], False)
-    wildcard_result = wildcard_system(scenario['emotion'], scenario['opponents'], scenario['results'], False)
+    # Summary statistics
+    avg_difference = sum(total_differences) / len(total_differences)
+    max_difference = max(total_differences)
+    min_difference = min(total_differences)
+
+    emit(SUMMARY, f"\n🏆 EXTENDED SIMULATION SUMMARY")
+    emit(SUMMARY, "=" * 80)
+    emit(SUMMARY, f"📊 Total scenarios tested: {len(scenarios)}")
+    emit(SUMMARY, f"📈 Home Screen rated higher: {home_higher_count}")
+    emit(SUMMARY, f"📈 Wildcard rated higher: {wildcard_higher_count}")
+    emit(SUMMARY, f"⚖️  Identical results: {identical_count}")
+    emit(SUMMARY, f"📏 Average difference: {avg_difference:.2f}")
+    emit(SUMMARY, f"📏 Maximum difference: {max_difference:.1f}")
+    emit(SUMMARY, f"📏 Minimum difference: {min_difference:.1f}")
+
+    # Pattern analysis
+    emit(SUMMARY, f"\n🔍 PATTERN ANALYSIS:")
+
+    # Analyze by emotion
+    emotions_analysis = {}
+    for i, scenario in enumerate(scenarios):
+        emotion = scenario['emotion']
+        if emotion not in emotions_analysis:
+            emotions_analysis[emotion] = {'count': 0, 'total_diff': 0, 'home_higher': 0, 'wildcard_higher': 0}
+        
+        emotions_analysis[emotion]['count'] += 1
+        emotions_analysis[emotion]['total_diff'] += total_differences[i]
+        
+        # Already rated above; the cache returns the same results without re-running them
+        home_result, wildcard_result = rate_scenario(cache, scenario)
+        
+        if home_result > wildcard_result:
+            emotions_analysis[emotion]['home_higher'] += 1
+        elif wildcard_result > home_result:
+            emotions_analysis[emotion]['wildcard_higher'] += 1
+
+    emit(SUMMARY, "📈 By Emotion:")
+    for emotion, stats in emotions_analysis.items():
+        avg_diff = stats['total_diff'] / stats['count']
+        emit(SUMMARY, f"   {emotion}: Avg diff {avg_diff:.2f} | Home higher: {stats['home_higher']} | Wildcard higher: {stats['wildcard_higher']}")
+
+    emit(SUMMARY, f"\n💡 KEY INSIGHTS:")
+    if home_higher_count > wildcard_higher_count:
+        emit(SUMMARY, "🏠 Home Screen tends to rate movies HIGHER overall")
+        emit(SUMMARY, "   → Baseline-free system rewards actual performance vs opponent quality")
+    elif wildcard_higher_count > home_higher_count:
+        emit(SUMMARY, "🃏 Wildcard tends to rate movies HIGHER overall") 
+        emit(SUMMARY, "   → Emotion baselines create rating inflation/deflation")
+    else:
+        emit(SUMMARY, "⚖️  Both systems are balanced in their rating tendencies")
+
+    emit(SUMMARY, f"🎯 The average {avg_difference:.2f} point difference shows how much emotion baselines impact final ratings!")
+
+    summary = dict(
+        scenarios=len(scenarios),
+        home_higher=home_higher_count,
+        wildcard_higher=wildcard_higher_count,
+        identical=identical_count,
+        average_difference=avg_difference,
+        maximum_difference=max_difference,
+        minimum_difference=min_difference,
+        emotions=emotions_analysis
+    )
+    emit_record(SUMMARY, 'summary', **summary)
     
-    if home_result > wildcard_result:
-        emotions_analysis[emotion]['home_higher'] += 1
-    elif wildcard_result > home_result:
-        emotions_analysis[emotion]['wildcard_higher'] += 1
+    return summary
+
 
-print("📈 By Emotion:")
-for emotion, stats in emotions_analysis.items():
-    avg_diff = stats['total_diff'] / stats['count']
-    print(f"   {emotion}: Avg diff {avg_diff:.2f} | Home higher: {stats['home_higher']} | Wildcard higher: {stats['wildcard_higher']}")
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extended Home Screen vs Wildcard simulation")
+    parser.add_argument('--cache-file', help="SQLite file that keeps computed ratings between runs")
+    add_output_arguments(parser)
+    args = parser.parse_args(argv)
+    configure_output(args)
+    if args.cache_file is None:
+        return run_extended_simulation()
+    cache = ResultCache(path=args.cache_file)
+    try:
+        return run_extended_simulation(cache=cache)
+    finally:
+        cache.close()
 
-print(f"\n💡 KEY INSIGHTS:")
-if home_higher_count > wildcard_higher_count:
-    print("🏠 Home Screen tends to rate movies HIGHER overall")
-    print("   → Baseline-free system rewards actual performance vs opponent quality")
-elif wildcard_higher_count > home_higher_count:
-    print("🃏 Wildcard tends to rate movies HIGHER overall") 
-    print("   → Emotion baselines create rating inflation/deflation")
-else:
-    print("⚖️  Both systems are balanced in their rating tendencies")
 
-print(f"🎯 The average {avg_difference:.2f} point difference shows how much emotion baselines impact final ratings!")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
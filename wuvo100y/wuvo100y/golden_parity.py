@@ -0,0 +1,81 @@
+# GOLDEN PARITY: Does the Python engine really reproduce Wildcard's adjustRatingWildcard?
+# Writes every grid input with the Python results to a compressed corpus, then replays it through the app's JS in one node process
+
+import argparse
+import os
+import tempfile
+import time
+
+from rating_core.golden import JS_SOURCE, check_parity, read_corpus, write_corpus
+from rating_core.output import SCENARIO, SUMMARY, add_output_arguments, configure_output, emit, emit_record
+
+# Regenerated on demand, so it lives outside the project directory
+DEFAULT_CORPUS = os.path.join(tempfile.gettempdir(), 'wildcard_golden.bin')
+
+
+def print_report(report, elapsed):
+    emit(SUMMARY, "=" * 80)
+    emit(SUMMARY, "🏆 PYTHON / JS PARITY")
+    emit(SUMMARY, "=" * 80)
+    emit(SUMMARY, f"Vectors checked: {report.vectors:,}")
+    emit(SUMMARY, f"Mismatches: {report.mismatches:,} ({report.mismatches / max(report.vectors, 1):.2%}) → "
+                  f"winner {report.winner_mismatches:,}, loser {report.loser_mismatches:,}, largest error {report.max_error:.1f}")
+    if report.k_factor_mismatches:
+        for games, python, js in report.k_factor_mismatches:
+            emit(SUMMARY, f"❌ calculateKFactor({games}): Python {python}, JS {js}")
+    else:
+        emit(SUMMARY, "✅ calculateKFactor matches for every games count")
+
+    emit(SUMMARY, "\n🧮 MISMATCHES BY RULE (Python's branch):")
+    for rule, (fired, wrong) in report.by_rule.items():
+        emit(SUMMARY, f"   {rule}: {wrong:,} of {fired:,}")
+    if report.examples:
+        emit(SCENARIO, "\n🔍 FIRST MISMATCHES:")
+        for example in report.examples:
+            emit(SCENARIO, f"   {example['winner']} beats {example['loser']} (games {example['winner_games']}/{example['loser_games']}): "
+                           f"Python {example['python']}, JS {example['js']}")
+
+    emit(SUMMARY, f"\n{'✅ PARITY' if not report.mismatches and not report.k_factor_mismatches else '🚨 NO PARITY'}")
+    emit(SUMMARY, f"⏱️  {elapsed:.2f}s")
+    emit_record(SUMMARY, 'summary', elapsed=elapsed, **report._asdict())
+
+
+def corpus_is_current(path, max_games):
+    """Whether `path` holds a readable corpus covering games 0..max_games"""
+    if not os.path.exists(path):
+        return False
+    try:
+        return read_corpus(path).metadata['max_games'] == max_games
+    except ValueError:
+        return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Golden-vector parity check of the Python engine against the app's JS")
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS,
+                        help="golden corpus path (rewritten if missing or built for another --max-games)")
+    parser.add_argument('--write', action='store_true', help="regenerate the corpus even if it exists")
+    parser.add_argument('--max-games', type=int, default=24, help="games-played counts 0..N for both sides")
+    parser.add_argument('--js', default=JS_SOURCE, help="file defining adjustRatingWildcard and calculateKFactor")
+    parser.add_argument('--node', default=None, help="node executable (default: from PATH)")
+    parser.add_argument('--examples', type=int, default=10)
+    parser.add_argument('--no-check', action='store_true', help="only write the corpus")
+    add_output_arguments(parser)
+    args = parser.parse_args(argv)
+    configure_output(args)
+
+    emit(SUMMARY, "🥇🎬 GOLDEN PARITY: Python engine vs EnhancedRatingSystem.js")
+    start = time.perf_counter()
+    if args.write or not corpus_is_current(args.corpus, args.max_games):
+        count = write_corpus(args.corpus, args.max_games)
+        emit(SUMMARY, f"💾 Wrote {count:,} vectors to {args.corpus} ({os.path.getsize(args.corpus):,} bytes)")
+    if args.no_check:
+        return None
+
+    report = check_parity(args.corpus, args.js, args.node, args.examples)
+    print_report(report, time.perf_counter() - start)
+    return report
+
+
+if __name__ == "__main__":
+    main()
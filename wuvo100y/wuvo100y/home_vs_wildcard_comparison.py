@@ -1,61 +1,20 @@
 # HOME SCREEN vs WILDCARD COMPARISON
 # Detailed side-by-side comparison of both rating systems
 
-import math
+from rating_core import set_trace_hook, wildcard_adjust_rating
+from rating_core.engines import DEFAULT_BASELINE, EMOTION_BASELINES
+from rating_core.output import ROUND, SCENARIO, SUMMARY, emit, emit_record, get_reporter, parse_output_args
 
-# Wildcard's exact adjustRating function
-def wildcard_adjust_rating(winner_rating, loser_rating, winner_won, winner_games_played=0, loser_games_played=0):
-    """Wildcard's exact ELO logic"""
-    
-    # Calculate K-factor (Wildcard's logic)
-    def calculate_k_factor(games_played):
-        if games_played < 5:
-            return 0.5
-        elif games_played < 10:
-            return 0.25
-        elif games_played < 20:
-            return 0.125
-        return 0.1
-    
-    rating_difference = abs(winner_rating - loser_rating)
-    expected_win_probability = 1 / (1 + math.pow(10, (loser_rating - winner_rating) / 4))
-    
-    winner_k = calculate_k_factor(winner_games_played)
-    loser_k = calculate_k_factor(loser_games_played)
-    
-    winner_increase = max(0.1, winner_k * (1 - expected_win_probability))
-    loser_decrease = max(0.1, loser_k * (1 - expected_win_probability))
-    
-    # Underdog bonus
-    if winner_rating < loser_rating:
-        winner_increase *= 1.2
-    
-    # Major upset bonus
-    is_major_upset = winner_rating < loser_rating and rating_difference > 3.0
-    if is_major_upset:
-        winner_increase += 3.0
-        print(f"  🚨 MAJOR UPSET! Winner ({winner_rating}) defeated Loser ({loser_rating}). +3.0 bonus!")
-    
-    # Apply limits
-    MAX_RATING_CHANGE = 0.7
-    if not is_major_upset:
-        winner_increase = min(MAX_RATING_CHANGE, winner_increase)
-        loser_decrease = min(MAX_RATING_CHANGE, loser_decrease)
-    
-    new_winner_rating = winner_rating + winner_increase
-    new_loser_rating = loser_rating - loser_decrease
-    
-    # Bounds enforcement
-    new_winner_rating = round(min(10, max(1, new_winner_rating)) * 10) / 10
-    new_loser_rating = round(min(10, max(1, new_loser_rating)) * 10) / 10
-    
-    return new_winner_rating, new_loser_rating
+def print_major_upset(trace):
+    """Console trace for the major upset bonus"""
+    if trace.is_major_upset:
+        emit(ROUND, f"  🚨 MAJOR UPSET! Winner ({trace.winner_rating}) defeated Loser ({trace.loser_rating}). +3.0 bonus!")
 
 # HOME SCREEN: Baseline-Free Unknown vs Known approach
 def home_screen_system(opponents, results):
     """Current Home Screen implementation (baseline-free)"""
     
-    print("  🏠 HOME SCREEN SYSTEM:")
+    emit(ROUND, "  🏠 HOME SCREEN SYSTEM:")
     
     # FIRST COMPARISON: Unknown vs Known (derive rating from comparison outcome)
     opponent_rating = opponents[0]
@@ -64,11 +23,11 @@ def home_screen_system(opponents, results):
     if new_movie_won:
         # If unknown movie won, it should be rated higher than opponent
         derived_rating = min(10, opponent_rating + 0.5)
-        print(f"    Round 1: Unknown movie WON vs {opponent_rating} → Initial rating: {derived_rating}")
+        emit(ROUND, f"    Round 1: Unknown movie WON vs {opponent_rating} → Initial rating: {derived_rating}")
     else:
         # If unknown movie lost, it should be rated lower than opponent  
         derived_rating = max(1, opponent_rating - 0.5)
-        print(f"    Round 1: Unknown movie LOST vs {opponent_rating} → Initial rating: {derived_rating}")
+        emit(ROUND, f"    Round 1: Unknown movie LOST vs {opponent_rating} → Initial rating: {derived_rating}")
     
     # Round to nearest 0.1
     current_rating = round(derived_rating * 10) / 10
@@ -87,7 +46,7 @@ def home_screen_system(opponents, results):
                 5                 # Opponent has experience
             )
             current_rating = new_winner_rating
-            print(f"    Round {i+1}: Movie ({current_rating - (new_winner_rating - current_rating):.1f}) WON vs {opponent_rating} → {current_rating}")
+            emit(ROUND, f"    Round {i+1}: Movie ({current_rating - (new_winner_rating - current_rating):.1f}) WON vs {opponent_rating} → {current_rating}")
         else:
             new_winner_rating, new_loser_rating = wildcard_adjust_rating(
                 opponent_rating,   # Opponent won
@@ -98,25 +57,19 @@ def home_screen_system(opponents, results):
             )
             old_rating = current_rating
             current_rating = new_loser_rating
-            print(f"    Round {i+1}: Movie ({old_rating}) LOST vs {opponent_rating} → {current_rating}")
+            emit(ROUND, f"    Round {i+1}: Movie ({old_rating}) LOST vs {opponent_rating} → {current_rating}")
     
-    print(f"  🏠 HOME FINAL RATING: {current_rating}")
+    emit(ROUND, f"  🏠 HOME FINAL RATING: {current_rating}")
     return current_rating
 
 # WILDCARD SYSTEM: With emotion baselines (original Wildcard behavior)
 def wildcard_system(emotion, opponents, results):
     """Original Wildcard system with emotion baselines"""
     
-    print("  🃏 WILDCARD SYSTEM:")
+    emit(ROUND, "  🃏 WILDCARD SYSTEM:")
     
-    emotion_baselines = {
-        'LOVED': 8.5,
-        'LIKED': 7.0,
-        'AVERAGE': 5.5,
-        'DISLIKED': 3.0
-    }
-    current_rating = emotion_baselines.get(emotion, 7.0)
-    print(f"    Starting with {emotion} baseline: {current_rating}")
+    current_rating = EMOTION_BASELINES.get(emotion, DEFAULT_BASELINE)
+    emit(ROUND, f"    Starting with {emotion} baseline: {current_rating}")
     
     for i, (opponent_rating, new_movie_won) in enumerate(zip(opponents, results)):
         if new_movie_won:
@@ -129,7 +82,7 @@ def wildcard_system(emotion, opponents, results):
             )
             old_rating = current_rating
             current_rating = new_winner_rating
-            print(f"    Round {i+1}: Movie ({old_rating}) WON vs {opponent_rating} → {current_rating}")
+            emit(ROUND, f"    Round {i+1}: Movie ({old_rating}) WON vs {opponent_rating} → {current_rating}")
         else:
             new_winner_rating, new_loser_rating = wildcard_adjust_rating(
                 opponent_rating,   # Opponent won
@@ -140,9 +93,9 @@ def wildcard_system(emotion, opponents, results):
             )
             old_rating = current_rating
             current_rating = new_loser_rating
-            print(f"    Round {i+1}: Movie ({old_rating}) LOST vs {opponent_rating} → {current_rating}")
+            emit(ROUND, f"    Round {i+1}: Movie ({old_rating}) LOST vs {opponent_rating} → {current_rating}")
     
-    print(f"  🃏 WILDCARD FINAL RATING: {current_rating}")
+    emit(ROUND, f"  🃏 WILDCARD FINAL RATING: {current_rating}")
     return current_rating
 
 # Test scenarios
@@ -184,63 +137,104 @@ test_scenarios = [
     }
 ]
 
-print("🎬🆚🃏 HOME SCREEN vs WILDCARD SYSTEM COMPARISON")
-print("=" * 80)
-print("Detailed side-by-side rating calculations")
-print("=" * 80)
-
-for i, scenario in enumerate(test_scenarios, 1):
-    print(f"\n🎭 TEST {i}: {scenario['name']}")
-    print(f"📝 Description: {scenario['description']}")
-    print(f"😀 Emotion: {scenario['emotion']}")
-    print(f"🥊 Opponents: {scenario['opponents']}")
-    print(f"⚔️  Battle Results: {['WIN' if r else 'LOSS' for r in scenario['results']]}")
-    print()
-    
-    # Run both systems
-    home_result = home_screen_system(scenario['opponents'], scenario['results'])
-    print()
-    wildcard_result = wildcard_system(scenario['emotion'], scenario['opponents'], scenario['results'])
-    
-    # Comparison
-    difference = abs(home_result - wildcard_result)
-    print(f"\n📊 COMPARISON:")
-    print(f"   🏠 Home Screen (baseline-free): {home_result:.1f}")
-    print(f"   🃏 Wildcard (with baseline):    {wildcard_result:.1f}")
-    print(f"   📏 Difference:                  {difference:.1f}")
-    
-    if difference == 0.0:
-        print("   ✅ IDENTICAL RESULTS!")
-    elif difference <= 0.5:
-        print("   ✅ VERY CLOSE - Minor difference")
-    elif difference <= 1.0:
-        print("   ⚠️  MODERATE - Expected due to different starting approaches")
-    elif difference <= 2.0:
-        print("   ⚠️  NOTICEABLE - Different philosophies showing")
-    else:
-        print("   🚨 LARGE DIFFERENCE - Significantly different outcomes")
-    
-    # Determine which system rated higher
-    if home_result > wildcard_result:
-        print(f"   📈 Home Screen rated {difference:.1f} points HIGHER")
-    elif wildcard_result > home_result:
-        print(f"   📈 Wildcard rated {difference:.1f} points HIGHER") 
+def run_comparison(scenarios=None):
+    """Side-by-side Home Screen vs Wildcard calculation for each scenario"""
+    if scenarios is None:
+        scenarios = test_scenarios
+    
+    emit(SUMMARY, "🎬🆚🃏 HOME SCREEN vs WILDCARD SYSTEM COMPARISON")
+    emit(SUMMARY, "=" * 80)
+    emit(SUMMARY, "Detailed side-by-side rating calculations")
+    emit(SUMMARY, "=" * 80)
+
+    total_difference = 0
+    max_difference = 0
+
+    for i, scenario in enumerate(scenarios, 1):
+        emit(SCENARIO, f"\n🎭 TEST {i}: {scenario['name']}")
+        emit(SCENARIO, f"📝 Description: {scenario['description']}")
+        emit(SCENARIO, f"😀 Emotion: {scenario['emotion']}")
+        emit(SCENARIO, f"🥊 Opponents: {scenario['opponents']}")
+        emit(SCENARIO, f"⚔️  Battle Results: {['WIN' if r else 'LOSS' for r in scenario['results']]}")
+        emit(SCENARIO)
+        
+        # Run both systems
+        home_result = home_screen_system(scenario['opponents'], scenario['results'])
+        emit(ROUND)
+        wildcard_result = wildcard_system(scenario['emotion'], scenario['opponents'], scenario['results'])
+        
+        # Comparison
+        difference = abs(home_result - wildcard_result)
+        emit(SCENARIO, f"\n📊 COMPARISON:")
+        emit(SCENARIO, f"   🏠 Home Screen (baseline-free): {home_result:.1f}")
+        emit(SCENARIO, f"   🃏 Wildcard (with baseline):    {wildcard_result:.1f}")
+        emit(SCENARIO, f"   📏 Difference:                  {difference:.1f}")
+        
+        if difference == 0.0:
+            emit(SCENARIO, "   ✅ IDENTICAL RESULTS!")
+        elif difference <= 0.5:
+            emit(SCENARIO, "   ✅ VERY CLOSE - Minor difference")
+        elif difference <= 1.0:
+            emit(SCENARIO, "   ⚠️  MODERATE - Expected due to different starting approaches")
+        elif difference <= 2.0:
+            emit(SCENARIO, "   ⚠️  NOTICEABLE - Different philosophies showing")
+        else:
+            emit(SCENARIO, "   🚨 LARGE DIFFERENCE - Significantly different outcomes")
+        
+        # Determine which system rated higher
+        if home_result > wildcard_result:
+            emit(SCENARIO, f"   📈 Home Screen rated {difference:.1f} points HIGHER")
+        elif wildcard_result > home_result:
+            emit(SCENARIO, f"   📈 Wildcard rated {difference:.1f} points HIGHER") 
+        
+        emit(SCENARIO, "=" * 80)
+        
+        total_difference += difference
+        max_difference = max(max_difference, difference)
+        emit_record(
+            SCENARIO, 'scenario',
+            name=scenario['name'],
+            emotion=scenario['emotion'],
+            opponents=scenario['opponents'],
+            results=scenario['results'],
+            home=home_result,
+            wildcard=wildcard_result,
+            difference=difference
+        )
+
+    summary = dict(
+        scenarios=len(scenarios),
+        average_difference=total_difference / len(scenarios),
+        maximum_difference=max_difference
+    )
+    emit_record(SUMMARY, 'summary', **summary)
+
+    emit(SUMMARY, "\n🎯 SYSTEM ANALYSIS:")
+    emit(SUMMARY, "🏠 HOME SCREEN (Baseline-Free):")
+    emit(SUMMARY, "   • First rating derived purely from comparison outcome")
+    emit(SUMMARY, "   • No emotion bias in starting rating")
+    emit(SUMMARY, "   • Subsequent rounds use Wildcard ELO logic")
+    emit(SUMMARY, "   • More 'fair' as rating based on actual performance")
+
+    emit(SUMMARY, "\n🃏 WILDCARD (With Baselines):")
+    emit(SUMMARY, "   • Starts with predetermined emotion rating")
+    emit(SUMMARY, "   • LOVED movies start at 8.5, DISLIKED at 3.0")
+    emit(SUMMARY, "   • All rounds use same ELO logic")
+    emit(SUMMARY, "   • Emotion influences final rating significantly")
+
+    emit(SUMMARY, "\n💡 KEY INSIGHT:")
+    emit(SUMMARY, "Home Screen removes emotion bias - ratings are now purely performance-based!")
+    emit(SUMMARY, "The difference in results shows how much emotion baselines influenced ratings.")
     
-    print("=" * 80)
-
-print("\n🎯 SYSTEM ANALYSIS:")
-print("🏠 HOME SCREEN (Baseline-Free):")
-print("   • First rating derived purely from comparison outcome")
-print("   • No emotion bias in starting rating")
-print("   • Subsequent rounds use Wildcard ELO logic")
-print("   • More 'fair' as rating based on actual performance")
-
-print("\n🃏 WILDCARD (With Baselines):")
-print("   • Starts with predetermined emotion rating")
-print("   • LOVED movies start at 8.5, DISLIKED at 3.0")
-print("   • All rounds use same ELO logic")
-print("   • Emotion influences final rating significantly")
-
-print("\n💡 KEY INSIGHT:")
-print("Home Screen removes emotion bias - ratings are now purely performance-based!")
-print("The difference in results shows how much emotion baselines influenced ratings.")
\ No newline at end of file
+    return summary
+
+
+def main(argv=None):
+    parse_output_args("Side-by-side Home Screen vs Wildcard comparison", argv)
+    if get_reporter().text_enabled(ROUND):
+        set_trace_hook(print_major_upset)
+    return run_comparison()
+
+
+if __name__ == "__main__":
+    main()
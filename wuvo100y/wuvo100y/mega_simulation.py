@@ -1,69 +1,56 @@
 # MEGA SIMULATION: 10 Movies - Wildcard vs Home Screen Rating Systems
 # Comprehensive test with diverse emotions and battle scenarios
 
-import math
-import random
+import argparse
 
-# Wildcard's exact adjustRating function
-def wildcard_adjust_rating(winner_rating, loser_rating, winner_won, winner_games_played=0, loser_games_played=0):
-    """Wildcard's exact ELO logic"""
-    
-    # Calculate K-factor (Wildcard's logic)
-    def calculate_k_factor(games_played):
-        if games_played < 5:
-            return 0.5
-        elif games_played < 10:
-            return 0.25
-        elif games_played < 20:
-            return 0.125
-        return 0.1
-    
-    rating_difference = abs(winner_rating - loser_rating)
-    expected_win_probability = 1 / (1 + math.pow(10, (loser_rating - winner_rating) / 4))
-    
-    winner_k = calculate_k_factor(winner_games_played)
-    loser_k = calculate_k_factor(loser_games_played)
-    
-    winner_increase = max(0.1, winner_k * (1 - expected_win_probability))
-    loser_decrease = max(0.1, loser_k * (1 - expected_win_probability))
-    
-    # Underdog bonus
-    if winner_rating < loser_rating:
-        winner_increase *= 1.2
-    
-    # Major upset bonus
-    is_major_upset = winner_rating < loser_rating and rating_difference > 3.0
-    if is_major_upset:
-        winner_increase += 3.0
-        print(f"🚨 WILDCARD MAJOR UPSET! Winner ({winner_rating}) defeated Loser ({loser_rating}). +3.0 bonus!")
-    
-    # Apply limits
-    MAX_RATING_CHANGE = 0.7
-    if not is_major_upset:
-        winner_increase = min(MAX_RATING_CHANGE, winner_increase)
-        loser_decrease = min(MAX_RATING_CHANGE, loser_decrease)
-    
-    new_winner_rating = winner_rating + winner_increase
-    new_loser_rating = loser_rating - loser_decrease
-    
-    # Bounds enforcement
-    new_winner_rating = round(min(10, max(1, new_winner_rating)) * 10) / 10
-    new_loser_rating = round(min(10, max(1, new_loser_rating)) * 10) / 10
-    
-    return new_winner_rating, new_loser_rating
+from rating_core import engines, set_trace_hook, wildcard_adjust_rating
+from rating_core.engines import DEFAULT_BASELINE, EMOTION_BASELINES
+from rating_core.output import (
+    ROUND,
+    SCENARIO,
+    SUMMARY,
+    add_output_arguments,
+    configure_output,
+    emit,
+    emit_record,
+    get_reporter,
+)
+from rating_core.reanalysis import DEFAULT_THRESHOLDS, DifferenceCounts, Thresholds, difference_category, verdict
+from rating_core.scenarios import generate_scenarios
+from rating_core.streaming import ResultsAnalysis, analyze_stream
+
+# Per-movie detail lines kept for the final report (everything else is streamed)
+DETAIL_LIMIT = 100
+
+DIFFERENCE_LABELS = {
+    'perfect': "   ✅ PERFECT MATCH",
+    'excellent': "   ✅ EXCELLENT (minor rounding)",
+    'acceptable': "   ⚠️  ACCEPTABLE (small variance)",
+    'significant': "   🚨 SIGNIFICANT DIFFERENCE"
+}
+
+VERDICTS = {
+    'excellent': ("\n🎯 VERDICT: EXCELLENT ALIGNMENT",
+                  "Both systems are virtually identical in their rating calculations."),
+    'good': ("\n✅ VERDICT: GOOD ALIGNMENT",
+             "Systems are well-aligned with minor acceptable differences."),
+    'acceptable': ("\n👍 VERDICT: ACCEPTABLE ALIGNMENT",
+                   "No major differences detected, minor variances within tolerance."),
+    'investigate': ("\n⚠️ VERDICT: NEEDS INVESTIGATION",
+                    "Significant differences detected that may require analysis.")
+}
+
+def print_major_upset(trace):
+    """Console trace for the major upset bonus"""
+    if trace.is_major_upset:
+        emit(ROUND, f"🚨 WILDCARD MAJOR UPSET! Winner ({trace.winner_rating}) defeated Loser ({trace.loser_rating}). +3.0 bonus!")
 
 # Home Screen's Unknown vs Known approach
 def home_screen_unknown_vs_known(emotion, opponents, results):
     """Home Screen's Unknown vs Known then Known vs Known approach"""
     
     # Use emotion as a baseline for the unknown movie in the comparison
-    emotion_baselines = {
-        'LOVED': 8.5,
-        'LIKED': 7.0,
-        'AVERAGE': 5.5,
-        'DISLIKED': 3.0
-    }
-    emotion_baseline = emotion_baselines.get(emotion, 7.0)
+    emotion_baseline = EMOTION_BASELINES.get(emotion, DEFAULT_BASELINE)
     
     # FIRST COMPARISON: Unknown vs Known
     opponent_rating = opponents[0]
@@ -90,7 +77,8 @@ def home_screen_unknown_vs_known(emotion, opponents, results):
         )
         current_rating = new_loser_rating
     
-    print(f"HOME Round 1 (Unknown vs Known): {current_rating}")
+    emit(ROUND, f"HOME Round 1 (Unknown vs Known): {current_rating}")
+    emit_record(ROUND, 'round', system='home', round=1, rating=current_rating)
     
     # SUBSEQUENT COMPARISONS: Known vs Known
     for i in range(1, len(opponents)):
@@ -116,20 +104,15 @@ def home_screen_unknown_vs_known(emotion, opponents, results):
             )
             current_rating = new_loser_rating
         
-        print(f"HOME Round {i+1} (Known vs Known): {current_rating}")
+        emit(ROUND, f"HOME Round {i+1} (Known vs Known): {current_rating}")
+        emit_record(ROUND, 'round', system='home', round=i + 1, rating=current_rating)
     
     return current_rating
 
 # Wildcard simulation (for comparison)
 def wildcard_simulation(emotion, opponents, results):
     """Simulate how Wildcard would handle the same scenario"""
-    emotion_baselines = {
-        'LOVED': 8.5,
-        'LIKED': 7.0,
-        'AVERAGE': 5.5,
-        'DISLIKED': 3.0
-    }
-    current_rating = emotion_baselines.get(emotion, 7.0)
+    current_rating = EMOTION_BASELINES.get(emotion, DEFAULT_BASELINE)
     
     for i, (opponent_rating, new_movie_won) in enumerate(zip(opponents, results)):
         if new_movie_won:
@@ -151,7 +134,8 @@ def wildcard_simulation(emotion, opponents, results):
             )
             current_rating = new_loser_rating
         
-        print(f"WILDCARD Round {i+1}: {current_rating}")
+        emit(ROUND, f"WILDCARD Round {i+1}: {current_rating}")
+        emit_record(ROUND, 'round', system='wildcard', round=i + 1, rating=current_rating)
     
     return current_rating
 
@@ -255,86 +239,86 @@ def generate_test_scenarios():
     return scenarios
 
 # Enhanced analysis function
-def analyze_results(wildcard_results, home_results, scenarios):
+def analyze_results(wildcard_results, home_results, scenarios, thresholds=DEFAULT_THRESHOLDS, home_engine=None):
     """Comprehensive analysis of all results"""
+    analysis = ResultsAnalysis(keep_details=len(scenarios))
+    counts = DifferenceCounts.for_engine(home_engine)
+    for w_result, h_result, scenario in zip(wildcard_results, home_results, scenarios):
+        analysis.add(scenario['emotion'], w_result, h_result, scenario)
+        counts.add(scenario['emotion'], w_result, h_result)
+    return report_analysis(analysis, counts, thresholds)
+
+def report_analysis(analysis, counts=None, thresholds=DEFAULT_THRESHOLDS):
+    """Print the comprehensive analysis from a streamed ResultsAnalysis
+
+    Category counts and the verdict come from `counts` (a DifferenceCounts
+    over the same results) when given, so `thresholds` can move them.
+    """
     
     differences = []
-    perfect_matches = 0
-    minor_differences = 0
-    major_differences = 0
     
-    print("=" * 80)
-    print("📊 DETAILED RESULTS ANALYSIS")
-    print("=" * 80)
+    emit(SCENARIO, "=" * 80)
+    emit(SCENARIO, "📊 DETAILED RESULTS ANALYSIS")
+    emit(SCENARIO, "=" * 80)
     
-    for i, (w_result, h_result, scenario) in enumerate(zip(wildcard_results, home_results, scenarios)):
-        diff = abs(w_result - h_result)
+    for scenario, w_result, h_result, diff in analysis.details:
         differences.append(diff)
         
-        print(f"\n🎬 {scenario['name']}")
-        print(f"   Emotion: {scenario['emotion']}")
-        print(f"   Opponents: {scenario['opponents']}")
-        print(f"   Results: {['WIN' if r else 'LOSS' for r in scenario['results']]}")
-        print(f"   Wildcard: {w_result:.1f} | Home: {h_result:.1f} | Diff: {diff:.2f}")
+        emit(SCENARIO, f"\n🎬 {scenario['name']}")
+        emit(SCENARIO, f"   Emotion: {scenario['emotion']}")
+        emit(SCENARIO, f"   Opponents: {scenario['opponents']}")
+        emit(SCENARIO, f"   Results: {['WIN' if r else 'LOSS' for r in scenario['results']]}")
+        emit(SCENARIO, f"   Wildcard: {w_result:.1f} | Home: {h_result:.1f} | Diff: {diff:.2f}")
         
-        if diff == 0.0:
-            print("   ✅ PERFECT MATCH")
-            perfect_matches += 1
-        elif diff <= 0.1:
-            print("   ✅ EXCELLENT (minor rounding)")
-            minor_differences += 1
-        elif diff <= 0.5:
-            print("   ⚠️  ACCEPTABLE (small variance)")
-            minor_differences += 1
-        else:
-            print("   🚨 SIGNIFICANT DIFFERENCE")
-            major_differences += 1
-    
-    # Summary statistics
-    avg_diff = sum(differences) / len(differences)
-    max_diff = max(differences)
-    min_diff = min(differences)
-    
-    print("\n" + "=" * 80)
-    print("🏆 MEGA SIMULATION SUMMARY")
-    print("=" * 80)
-    print(f"Total movies tested: {len(scenarios)}")
-    print(f"Perfect matches: {perfect_matches}")
-    print(f"Minor differences: {minor_differences}")
-    print(f"Major differences: {major_differences}")
-    print(f"Average difference: {avg_diff:.3f}")
-    print(f"Maximum difference: {max_diff:.3f}")
-    print(f"Minimum difference: {min_diff:.3f}")
+        emit(SCENARIO, DIFFERENCE_LABELS[difference_category(diff, thresholds)])
+    
+    if len(analysis.details) < analysis.count:
+        emit(SCENARIO, f"\n... details shown for the first {len(analysis.details)} of {analysis.count} movies")
+    
+    # Summary statistics (streamed, constant memory)
+    summary = analysis.summary()
+    if counts is not None:
+        classified = counts.summary(thresholds)
+        for key in ('perfect_matches', 'minor_differences', 'major_differences', 'categories'):
+            summary[key] = classified[key]
+    summary['verdict'] = verdict(summary['perfect_matches'], summary['major_differences'], thresholds)
+    emotions = {emotion: stats.as_dict() for emotion, stats in analysis.emotions.items()}
+    
+    result = report_summary(summary, emotions)
+    result['differences'] = differences
+    return result
+
+def report_summary(summary, emotions):
+    """Print the summary, verdict and emotion sections (shared with --from-stats)"""
+    perfect_matches = summary['perfect_matches']
+    minor_differences = summary['minor_differences']
+    major_differences = summary['major_differences']
+    avg_diff = summary['average_difference']
+    max_diff = summary['maximum_difference']
+    min_diff = summary['minimum_difference']
+    
+    emit(SUMMARY, "\n" + "=" * 80)
+    emit(SUMMARY, "🏆 MEGA SIMULATION SUMMARY")
+    emit(SUMMARY, "=" * 80)
+    emit(SUMMARY, f"Total movies tested: {summary['scenarios']}")
+    emit(SUMMARY, f"Perfect matches: {perfect_matches}")
+    emit(SUMMARY, f"Minor differences: {minor_differences}")
+    emit(SUMMARY, f"Major differences: {major_differences}")
+    emit(SUMMARY, f"Average difference: {avg_diff:.3f}")
+    emit(SUMMARY, f"Maximum difference: {max_diff:.3f}")
+    emit(SUMMARY, f"Minimum difference: {min_diff:.3f}")
     
     # Overall assessment
-    if perfect_matches >= 8:
-        print("\n🎯 VERDICT: EXCELLENT ALIGNMENT")
-        print("Both systems are virtually identical in their rating calculations.")
-    elif perfect_matches >= 6:
-        print("\n✅ VERDICT: GOOD ALIGNMENT")
-        print("Systems are well-aligned with minor acceptable differences.")
-    elif major_differences == 0:
-        print("\n👍 VERDICT: ACCEPTABLE ALIGNMENT")
-        print("No major differences detected, minor variances within tolerance.")
-    else:
-        print("\n⚠️ VERDICT: NEEDS INVESTIGATION")
-        print("Significant differences detected that may require analysis.")
+    headline, explanation = VERDICTS[summary['verdict']]
+    emit(SUMMARY, headline)
+    emit(SUMMARY, explanation)
     
     # Emotion-based analysis
-    emotion_stats = {}
-    for i, scenario in enumerate(scenarios):
-        emotion = scenario['emotion']
-        if emotion not in emotion_stats:
-            emotion_stats[emotion] = {'count': 0, 'total_diff': 0, 'max_diff': 0}
-        
-        emotion_stats[emotion]['count'] += 1
-        emotion_stats[emotion]['total_diff'] += differences[i]
-        emotion_stats[emotion]['max_diff'] = max(emotion_stats[emotion]['max_diff'], differences[i])
+    emit(SUMMARY, "\n📈 EMOTION-BASED ANALYSIS:")
+    for emotion, stats in emotions.items():
+        emit(SUMMARY, f"   {emotion}: {stats['count']} movies, avg diff: {stats['mean']:.3f}, max diff: {stats['max']:.3f}")
     
-    print("\n📈 EMOTION-BASED ANALYSIS:")
-    for emotion, stats in emotion_stats.items():
-        avg_emotion_diff = stats['total_diff'] / stats['count']
-        print(f"   {emotion}: {stats['count']} movies, avg diff: {avg_emotion_diff:.3f}, max diff: {stats['max_diff']:.3f}")
+    emit_record(SUMMARY, 'summary', **summary)
     
     return {
         'perfect_matches': perfect_matches,
@@ -342,54 +326,145 @@ def analyze_results(wildcard_results, home_results, scenarios):
         'major_differences': major_differences,
         'average_difference': avg_diff,
         'maximum_difference': max_diff,
-        'differences': differences
+        'verdict': summary['verdict']
     }
 
-# Main simulation execution
-def run_mega_simulation():
-    """Execute the mega simulation"""
-    
-    print("🎬🎬🎬 MEGA SIMULATION: 10 MOVIES 🎬🎬🎬")
-    print("Testing Wildcard vs Home Screen Rating Systems")
-    print("=" * 80)
+def reanalyze_stats(path, thresholds=DEFAULT_THRESHOLDS):
+    """Re-classify a --save-stats table under new thresholds without running any engine"""
+    counts = DifferenceCounts.load(path)
+    emit(SUMMARY, f"♻️  Re-analyzing {path} with thresholds {dict(thresholds._asdict())}")
+    summary = counts.summary(thresholds)
+    return report_summary(summary, summary['emotions'])
+
+# Stream scenarios through both systems one at a time
+def simulate_scenarios(scenarios, home_engine=None):
+    """Yield (scenario, wildcard_final, home_final) while printing each test
+
+    `home_engine` names an engines.HOME_ENGINES entry to run in place of
+    the Unknown vs Known Home Screen (e.g. 'bradley_terry').
+    """
+    
+    # Below per-round verbosity the print-free engines give identical ratings
+    reporter = get_reporter()
+    if reporter.enabled(ROUND):
+        run_wildcard, run_home = wildcard_simulation, home_screen_unknown_vs_known
+    else:
+        run_wildcard, run_home = engines.wildcard_simulation, engines.home_screen_unknown_vs_known
+    if home_engine is not None:
+        run_home = engines.HOME_ENGINES[home_engine]
     
-    scenarios = generate_test_scenarios()
-    wildcard_results = []
-    home_results = []
+    # Summary-only runs skip all per-movie formatting
+    if not reporter.enabled(SCENARIO):
+        for scenario in scenarios:
+            emotion, opponents, results = scenario['emotion'], scenario['opponents'], scenario['results']
+            yield scenario, run_wildcard(emotion, opponents, results), run_home(emotion, opponents, results)
+        return
     
     for i, scenario in enumerate(scenarios, 1):
-        print(f"\n🎭 TEST {i}: {scenario['name']}")
-        print(f"Description: {scenario['description']}")
-        print(f"Emotion: {scenario['emotion']}")
-        print(f"Opponents: {scenario['opponents']}")
-        print(f"Battle results: {['WIN' if r else 'LOSS' for r in scenario['results']]}")
-        print()
+        emit(SCENARIO, f"\n🎭 TEST {i}: {scenario['name']}")
+        emit(SCENARIO, f"Description: {scenario['description']}")
+        emit(SCENARIO, f"Emotion: {scenario['emotion']}")
+        emit(SCENARIO, f"Opponents: {scenario['opponents']}")
+        emit(SCENARIO, f"Battle results: {['WIN' if r else 'LOSS' for r in scenario['results']]}")
+        emit(SCENARIO)
         
         # Run Wildcard simulation
-        print("WILDCARD SYSTEM:")
-        wildcard_final = wildcard_simulation(
+        emit(ROUND, "WILDCARD SYSTEM:")
+        wildcard_final = run_wildcard(
             scenario['emotion'], 
             scenario['opponents'], 
             scenario['results']
         )
-        wildcard_results.append(wildcard_final)
         
-        print("\nHOME SCREEN SYSTEM:")
-        home_final = home_screen_unknown_vs_known(
+        emit(ROUND, "\nHOME SCREEN SYSTEM:")
+        home_final = run_home(
             scenario['emotion'], 
             scenario['opponents'], 
             scenario['results']
         )
-        home_results.append(home_final)
         
         difference = abs(wildcard_final - home_final)
-        print(f"\n📊 RESULT: Wildcard={wildcard_final}, Home={home_final}, Diff={difference:.2f}")
-        print("-" * 80)
+        emit(SCENARIO, f"\n📊 RESULT: Wildcard={wildcard_final}, Home={home_final}, Diff={difference:.2f}")
+        emit(SCENARIO, "-" * 80)
+        emit_record(
+            SCENARIO, 'scenario',
+            name=scenario['name'],
+            emotion=scenario['emotion'],
+            opponents=scenario['opponents'],
+            results=scenario['results'],
+            wildcard=wildcard_final,
+            home=home_final,
+            difference=difference
+        )
+        
+        yield scenario, wildcard_final, home_final
+
+def print_progress(analysis):
+    """Running totals while a long stream is in flight"""
+    emit(SUMMARY, f"⏳ {analysis.count} movies simulated, running avg diff: {analysis.differences.mean:.3f}")
+    emit_record(SUMMARY, 'progress', scenarios=analysis.count, average_difference=analysis.differences.mean)
+    get_reporter().flush()
+
+# Main simulation execution
+def run_mega_simulation(scenarios=None, progress_every=0, home_engine=None,
+                        thresholds=DEFAULT_THRESHOLDS, stats_path=None):
+    """Execute the mega simulation
+
+    `scenarios` may be any iterable (e.g. a generator from
+    rating_core.scenarios); results are aggregated as they stream, so
+    memory stays constant no matter how many scenarios run. stats_path
+    saves the per-emotion DifferenceCounts for later reanalyze_stats().
+    """
+    
+    emit(SUMMARY, "🎬🎬🎬 MEGA SIMULATION: 10 MOVIES 🎬🎬🎬")
+    emit(SUMMARY, "Testing Wildcard vs Home Screen Rating Systems")
+    emit(SUMMARY, "=" * 80)
+    
+    if scenarios is None:
+        scenarios = generate_test_scenarios()
+    
+    counts = DifferenceCounts.for_engine(home_engine)
+    analysis = analyze_stream(
+        counts.observe(simulate_scenarios(scenarios, home_engine)),
+        ResultsAnalysis(keep_details=DETAIL_LIMIT),
+        progress_every=progress_every,
+        on_progress=print_progress
+    )
+    if stats_path:
+        counts.save(stats_path)
     
     # Comprehensive analysis
-    analysis = analyze_results(wildcard_results, home_results, scenarios)
-    
-    return analysis
+    return report_analysis(analysis, counts, thresholds)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Wildcard vs Home Screen mega simulation")
+    parser.add_argument('--scenarios', type=int, default=0, help="stream N generated scenarios instead of the 10 built-in ones")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--progress-every', type=int, default=0)
+    parser.add_argument('--home-engine', choices=sorted(engines.HOME_ENGINES),
+                        help="compare Wildcard against this Home engine instead of Unknown vs Known")
+    parser.add_argument('--save-stats', metavar='PATH', help="save per-emotion difference counts for --from-stats")
+    parser.add_argument('--from-stats', metavar='PATH', help="re-classify saved counts instead of simulating")
+    for name in Thresholds._fields:
+        kind = float if isinstance(getattr(DEFAULT_THRESHOLDS, name), float) else int
+        parser.add_argument('--' + name.replace('_', '-'), type=kind, default=getattr(DEFAULT_THRESHOLDS, name),
+                            help="difference category bound" if kind is float else "perfect matches needed for this verdict")
+    args = add_output_arguments(parser).parse_args(argv)
+    configure_output(args)
+    thresholds = Thresholds(*(getattr(args, name) for name in Thresholds._fields))
+    
+    if args.from_stats:
+        return reanalyze_stats(args.from_stats, thresholds)
+    if get_reporter().text_enabled(ROUND):
+        set_trace_hook(print_major_upset)
+    return run_mega_simulation(
+        generate_scenarios(args.scenarios, seed=args.seed) if args.scenarios else None,
+        progress_every=args.progress_every,
+        home_engine=args.home_engine,
+        thresholds=thresholds,
+        stats_path=args.save_stats
+    )
+
 
 if __name__ == "__main__":
-    run_mega_simulation()
\ No newline at end of file
+    main()
@@ -0,0 +1,106 @@
+# MONTE CARLO SIMULATION: Wildcard vs Home Screen at scale
+# Random seeded scenarios fanned across all CPU cores instead of 10 hand-written cases
+
+import argparse
+import os
+import time
+
+from rating_core.engines import DEFAULT_HOME_ENGINE, HOME_ENGINES
+from rating_core.output import SCENARIO, SUMMARY, add_output_arguments, configure_output, emit, emit_record, get_reporter
+from rating_core.results_file import analyze_results_file, open_results
+from rating_core.runner import run_monte_carlo
+
+
+def print_summary(summary, elapsed, workers):
+    """Print the merged aggregate in the same shape as analyze_results"""
+    emit(SUMMARY, "=" * 80)
+    emit(SUMMARY, "🏆 MONTE CARLO SUMMARY")
+    emit(SUMMARY, "=" * 80)
+    emit(SUMMARY, f"Total scenarios: {summary['scenarios']:,}")
+    emit(SUMMARY, f"Perfect matches: {summary['perfect_matches']:,}")
+    emit(SUMMARY, f"Minor differences: {summary['minor_differences']:,}")
+    emit(SUMMARY, f"Major differences: {summary['major_differences']:,}")
+    emit(SUMMARY, f"Home rated higher: {summary['home_higher']:,}")
+    emit(SUMMARY, f"Wildcard rated higher: {summary['wildcard_higher']:,}")
+    emit(SUMMARY, f"Average difference: {summary['average_difference']:.4f} (σ {summary['stddev_difference']:.4f})")
+    if summary['scenarios']:
+        emit(SUMMARY, f"Median / p95 difference: {summary['median_difference']:.1f} / {summary['p95_difference']:.1f}")
+    else:
+        emit(SUMMARY, "Median / p95 difference: n/a (no scenarios)")
+    emit(SUMMARY, f"Maximum difference: {summary['maximum_difference']:.3f}")
+
+    emit(SUMMARY, "\n📈 EMOTION-BASED ANALYSIS:")
+    for emotion, stats in sorted(summary['emotions'].items()):
+        emit(SUMMARY, f"   {emotion}: {stats['count']:,} movies, avg diff: {stats['mean']:.4f} (σ {stats['stddev']:.4f}), max diff: {stats['max']:.3f}")
+
+    if 'rules' in summary:
+        rules = summary['rules']
+        emit(SUMMARY, f"\n🧮 RULE FIRINGS over {rules['adjustments']:,} adjustments:")
+        for rule, count in rules['counts'].items():
+            emit(SUMMARY, f"   {rule}: {count:,} ({rules['rates'][rule]:.2%})")
+
+    emit(SUMMARY, f"\n⏱️  {elapsed:.2f}s on {workers} worker(s) → {summary['scenarios'] / elapsed:,.0f} scenarios/sec")
+    emit_record(SUMMARY, 'summary', elapsed=elapsed, workers=workers, **summary)
+
+
+def print_progress(analysis, total):
+    """One progress line per merged chunk"""
+    emit(SCENARIO, f"   ... {analysis.count:,}/{total:,} scenarios, running avg diff {analysis.differences.mean:.4f}")
+    emit_record(SCENARIO, 'progress', scenarios=analysis.count, total=total, average_difference=analysis.differences.mean)
+    get_reporter().flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo Wildcard vs Home Screen comparison")
+    parser.add_argument('--scenarios', type=int, default=1_000_000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--workers', type=int, default=None, help="defaults to the CPU count")
+    parser.add_argument('--chunk-size', type=int, default=50_000)
+    parser.add_argument('--home-engine', choices=sorted(HOME_ENGINES), default=DEFAULT_HOME_ENGINE)
+    parser.add_argument('--results-file', help="also write every scenario's finals and trajectories to this binary file")
+    parser.add_argument('--count-rules', action='store_true', help="count how often each rating rule fires")
+    parser.add_argument('--from-results', metavar='PATH', help="re-analyze a results file instead of simulating")
+    add_output_arguments(parser)
+    args = parser.parse_args(argv)
+    configure_output(args)
+
+    if args.from_results:
+        return reanalyze(args.from_results)
+
+    emit(SUMMARY, "🎲🎬 MONTE CARLO SIMULATION: Wildcard vs Home Screen")
+    emit(SUMMARY, f"{args.scenarios:,} scenarios, seed {args.seed}, {args.rounds} rounds each, Home engine: {args.home_engine}")
+
+    start = time.perf_counter()
+    aggregate = run_monte_carlo(
+        args.scenarios,
+        seed=args.seed,
+        rounds=args.rounds,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        home_engine=args.home_engine,
+        on_progress=print_progress,
+        results_path=args.results_file,
+        count_rules=args.count_rules
+    )
+    elapsed = time.perf_counter() - start
+
+    print_summary(aggregate.summary(), elapsed, args.workers or os.cpu_count())
+    if args.results_file:
+        emit(SUMMARY, f"💾 Per-scenario results written to {args.results_file}")
+    return aggregate
+
+
+def reanalyze(path):
+    """Summarize a results file written by --results-file without re-simulating"""
+    metadata = open_results(path).metadata
+    emit(SUMMARY, "🎲🎬 MONTE CARLO RE-ANALYSIS: Wildcard vs Home Screen")
+    emit(SUMMARY, f"{path}: {metadata.get('scenarios', 0):,} scenarios, seed {metadata.get('seed')}, Home engine: {metadata.get('home_engine')}")
+    start = time.perf_counter()
+    aggregate = analyze_results_file(path)
+    print_summary(aggregate.summary(), time.perf_counter() - start, 1)
+    return aggregate
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# OPPONENT SELECTION SIMULATION: Information-gain opponents vs percentile + random picks
+# Counts how many comparisons a new movie needs before its rating is known to a target precision
+
+import argparse
+import random
+import statistics
+import time
+
+from rating_core.information_gain import SENTIMENT_RANGES, InformationGainIndex, comparisons_to_confidence
+from rating_core.output import SCENARIO, SUMMARY, add_output_arguments, configure_output, emit, emit_record
+
+STRATEGIES = ('percentile', 'information_gain')
+
+
+def make_library(size, seed=0):
+    """Rated movies on the 0.1 grid, each with a confidence standard error"""
+    rng = random.Random(seed)
+    return [{'id': i, 'title': f'Movie {i}', 'rating': rng.randint(10, 100) / 10,
+             'standard_error': round(rng.uniform(0.2, 1.5), 3)} for i in range(size)]
+
+
+def time_selection(index, picks, seed=0):
+    """Mean seconds per InformationGainIndex.select over random current ratings"""
+    rng = random.Random(seed)
+    ratings = [rng.randint(10, 100) / 10 for _ in range(picks)]
+    start = time.perf_counter()
+    for rating in ratings:
+        index.select(rating, (), rng)
+    return (time.perf_counter() - start) / picks
+
+
+def run_opponent_selection(library_size=10_000, movies=2_000, target=1.0, max_comparisons=40, seed=0):
+    """Comparisons-to-confidence per strategy for the same new movies and outcome draws"""
+    index = InformationGainIndex(make_library(library_size, seed))
+    rng = random.Random(seed)
+    new_movies = []
+    for _ in range(movies):
+        emotion = rng.choice(tuple(SENTIMENT_RANGES))
+        new_movies.append((emotion, rng.uniform(*SENTIMENT_RANGES[emotion])))
+
+    results = {}
+    for strategy in STRATEGIES:
+        counts, errors = [], []
+        for i, (emotion, true_rating) in enumerate(new_movies):
+            comparisons, estimate = comparisons_to_confidence(
+                index, emotion, true_rating, strategy, target, max_comparisons, rng=random.Random(seed * 1_000_003 + i))
+            counts.append(comparisons)
+            errors.append(abs(estimate - true_rating))
+        results[strategy] = {
+            'mean_comparisons': statistics.fmean(counts),
+            'median_comparisons': statistics.median(counts),
+            'p90_comparisons': statistics.quantiles(counts, n=10)[-1] if len(counts) > 1 else counts[0],
+            'capped': sum(count >= max_comparisons for count in counts),
+            'mean_absolute_error': statistics.fmean(errors)
+        }
+        emit(SCENARIO, f"   {strategy}: {results[strategy]['mean_comparisons']:.2f} comparisons on average")
+        emit_record(SCENARIO, 'strategy', strategy=strategy, **results[strategy])
+
+    baseline, adaptive = results['percentile']['mean_comparisons'], results['information_gain']['mean_comparisons']
+    return {
+        'library_size': library_size,
+        'movies': movies,
+        'target_standard_error': target,
+        'strategies': results,
+        'comparisons_saved': 1 - adaptive / baseline if baseline else 0.0,
+        'selection_seconds': time_selection(index, 2_000, seed)
+    }
+
+
+def print_summary(summary, elapsed):
+    emit(SUMMARY, "=" * 80)
+    emit(SUMMARY, "🏆 OPPONENT SELECTION SUMMARY")
+    emit(SUMMARY, "=" * 80)
+    for strategy, stats in summary['strategies'].items():
+        emit(SUMMARY, f"{strategy}: mean {stats['mean_comparisons']:.2f}, median {stats['median_comparisons']:.0f}, "
+                      f"p90 {stats['p90_comparisons']:.0f} comparisons, {stats['capped']:,} capped, "
+                      f"mean |estimate - true| {stats['mean_absolute_error']:.3f}")
+    emit(SUMMARY, f"\n📉 Information gain needs {summary['comparisons_saved']:.1%} fewer comparisons")
+    emit(SUMMARY, f"⚡ Selection: {summary['selection_seconds'] * 1e6:,.1f} µs per pick over {summary['library_size']:,} titles")
+    emit(SUMMARY, f"\n⏱️  {elapsed:.2f}s")
+    emit_record(SUMMARY, 'summary', elapsed=elapsed, **summary)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Information-gain vs percentile opponent selection")
+    parser.add_argument('--library-size', type=int, default=10_000)
+    parser.add_argument('--movies', type=int, default=2_000, help="new movies rated per strategy")
+    parser.add_argument('--target', type=float, default=1.0, help="posterior standard error that counts as confident")
+    parser.add_argument('--max-comparisons', type=int, default=40)
+    parser.add_argument('--seed', type=int, default=0)
+    add_output_arguments(parser)
+    args = parser.parse_args(argv)
+    configure_output(args)
+
+    emit(SUMMARY, "🎯🎬 OPPONENT SELECTION SIMULATION: information gain vs percentile + random")
+    emit(SUMMARY, f"{args.movies:,} new movies, {args.library_size:,}-title library, target σ {args.target}, seed {args.seed}")
+
+    start = time.perf_counter()
+    summary = run_opponent_selection(args.library_size, args.movies, args.target, args.max_comparisons, args.seed)
+    print_summary(summary, time.perf_counter() - start)
+    return summary
+
+
+if __name__ == "__main__":
+    main()
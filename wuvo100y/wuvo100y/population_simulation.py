@@ -0,0 +1,60 @@
+# POPULATION SIMULATION: Thousands of users rating a shared catalog over time
+# Unlike the fixed-opponent scripts, opponents' ratings and games played evolve with every battle
+
+import argparse
+import time
+
+from rating_core.output import SCENARIO, SUMMARY, add_output_arguments, configure_output, emit, emit_record, get_reporter
+from rating_core.population import Population
+
+
+def print_step(population, step):
+    """One line per simulated step"""
+    summary = population.summary()
+    emit(SCENARIO, f"   ... step {step}: {summary['battles']:,} battles, avg library {summary['average_library']:.1f}, "
+                   f"mean |rating - taste| {summary['mean_absolute_error']:.3f}")
+    emit_record(SCENARIO, 'step', step=step, **summary)
+    get_reporter().flush()
+
+
+def print_summary(summary, elapsed):
+    emit(SUMMARY, "=" * 80)
+    emit(SUMMARY, "🏆 POPULATION SUMMARY")
+    emit(SUMMARY, "=" * 80)
+    emit(SUMMARY, f"Users × titles: {summary['users']:,} × {summary['titles']:,}")
+    emit(SUMMARY, f"Battles: {summary['battles']:,}")
+    emit(SUMMARY, f"Rated movies: {summary['rated_movies']:,} (avg library {summary['average_library']:.1f})")
+    emit(SUMMARY, f"Average rating: {summary['average_rating']:.3f}")
+    emit(SUMMARY, f"Average games per movie: {summary['average_games']:.2f}")
+    emit(SUMMARY, f"Mean / p95 |rating - taste|: {summary['mean_absolute_error']:.3f} / {summary['p95_absolute_error']:.3f}")
+    emit(SUMMARY, f"\n⏱️  {elapsed:.2f}s → {summary['battles'] / elapsed:,.0f} battles/sec")
+    emit_record(SUMMARY, 'summary', elapsed=elapsed, **summary)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Multi-user population simulation over a shared title catalog")
+    parser.add_argument('--users', type=int, default=1_000)
+    parser.add_argument('--titles', type=int, default=1_000)
+    parser.add_argument('--steps', type=int, default=20)
+    parser.add_argument('--initial-library', type=int, default=20)
+    parser.add_argument('--new-movie-every', type=int, default=1, help="each user rates a new title every N steps (0 = never)")
+    parser.add_argument('--rebattles', type=int, default=1, help="Known vs Known re-comparisons per user per step")
+    parser.add_argument('--seed', type=int, default=0)
+    add_output_arguments(parser)
+    args = parser.parse_args(argv)
+    configure_output(args)
+
+    emit(SUMMARY, "👥🎬 POPULATION SIMULATION: Home Screen + Wildcard over a shared catalog")
+    emit(SUMMARY, f"{args.users:,} users, {args.titles:,} titles, {args.steps} steps, seed {args.seed}")
+
+    start = time.perf_counter()
+    population = Population(args.users, args.titles, seed=args.seed, initial_library=args.initial_library)
+    population.run(args.steps, args.new_movie_every, args.rebattles, on_step=print_step)
+    elapsed = time.perf_counter() - start
+
+    print_summary(population.summary(), elapsed)
+    return population
+
+
+if __name__ == "__main__":
+    main()
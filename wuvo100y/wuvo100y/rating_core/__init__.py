@@ -0,0 +1,22 @@
+# RATING CORE: Shared rating engines for the Wildcard / Home Screen simulations
+# The NumPy-backed batch engine lives in rating_core.batch and is imported on demand
+
+from .elo import (
+    RULE_FLAGS,
+    AdjustmentTrace,
+    calculate_k_factor,
+    get_rule_counters,
+    set_rule_counters,
+    set_trace_hook,
+    wildcard_adjust_rating,
+)
+
+__all__ = [
+    'RULE_FLAGS',
+    'AdjustmentTrace',
+    'calculate_k_factor',
+    'get_rule_counters',
+    'set_rule_counters',
+    'set_trace_hook',
+    'wildcard_adjust_rating',
+]
@@ -0,0 +1,205 @@
+# ADVERSARIAL SEARCH: Provable worst-case (emotion, opponents, results) inputs for Home vs Wildcard
+# Branch-and-bound over the 0.1 grid: scenarios that reach the same (Wildcard, Home) ratings after the
+# same round share every continuation, and a per-round movement bound from the 0.7 cap and the +3.0
+# upset bonus discards states that cannot reach the current top k
+
+from collections import namedtuple
+
+import numpy as np
+
+from .config import DEFAULT_CONFIG, games_tier
+from .engines import EMOTION_BASELINES
+from .transitions import GRID_SIZE, LOSS, RATING_GRID, WIN, get_transition_table, rating_index
+
+HOME_UNSET = GRID_SIZE          # baseline-free Home has no rating before its first battle
+STATE_BASE = GRID_SIZE + 1
+MOVES = 2 * GRID_SIZE           # move m: opponent m % 91, won = m < 91
+ROUNDING_SLACK = 0.05           # rounding to the 0.1 grid can add half a step
+
+SEARCH_HOME_ENGINES = ('baseline_free', 'unknown_vs_known')
+
+# Objectives are maximized; each is a function of the final (wildcard, home) ratings
+OBJECTIVES = {
+    'abs_difference': lambda wildcard, home: np.abs(home - wildcard),
+    'home_minus_wildcard': lambda wildcard, home: home - wildcard,
+    'wildcard_minus_home': lambda wildcard, home: wildcard - home
+}
+
+WorstCase = namedtuple('WorstCase', ['value', 'emotion', 'opponents', 'results', 'wildcard', 'home'])
+SearchStats = namedtuple('SearchStats', ['expanded', 'generated', 'pruned', 'incumbent', 'brute_force'])
+
+
+def step_bounds(round_index, config=DEFAULT_CONFIG):
+    """(normal_rise, upset_rise, fall): most one battle in `round_index` can move the new movie
+
+    A win rises by at most the 0.7 cap, unless it is a major upset: then the
+    underdog-boosted K gain plus the +3.0 bonus applies uncapped. A loss falls by
+    at most K (uncapped only when the opponent pulls the upset, and K < 0.7).
+    """
+    k = config.k_factors[games_tier(round_index, config)]
+    boosted = max(config.min_change, k * config.underdog_multiplier)
+    return (min(config.max_change, boosted) + ROUNDING_SLACK,
+            boosted + config.upset_bonus + ROUNDING_SLACK,
+            max(config.min_change, k) + ROUNDING_SLACK)
+
+
+def divergence_bound(round_index, config=DEFAULT_CONFIG, upset_possible=True):
+    """Largest change of (Home - Wildcard) in one round
+
+    Both engines see the same result, so both ratings move the same way and the
+    gap changes by at most the larger single move, not the sum of both.
+    """
+    normal_rise, upset_rise, fall = step_bounds(round_index, config)
+    return max(upset_rise if upset_possible else normal_rise, fall)
+
+
+class _Layer:
+    """Unique states after a round plus the edges that reached them"""
+
+    def __init__(self, keys, parents=None, moves=None, children=None):
+        self.keys = keys
+        # Edges sorted by child key, for walking back from the final states
+        if parents is not None:
+            order = np.argsort(children, kind='stable')
+            self.parents, self.moves, self.children = parents[order], moves[order], children[order]
+
+
+class WorstCaseSearch:
+    """Top-k scenarios for an objective over `rounds` battles on the 0.1 grid
+
+    Layers are expanded breadth-first with vectorized table lookups. A cheap
+    beam pass first finds k real scenarios; their k-th value is the incumbent,
+    and any state whose optimistic bound falls below it is cut. The bound is
+    sound, so the result is the exact top k (ties broken by grid order).
+    """
+
+    def __init__(self, rounds=3, objective='abs_difference', home_engine='baseline_free',
+                 emotions=tuple(EMOTION_BASELINES), config=DEFAULT_CONFIG):
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Unknown objective {objective!r}; expected one of {sorted(OBJECTIVES)}")
+        if home_engine not in SEARCH_HOME_ENGINES:
+            raise ValueError(f"Unknown Home engine {home_engine!r}; expected one of {SEARCH_HOME_ENGINES}")
+        if rounds < 1:
+            raise ValueError("rounds must be at least 1")
+        self.rounds = rounds
+        self.objective = OBJECTIVES[objective]
+        self.home_engine = home_engine
+        self.config = config
+        self.table = get_transition_table(config)
+        self.grid = np.array(RATING_GRID)
+        self.start = {}
+        for emotion in emotions:
+            wildcard = rating_index(EMOTION_BASELINES[emotion])
+            home = HOME_UNSET if home_engine == 'baseline_free' else wildcard
+            self.start[wildcard * STATE_BASE + home] = emotion
+
+        offset = config.first_round_offset
+        self._derived = [np.rint(np.clip(self.grid + offset, 1, 10) * 10).astype(np.intp) - 10,
+                         np.rint(np.clip(self.grid - offset, 1, 10) * 10).astype(np.intp) - 10]
+        # Optimistic gap growth from each round to the end, assuming upsets stay possible
+        self._tail = [sum(divergence_bound(j, config) for j in range(r, rounds)) for r in range(rounds + 1)]
+        self._upset_ceiling = 10 - config.upset_threshold
+
+    def _expand(self, keys, round_index):
+        """Children of every state in `keys` for all 182 moves: (parents, moves, child keys)"""
+        wildcard, home = keys // STATE_BASE, keys % STATE_BASE
+        tier = games_tier(round_index, self.config)
+        opponents = np.arange(GRID_SIZE)
+        child_w, child_h = [], []
+        for outcome in (WIN, LOSS):
+            table = self.table.new_index[outcome, tier, self.table.opponent_tier].astype(np.intp)
+            child_w.append(table[wildcard[:, None], opponents[None, :]])
+            derived = np.broadcast_to(self._derived[outcome][None, :], (len(keys), GRID_SIZE))
+            lookup = table[np.minimum(home, GRID_SIZE - 1)[:, None], opponents[None, :]]
+            child_h.append(np.where((home == HOME_UNSET)[:, None], derived, lookup))
+        children = (np.concatenate(child_w, axis=1) * STATE_BASE + np.concatenate(child_h, axis=1)).ravel()
+        parents = np.repeat(keys, MOVES)
+        moves = np.tile(np.arange(MOVES), len(keys))
+        return parents, moves, children
+
+    def _values(self, keys):
+        # Rounded so 8.1 - 1.1 and 9.0 - 2.0 tie instead of differing in the last bit
+        values = self.objective(self.grid[keys // STATE_BASE], self.grid[np.minimum(keys % STATE_BASE, GRID_SIZE - 1)])
+        return np.round(values, 9)
+
+    def bound(self, keys, rounds_played):
+        """Best objective any continuation of these states could still reach"""
+        if rounds_played == self.rounds:
+            return self._values(keys)
+        wildcard = self.grid[keys // STATE_BASE]
+        home = self.grid[np.minimum(keys % STATE_BASE, GRID_SIZE - 1)]
+        # Next round: a +3.0 bonus needs the rating below 10 - upset threshold
+        upset = (wildcard < self._upset_ceiling) | (home < self._upset_ceiling)
+        upcoming = np.where(upset, divergence_bound(rounds_played, self.config, True),
+                            divergence_bound(rounds_played, self.config, False))
+        return np.minimum(9.0, self._values(keys) + upcoming + self._tail[rounds_played + 1])
+
+    def _incumbent(self, k, beam):
+        """k-th best value among real scenarios found by a beam search (-inf if fewer than k)"""
+        keys = np.array(sorted(self.start), dtype=np.int64)
+        for r in range(self.rounds):
+            keys = np.unique(self._expand(keys, r)[2])
+            if r + 1 < self.rounds and len(keys) > beam:
+                keys = keys[np.argsort(-self.bound(keys, r + 1), kind='stable')[:beam]]
+        values = np.sort(self._values(keys))[::-1]
+        return values[k - 1] if len(values) >= k else -np.inf
+
+    def search(self, k=10, beam=256, prune=True):
+        """(list of WorstCase best first, SearchStats)"""
+        incumbent = self._incumbent(k, max(beam, k)) if prune else -np.inf
+        layers = [_Layer(np.array(sorted(self.start), dtype=np.int64))]
+        expanded = generated = pruned = 0
+        for r in range(self.rounds):
+            parents, moves, children = self._expand(layers[-1].keys, r)
+            expanded += len(layers[-1].keys)
+            generated += len(children)
+            if prune:
+                keep = self.bound(children, r + 1) >= incumbent
+                pruned += int(np.count_nonzero(~keep))
+                parents, moves, children = parents[keep], moves[keep], children[keep]
+            layers.append(_Layer(np.unique(children), parents, moves, children))
+
+        final = layers[-1].keys
+        values = self._values(final)
+        order = np.lexsort((final, -values))
+        cases = []
+        for key, value in zip(final[order].tolist(), values[order].tolist()):
+            for path in self._paths(layers, key, k - len(cases)):
+                cases.append(self._case(value, path))
+            if len(cases) >= k:
+                break
+        brute_force = len(self.start) * MOVES ** self.rounds
+        return cases, SearchStats(expanded, generated, pruned, float(incumbent), brute_force)
+
+    def _paths(self, layers, key, limit):
+        """Up to `limit` (start key, [moves]) paths ending at `key`, in grid order"""
+        found = []
+
+        def walk(depth, state, suffix):
+            if depth == 0:
+                found.append((state, suffix))
+                return
+            layer = layers[depth]
+            lo, hi = np.searchsorted(layer.children, [state, state + 1])
+            for parent, move in sorted(zip(layer.parents[lo:hi].tolist(), layer.moves[lo:hi].tolist())):
+                walk(depth - 1, parent, [move] + suffix)
+                if len(found) >= limit:
+                    return
+
+        walk(len(layers) - 1, key, [])
+        return found
+
+    def _case(self, value, path):
+        start, moves = path
+        opponents = [RATING_GRID[move % GRID_SIZE] for move in moves]
+        results = [move < GRID_SIZE for move in moves]
+        final = start
+        for r, move in enumerate(moves):
+            final = self._expand(np.array([final], dtype=np.int64), r)[2][move]
+        return WorstCase(value, self.start[start], opponents, results,
+                         RATING_GRID[final // STATE_BASE], RATING_GRID[final % STATE_BASE])
+
+
+def find_worst_cases(k=10, rounds=3, objective='abs_difference', home_engine='baseline_free', config=DEFAULT_CONFIG):
+    """Convenience wrapper: the provable top-k scenarios and the search statistics"""
+    return WorstCaseSearch(rounds, objective, home_engine, config=config).search(k)
@@ -0,0 +1,274 @@
+# BRADLEY-TERRY ENGINE: Port of src/Components/BradleyTerryRatingSystem.js
+# Scalar per-comparison updates, a vectorized batch path and a full-library MM refit
+
+import math
+from collections import namedtuple
+
+import numpy as np
+
+# BT_CONFIG
+LEARNING_RATE = 1.3
+SHRINKAGE_STRENGTH = 0.15
+MIN_COMPARISONS = 3
+MAX_COMPARISONS = 5
+Z_SCORE = 1.96
+DEFAULT_TMDB_RATING = 6
+TARGET_CONFIDENCE = 80
+
+# initializeBTMovie: initial rating = 0.7 * sentiment score + 0.3 * TMDB rating
+SENTIMENT_SCORES = {
+    'LOVED': 10.0,
+    'LIKED': 7.5,
+    'AVERAGE': 5.5,
+    'DISLIKED': 3.5
+}
+SENTIMENT_WEIGHT = 0.7
+
+BTMovie = namedtuple('BTMovie', ['theta', 'theta_prior', 'comparisons', 'wins', 'losses'])
+ConfidenceInterval = namedtuple('ConfidenceInterval', ['lower', 'upper', 'width'])
+
+
+def rating_to_theta(rating):
+    """1-10 rating -> log-odds strength (ratingToTheta)"""
+    r = max(1.01, min(9.99, rating))
+    return math.log(r / (10 - r))
+
+
+def theta_to_rating(theta):
+    """Log-odds strength -> 1-10 rating (thetaToRating)"""
+    return max(1.0, min(10.0, 10 / (1 + math.exp(-theta))))
+
+
+def bradley_terry_probability(theta_a, theta_b):
+    """P(A beats B) = 1 / (1 + exp(theta_B - theta_A))"""
+    return 1 / (1 + math.exp(theta_b - theta_a))
+
+
+def update_theta_mle(theta, predicted_probability, actual_win, learning_rate=LEARNING_RATE):
+    """One stochastic gradient-ascent step (updateThetaMLE)"""
+    return theta + learning_rate * ((1 if actual_win else 0) - predicted_probability)
+
+
+def apply_shrinkage(theta_mle, theta_prior, comparisons, shrinkage_strength=SHRINKAGE_STRENGTH):
+    """Bayesian pull toward the prior: (n * mle + a * prior) / (n + a)"""
+    return (comparisons * theta_mle + shrinkage_strength * theta_prior) / (comparisons + shrinkage_strength)
+
+
+def theta_confidence_interval(theta, comparisons, wins=None, z=Z_SCORE):
+    """Fisher-information interval; ties (half wins) count as 0.75 of a comparison"""
+    if comparisons == 0:
+        return ConfidenceInterval(theta - 2, theta + 2, 4)
+    effective = comparisons
+    if wins is not None:
+        ties = comparisons - math.floor(wins) - math.floor(comparisons - wins)
+        if ties > 0:
+            effective = comparisons - ties + ties * 0.75
+    margin = z * 2 / math.sqrt(effective)
+    return ConfidenceInterval(theta - margin, theta + margin, 2 * margin)
+
+
+def confidence_percent(width):
+    """CI width 0.8 or less -> 80%, 4.0 -> 0%"""
+    return min(80, max(0, 80 - (width - 0.8) * 20))
+
+
+def should_stop_early(comparisons, confidence):
+    """At least MIN_COMPARISONS, then stop once confidence reaches 80%"""
+    return comparisons >= MIN_COMPARISONS and confidence >= TARGET_CONFIDENCE
+
+
+def initial_rating(sentiment=None, tmdb_rating=DEFAULT_TMDB_RATING):
+    if sentiment in SENTIMENT_SCORES:
+        blended = SENTIMENT_WEIGHT * SENTIMENT_SCORES[sentiment] + (1 - SENTIMENT_WEIGHT) * tmdb_rating
+        return max(1.0, min(10.0, blended))
+    return tmdb_rating
+
+
+def new_movie(sentiment=None, tmdb_rating=DEFAULT_TMDB_RATING):
+    """A first-time rating (initializeBTMovie without the storage fields)"""
+    theta = rating_to_theta(initial_rating(sentiment, tmdb_rating))
+    return BTMovie(theta, theta, 0, 0, 0)
+
+
+def known_movie(rating, tmdb_rating=DEFAULT_TMDB_RATING, comparisons=0):
+    """An already-rated movie seeded from its displayed rating"""
+    return BTMovie(rating_to_theta(rating), rating_to_theta(tmdb_rating), comparisons, 0, 0)
+
+
+def update_after_comparison(movie, opponent_theta, won):
+    """updateMovieAfterComparison: scaled gradient step, then shrinkage toward the prior"""
+    predicted = bradley_terry_probability(movie.theta, opponent_theta)
+    learning_rate = LEARNING_RATE / (1 + movie.comparisons / 10)
+    theta_mle = update_theta_mle(movie.theta, predicted, won, learning_rate)
+    comparisons = movie.comparisons + 1
+    return movie._replace(
+        theta=apply_shrinkage(theta_mle, movie.theta_prior, comparisons),
+        comparisons=comparisons,
+        wins=movie.wins + (1 if won else 0),
+        losses=movie.losses + (0 if won else 1)
+    )
+
+
+def movie_confidence(movie):
+    return confidence_percent(theta_confidence_interval(movie.theta, movie.comparisons, movie.wins).width)
+
+
+def bradley_terry_simulation(emotion, opponents, results, early_stop=False):
+    """Bradley-Terry behind the engines' (emotion, opponents, results) signature
+
+    Opponents are seeded from their ratings, as the app does for movies rated
+    before the migration. With early_stop the loop ends like ComparisonModal:
+    at MAX_COMPARISONS or once should_stop_early() holds.
+    """
+    movie = new_movie(emotion)
+    for opponent_rating, won in zip(opponents, results):
+        movie = update_after_comparison(movie, rating_to_theta(opponent_rating), won)
+        if early_stop and (movie.comparisons >= MAX_COMPARISONS or
+                           should_stop_early(movie.comparisons, movie_confidence(movie))):
+            break
+    return theta_to_rating(movie.theta)
+
+
+# BATCH PATH: the same update applied elementwise across many movies
+
+def rating_to_theta_batch(ratings):
+    r = np.clip(np.asarray(ratings, dtype=np.float64), 1.01, 9.99)
+    return np.log(r / (10 - r))
+
+
+def theta_to_rating_batch(thetas):
+    return np.clip(10 / (1 + np.exp(-np.asarray(thetas, dtype=np.float64))), 1.0, 10.0)
+
+
+def update_theta_batch(thetas, theta_priors, comparisons, opponent_thetas, won):
+    """Vectorized update_after_comparison for the theta column; returns new thetas"""
+    comparisons = np.asarray(comparisons, dtype=np.float64)
+    predicted = 1 / (1 + np.exp(np.asarray(opponent_thetas) - thetas))
+    theta_mle = thetas + LEARNING_RATE / (1 + comparisons / 10) * (np.asarray(won, dtype=np.float64) - predicted)
+    return ((comparisons + 1) * theta_mle + SHRINKAGE_STRENGTH * np.asarray(theta_priors)) / (comparisons + 1 + SHRINKAGE_STRENGTH)
+
+
+def bradley_terry_simulate(emotions, opponents, results, trajectory=False):
+    """bradley_terry_simulation for a whole batch, one vector update per round
+
+    With trajectory=True returns the (n, rounds) ratings after every round.
+    """
+    priors = np.array([rating_to_theta(initial_rating(emotion)) for emotion in emotions], dtype=np.float64)
+    opponent_thetas = rating_to_theta_batch(opponents)
+    results = np.asarray(results, dtype=np.bool_)
+    thetas = priors
+    path = np.empty(opponent_thetas.shape) if trajectory else None
+    for r in range(opponent_thetas.shape[1]):
+        thetas = update_theta_batch(thetas, priors, r, opponent_thetas[:, r], results[:, r])
+        if trajectory:
+            path[:, r] = thetas
+    return theta_to_rating_batch(path if trajectory else thetas)
+
+
+def bradley_terry_simulate_batch(batch, trajectory=False):
+    """bradley_terry_simulate over a packed ScenarioBatch"""
+    from .engines import EMOTIONS
+    return bradley_terry_simulate([EMOTIONS[code] for code in batch.emotion_codes.tolist()],
+                                  batch.opponent_ratings(), batch.result_matrix(), trajectory)
+
+
+# FULL-LIBRARY REFIT: maximum a posteriori strengths from a whole comparison history
+
+class ComparisonMatrix:
+    """Sparse (COO) pairwise win counts for a library of `size` movies
+
+    Each unordered pair that ever met is stored once: rows i < j, the number of
+    games between them and i's wins (ties count half to each side).
+    """
+
+    def __init__(self, size, winners, losers, ties=None):
+        winners = np.asarray(winners, dtype=np.int64)
+        losers = np.asarray(losers, dtype=np.int64)
+        score = np.ones(len(winners)) if ties is None else np.where(np.asarray(ties, dtype=np.bool_), 0.5, 1.0)
+        low, high = np.minimum(winners, losers), np.maximum(winners, losers)
+        # Credit to the lower index of each pair: the winner's score, or the rest of the game if it lost
+        low_score = np.where(winners == low, score, 1 - score)
+        pairs, inverse = np.unique(low * size + high, return_inverse=True)
+        self.size = size
+        self.rows = pairs // size
+        self.cols = pairs % size
+        self.games = np.bincount(inverse, minlength=len(pairs)).astype(np.float64)
+        self.row_wins = np.bincount(inverse, weights=low_score, minlength=len(pairs))
+        self.wins = (np.bincount(self.rows, weights=self.row_wins, minlength=size) +
+                     np.bincount(self.cols, weights=self.games - self.row_wins, minlength=size))
+
+    @property
+    def pairs(self):
+        return len(self.rows)
+
+    def games_played(self):
+        return np.bincount(self.rows, weights=self.games, minlength=self.size) + \
+            np.bincount(self.cols, weights=self.games, minlength=self.size)
+
+
+def _mm_step(matrix, thetas, theta_priors, prior_strength, numerator):
+    """One minorization-maximization update of every strength (in theta space)"""
+    gamma = np.exp(thetas)
+    per_pair = matrix.games / (gamma[matrix.rows] + gamma[matrix.cols])
+    denominator = (np.bincount(matrix.rows, weights=per_pair, minlength=matrix.size) +
+                   np.bincount(matrix.cols, weights=per_pair, minlength=matrix.size) +
+                   prior_strength / (gamma + np.exp(theta_priors)))
+    return np.log(numerator / denominator)
+
+
+def log_posterior(matrix, thetas, theta_priors, prior_strength=SHRINKAGE_STRENGTH):
+    """Log-likelihood of the history plus the phantom prior games"""
+    gap = thetas[matrix.rows] - thetas[matrix.cols]
+    likelihood = -(matrix.row_wins * np.logaddexp(0, -gap) + (matrix.games - matrix.row_wins) * np.logaddexp(0, gap)).sum()
+    offset = thetas - theta_priors
+    return likelihood - prior_strength / 2 * (np.logaddexp(0, -offset) + np.logaddexp(0, offset)).sum()
+
+
+def refit_thetas(matrix, theta_priors=None, prior_strength=SHRINKAGE_STRENGTH, tolerance=1e-8, max_iterations=1000,
+                 accelerate=True):
+    """MAP Bradley-Terry strengths by minorization-maximization (Hunter 2004)
+
+    The prior enters as `prior_strength` virtual games against a phantom
+    opponent at each movie's prior strength, split evenly, which keeps
+    unbeaten or winless movies finite and pulls thin histories toward
+    the prior like applyShrinkage. Plain MM crawls on sparse histories
+    (thousands of sweeps), so by default each iteration is a SQUAREM
+    extrapolation of two MM steps that falls back to the plain steps
+    whenever it would lower the posterior. Returns (thetas, iterations).
+    """
+    if theta_priors is None:
+        theta_priors = np.zeros(matrix.size)
+    theta_priors = np.asarray(theta_priors, dtype=np.float64)
+    numerator = matrix.wins + prior_strength / 2
+    thetas = theta_priors.copy()
+    posterior = log_posterior(matrix, thetas, theta_priors, prior_strength)
+    for iteration in range(1, max_iterations + 1):
+        first = _mm_step(matrix, thetas, theta_priors, prior_strength, numerator)
+        if accelerate:
+            second = _mm_step(matrix, first, theta_priors, prior_strength, numerator)
+            r = first - thetas
+            v = second - first - r
+            updated = second
+            v_norm = np.linalg.norm(v)
+            if v_norm > 0:
+                alpha = min(-1.0, -np.linalg.norm(r) / v_norm)
+                candidate = _mm_step(matrix, thetas - 2 * alpha * r + alpha * alpha * v,
+                                     theta_priors, prior_strength, numerator)
+                candidate_posterior = log_posterior(matrix, candidate, theta_priors, prior_strength)
+                if np.isfinite(candidate_posterior) and candidate_posterior >= posterior:
+                    updated = candidate
+            posterior = log_posterior(matrix, updated, theta_priors, prior_strength)
+        else:
+            updated = first
+        change = np.max(np.abs(updated - thetas)) if matrix.size else 0.0
+        thetas = updated
+        if change < tolerance:
+            break
+    return thetas, iteration
+
+
+def refit_ratings(size, winners, losers, ties=None, prior_ratings=None, **options):
+    """1-10 ratings for a library refit from its full comparison history"""
+    priors = None if prior_ratings is None else rating_to_theta_batch(prior_ratings)
+    thetas, _ = refit_thetas(ComparisonMatrix(size, winners, losers, ties), priors, **options)
+    return theta_to_rating_batch(thetas)
@@ -0,0 +1,137 @@
+# RESULT CACHE: Memoized final ratings keyed by a canonical scenario fingerprint
+# LRU-bounded in memory, optionally backed by an SQLite file shared across runs
+
+import hashlib
+import sqlite3
+from collections import OrderedDict
+
+# Engines whose result does not depend on the emotion (dropped from the fingerprint)
+EMOTION_FREE_ENGINES = frozenset({'baseline_free'})
+
+
+def fingerprint(engine, emotion, opponents, results, params=None):
+    """Canonical hashable key for one rating trajectory
+
+    Opponents become floats and results bools, so [5, 6] / (5.0, 6.0) and
+    [1, 0] / (True, False) share an entry. `params` is anything hashable
+    that changes the outcome (a RatingConfig, or None for production).
+    """
+    if engine in EMOTION_FREE_ENGINES:
+        emotion = None
+    return (engine, emotion, tuple(float(o) for o in opponents), tuple(bool(r) for r in results), params)
+
+
+def disk_key(key):
+    """Stable text digest of a fingerprint for the on-disk store"""
+    return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+
+class ResultCache:
+    """LRU map of fingerprint -> final rating, with optional SQLite persistence
+
+    Lookups fall through memory -> disk -> compute; computed and disk hits
+    are promoted into memory. hits/disk_hits/misses count each outcome.
+    """
+
+    def __init__(self, maxsize=100_000, path=None):
+        self.maxsize = maxsize
+        self.path = path
+        self._entries = OrderedDict()
+        self._db = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if path is not None:
+            self._db = sqlite3.connect(path)
+            self._db.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, rating REAL NOT NULL)")
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries or self._disk_get(key) is not None
+
+    def _remember(self, key, rating):
+        self._entries[key] = rating
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _disk_get(self, key):
+        if self._db is None:
+            return None
+        row = self._db.execute("SELECT rating FROM results WHERE key = ?", (disk_key(key),)).fetchone()
+        return row[0] if row else None
+
+    def get(self, key, default=None):
+        rating = self._entries.get(key)
+        if rating is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return rating
+        rating = self._disk_get(key)
+        if rating is not None:
+            self.disk_hits += 1
+            self._remember(key, rating)
+            return rating
+        return default
+
+    def put(self, key, rating):
+        self._remember(key, rating)
+        if self._db is not None:
+            self._db.execute("INSERT OR REPLACE INTO results VALUES (?, ?)", (disk_key(key), rating))
+
+    def get_or_compute(self, key, compute):
+        """Cached rating for `key`, calling compute() only on a miss"""
+        rating = self.get(key)
+        if rating is None:
+            self.misses += 1
+            rating = compute()
+            self.put(key, rating)
+        return rating
+
+    def wrap(self, engine, system, params=None):
+        """Memoized version of an (emotion, opponents, results) engine function
+
+        The result drops into simulate_stream's home_system / wildcard_system.
+        """
+        def cached_system(emotion, opponents, results):
+            key = fingerprint(engine, emotion, opponents, results, params)
+            return self.get_or_compute(key, lambda: system(emotion, opponents, results))
+        return cached_system
+
+    def flush(self):
+        """Commit pending disk writes"""
+        if self._db is not None:
+            self._db.commit()
+
+    def close(self):
+        if self._db is not None:
+            self._db.commit()
+            self._db.close()
+            self._db = None
+
+    def stats(self):
+        return {
+            'entries': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses
+        }
+
+
+# Process-wide cache shared by the scripts unless they are handed their own
+_default_cache = ResultCache()
+
+
+def get_result_cache():
+    return _default_cache
+
+
+def set_result_cache(cache):
+    """Replace the process-wide cache; returns the previous one"""
+    global _default_cache
+    previous = _default_cache
+    _default_cache = cache
+    return previous
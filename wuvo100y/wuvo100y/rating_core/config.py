@@ -0,0 +1,67 @@
+# RATING CONFIG: Every tunable constant of the Wildcard / Home Screen rating flow in one record
+# The defaults reproduce wildcard_adjust_rating and home_screen_baseline_free exactly
+
+from collections import namedtuple
+
+from .elo import (
+    MAJOR_UPSET_BONUS,
+    MAJOR_UPSET_THRESHOLD,
+    MAX_RATING_CHANGE,
+    MIN_RATING_CHANGE,
+    UNDERDOG_MULTIPLIER,
+)
+from .engines import FIRST_ROUND_OFFSET
+
+RatingConfig = namedtuple('RatingConfig', [
+    'k_factors',            # K for games < t1, < t2, < t3, otherwise
+    'k_thresholds',         # (t1, t2, t3) games-played tier boundaries
+    'logistic_scale',       # rating difference for 10:1 expected odds
+    'min_change',
+    'underdog_multiplier',
+    'upset_threshold',
+    'upset_bonus',
+    'max_change',
+    'first_round_offset',   # baseline-free round 1: opponent +/- this
+])
+
+DEFAULT_CONFIG = RatingConfig(
+    k_factors=(0.5, 0.25, 0.125, 0.1),
+    k_thresholds=(5, 10, 20),
+    logistic_scale=4,
+    min_change=MIN_RATING_CHANGE,
+    underdog_multiplier=UNDERDOG_MULTIPLIER,
+    upset_threshold=MAJOR_UPSET_THRESHOLD,
+    upset_bonus=MAJOR_UPSET_BONUS,
+    max_change=MAX_RATING_CHANGE,
+    first_round_offset=FIRST_ROUND_OFFSET
+)
+
+
+def make_config(**overrides):
+    """DEFAULT_CONFIG with some fields replaced; validates the tier tables"""
+    config = DEFAULT_CONFIG._replace(**overrides)
+    config = config._replace(k_factors=tuple(config.k_factors), k_thresholds=tuple(config.k_thresholds))
+    if len(config.k_factors) != 4 or len(config.k_thresholds) != 3:
+        raise ValueError("k_factors needs 4 values and k_thresholds 3 boundaries")
+    if list(config.k_thresholds) != sorted(config.k_thresholds):
+        raise ValueError("k_thresholds must be ascending")
+    if config.logistic_scale <= 0:
+        raise ValueError("logistic_scale must be positive")
+    return config
+
+
+def games_tier(games_played, config=DEFAULT_CONFIG):
+    """K-factor tier index (0-3) for a games-played count"""
+    t1, t2, t3 = config.k_thresholds
+    if games_played < t1:
+        return 0
+    elif games_played < t2:
+        return 1
+    elif games_played < t3:
+        return 2
+    return 3
+
+
+def tier_games(config=DEFAULT_CONFIG):
+    """A representative games-played count inside each tier"""
+    return (0,) + tuple(config.k_thresholds)
@@ -0,0 +1,169 @@
+# CONVERGENCE: How many comparisons a new movie needs before a stopping rule says its rating is done
+# Every movie battles random grid opponents with outcomes drawn from a hidden "true" rating, one
+# vectorized round at a time, until each stopping rule has fired or the comparison cap is reached
+
+from collections import namedtuple
+
+import numpy as np
+
+from . import bradley_terry as bt
+from .batch import adjust_ratings_batch
+from .config import DEFAULT_CONFIG
+from .engines import BASELINE_BY_CODE, EMOTIONS
+from .information_gain import INITIAL_UNCERTAINTY, SENTIMENT_RANGES
+from .kernels import OPPONENT_GAMES
+
+CONVERGENCE_ENGINES = ('wildcard', 'baseline_free', 'unknown_vs_known', 'bradley_terry')
+
+# ci_width:      Fisher-information interval around the engine's own rating is narrow enough
+# bt_early_stop: the Bradley-Terry modal's rule (shouldStopEarly, or MAX_COMPARISONS reached)
+# stable:        the rating moved less than STABILITY_THRESHOLD for STABLE_WINDOW comparisons in a row
+STOPPING_RULES = ('ci_width', 'bt_early_stop', 'stable')
+
+STABILITY_THRESHOLD = 0.2   # ENHANCED_RATING_CONFIG.CONFIDENCE.RATING_STABILITY_THRESHOLD
+STABLE_WINDOW = 2
+MIN_COMPARISONS = 3
+
+# comparisons / final_ratings per movie; converged is False where only the cap stopped it
+ConvergenceResult = namedtuple('ConvergenceResult', ['comparisons', 'ratings', 'converged'])
+
+
+def draw_population(count, seed=0):
+    """(emotion_codes, true_ratings): a sentiment per movie and a true rating inside its usual range"""
+    rng = np.random.default_rng(seed)
+    codes = rng.integers(0, len(EMOTIONS), count).astype(np.uint8)
+    ranges = np.array([SENTIMENT_RANGES[emotion] for emotion in EMOTIONS])
+    low, high = ranges[codes, 0], ranges[codes, 1]
+    return codes, low + (high - low) * rng.random(count)
+
+
+def win_probability(ratings, opponents, noise_scale):
+    """Logistic win model: a rating noise_scale above the opponent wins 10 times out of 11"""
+    return 1 / (1 + 10 ** ((opponents - ratings) / noise_scale))
+
+
+def _play_round(ratings, opponents, won, games, config):
+    """engines.play_round for arrays: the new movie against 5-game opponents"""
+    winners, losers = np.where(won, ratings, opponents), np.where(won, opponents, ratings)
+    new_winners, new_losers = adjust_ratings_batch(winners, losers, np.where(won, games, OPPONENT_GAMES),
+                                                   np.where(won, OPPONENT_GAMES, games), config)
+    return np.where(won, new_winners, new_losers)
+
+
+class _EngineState:
+    """Per-movie state of one engine across rounds"""
+
+    def __init__(self, engine, emotion_codes, config):
+        if engine not in CONVERGENCE_ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}; expected one of {CONVERGENCE_ENGINES}")
+        self.engine = engine
+        self.config = config
+        if engine == 'bradley_terry':
+            self.priors = np.array([bt.rating_to_theta(bt.initial_rating(EMOTIONS[code]))
+                                    for code in range(len(EMOTIONS))])[emotion_codes]
+            self.thetas = self.priors.copy()
+            self.ratings = bt.theta_to_rating_batch(self.thetas)
+        else:
+            # baseline_free has no rating before its first battle; the baseline only feeds the CI rule
+            self.ratings = np.array(BASELINE_BY_CODE)[emotion_codes]
+
+    def step(self, rows, round_index, opponents, won):
+        """Apply round `round_index` to the movies in `rows`"""
+        if self.engine == 'bradley_terry':
+            self.thetas[rows] = bt.update_theta_batch(self.thetas[rows], self.priors[rows], round_index,
+                                                      bt.rating_to_theta_batch(opponents), won)
+            self.ratings[rows] = bt.theta_to_rating_batch(self.thetas[rows])
+        elif self.engine == 'baseline_free' and round_index == 0:
+            offset = np.where(won, self.config.first_round_offset, -self.config.first_round_offset)
+            self.ratings[rows] = np.rint(np.clip(opponents + offset, 1, 10) * 10) / 10
+        else:
+            self.ratings[rows] = _play_round(self.ratings[rows], opponents, won, round_index, self.config)
+
+
+def bt_rule_fires(comparisons):
+    """ComparisonModal's stop check; it depends only on the count when there are no ties"""
+    confidence = bt.confidence_percent(bt.theta_confidence_interval(0.0, comparisons).width)
+    return comparisons >= bt.MAX_COMPARISONS or bt.should_stop_early(comparisons, confidence)
+
+
+def convergence_simulate(engine, emotion_codes, true_ratings, rules=STOPPING_RULES, max_comparisons=40,
+                         noise_scale=2.0, target_width=2.0, seed=0, config=DEFAULT_CONFIG,
+                         opponents=None, results=None):
+    """{rule: ConvergenceResult} for one engine over a population of new movies
+
+    All rules share one pass: a movie keeps battling until every rule has
+    fired for it. Opponents are uniform on the 0.1 grid and the same seed
+    gives every engine the same opponents and outcome draws. Pass
+    (n, max_comparisons) `opponents` and `results` to replay fixed battles.
+    """
+    for rule in rules:
+        if rule not in STOPPING_RULES:
+            raise ValueError(f"Unknown stopping rule {rule!r}; expected one of {STOPPING_RULES}")
+    true_ratings = np.asarray(true_ratings, dtype=np.float64)
+    count = len(true_ratings)
+    rng = np.random.default_rng(seed)
+    state = _EngineState(engine, np.asarray(emotion_codes), config)
+    q = np.log(10) / noise_scale
+    precision = np.full(count, 1 / INITIAL_UNCERTAINTY ** 2)
+    streak = np.zeros(count, dtype=np.int64)
+
+    stopped = {rule: np.zeros(count, dtype=np.int64) for rule in rules}      # 0 = still running
+    stop_ratings = {rule: np.full(count, np.nan) for rule in rules}
+    active = np.arange(count)
+
+    for r in range(max_comparisons):
+        if opponents is None:
+            round_opponents = rng.integers(10, 101, count) / 10
+            round_won = rng.random(count) < win_probability(true_ratings, round_opponents, noise_scale)
+        else:
+            round_opponents, round_won = np.asarray(opponents)[:, r], np.asarray(results, dtype=np.bool_)[:, r]
+        opponent, won = round_opponents[active], round_won[active]
+
+        before = state.ratings[active].copy()
+        p = win_probability(before, opponent, noise_scale)
+        precision[active] += q * q * p * (1 - p)
+        state.step(active, r, opponent, won)
+        after = state.ratings[active]
+        streak[active] = np.where(np.abs(after - before) < STABILITY_THRESHOLD, streak[active] + 1, 0)
+
+        comparisons = r + 1
+        still_running = np.zeros(len(active), dtype=np.bool_)
+        for rule in rules:
+            if rule == 'ci_width':
+                fires = 2 * bt.Z_SCORE / np.sqrt(precision[active]) <= target_width
+            elif rule == 'bt_early_stop':
+                fires = np.full(len(active), bt_rule_fires(comparisons))
+            else:
+                fires = (streak[active] >= STABLE_WINDOW) & (comparisons >= MIN_COMPARISONS)
+            pending = stopped[rule][active] == 0
+            newly = pending & (fires | (comparisons == max_comparisons))
+            rows = active[newly]
+            stopped[rule][rows] = np.where(fires[newly], comparisons, -comparisons)
+            stop_ratings[rule][rows] = after[newly]
+            still_running |= pending & ~newly
+        active = active[still_running]
+        if len(active) == 0:
+            break
+
+    return {rule: ConvergenceResult(np.abs(stopped[rule]), stop_ratings[rule], stopped[rule] > 0)
+            for rule in rules}
+
+
+def convergence_summary(result, true_ratings, max_comparisons):
+    """Distribution of comparisons-to-convergence plus the error left at the stop"""
+    comparisons = result.comparisons
+    errors = np.abs(result.ratings - np.asarray(true_ratings))
+    if len(comparisons) == 0:
+        return {'movies': 0}
+    return {
+        'movies': len(comparisons),
+        'converged_fraction': float(result.converged.mean()),
+        'mean_comparisons': float(comparisons.mean()),
+        'median_comparisons': float(np.median(comparisons)),
+        'p90_comparisons': float(np.percentile(comparisons, 90)),
+        'p99_comparisons': float(np.percentile(comparisons, 99)),
+        'max_comparisons': int(comparisons.max()),
+        'mean_absolute_error': float(errors.mean()),
+        'rmse': float(np.sqrt((errors ** 2).mean())),
+        'histogram': np.bincount(comparisons, minlength=max_comparisons + 1)[1:].tolist()
+    }
@@ -0,0 +1,75 @@
+# RULE COUNTERS: How often each branch of wildcard_adjust_rating fires
+# A 256-bin histogram of RULE_FLAGS masks: one increment per adjustment, mergeable across workers
+
+from contextlib import contextmanager
+
+import numpy as np
+
+from .elo import RULE_FLAGS, set_rule_counters
+
+MASKS = 1 << len(RULE_FLAGS)
+
+
+class RuleCounters:
+    """Adjustment counts keyed by rule mask
+
+    Keeping the joint histogram rather than one counter per rule costs the
+    same single increment and also answers "how often did the floor and the
+    clamp fire together". Scalar engines call count(); batch paths add_masks().
+    """
+
+    def __init__(self):
+        self.masks = [0] * MASKS
+
+    def count(self, mask):
+        self.masks[mask] += 1
+
+    def add_masks(self, masks):
+        """Tally an array of uint8 masks; returns self"""
+        counts = np.bincount(np.asarray(masks, dtype=np.uint8).ravel(), minlength=MASKS)
+        self.masks = [a + b for a, b in zip(self.masks, counts.tolist())]
+        return self
+
+    def merge(self, other):
+        self.masks = [a + b for a, b in zip(self.masks, other.masks)]
+        return self
+
+    @property
+    def adjustments(self):
+        return sum(self.masks)
+
+    def rule_counts(self):
+        """{rule: adjustments where it fired}"""
+        return {rule: sum(count for mask, count in enumerate(self.masks) if mask >> bit & 1)
+                for bit, rule in enumerate(RULE_FLAGS)}
+
+    def summary(self):
+        total = self.adjustments
+        counts = self.rule_counts()
+        return {
+            'adjustments': total,
+            'counts': counts,
+            'rates': {rule: count / total if total else 0.0 for rule, count in counts.items()},
+            'untouched': self.masks[0]
+        }
+
+    def as_dict(self):
+        return {'masks': {str(mask): count for mask, count in enumerate(self.masks) if count}}
+
+    @classmethod
+    def from_dict(cls, data):
+        counters = cls()
+        for mask, count in data['masks'].items():
+            counters.masks[int(mask)] = count
+        return counters
+
+
+@contextmanager
+def counting_rules(counters=None):
+    """Count every scalar wildcard_adjust_rating call inside the block; yields the RuleCounters"""
+    counters = counters if counters is not None else RuleCounters()
+    previous = set_rule_counters(counters)
+    try:
+        yield counters
+    finally:
+        set_rule_counters(previous)
@@ -0,0 +1,131 @@
+# RATING CORE: Wildcard's exact ELO logic (shared by every simulation script)
+# Pure, print-free fast path with an opt-in tracing hook for console output and rule counters
+
+import math
+from collections import namedtuple
+
+MIN_RATING_CHANGE = 0.1
+UNDERDOG_MULTIPLIER = 1.2
+MAJOR_UPSET_THRESHOLD = 3.0
+MAJOR_UPSET_BONUS = 3.0
+MAX_RATING_CHANGE = 0.7
+
+# One record per wildcard_adjust_rating call, handed to the trace hook
+AdjustmentTrace = namedtuple('AdjustmentTrace', [
+    'winner_rating',
+    'loser_rating',
+    'winner_increase',
+    'loser_decrease',
+    'is_underdog',
+    'is_major_upset',
+    'new_winner_rating',
+    'new_loser_rating',
+])
+
+# Branches of wildcard_adjust_rating, bit i of a rule mask set when RULE_FLAGS[i] fired
+RULE_FLAGS = (
+    'winner_floor',     # K * surprise below the 0.1 minimum change
+    'loser_floor',
+    'underdog',         # lower-rated winner: increase * 1.2
+    'major_upset',      # underdog by more than 3.0: +3.0, no cap
+    'winner_cap',       # increase cut to 0.7
+    'loser_cap',        # decrease cut to 0.7
+    'winner_clamp',     # new rating clamped into [1, 10]
+    'loser_clamp',
+)
+
+_trace_hook = None
+_rule_counters = None
+
+
+def set_trace_hook(hook):
+    """Install a callable that receives an AdjustmentTrace per adjustment (None disables)
+
+    Returns the previously installed hook so callers can restore it.
+    """
+    global _trace_hook
+    previous = _trace_hook
+    _trace_hook = hook
+    return previous
+
+
+def set_rule_counters(counters):
+    """Install an object with count(mask) that receives one rule mask per adjustment (None disables)
+
+    Returns the previously installed counters; see rating_core.counters.RuleCounters.
+    """
+    global _rule_counters
+    previous = _rule_counters
+    _rule_counters = counters
+    return previous
+
+
+def get_rule_counters():
+    return _rule_counters
+
+
+def rule_mask(winner_rating, loser_rating, winner_change, loser_change, is_underdog, is_major_upset,
+              winner_increase, loser_decrease):
+    """RULE_FLAGS bits for one adjustment from its intermediate values"""
+    boosted = max(MIN_RATING_CHANGE, winner_change) * (UNDERDOG_MULTIPLIER if is_underdog else 1)
+    flags = (
+        winner_change < MIN_RATING_CHANGE,
+        loser_change < MIN_RATING_CHANGE,
+        is_underdog,
+        is_major_upset,
+        not is_major_upset and boosted > MAX_RATING_CHANGE,
+        not is_major_upset and max(MIN_RATING_CHANGE, loser_change) > MAX_RATING_CHANGE,
+        not 1 <= winner_rating + winner_increase <= 10,
+        not 1 <= loser_rating - loser_decrease <= 10,
+    )
+    return sum(1 << i for i, fired in enumerate(flags) if fired)
+
+
+def calculate_k_factor(games_played):
+    """Wildcard's K-factor ladder"""
+    if games_played < 5:
+        return 0.5
+    elif games_played < 10:
+        return 0.25
+    elif games_played < 20:
+        return 0.125
+    return 0.1
+
+
+def wildcard_adjust_rating(winner_rating, loser_rating, winner_won=True, winner_games_played=0, loser_games_played=0):
+    """Wildcard's exact ELO logic"""
+
+    expected_win_probability = 1 / (1 + math.pow(10, (loser_rating - winner_rating) / 4))
+    surprise = 1 - expected_win_probability
+
+    winner_change = calculate_k_factor(winner_games_played) * surprise
+    loser_change = calculate_k_factor(loser_games_played) * surprise
+    winner_increase = max(MIN_RATING_CHANGE, winner_change)
+    loser_decrease = max(MIN_RATING_CHANGE, loser_change)
+
+    # Underdog bonus, major upset bonus (uncapped) or the usual cap
+    is_underdog = winner_rating < loser_rating
+    is_major_upset = False
+    if is_underdog:
+        winner_increase *= UNDERDOG_MULTIPLIER
+        is_major_upset = loser_rating - winner_rating > MAJOR_UPSET_THRESHOLD
+    if is_major_upset:
+        winner_increase += MAJOR_UPSET_BONUS
+    else:
+        winner_increase = min(MAX_RATING_CHANGE, winner_increase)
+        loser_decrease = min(MAX_RATING_CHANGE, loser_decrease)
+
+    # Bounds enforcement
+    new_winner_rating = round(min(10, max(1, winner_rating + winner_increase)) * 10) / 10
+    new_loser_rating = round(min(10, max(1, loser_rating - loser_decrease)) * 10) / 10
+
+    if _trace_hook is not None:
+        _trace_hook(AdjustmentTrace(
+            winner_rating, loser_rating, winner_increase, loser_decrease,
+            is_underdog, is_major_upset, new_winner_rating, new_loser_rating
+        ))
+    if _rule_counters is not None:
+        _rule_counters.count(rule_mask(winner_rating, loser_rating, winner_change, loser_change,
+                                       is_underdog, is_major_upset, winner_increase, loser_decrease))
+
+    return new_winner_rating, new_loser_rating
@@ -0,0 +1,71 @@
+# RATING ENGINES: Print-free Home Screen and Wildcard rating flows
+# Same round-by-round logic as the simulation scripts, without console output
+
+from .bradley_terry import bradley_terry_simulation
+from .elo import wildcard_adjust_rating
+
+EMOTION_BASELINES = {
+    'LOVED': 8.5,
+    'LIKED': 7.0,
+    'AVERAGE': 5.5,
+    'DISLIKED': 3.0
+}
+DEFAULT_BASELINE = 7.0
+EMOTIONS = tuple(EMOTION_BASELINES)
+
+# Integer emotion codes for compact records: code -> EMOTIONS[code] / BASELINE_BY_CODE[code]
+EMOTION_CODES = {emotion: code for code, emotion in enumerate(EMOTIONS)}
+BASELINE_BY_CODE = tuple(EMOTION_BASELINES[emotion] for emotion in EMOTIONS)
+
+# Baseline-free first round: opponent rating +/- this offset
+FIRST_ROUND_OFFSET = 0.5
+
+
+def play_round(current_rating, opponent_rating, new_movie_won, games_played):
+    """One Known vs Known battle for the new movie; returns its new rating"""
+    if new_movie_won:
+        return wildcard_adjust_rating(current_rating, opponent_rating, True, games_played, 5)[0]
+    return wildcard_adjust_rating(opponent_rating, current_rating, True, 5, games_played)[1]
+
+
+def home_screen_unknown_vs_known(emotion, opponents, results):
+    """Home Screen's Unknown vs Known then Known vs Known approach"""
+    current_rating = EMOTION_BASELINES.get(emotion, DEFAULT_BASELINE)
+    for i in range(len(opponents)):
+        current_rating = play_round(current_rating, opponents[i], results[i], i)
+    return current_rating
+
+
+def wildcard_simulation(emotion, opponents, results):
+    """Wildcard with emotion baselines"""
+    current_rating = EMOTION_BASELINES.get(emotion, DEFAULT_BASELINE)
+    for i, (opponent_rating, new_movie_won) in enumerate(zip(opponents, results)):
+        current_rating = play_round(current_rating, opponent_rating, new_movie_won, i)
+    return current_rating
+
+
+def home_screen_baseline_free(opponents, results):
+    """Home Screen's Unknown vs Known with NO emotion baselines"""
+    if results[0]:
+        derived_rating = min(10, opponents[0] + FIRST_ROUND_OFFSET)
+    else:
+        derived_rating = max(1, opponents[0] - FIRST_ROUND_OFFSET)
+    current_rating = round(derived_rating * 10) / 10
+
+    for i in range(1, len(opponents)):
+        current_rating = play_round(current_rating, opponents[i], results[i], i)
+    return current_rating
+
+
+def home_screen_system(emotion, opponents, results):
+    """Baseline-free Home Screen behind the common (emotion, opponents, results) signature"""
+    return home_screen_baseline_free(opponents, results)
+
+
+# Home Screen variants selectable by name in runners and CLIs
+HOME_ENGINES = {
+    'baseline_free': home_screen_system,
+    'unknown_vs_known': home_screen_unknown_vs_known,
+    'bradley_terry': bradley_terry_simulation
+}
+DEFAULT_HOME_ENGINE = 'baseline_free'
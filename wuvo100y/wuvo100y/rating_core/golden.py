@@ -0,0 +1,159 @@
+# GOLDEN VECTORS: Python-engine adjustments written to a compact corpus and replayed through the app's JS
+# Every (winner, loser, winner games, loser games) on the 0.1 grid is one byte per field; a single node
+# process runs adjustRatingWildcard / calculateKFactor over the whole corpus and mismatches are tallied here
+
+import json
+import os
+import shutil
+import struct
+import subprocess
+import zlib
+from collections import namedtuple
+
+import numpy as np
+
+from .batch import adjust_ratings_masked
+from .elo import RULE_FLAGS, calculate_k_factor
+from .transitions import GRID_SIZE, RATING_GRID
+
+MAGIC = b'WUVOGLD1'
+HEADER_ALIGN = 64
+FORMAT_VERSION = 1
+
+# One uint8 column each, stored back to back: inputs first, then the Python engine's outputs
+COLUMNS = ('winner', 'loser', 'winner_games', 'loser_games', 'new_winner', 'new_loser')
+INPUT_COLUMNS = COLUMNS[:4]
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+RUNNER = os.path.join(PACKAGE_DIR, 'golden_runner.js')
+JS_SOURCE = os.path.normpath(os.path.join(PACKAGE_DIR, '..', '..', '..', 'src', 'Components',
+                                          'EnhancedRatingSystem.js'))
+
+GoldenCorpus = namedtuple('GoldenCorpus', ['columns', 'k_factors', 'metadata'])
+ParityReport = namedtuple('ParityReport', [
+    'vectors',
+    'mismatches',           # vectors where either new rating differs
+    'winner_mismatches',
+    'loser_mismatches',
+    'max_error',            # largest |JS - Python| rating difference
+    'by_rule',              # {rule: (vectors where it fired, mismatches among them)}
+    'k_factor_mismatches',  # [(games, python K, JS K)]
+    'examples'              # first few mismatching vectors as dicts of ratings
+])
+
+
+def golden_vectors(max_games=24):
+    """Every grid rating pair for every games count in 0..max_games, with the Python engine's results"""
+    ratings = np.arange(GRID_SIZE, dtype=np.uint8)
+    games = np.arange(max_games + 1, dtype=np.uint8)
+    winner_games, loser_games, winner, loser = (a.ravel() for a in np.meshgrid(games, games, ratings, ratings,
+                                                                                 indexing='ij'))
+    grid = np.array(RATING_GRID)
+    new_winner, new_loser, _ = adjust_ratings_masked(grid[winner], grid[loser], winner_games, loser_games,
+                                                     with_masks=False)
+    return {
+        'winner': winner, 'loser': loser, 'winner_games': winner_games, 'loser_games': loser_games,
+        'new_winner': _to_index(new_winner), 'new_loser': _to_index(new_loser)
+    }
+
+
+def _to_index(ratings):
+    return (np.rint(np.asarray(ratings) * 10) - 10).astype(np.uint8)
+
+
+def write_corpus(path, max_games=24, level=6):
+    """Write the golden corpus for games 0..max_games; returns the number of vectors"""
+    if not 0 <= max_games <= 255:
+        raise ValueError("max_games must fit in one byte")
+    columns = golden_vectors(max_games)
+    count = len(columns['winner'])
+    header = {
+        'version': FORMAT_VERSION,
+        'count': count,
+        'max_games': max_games,
+        'columns': list(COLUMNS),
+        'compression': 'zlib',
+        'k_factors': [calculate_k_factor(games) for games in range(max_games + 1)]
+    }
+    body = json.dumps(header).encode()
+    size = len(MAGIC) + 4 + len(body)
+    payload = zlib.compress(b''.join(columns[name].tobytes() for name in COLUMNS), level)
+    with open(path, 'wb') as handle:
+        handle.write(MAGIC + struct.pack('<I', len(body)) + body + b' ' * (-size % HEADER_ALIGN))
+        handle.write(payload)
+    return count
+
+
+def read_corpus(path):
+    """GoldenCorpus with one uint8 array per column"""
+    with open(path, 'rb') as handle:
+        if handle.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a golden corpus")
+        (length,) = struct.unpack('<I', handle.read(4))
+        header = json.loads(handle.read(length))
+        if header['version'] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported golden corpus version {header['version']}")
+        size = len(MAGIC) + 4 + length
+        handle.read(-size % HEADER_ALIGN)
+        data = np.frombuffer(zlib.decompress(handle.read()), dtype=np.uint8)
+    count = header['count']
+    columns = {name: data[i * count:(i + 1) * count] for i, name in enumerate(header['columns'])}
+    return GoldenCorpus(columns, header['k_factors'], header)
+
+
+def run_js(corpus_path, js_source=JS_SOURCE, node=None):
+    """(new_winner, new_loser, k_factors) from one node process over the whole corpus"""
+    node = node or shutil.which('node')
+    if node is None:
+        raise RuntimeError("node is not installed; the JS side of the parity check needs it")
+    result = subprocess.run([node, RUNNER, js_source, corpus_path], capture_output=True, check=False)
+    if result.returncode != 0:
+        raise RuntimeError(f"golden runner failed: {result.stderr.decode(errors='replace').strip()}")
+    metadata = read_corpus(corpus_path).metadata
+    count, games = metadata['count'], metadata['max_games'] + 1
+    output = np.frombuffer(result.stdout, dtype=np.uint8)
+    if len(output) != 2 * count + 8 * games:
+        raise RuntimeError(f"golden runner returned {len(output)} bytes for {count:,} vectors")
+    return output[:count], output[count:2 * count], output[2 * count:].view('<f8').tolist()
+
+
+def check_parity(corpus_path, js_source=JS_SOURCE, node=None, examples=10):
+    """ParityReport comparing the corpus's Python results with the JS functions"""
+    corpus = read_corpus(corpus_path)
+    columns = corpus.columns
+    js_winner, js_loser, js_k = run_js(corpus_path, js_source, node)
+
+    winner_wrong = js_winner != columns['new_winner']
+    loser_wrong = js_loser != columns['new_loser']
+    wrong = winner_wrong | loser_wrong
+    errors = np.maximum(np.abs(js_winner.astype(np.int16) - columns['new_winner']),
+                        np.abs(js_loser.astype(np.int16) - columns['new_loser']))
+
+    grid = np.array(RATING_GRID)
+    inputs = [grid[columns['winner']], grid[columns['loser']], columns['winner_games'], columns['loser_games']]
+    _, _, masks = adjust_ratings_masked(*inputs)
+    by_rule = {}
+    for bit, rule in enumerate(RULE_FLAGS):
+        fired = (masks >> bit & 1).astype(np.bool_)
+        by_rule[rule] = (int(np.count_nonzero(fired)), int(np.count_nonzero(fired & wrong)))
+
+    samples = []
+    for i in np.flatnonzero(wrong)[:examples].tolist():
+        samples.append({
+            'winner': RATING_GRID[columns['winner'][i]], 'loser': RATING_GRID[columns['loser'][i]],
+            'winner_games': int(columns['winner_games'][i]), 'loser_games': int(columns['loser_games'][i]),
+            'python': (RATING_GRID[columns['new_winner'][i]], RATING_GRID[columns['new_loser'][i]]),
+            'js': (RATING_GRID[js_winner[i]], RATING_GRID[js_loser[i]])
+        })
+
+    return ParityReport(
+        vectors=len(wrong),
+        mismatches=int(np.count_nonzero(wrong)),
+        winner_mismatches=int(np.count_nonzero(winner_wrong)),
+        loser_mismatches=int(np.count_nonzero(loser_wrong)),
+        max_error=int(errors.max(initial=0)) / 10,
+        by_rule=by_rule,
+        k_factor_mismatches=[(games, python, js) for games, (python, js) in enumerate(zip(corpus.k_factors, js_k))
+                             if python != js],
+        examples=samples
+    )
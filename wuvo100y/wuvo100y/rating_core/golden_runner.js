@@ -0,0 +1,76 @@
+// GOLDEN RUNNER: Feed a whole golden-vector corpus through the app's JavaScript rating functions
+// Usage: node golden_runner.js <EnhancedRatingSystem.js> <corpus>
+// Writes new winner / loser grid indices (2 bytes per vector) then one float64 K per games count to stdout
+
+const fs = require('fs');
+const zlib = require('zlib');
+
+const MAGIC = 'WUVOGLD1';
+const HEADER_ALIGN = 64;
+
+// Top-level declarations the Wildcard functions need; the rest of the module pulls in React Native
+const DECLARATIONS = [
+  'ENHANCED_RATING_CONFIG',
+  'CONFIDENCE_RATING_CONFIG',
+  'calculateDynamicKFactor',
+  'calculateKFactor',
+  'adjustRatingWildcard'
+];
+
+const extractDeclaration = (source, name) => {
+  const match = new RegExp(`^(?:export )?const ${name} = `, 'm').exec(source);
+  if (!match) return null;
+  let depth = 0;
+  let i = match.index + match[0].length;
+  for (; i < source.length; i++) {
+    const c = source[i];
+    if (c === '/' && source[i + 1] === '/') {
+      i = source.indexOf('\n', i);
+    } else if (c === '{' || c === '(') {
+      depth++;
+    } else if (c === '}' || c === ')') {
+      depth--;
+    } else if (c === ';' && depth === 0) {
+      break;
+    }
+  }
+  return source.slice(match.index, i + 1).replace(/^export /, '');
+};
+
+const loadFunctions = (path) => {
+  const source = fs.readFileSync(path, 'utf8');
+  const body = DECLARATIONS.map((name) => extractDeclaration(source, name)).filter(Boolean).join('\n');
+  // A plain function scope: vm contexts route every global lookup through a slow interceptor
+  return new Function(`${body}\nreturn { adjustRatingWildcard, calculateKFactor };`)();
+};
+
+const readCorpus = (path) => {
+  const data = fs.readFileSync(path);
+  if (data.toString('latin1', 0, MAGIC.length) !== MAGIC) throw new Error(`${path} is not a golden corpus`);
+  const length = data.readUInt32LE(MAGIC.length);
+  const header = JSON.parse(data.toString('utf8', MAGIC.length + 4, MAGIC.length + 4 + length));
+  const size = MAGIC.length + 4 + length;
+  const columns = zlib.inflateSync(data.subarray(size + ((HEADER_ALIGN - (size % HEADER_ALIGN)) % HEADER_ALIGN)));
+  const column = (i) => columns.subarray(i * header.count, (i + 1) * header.count);
+  return { header, winner: column(0), loser: column(1), winnerGames: column(2), loserGames: column(3) };
+};
+
+const main = () => {
+  const [source, corpusPath] = process.argv.slice(2);
+  const { adjustRatingWildcard, calculateKFactor } = loadFunctions(source);
+  const corpus = readCorpus(corpusPath);
+  const n = corpus.header.count;
+  const output = Buffer.alloc(2 * n + 8 * (corpus.header.max_games + 1));
+  for (let i = 0; i < n; i++) {
+    const result = adjustRatingWildcard((corpus.winner[i] + 10) / 10, (corpus.loser[i] + 10) / 10, true,
+      corpus.winnerGames[i], corpus.loserGames[i]);
+    output[i] = Math.round(result.updatedSeenContent * 10) - 10;
+    output[n + i] = Math.round(result.updatedNewContent * 10) - 10;
+  }
+  for (let games = 0; games <= corpus.header.max_games; games++) {
+    output.writeDoubleLE(calculateKFactor(games), 2 * n + 8 * games);
+  }
+  process.stdout.write(output);
+};
+
+main();
@@ -0,0 +1,251 @@
+# INFORMATION GAIN: Port of EnhancedRatingSystem.js adaptive opponent selection
+# A precomputed expected-gain table over the 0.1 rating grid plus rating-bucketed candidates
+# finds the most informative opponents without scoring the whole library
+
+import bisect
+import math
+import random
+
+from .opponents import PERCENTILE_RANGES, OpponentIndex
+from .transitions import GRID_SIZE, RATING_GRID
+
+# ENHANCED_RATING_CONFIG.ELO_CONFIG: win probability uses 10 ** (diff / SCALE_FACTOR)
+ELO_BASE = 10
+ELO_SCALE = 10
+INITIAL_UNCERTAINTY = 2.0
+TOP_CANDIDATES = 3
+
+# SENTIMENT_BASELINES: where a movie with each sentiment usually ends up
+SENTIMENT_RANGES = {
+    'LOVED': (7.5, 9.5),
+    'LIKED': (6.0, 8.0),
+    'AVERAGE': (4.5, 6.5),
+    'DISLIKED': (1.5, 4.5)
+}
+
+
+def expected_win_probability(current_rating, opponent_rating, scale=ELO_SCALE):
+    return 1 / (1 + math.pow(ELO_BASE, (opponent_rating - current_rating) / scale))
+
+
+def information_gain(current_rating, current_standard_error, opponent_rating, opponent_standard_error,
+                     scale=ELO_SCALE):
+    """calculateInformationGain: outcome uncertainty (max 1 at p=0.5) times opponent reliability
+
+    current_standard_error is unused, as in the app.
+    """
+    p = expected_win_probability(current_rating, opponent_rating, scale)
+    return 4 * p * (1 - p) * (1 / (1 + opponent_standard_error))
+
+
+def select_optimal_opponent(current_rating, current_standard_error, movies, exclude=(), rng=random,
+                            scale=ELO_SCALE):
+    """selectOptimalOpponent over a list of movie dicts by scoring every candidate
+
+    Movies carry 'id' and 'rating' and, once rated with confidence,
+    'standard_error'. Picks uniformly among the top three by information gain;
+    falls back to any movie when nobody has a standard error yet.
+    """
+    exclude = set(exclude)
+    valid = [movie for movie in movies if movie['id'] not in exclude and movie.get('standard_error') is not None]
+    if not valid:
+        fallback = [movie for movie in movies if movie['id'] not in exclude]
+        return fallback[rng.randrange(len(fallback))] if fallback else None
+    ranked = sorted(valid, key=lambda movie: -information_gain(current_rating, current_standard_error,
+                                                                movie['rating'], movie['standard_error'], scale))
+    top = ranked[:TOP_CANDIDATES]
+    return top[rng.randrange(len(top))]
+
+
+def grid_index(rating):
+    """Nearest 0.1 grid position of a rating, clamped to [1, 10]"""
+    return min(GRID_SIZE - 1, max(0, int(round(rating * 10)) - 10))
+
+
+class ExpectedGainTable:
+    """4p(1-p) for every (current, opponent) pair on the 0.1 grid
+
+    Also stores, per current rating, the opponent grid positions ordered from
+    most to least uncertain outcome, which is the order candidates are searched in.
+    """
+
+    def __init__(self, scale=ELO_SCALE):
+        self.scale = scale
+        self.uncertainty = []
+        self.search_order = []
+        for current in RATING_GRID:
+            row = []
+            for opponent in RATING_GRID:
+                p = expected_win_probability(current, opponent, scale)
+                row.append(4 * p * (1 - p))
+            self.uncertainty.append(row)
+            self.search_order.append(sorted(range(GRID_SIZE), key=lambda b: (-row[b], b)))
+
+    def gain(self, current_rating, opponent_rating, opponent_standard_error):
+        return (self.uncertainty[grid_index(current_rating)][grid_index(opponent_rating)]
+                * (1 / (1 + opponent_standard_error)))
+
+
+_TABLES = {}
+
+
+def get_gain_table(scale=ELO_SCALE):
+    if scale not in _TABLES:
+        _TABLES[scale] = ExpectedGainTable(scale)
+    return _TABLES[scale]
+
+
+class InformationGainIndex:
+    """Library bucketed by 0.1 rating, each bucket sorted by standard error
+
+    best(rating) visits buckets from the most uncertain matchup outward and stops
+    once no remaining bucket can beat the current top three, so a 10k-title
+    library costs a few dozen candidate checks. Ratings are snapped to the grid
+    (user ratings already live on it); ties keep library insertion order, like
+    the app's stable sort.
+    """
+
+    def __init__(self, movies=(), scale=ELO_SCALE):
+        self.table = get_gain_table(scale)
+        self._buckets = [[] for _ in range(GRID_SIZE)]   # (standard_error, seq, id)
+        self._entries = {}                               # id -> (movie, bucket, key)
+        self._movies = OpponentIndex()                    # every movie, for the no-stats fallback
+        self._next_seq = 0
+        for movie in movies:
+            self.add(movie)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, movie_id):
+        return movie_id in self._entries
+
+    def add(self, movie):
+        """Index a movie dict; an existing id is updated instead"""
+        if movie['id'] in self._entries:
+            self.update(movie['id'], movie['rating'], movie.get('standard_error'))
+            return
+        seq = self._next_seq
+        self._next_seq += 1
+        self._entries[movie['id']] = (movie, None, (None, seq, movie['id']))
+        self._movies.add(movie)
+        self._insert(movie)
+
+    def update(self, movie_id, rating, standard_error=None):
+        """Re-bucket a movie after its rating or standard error changed"""
+        movie = self._remove(movie_id)
+        self._movies.update_rating(movie_id, rating)
+        movie['standard_error'] = standard_error
+        self._insert(movie)
+
+    def remove(self, movie_id):
+        movie = self._remove(movie_id)
+        del self._entries[movie_id]
+        self._movies.remove(movie_id)
+        return movie
+
+    def _insert(self, movie):
+        _, _, (_, seq, movie_id) = self._entries[movie['id']]
+        standard_error = movie.get('standard_error')
+        if standard_error is None:
+            self._entries[movie_id] = (movie, None, (None, seq, movie_id))
+            return
+        bucket = grid_index(movie['rating'])
+        key = (standard_error, seq, movie_id)
+        bisect.insort(self._buckets[bucket], key)
+        self._entries[movie_id] = (movie, bucket, key)
+
+    def _remove(self, movie_id):
+        movie, bucket, key = self._entries[movie_id]
+        if bucket is not None:
+            entries = self._buckets[bucket]
+            del entries[bisect.bisect_left(entries, key)]
+            self._entries[movie_id] = (movie, None, (None, key[1], movie_id))
+        return movie
+
+    def best(self, rating, exclude=(), k=TOP_CANDIDATES):
+        """[(gain, movie)] for the k highest-gain opponents, best first"""
+        exclude = set(exclude)
+        current = grid_index(rating)
+        row = self.table.uncertainty[current]
+        top = []   # (-gain, seq, id), kept sorted, at most k long
+        for bucket in self.table.search_order[current]:
+            uncertainty = row[bucket]
+            # Reliability is at most 1, so this bucket and every later one are out of reach
+            if len(top) == k and uncertainty < -top[-1][0]:
+                break
+            for standard_error, seq, movie_id in self._buckets[bucket]:
+                if movie_id in exclude:
+                    continue
+                candidate = (-(uncertainty * (1 / (1 + standard_error))), seq, movie_id)
+                if len(top) == k and candidate >= top[-1]:
+                    break   # the rest of the bucket has larger errors (or later ties)
+                bisect.insort(top, candidate)
+                del top[k:]
+        return [(-gain, self._entries[movie_id][0]) for gain, _, movie_id in top]
+
+    def select(self, rating, exclude=(), rng=random):
+        """selectOptimalOpponent: random pick among the top three (None if nobody is left)"""
+        top = self.best(rating, exclude)
+        if top:
+            return top[rng.randrange(len(top))][1]
+        # Nobody left has confidence stats: the app falls back to a random movie
+        return self.select_random(exclude, rng)
+
+    def select_random(self, exclude=(), rng=random):
+        """Uniformly random movie whose id is not in `exclude` (None if nobody is left)"""
+        excluded = {movie_id for movie_id in exclude if movie_id in self._entries}
+        if len(excluded) >= len(self._entries):
+            return None
+        return self._movies.sample(1, excluded, rng)[0]
+
+    def select_initial(self, emotion, rng=random):
+        """selectInitialOpponent: random movie from the sentiment's percentile band"""
+        return self._movies.choose_in_percentile(*PERCENTILE_RANGES[emotion], rng=rng)
+
+
+# CONVERGENCE: comparisons needed before the new movie's rating is known to a target precision.
+# The app's standard error only counts wins and losses, so it cannot tell good opponents from bad
+# ones; the simulation tracks a Glicko-style posterior instead, for which 4p(1-p) is exactly the
+# (normalized) Fisher information that calculateInformationGain maximizes.
+
+def glicko_update(mean, standard_error, opponent_rating, opponent_standard_error, score, scale):
+    """One Glicko-1 step: new (mean, standard_error) after scoring `score` against an opponent"""
+    q = math.log(ELO_BASE) / scale
+    g = 1 / math.sqrt(1 + 3 * q * q * opponent_standard_error ** 2 / math.pi ** 2)
+    p = 1 / (1 + math.pow(ELO_BASE, -g * (mean - opponent_rating) / scale))
+    precision = 1 / standard_error ** 2 + q * q * g * g * p * (1 - p)
+    mean = min(10.0, max(1.0, mean + q * g * (score - p) / precision))
+    return mean, 1 / math.sqrt(precision)
+
+
+def comparisons_to_confidence(index, emotion, true_rating, strategy='information_gain', target=1.0,
+                              max_comparisons=40, scale=4, rng=random, baseline=None):
+    """Comparisons until the posterior standard error drops to `target` (capped at max_comparisons)
+
+    The new movie beats an opponent with the logistic probability implied by
+    the hidden `true_rating`. Both strategies open with the sentiment percentile
+    opponent; 'information_gain' then asks InformationGainIndex.select and
+    'percentile' picks uniformly at random, like OpponentIndex.select_opponents.
+    """
+    mean = baseline if baseline is not None else sum(SENTIMENT_RANGES[emotion]) / 2
+    standard_error = INITIAL_UNCERTAINTY
+    used = []
+    opponent = index.select_initial(emotion, rng)
+    for comparison in range(1, max_comparisons + 1):
+        used.append(opponent['id'])
+        opponent_error = opponent.get('standard_error') or 0.0
+        won = rng.random() < expected_win_probability(true_rating, opponent['rating'], scale)
+        mean, standard_error = glicko_update(mean, standard_error, opponent['rating'], opponent_error,
+                                             1.0 if won else 0.0, scale)
+        if standard_error <= target:
+            return comparison, mean
+        if strategy == 'information_gain':
+            opponent = index.select(mean, used, rng)
+        elif strategy == 'percentile':
+            opponent = index.select_random(used, rng)
+        else:
+            raise ValueError(f"Unknown strategy {strategy!r}")
+        if opponent is None:
+            return comparison, mean
+    return max_comparisons, mean
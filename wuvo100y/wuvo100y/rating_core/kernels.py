@@ -0,0 +1,261 @@
+# COMPILED KERNELS: The sequential N-round battle loop for a whole batch in native code
+# JIT-compiled with numba when it is installed; otherwise the same loop runs as plain Python
+
+import math
+
+import numpy as np
+
+from .config import DEFAULT_CONFIG
+from .engines import BASELINE_BY_CODE, DEFAULT_BASELINE, EMOTION_BASELINES
+
+try:
+    from numba import njit
+except ImportError:  # optional dependency
+    njit = None
+
+HAVE_NUMBA = njit is not None
+
+# play_round's opponents are always treated as 5-game movies
+OPPONENT_GAMES = 5
+
+KERNEL_ENGINES = ('wildcard', 'unknown_vs_known', 'baseline_free')
+
+# Comparison-log outcome codes (see rating_core.history)
+DECISIVE = 0
+TIE = 1
+DERIVED_WINNER = 2   # winner was unrated: first-round rating = loser + offset
+DERIVED_LOSER = 3    # loser was unrated: first-round rating = winner - offset
+
+
+# The loops below are the whole kernel. They only use float
+# arithmetic, math.pow and round() so numba compiles them as-is and the
+# interpreted fallback gives the same results as wildcard_adjust_rating.
+
+def _k_factor(games_played, k_factors, k_thresholds):
+    for tier in range(3):
+        if games_played < k_thresholds[tier]:
+            return k_factors[tier]
+    return k_factors[3]
+
+
+def _adjust(winner, loser, winner_games, loser_games, k_factors, k_thresholds, constants):
+    """wildcard_adjust_rating; constants = scale, floor, underdog, upset threshold, bonus, cap"""
+    logistic_scale, min_change, underdog_multiplier, upset_threshold, upset_bonus, max_change = constants
+    surprise = 1 - 1 / (1 + math.pow(10, (loser - winner) / logistic_scale))
+    winner_increase = max(min_change, _k_factor(winner_games, k_factors, k_thresholds) * surprise)
+    loser_decrease = max(min_change, _k_factor(loser_games, k_factors, k_thresholds) * surprise)
+    is_major_upset = False
+    if winner < loser:
+        winner_increase *= underdog_multiplier
+        is_major_upset = loser - winner > upset_threshold
+    if is_major_upset:
+        winner_increase += upset_bonus
+    else:
+        winner_increase = min(max_change, winner_increase)
+        loser_decrease = min(max_change, loser_decrease)
+    return (round(min(10.0, max(1.0, winner + winner_increase)) * 10) / 10,
+            round(min(10.0, max(1.0, loser - loser_decrease)) * 10) / 10)
+
+
+def _battle_loop(start_ratings, opponents, results, first_round, out, k_factors, k_thresholds, constants):
+    """out[i] = new movie's rating after rounds first_round.. of scenario i"""
+    for i in range(len(start_ratings)):
+        rating = start_ratings[i]
+        row_opponents = opponents[i]
+        row_results = results[i]
+        for r in range(first_round, len(row_opponents)):
+            opponent = row_opponents[r]
+            if row_results[r]:
+                rating = _adjust(rating, opponent, r, OPPONENT_GAMES, k_factors, k_thresholds, constants)[0]
+            else:
+                rating = _adjust(opponent, rating, OPPONENT_GAMES, r, k_factors, k_thresholds, constants)[1]
+        out[i] = rating
+    return out
+
+
+def _replay_loop(winners, losers, outcomes, ratings, games, k_factors, k_thresholds, constants, first_round_offset,
+                 states):
+    """Apply logged comparisons in order to ratings/games (indexed by movie id) in place
+
+    A non-empty (n, 4) `states` receives each row's (winner rating, loser
+    rating, winner games, loser games) before the row is applied.
+    """
+    record = len(states) > 0
+    for e in range(len(winners)):
+        winner = winners[e]
+        loser = losers[e]
+        outcome = outcomes[e]
+        if record:
+            states[e, 0] = ratings[winner]
+            states[e, 1] = ratings[loser]
+            states[e, 2] = games[winner]
+            states[e, 3] = games[loser]
+        if outcome == DECISIVE:
+            ratings[winner], ratings[loser] = _adjust(ratings[winner], ratings[loser], games[winner], games[loser],
+                                                      k_factors, k_thresholds, constants)
+        elif outcome == DERIVED_WINNER:
+            ratings[winner] = round(min(10.0, max(1.0, ratings[loser] + first_round_offset)) * 10) / 10
+        elif outcome == DERIVED_LOSER:
+            ratings[loser] = round(min(10.0, max(1.0, ratings[winner] - first_round_offset)) * 10) / 10
+        # Wildcard has no tie rule: a TIE only counts as a game for both sides
+        games[winner] += 1
+        games[loser] += 1
+
+
+def _sparse_replay_loop(winners, losers, outcomes, states, changed, current, dirty,
+                        k_factors, k_thresholds, constants, first_round_offset, record):
+    """Re-run only the rows whose result can differ from the recorded run
+
+    A row is re-run when `changed` flags it or it involves a dirty movie (one
+    an earlier re-run row touched). Clean movies read their rating from the
+    row's recorded `states`, dirty ones from `current`; both sides of a re-run
+    row become dirty. With `record`, re-run rows get their new input ratings
+    written back into `states`. Returns the number of rows re-run.
+    """
+    replayed = 0
+    for e in range(len(winners)):
+        winner = winners[e]
+        loser = losers[e]
+        if not (changed[e] or dirty[winner] or dirty[loser]):
+            continue
+        winner_rating = current[winner] if dirty[winner] else states[e][0]
+        loser_rating = current[loser] if dirty[loser] else states[e][1]
+        if record:
+            states[e][0] = winner_rating
+            states[e][1] = loser_rating
+        outcome = outcomes[e]
+        if outcome == DECISIVE:
+            winner_rating, loser_rating = _adjust(winner_rating, loser_rating, int(states[e][2]), int(states[e][3]),
+                                                  k_factors, k_thresholds, constants)
+        elif outcome == DERIVED_WINNER:
+            winner_rating = round(min(10.0, max(1.0, loser_rating + first_round_offset)) * 10) / 10
+        elif outcome == DERIVED_LOSER:
+            loser_rating = round(min(10.0, max(1.0, winner_rating - first_round_offset)) * 10) / 10
+        current[winner] = winner_rating
+        current[loser] = loser_rating
+        dirty[winner] = True
+        dirty[loser] = True
+        replayed += 1
+    return replayed
+
+
+if HAVE_NUMBA:
+    # Rebinding the module globals makes the compiled loops call the compiled helpers
+    _k_factor = njit(cache=True)(_k_factor)
+    _adjust = njit(cache=True)(_adjust)
+    _compiled_battle_loop = njit(cache=True)(_battle_loop)
+    _compiled_replay_loop = njit(cache=True)(_replay_loop)
+    _compiled_sparse_replay_loop = njit(cache=True)(_sparse_replay_loop)
+
+
+def _constants(config):
+    return (float(config.logistic_scale), float(config.min_change), float(config.underdog_multiplier),
+            float(config.upset_threshold), float(config.upset_bonus), float(config.max_change))
+
+
+def _use_jit(jit):
+    """jit=None means numba if installed; jit=True insists on it"""
+    if jit and not HAVE_NUMBA:
+        raise RuntimeError("jit=True needs numba; install it or pass jit=None")
+    return HAVE_NUMBA if jit is None else jit
+
+
+def run_battle_loop(start_ratings, opponents, results, first_round=0, config=DEFAULT_CONFIG, jit=None):
+    """Final ratings after replaying each scenario's rounds from its start rating
+
+    `opponents` is an (n, rounds) array of any ratings in [1, 10] (no 0.1 grid
+    needed) and `results` the matching bool matrix. jit=None uses numba when
+    available; jit=False forces the pure-Python loop.
+    """
+    start_ratings = np.asarray(start_ratings, dtype=np.float64)
+    opponents = np.asarray(opponents, dtype=np.float64)
+    results = np.asarray(results, dtype=np.bool_)
+    k_factors = tuple(float(k) for k in config.k_factors)
+    k_thresholds = tuple(int(t) for t in config.k_thresholds)
+    if _use_jit(jit):
+        out = np.empty(len(start_ratings), dtype=np.float64)
+        return _compiled_battle_loop(start_ratings, opponents, results, first_round, out,
+                                     k_factors, k_thresholds, _constants(config))
+    # Python floats and lists are much faster than NumPy scalars in an interpreted loop
+    out = [0.0] * len(start_ratings)
+    _battle_loop(start_ratings.tolist(), opponents.tolist(), results.tolist(), first_round, out,
+                 k_factors, k_thresholds, _constants(config))
+    return np.array(out, dtype=np.float64)
+
+
+def replay_comparisons(winners, losers, outcomes, ratings, games, config=DEFAULT_CONFIG, jit=None, record=False):
+    """Re-rate a library by replaying its comparisons in order with Wildcard's ELO
+
+    `ratings` (float) and `games` (int) are indexed by movie id and hold the
+    state before the first comparison; returns new (ratings, games) arrays.
+    With record=True a third (n, 4) array holds every row's state before it
+    was applied: winner rating, loser rating, winner games, loser games.
+    """
+    ratings = np.array(ratings, dtype=np.float64)
+    games = np.array(games, dtype=np.int64)
+    states = np.empty((len(winners) if record else 0, 4), dtype=np.float64)
+    args = (tuple(float(k) for k in config.k_factors), tuple(int(t) for t in config.k_thresholds),
+            _constants(config), float(config.first_round_offset), states)
+    if _use_jit(jit):
+        _compiled_replay_loop(np.asarray(winners), np.asarray(losers), np.asarray(outcomes), ratings, games, *args)
+        return (ratings, games, states) if record else (ratings, games)
+    rating_list, game_list = ratings.tolist(), games.tolist()
+    _replay_loop(np.asarray(winners).tolist(), np.asarray(losers).tolist(), np.asarray(outcomes).tolist(),
+                 rating_list, game_list, *args)
+    ratings, games = np.array(rating_list, dtype=np.float64), np.array(game_list, dtype=np.int64)
+    return (ratings, games, states) if record else (ratings, games)
+
+
+def replay_changed_rows(winners, losers, outcomes, states, changed, ratings, config=DEFAULT_CONFIG, first=0,
+                        jit=None, record=False):
+    """Final (ratings, rows re-run) of a recorded replay under `config`, re-running only affected rows
+
+    `states` is the (n, 4) record from replay_comparisons(record=True),
+    `ratings` that run's final ratings and `changed` marks the rows whose
+    result differs under `config` given their recorded inputs. Rows before
+    `first` must be unchanged. With record, `states` (a float64 array) is
+    updated in place to the new run's inputs.
+    """
+    winners, losers, outcomes = np.asarray(winners)[first:], np.asarray(losers)[first:], np.asarray(outcomes)[first:]
+    suffix = states[first:]
+    changed = np.asarray(changed, dtype=np.bool_)[first:]
+    current = np.array(ratings, dtype=np.float64)
+    dirty = np.zeros(len(current), dtype=np.bool_)
+    args = (tuple(float(k) for k in config.k_factors), tuple(int(t) for t in config.k_thresholds),
+            _constants(config), float(config.first_round_offset), record)
+    if _use_jit(jit):
+        replayed = _compiled_sparse_replay_loop(winners, losers, outcomes, suffix, changed, current, dirty, *args)
+        return current, replayed
+    state_rows = suffix.tolist()
+    current_list, dirty_list = current.tolist(), dirty.tolist()
+    replayed = _sparse_replay_loop(winners.tolist(), losers.tolist(), outcomes.tolist(), state_rows, changed.tolist(),
+                                   current_list, dirty_list, *args)
+    if record:
+        suffix[:] = state_rows
+    return np.array(current_list, dtype=np.float64), replayed
+
+
+def kernel_simulate(emotions, opponents, results, engine='wildcard', config=DEFAULT_CONFIG, jit=None):
+    """Whole-batch equivalent of the engines' (emotion, opponents, results) functions
+
+    `emotions` is a sequence of emotion names or an array of EMOTION_CODES.
+    """
+    opponents = np.asarray(opponents, dtype=np.float64)
+    if engine in ('wildcard', 'unknown_vs_known'):
+        emotions = np.asarray(emotions)
+        if emotions.dtype.kind in 'iu':
+            start = np.array(BASELINE_BY_CODE)[emotions]
+        else:
+            start = np.array([EMOTION_BASELINES.get(emotion, DEFAULT_BASELINE) for emotion in emotions.tolist()])
+        return run_battle_loop(start, opponents, results, 0, config, jit)
+    elif engine == 'baseline_free':
+        won_first = np.asarray(results, dtype=np.bool_)[:, 0]
+        offset = np.where(won_first, config.first_round_offset, -config.first_round_offset)
+        start = np.rint(np.clip(opponents[:, 0] + offset, 1, 10) * 10) / 10
+        return run_battle_loop(start, opponents, results, 1, config, jit)
+    raise ValueError(f"Unknown engine {engine!r}; expected one of {KERNEL_ENGINES}")
+
+
+def kernel_simulate_batch(batch, engine='wildcard', config=DEFAULT_CONFIG, jit=None):
+    """kernel_simulate over a packed ScenarioBatch"""
+    return kernel_simulate(batch.emotion_codes, batch.opponent_ratings(), batch.result_matrix(), engine, config, jit)
@@ -0,0 +1,148 @@
+# OPPONENT INDEX: Persistent rating-sorted library for percentile opponent selection
+# Replaces re-sorting and shuffling the whole user library on every new movie
+
+import bisect
+import random
+
+# Emotion -> percentile band of the library (0.0 = highest rated) for the first opponent
+PERCENTILE_RANGES = {
+    'LOVED': (0.0, 0.25),      # Top 25% (highest rated)
+    'LIKED': (0.25, 0.50),     # Upper-middle 25-50%
+    'AVERAGE': (0.50, 0.75),   # Lower-middle 50-75%
+    'DISLIKED': (0.75, 1.0)    # Bottom 25% (lowest rated)
+}
+
+
+class OpponentIndex:
+    """Movies kept sorted by rating (descending) for O(log n) percentile lookups
+
+    Ties keep insertion order, matching `sorted(movies, key=rating, reverse=True)`.
+    Movies are the usual {'id', 'title', 'rating'} dicts; `update_rating` edits
+    them in place. Random picks take an `rng` with randrange (default: random).
+    """
+
+    def __init__(self, movies=()):
+        self._keys = []        # (-rating, seq), ascending == rating descending
+        self._sorted = []      # movies in the same order as _keys
+        self._entries = {}     # id -> (movie, key in _keys, position in _movies)
+        self._movies = []      # insertion order, for O(1) uniform sampling
+        self._next_seq = 0
+        movies = list(movies)
+        if movies:
+            self._bulk_load(movies)
+
+    def _bulk_load(self, movies):
+        for movie in movies:
+            if movie['id'] in self._entries:
+                raise ValueError(f"Duplicate movie id: {movie['id']}")
+            self._entries[movie['id']] = (movie, (-movie['rating'], self._next_seq), len(self._movies))
+            self._movies.append(movie)
+            self._next_seq += 1
+        order = sorted(range(len(movies)), key=lambda i: (-movies[i]['rating'], i))
+        self._keys = [self._entries[movies[i]['id']][1] for i in order]
+        self._sorted = [movies[i] for i in order]
+
+    def __len__(self):
+        return len(self._movies)
+
+    def __contains__(self, movie_id):
+        return movie_id in self._entries
+
+    def __iter__(self):
+        """Movies from highest to lowest rating"""
+        return iter(self._sorted)
+
+    def get(self, movie_id):
+        return self._entries[movie_id][0]
+
+    def add(self, movie):
+        """Insert a movie; an existing id is re-rated instead"""
+        if movie['id'] in self._entries:
+            self.update_rating(movie['id'], movie['rating'])
+            return
+        key = (-movie['rating'], self._next_seq)
+        self._next_seq += 1
+        self._entries[movie['id']] = (movie, key, len(self._movies))
+        self._movies.append(movie)
+        self._insert_sorted(movie, key)
+
+    def update_rating(self, movie_id, rating):
+        """Move a movie to its new rating position
+
+        The old position comes from the stored key, so callers may already
+        have written the new rating into the shared movie dict.
+        """
+        movie, key, position = self._entries[movie_id]
+        self._remove_sorted(key)
+        movie['rating'] = rating
+        key = (-rating, key[1])
+        self._entries[movie_id] = (movie, key, position)
+        self._insert_sorted(movie, key)
+
+    def remove(self, movie_id):
+        movie, key, position = self._entries.pop(movie_id)
+        self._remove_sorted(key)
+        # Swap-remove from the sampling list
+        last = self._movies.pop()
+        if position < len(self._movies):
+            self._movies[position] = last
+            last_movie, last_key, _ = self._entries[last['id']]
+            self._entries[last['id']] = (last_movie, last_key, position)
+        return movie
+
+    def _insert_sorted(self, movie, key):
+        i = bisect.bisect_left(self._keys, key)
+        self._keys.insert(i, key)
+        self._sorted.insert(i, movie)
+
+    def _remove_sorted(self, key):
+        i = bisect.bisect_left(self._keys, key)
+        assert i < len(self._keys) and self._keys[i] == key, f"OpponentIndex out of sync at {key}"
+        del self._keys[i]
+        del self._sorted[i]
+
+    def percentile_bounds(self, low, high):
+        """[start, stop) positions of a percentile band (always at least one movie)"""
+        n = len(self._sorted)
+        start = int(low * n)
+        return start, max(int(high * n), start + 1)
+
+    def percentile_movies(self, low, high):
+        start, stop = self.percentile_bounds(low, high)
+        return self._sorted[start:stop]
+
+    def choose_in_percentile(self, low, high, rng=random):
+        """Random movie from a percentile band (same draw as random.choice on the slice)"""
+        start, stop = self.percentile_bounds(low, high)
+        stop = min(stop, len(self._sorted))
+        if start >= stop:
+            raise ValueError("Cannot choose from an empty library")
+        return self._sorted[rng.randrange(start, stop)]
+
+    def sample(self, k, exclude=(), rng=random):
+        """k distinct random movies whose ids are not in `exclude`
+
+        Rejection sampling costs O(k) expected draws while most of the library
+        is eligible; otherwise falls back to sampling the eligible list.
+        """
+        excluded = {movie_id for movie_id in exclude if movie_id in self._entries}
+        available = len(self._movies) - len(excluded)
+        if k > available:
+            raise ValueError(f"Need {k} opponents but only {available} movies are available")
+        if 2 * (len(excluded) + k) > len(self._movies):
+            eligible = [movie for movie in self._movies if movie['id'] not in excluded]
+            return rng.sample(eligible, k)
+
+        picked = []
+        while len(picked) < k:
+            movie = self._movies[rng.randrange(len(self._movies))]
+            if movie['id'] not in excluded:
+                excluded.add(movie['id'])
+                picked.append(movie)
+        return picked
+
+    def select_opponents(self, emotion, count=3, rng=random):
+        """First opponent from the emotion's percentile band, the rest uniformly at random"""
+        low, high = PERCENTILE_RANGES[emotion]
+        first_opponent = self.choose_in_percentile(low, high, rng)
+        return [first_opponent] + self.sample(count - 1, (first_opponent['id'],), rng)
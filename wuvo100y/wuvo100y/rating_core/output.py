@@ -0,0 +1,133 @@
+# OUTPUT LAYER: Shared verbosity levels and sinks for every simulation entry point
+# Text goes through a buffered writer; --format jsonl emits one JSON record per event
+
+import argparse
+import atexit
+import json
+import sys
+
+SILENT, SUMMARY, SCENARIO, ROUND = 0, 1, 2, 3
+LEVELS = {
+    'silent': SILENT,
+    'summary': SUMMARY,
+    'scenario': SCENARIO,
+    'round': ROUND
+}
+FORMATS = ('text', 'jsonl')
+
+# Lines held in memory before a single write() when running from the CLI
+CLI_BUFFER_LINES = 512
+
+
+class Reporter:
+    """Filters output by verbosity level and writes it as text or JSON Lines
+
+    `stream=None` resolves sys.stdout at write time, so redirect_stdout works.
+    With buffer_lines=1 every line is written immediately (same as print).
+    """
+
+    def __init__(self, verbosity=ROUND, format='text', stream=None, buffer_lines=1):
+        if format not in FORMATS:
+            raise ValueError(f"Unknown output format: {format}")
+        self.verbosity = verbosity
+        self.format = format
+        self.stream = stream
+        self.buffer_lines = max(1, buffer_lines)
+        self._pending = []
+
+    def enabled(self, level):
+        """True if anything (text or records) is written at this level"""
+        return level <= self.verbosity
+
+    def text_enabled(self, level):
+        return self.format == 'text' and level <= self.verbosity
+
+    def text(self, level, line=''):
+        if self.format == 'text' and level <= self.verbosity:
+            self._write(str(line))
+
+    def record(self, level, kind, **fields):
+        if self.format == 'jsonl' and level <= self.verbosity:
+            self._write(json.dumps({'type': kind, **fields}, ensure_ascii=False, default=_json_default))
+
+    def _write(self, line):
+        self._pending.append(line)
+        if len(self._pending) >= self.buffer_lines:
+            self.flush()
+
+    def flush(self):
+        if self._pending:
+            stream = self.stream or sys.stdout
+            stream.write('\n'.join(self._pending) + '\n')
+            self._pending.clear()
+
+
+def _json_default(value):
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    if hasattr(value, '_asdict'):
+        return value._asdict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# The active reporter; the default keeps the scripts' original print behaviour
+_reporter = Reporter()
+# Reporter whose flush configure_output registered with atexit (only the latest one stays registered)
+_exit_reporter = None
+
+
+def get_reporter():
+    return _reporter
+
+
+def set_reporter(reporter):
+    """Install the process-wide reporter; returns the previous one"""
+    global _reporter
+    previous = _reporter
+    previous.flush()
+    _reporter = reporter
+    return previous
+
+
+def emit(level, line=''):
+    """print() replacement that honours the active verbosity and format"""
+    _reporter.text(level, line)
+
+
+def emit_record(level, kind, **fields):
+    """Structured event; only written in --format jsonl"""
+    _reporter.record(level, kind, **fields)
+
+
+def add_output_arguments(parser, default='round'):
+    """--quiet/--silent/--verbosity/--format switches shared by every script"""
+    group = parser.add_argument_group('output')
+    group.add_argument('-q', '--quiet', action='store_const', dest='verbosity', const='summary',
+                       help="summary only (same as --verbosity summary)")
+    group.add_argument('--silent', action='store_const', dest='verbosity', const='silent',
+                       help="no output at all")
+    group.add_argument('--verbosity', choices=LEVELS)
+    group.add_argument('--format', choices=FORMATS, default='text',
+                       help="text (default) or one JSON record per line")
+    parser.set_defaults(verbosity=default)
+    return parser
+
+
+def configure_output(args):
+    """Install a buffered reporter from parsed CLI arguments and flush it at exit"""
+    global _exit_reporter
+    reporter = Reporter(LEVELS[args.verbosity], args.format, buffer_lines=CLI_BUFFER_LINES)
+    set_reporter(reporter)
+    if _exit_reporter is not None:
+        # set_reporter flushed it when it stopped being the current reporter
+        atexit.unregister(_exit_reporter.flush)
+    atexit.register(reporter.flush)
+    _exit_reporter = reporter
+    return reporter
+
+
+def parse_output_args(description=None, argv=None):
+    """Parse just the output switches for scripts without other options"""
+    args = add_output_arguments(argparse.ArgumentParser(description=description)).parse_args(argv)
+    configure_output(args)
+    return args
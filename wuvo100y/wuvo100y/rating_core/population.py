@@ -0,0 +1,223 @@
+# POPULATION SIMULATOR: Many users rating movies from one shared title catalog
+# Per-user libraries live in (users, titles) arrays; every battle moves both movies
+
+import numpy as np
+
+from .batch import adjust_ratings_batch
+from .engines import EMOTIONS, FIRST_ROUND_OFFSET
+from .history import DERIVED_LOSER, DERIVED_WINNER
+from .opponents import PERCENTILE_RANGES
+from .quantiles import GridQuantiles, grid_index
+from .scenarios import EMOTION_BANDS
+
+# Lower bound of each emotion's taste band, highest first (LOVED >= 8.0, ...)
+EMOTION_THRESHOLDS = tuple(sorted(((EMOTION_BANDS[e][0], e) for e in EMOTIONS), reverse=True))
+
+
+def _to_grid(values):
+    """Clamp to [1, 10] and round to the 0.1 rating grid (half to even, like round())"""
+    return np.rint(np.clip(values, 1, 10) * 10) / 10
+
+
+class Population:
+    """Users x titles rating state for a shared catalog
+
+    ratings[u, t]  user u's current rating of title t (valid where rated)
+    games[u, t]    battles title t has taken part in for user u
+    rated[u, t]    whether t is in user u's library
+    taste[u, t]    hidden "true" preference deciding who wins each battle
+
+    Win probabilities follow the engine's logistic curve on taste, so
+    ratings should drift toward taste as users keep comparing.
+
+    quantiles keeps every library's rating order (a GridQuantiles row per
+    user) up to date through each rating change, so percentile lookups never
+    re-sort a library.
+
+    Pass a ComparisonLog as `log` to record every battle (stamped with the
+    step number) under the flat movie id user * titles + title.
+    """
+
+    def __init__(self, users, titles, seed=0, initial_library=20, initial_games=5, taste_spread=1.0, log=None):
+        if not 3 <= initial_library <= titles:
+            raise ValueError("initial_library must be between 3 and the number of titles")
+        self.rng = np.random.default_rng(seed)
+        self.users = users
+        self.titles = titles
+        self.quality = np.clip(self.rng.normal(6.5, 1.8, titles), 1, 10)
+        self.taste = np.clip(self.quality + self.rng.normal(0, taste_spread, (users, titles)), 1, 10)
+        self.ratings = np.zeros((users, titles))
+        self.games = np.zeros((users, titles), dtype=np.int64)
+        self.rated = np.zeros((users, titles), dtype=bool)
+        self.battles = 0
+        self.step = 0
+        self.log = log
+
+        # Existing libraries: a random subset per user, already rated close to taste
+        library = np.argsort(self.rng.random((users, titles)), axis=1)[:, :initial_library]
+        rows = np.arange(users)[:, None]
+        self.rated[rows, library] = True
+        self.ratings[rows, library] = _to_grid(self.taste[rows, library])
+        self.games[rows, library] = initial_games
+        self.quantiles = GridQuantiles.from_ratings(self.ratings, self.rated)
+
+    def movie_ids(self, users, titles):
+        """Flat per-user movie ids, as used in the comparison log"""
+        return users * self.titles + titles
+
+    def library_sizes(self):
+        return self.rated.sum(axis=1)
+
+    def emotions_for(self, users, titles):
+        """Emotion a user would pick for a title, from the EMOTION_BANDS its taste falls in"""
+        taste = self.taste[users, titles]
+        codes = np.full(taste.shape, len(EMOTIONS) - 1)
+        for low, emotion in reversed(EMOTION_THRESHOLDS):
+            codes[taste >= low] = EMOTIONS.index(emotion)
+        return codes
+
+    def win_probability(self, users, titles, opponents):
+        return 1 / (1 + np.power(10, (self.taste[users, opponents] - self.taste[users, titles]) / 4))
+
+    def battle(self, users, titles, opponents, title_won):
+        """Known vs Known battles (one per user in `users`) with Wildcard's ELO update"""
+        winners = np.where(title_won, titles, opponents)
+        losers = np.where(title_won, opponents, titles)
+        new_winner, new_loser = adjust_ratings_batch(
+            self.ratings[users, winners], self.ratings[users, losers],
+            self.games[users, winners], self.games[users, losers]
+        )
+        self.quantiles.move(np.concatenate([users, users]),
+                            grid_index(np.concatenate([self.ratings[users, winners], self.ratings[users, losers]])),
+                            grid_index(np.concatenate([new_winner, new_loser])))
+        self.ratings[users, winners] = new_winner
+        self.ratings[users, losers] = new_loser
+        self.games[users, winners] += 1
+        self.games[users, losers] += 1
+        self.battles += len(users)
+        if self.log is not None:
+            self.log.extend(self.movie_ids(users, winners), self.movie_ids(users, losers), self.step)
+
+    def _draw_unrated(self, users):
+        """One random title per user that is not in their library (users must have room)"""
+        titles = self.rng.integers(0, self.titles, len(users))
+        pending = np.flatnonzero(self.rated[users, titles])
+        while pending.size:
+            titles[pending] = self.rng.integers(0, self.titles, pending.size)
+            pending = pending[self.rated[users[pending], titles[pending]]]
+        return titles
+
+    def _fill_distinct_ranks(self, ranks, sizes, first_column):
+        """Uniform random library positions for ranks[:, first_column:], distinct per row"""
+        for j in range(first_column, ranks.shape[1]):
+            ranks[:, j] = (self.rng.random(len(sizes)) * sizes).astype(np.int64)
+            clash = (ranks[:, j, None] == ranks[:, :j]).any(axis=1)
+            while clash.any():
+                redraw = np.flatnonzero(clash)
+                ranks[redraw, j] = (self.rng.random(redraw.size) * sizes[redraw]).astype(np.int64)
+                clash[redraw] = (ranks[redraw, j, None] == ranks[redraw, :j]).any(axis=1)
+        return ranks
+
+    def select_opponents(self, users, emotion_codes, count=3):
+        """(len(users), count) opponents: an emotion-percentile pick, then distinct random ones
+
+        Vectorized OpponentIndex.select_opponents over each user's library.
+        """
+        sizes = self.quantiles.sizes[users]
+
+        low = np.array([PERCENTILE_RANGES[e][0] for e in EMOTIONS])[emotion_codes]
+        high = np.array([PERCENTILE_RANGES[e][1] for e in EMOTIONS])[emotion_codes]
+        start = (low * sizes).astype(np.int64)
+        stop = np.minimum(np.maximum((high * sizes).astype(np.int64), start + 1), sizes)
+
+        ranks = np.empty((len(users), count), dtype=np.int64)
+        ranks[:, 0] = start + (self.rng.random(len(users)) * (stop - start)).astype(np.int64)
+        self._fill_distinct_ranks(ranks, sizes, 1)
+        return self.titles_at(users, ranks)
+
+    def titles_at(self, users, positions):
+        """Titles at library positions (highest rating first, ties in title order)
+
+        The quantile trees find each position's rating and its offset among the
+        titles tied there in O(log 91); turning that into a title still compares
+        the whole library row against the rating, O(titles) per position, but
+        never sorts it.
+        """
+        bins, offsets = self.quantiles.select(np.repeat(users, positions.shape[1]), positions.ravel())
+        keys = np.where(self.rated[users], self.ratings[users], -np.inf)
+        tied = keys[:, None, :] == ((bins + 10) / 10).reshape(positions.shape)[:, :, None]
+        # Row-major nonzero lists each position's tied titles in title order
+        flat = np.flatnonzero(tied)
+        first = np.searchsorted(flat // self.titles, np.arange(positions.size))
+        return (flat[first + offsets] % self.titles).reshape(positions.shape)
+
+    def rate_new_movies(self, rounds=3):
+        """Every user with room adds one unrated title through the Home Screen flow
+
+        Round 1 derives the rating from the first opponent (baseline-free);
+        later rounds are Known vs Known battles that also move the opponent.
+        Returns (users, titles) of the newly rated movies.
+        """
+        users = np.flatnonzero((self.library_sizes() >= rounds) & (self.library_sizes() < self.titles))
+        if users.size == 0:
+            return users, users
+        titles = self._draw_unrated(users)
+        opponents = self.select_opponents(users, self.emotions_for(users, titles), rounds)
+
+        first = opponents[:, 0]
+        won = self.rng.random(users.size) < self.win_probability(users, titles, first)
+        offset = np.where(won, FIRST_ROUND_OFFSET, -FIRST_ROUND_OFFSET)
+        self.ratings[users, titles] = _to_grid(self.ratings[users, first] + offset)
+        self.quantiles.add(users, grid_index(self.ratings[users, titles]))
+        self.games[users, titles] = 1
+        self.games[users, first] += 1
+        self.rated[users, titles] = True
+        self.battles += users.size
+        if self.log is not None:
+            new, old = self.movie_ids(users, titles), self.movie_ids(users, first)
+            self.log.extend(np.where(won, new, old), np.where(won, old, new), self.step,
+                            np.where(won, DERIVED_WINNER, DERIVED_LOSER))
+
+        for i in range(1, rounds):
+            opponent = opponents[:, i]
+            won = self.rng.random(users.size) < self.win_probability(users, titles, opponent)
+            self.battle(users, titles, opponent, won)
+        return users, titles
+
+    def rebattle(self):
+        """Every user compares two random titles already in their library"""
+        users = np.flatnonzero(self.library_sizes() >= 2)
+        # Library titles first (in title order), then the unrated ones
+        order = np.argsort(~self.rated[users], axis=1, kind='stable')
+        ranks = self._fill_distinct_ranks(np.empty((users.size, 2), dtype=np.int64), self.rated[users].sum(axis=1), 0)
+        pairs = np.take_along_axis(order, ranks, axis=1)
+        won = self.rng.random(users.size) < self.win_probability(users, pairs[:, 0], pairs[:, 1])
+        self.battle(users, pairs[:, 0], pairs[:, 1], won)
+
+    def run(self, steps, new_movie_every=1, rebattles_per_step=0, on_step=None):
+        """Advance the population; calls on_step(self, step) after each step"""
+        for step in range(1, steps + 1):
+            self.step += 1
+            if new_movie_every and step % new_movie_every == 0:
+                self.rate_new_movies()
+            for _ in range(rebattles_per_step):
+                self.rebattle()
+            if on_step:
+                on_step(self, step)
+        return self
+
+    def summary(self):
+        rated = self.rated
+        error = np.abs(self.ratings - self.taste)[rated]
+        sizes = self.library_sizes()
+        return {
+            'users': self.users,
+            'titles': self.titles,
+            'battles': self.battles,
+            'rated_movies': int(rated.sum()),
+            'average_library': float(sizes.mean()),
+            'average_rating': float(self.ratings[rated].mean()),
+            'average_games': float(self.games[rated].mean()),
+            'mean_absolute_error': float(error.mean()),
+            'p95_absolute_error': float(np.quantile(error, 0.95))
+        }
@@ -0,0 +1,162 @@
+# GRID QUANTILES: Incrementally maintained order statistics of many users' libraries
+# Ratings live on the 91-point 0.1 grid, so each user's library is a Fenwick tree of
+# per-grid-point counts: a rating change is O(log 91), the k-th highest rating is one
+# O(log 91) descent, and two trees over the same rows merge by adding their counts
+
+import numpy as np
+
+from .transitions import GRID_SIZE, RATING_GRID
+
+# Positional percentiles of the ascending library, as in calculateDynamicRatingCategories
+CATEGORY_PERCENTILES = (0.25, 0.50, 0.75)
+
+# Largest power of two <= GRID_SIZE, where the binary-lifting descent starts
+_TOP_STEP = 1 << (GRID_SIZE.bit_length() - 1)
+
+
+def _update_paths():
+    """(GRID_SIZE + 1, depth) tree positions an update at each position touches, padded with the unused 0"""
+    paths = []
+    for start in range(GRID_SIZE + 1):
+        path, position = [], start
+        while 0 < position <= GRID_SIZE:
+            path.append(position)
+            position += position & -position
+        paths.append(path)
+    depth = max(len(path) for path in paths)
+    return np.array([path + [0] * (depth - len(path)) for path in paths], dtype=np.int64)
+
+
+_UPDATE_PATHS = _update_paths()
+
+
+def grid_index(ratings):
+    """0.1-grid index (0 == 1.0, 90 == 10.0) of on-grid ratings"""
+    return (np.rint(np.asarray(ratings) * 10) - 10).astype(np.int64)
+
+
+class GridQuantiles:
+    """One Fenwick tree of grid-point counts per row (user), ordered highest rating first
+
+    Position k of a row is the k-th movie of its library sorted by rating
+    descending, the order `np.argsort(-ratings, kind='stable')` gives; the
+    descent returns the grid point holding it and its offset among the movies
+    tied there. Updates take (rows, grid indices) arrays; a row may repeat.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.tree = np.zeros((rows, GRID_SIZE + 1), dtype=np.int64)
+        self.sizes = np.zeros(rows, dtype=np.int64)
+
+    @classmethod
+    def from_counts(cls, counts):
+        """Build from a (rows, GRID_SIZE) count matrix in O(rows * GRID_SIZE)"""
+        counts = np.asarray(counts, dtype=np.int64)
+        quantiles = cls(len(counts))
+        quantiles.tree[:, 1:] = counts[:, ::-1]
+        for i in range(1, GRID_SIZE + 1):
+            parent = i + (i & -i)
+            if parent <= GRID_SIZE:
+                quantiles.tree[:, parent] += quantiles.tree[:, i]
+        quantiles.sizes = counts.sum(axis=1)
+        return quantiles
+
+    @classmethod
+    def from_ratings(cls, ratings, rated):
+        """Build from (rows, titles) ratings and the mask of which ones are in each library"""
+        rows, bins = np.nonzero(rated)
+        counts = np.zeros((len(rated), GRID_SIZE), dtype=np.int64)
+        np.add.at(counts, (rows, grid_index(ratings[rows, bins])), 1)
+        return cls.from_counts(counts)
+
+    def add(self, rows, bins, delta=1):
+        """Add `delta` movies at grid indices `bins` of `rows`"""
+        rows, bins = np.broadcast_arrays(np.asarray(rows, dtype=np.int64), np.asarray(bins, dtype=np.int64))
+        delta = np.broadcast_to(np.asarray(delta, dtype=np.int64), rows.shape)
+        np.add.at(self.sizes, rows, delta)
+        # Every level of every update in one scatter; column 0 soaks up the padding
+        np.add.at(self.tree, (rows[:, None], _UPDATE_PATHS[GRID_SIZE - bins]), delta[:, None])
+        self.tree[:, 0] = 0
+
+    def move(self, rows, old_bins, new_bins):
+        """Re-rate one movie per entry from old_bins to new_bins"""
+        old_bins, new_bins = np.asarray(old_bins), np.asarray(new_bins)
+        moved = old_bins != new_bins
+        rows = np.broadcast_to(rows, moved.shape)[moved]
+        self.add(np.concatenate([rows, rows]), np.concatenate([old_bins[moved], new_bins[moved]]),
+                 np.repeat([-1, 1], len(rows)))
+
+    def merge(self, other):
+        """Fold another set of trees over the same rows into this one"""
+        self.tree += other.tree
+        self.sizes += other.sizes
+        return self
+
+    def count_above(self, rows, bins):
+        """Movies of each row rated strictly higher than grid index `bins`"""
+        rows = np.asarray(rows, dtype=np.int64)
+        position = np.broadcast_to(GRID_SIZE - 1 - np.asarray(bins, dtype=np.int64), rows.shape).copy()
+        total = np.zeros(rows.shape, dtype=np.int64)
+        while (position > 0).any():
+            total += np.where(position > 0, self.tree[rows, position], 0)
+            position = position & (position - 1)
+        return total
+
+    def select(self, rows, positions):
+        """(grid index, offset among ties) of the movie at each descending position
+
+        Positions must be below the row's library size.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        remaining = np.array(positions, dtype=np.int64)
+        found = np.zeros(remaining.shape, dtype=np.int64)
+        step = _TOP_STEP
+        while step:
+            candidate = found + step
+            counts = self.tree[rows, np.minimum(candidate, GRID_SIZE)]
+            take = (candidate <= GRID_SIZE) & (counts <= remaining)
+            found = np.where(take, candidate, found)
+            remaining = np.where(take, remaining - counts, remaining)
+            step >>= 1
+        return GRID_SIZE - 1 - found, remaining
+
+    def counts(self, row):
+        """(GRID_SIZE,) grid-point counts of one row, ascending by rating"""
+        above = self.count_above(np.full(GRID_SIZE + 1, row), np.arange(GRID_SIZE - 1, -2, -1))
+        counts = np.diff(above)
+        return counts[::-1]
+
+    def category_boundaries(self, row):
+        """{emotion: (min rating, max rating)} of one row, as calculateDynamicRatingCategories builds them
+
+        None when the library is empty (the app falls back to fixed percentiles).
+        """
+        size = int(self.sizes[row])
+        if size == 0:
+            return None
+        rows = np.full(len(CATEGORY_PERCENTILES) + 2, row)
+        # Ascending position p is descending position size - 1 - p
+        ascending = [0] + [int(size * fraction) for fraction in CATEGORY_PERCENTILES] + [size - 1]
+        bins, _ = self.select(rows, size - 1 - np.array(ascending))
+        lowest, p25, p50, p75, highest = (RATING_GRID[b] for b in bins.tolist())
+
+        unique = int(np.count_nonzero(self.counts(row)))
+        if unique < 4 or size < 4:
+            # JS Math.round rounds halves up
+            midpoint = float(np.floor((lowest + highest) / 2 * 10 + 0.5)) / 10
+            if highest - lowest < 1.0:
+                p25, p50, p75 = lowest, midpoint, highest
+            else:
+                p25 = p50 = p75 = midpoint
+        else:
+            if p25 == p50:
+                p50 = min(p25 + 0.1, p75)
+            if p50 == p75:
+                p75 = min(p50 + 0.1, highest)
+        return {
+            'LOVED': (p75, highest),
+            'LIKED': (p50, p75),
+            'AVERAGE': (p25, p50),
+            'DISLIKED': (lowest, p25)
+        }
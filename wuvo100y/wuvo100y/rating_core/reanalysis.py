@@ -0,0 +1,169 @@
+# RE-ANALYSIS: Sufficient statistics for re-classifying results under new thresholds
+# Per emotion bucket we keep a count of every distinct |Wildcard - Home| difference, so changing
+# the 0.0 / 0.1 / 0.5 categories or the verdict cut-offs re-aggregates without re-running any engine
+
+import json
+from collections import namedtuple
+
+import numpy as np
+
+from .engines import EMOTIONS
+from .transitions import TABULATED_HOME_ENGINES
+
+# Difference categories are inclusive upper bounds; the verdict cut-offs count perfect matches
+Thresholds = namedtuple('Thresholds', ['perfect', 'excellent', 'acceptable', 'excellent_matches', 'good_matches'])
+DEFAULT_THRESHOLDS = Thresholds(perfect=0.0, excellent=0.1, acceptable=0.5, excellent_matches=8, good_matches=6)
+
+CATEGORY_NAMES = ('perfect', 'excellent', 'acceptable', 'significant')
+
+# Difference grid for Home engines off the 0.1 rating grid: at most 9,001 keys per emotion
+CONTINUOUS_RESOLUTION = 0.001
+
+
+def difference_category(diff, thresholds=DEFAULT_THRESHOLDS):
+    """'perfect', 'excellent', 'acceptable' or 'significant' for one difference"""
+    if diff <= thresholds.perfect:
+        return 'perfect'
+    elif diff <= thresholds.excellent:
+        return 'excellent'
+    elif diff <= thresholds.acceptable:
+        return 'acceptable'
+    return 'significant'
+
+
+def verdict(perfect_matches, major_differences, thresholds=DEFAULT_THRESHOLDS):
+    """mega_simulation's overall verdict: 'excellent', 'good', 'acceptable' or 'investigate'"""
+    if perfect_matches >= thresholds.excellent_matches:
+        return 'excellent'
+    elif perfect_matches >= thresholds.good_matches:
+        return 'good'
+    elif major_differences == 0:
+        return 'acceptable'
+    return 'investigate'
+
+
+class DifferenceCounts:
+    """{emotion: {difference: scenarios}} collected once per run
+
+    Differences are kept exactly, so re-classifying gives the same counts as
+    the original per-scenario comparisons. Grid engines only ever produce a
+    few hundred distinct differences per emotion; for continuous engines
+    (e.g. Bradley-Terry) pass `resolution` to snap differences to a grid,
+    or build with for_engine() to pick it from the Home engine.
+    """
+
+    def __init__(self, resolution=None):
+        self.resolution = resolution
+        self.buckets = {}
+
+    @classmethod
+    def for_engine(cls, home_engine=None):
+        """Exact counts for the grid Home engines, CONTINUOUS_RESOLUTION buckets for any other"""
+        if home_engine is None or home_engine in TABULATED_HOME_ENGINES:
+            return cls()
+        return cls(CONTINUOUS_RESOLUTION)
+
+    @property
+    def count(self):
+        return sum(sum(bucket.values()) for bucket in self.buckets.values())
+
+    def _key(self, diff):
+        if self.resolution is None:
+            return diff
+        return round(diff / self.resolution) * self.resolution
+
+    def add(self, emotion, wildcard_result, home_result):
+        bucket = self.buckets.setdefault(emotion, {})
+        key = self._key(abs(wildcard_result - home_result))
+        bucket[key] = bucket.get(key, 0) + 1
+
+    def add_arrays(self, emotion_codes, wildcard_results, home_results):
+        """Vectorized add() for NumPy chunks of EMOTION_CODES and float ratings"""
+        diff = np.abs(np.asarray(wildcard_results) - np.asarray(home_results))
+        if self.resolution is not None:
+            diff = np.rint(diff / self.resolution) * self.resolution
+        emotion_codes = np.asarray(emotion_codes)
+        for code in np.unique(emotion_codes).tolist():
+            values, counts = np.unique(diff[emotion_codes == code], return_counts=True)
+            bucket = self.buckets.setdefault(EMOTIONS[code], {})
+            for value, count in zip(values.tolist(), counts.tolist()):
+                bucket[value] = bucket.get(value, 0) + count
+        return self
+
+    def observe(self, records):
+        """Pass (scenario, wildcard_result, home_result) records through, counting each"""
+        for scenario, wildcard_result, home_result in records:
+            self.add(scenario['emotion'], wildcard_result, home_result)
+            yield scenario, wildcard_result, home_result
+
+    def merge(self, other):
+        for emotion, other_bucket in other.buckets.items():
+            bucket = self.buckets.setdefault(emotion, {})
+            for value, count in other_bucket.items():
+                bucket[value] = bucket.get(value, 0) + count
+        return self
+
+    @classmethod
+    def from_results_file(cls, path, chunk_size=1_000_000, resolution=None):
+        """Collect from a rating_core.results_file run, one memory-mapped chunk at a time"""
+        from .results_file import open_results
+        counts = cls(resolution)
+        records = open_results(path).records
+        for start in range(0, len(records), chunk_size):
+            chunk = records[start:start + chunk_size]
+            counts.add_arrays(chunk['emotion'], chunk['wildcard'], chunk['home'])
+        return counts
+
+    def summary(self, thresholds=DEFAULT_THRESHOLDS):
+        """Category counts, verdict and per-emotion stats in O(distinct differences)"""
+        categories = {name: 0 for name in CATEGORY_NAMES}
+        emotions = {}
+        total, total_sum = 0, 0.0
+        minimum, maximum = None, None
+        for emotion, bucket in self.buckets.items():
+            count = sum(bucket.values())
+            bucket_sum = sum(value * n for value, n in bucket.items())
+            for value, n in bucket.items():
+                categories[difference_category(value, thresholds)] += n
+            emotions[emotion] = {'count': count, 'mean': bucket_sum / count if count else 0.0,
+                                 'max': max(bucket) if count else 0.0}
+            if count:
+                minimum = min(bucket) if minimum is None else min(minimum, min(bucket))
+                maximum = max(bucket) if maximum is None else max(maximum, max(bucket))
+            total += count
+            total_sum += bucket_sum
+        major = categories['significant']
+        return {
+            'scenarios': total,
+            'perfect_matches': categories['perfect'],
+            'minor_differences': categories['excellent'] + categories['acceptable'],
+            'major_differences': major,
+            'categories': categories,
+            'average_difference': total_sum / total if total else 0.0,
+            'minimum_difference': minimum or 0.0,
+            'maximum_difference': maximum or 0.0,
+            'verdict': verdict(categories['perfect'], major, thresholds),
+            'emotions': emotions
+        }
+
+    def as_dict(self):
+        return {
+            'resolution': self.resolution,
+            'buckets': {emotion: sorted(bucket.items()) for emotion, bucket in self.buckets.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        counts = cls(data['resolution'])
+        counts.buckets = {emotion: {value: n for value, n in pairs} for emotion, pairs in data['buckets'].items()}
+        return counts
+
+    def save(self, path):
+        """JSON round-trips floats exactly, so a saved table re-classifies identically"""
+        with open(path, 'w') as handle:
+            json.dump(self.as_dict(), handle)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as handle:
+            return cls.from_dict(json.load(handle))
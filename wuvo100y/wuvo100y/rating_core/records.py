@@ -0,0 +1,198 @@
+# COMPACT RECORDS: __slots__ movies/scenarios and packed struct-of-arrays scenario batches
+# Emotions become integer codes, opponents one-byte 0.1-grid indices and results a bit mask
+
+import numpy as np
+
+from .engines import EMOTION_CODES, EMOTIONS
+from .scenarios import generate_scenarios
+from .transitions import RATING_GRID, rating_index
+
+GRID_RATINGS = np.array(RATING_GRID)
+
+# Smallest unsigned dtype that holds one result bit per round
+RESULT_DTYPES = ((8, np.uint8), (16, np.uint16), (32, np.uint32), (64, np.uint64))
+
+
+class Movie:
+    """Slotted {'id', 'title', 'rating'} record
+
+    Supports movie['rating'] style access so it drops into code written
+    for the dict movies (OpponentIndex, the workflow scripts).
+    """
+
+    __slots__ = ('id', 'title', 'rating')
+
+    def __init__(self, id, title, rating):
+        self.id = id
+        self.title = title
+        self.rating = rating
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
+
+    def __eq__(self, other):
+        return isinstance(other, Movie) and (self.id, self.title, self.rating) == (other.id, other.title, other.rating)
+
+    def __repr__(self):
+        return f"Movie({self.id!r}, {self.title!r}, {self.rating!r})"
+
+    @classmethod
+    def from_dict(cls, movie):
+        return cls(movie['id'], movie['title'], movie['rating'])
+
+
+def pack_results(results):
+    """[True, False, True] -> 0b101 (bit i = round i won)"""
+    bits = 0
+    for i, won in enumerate(results):
+        if won:
+            bits |= 1 << i
+    return bits
+
+
+def unpack_results(bits, rounds):
+    return [bool(bits >> i & 1) for i in range(rounds)]
+
+
+def result_dtype(rounds):
+    for width, dtype in RESULT_DTYPES:
+        if rounds <= width:
+            return dtype
+    raise ValueError(f"At most 64 rounds can be bit-packed, got {rounds}")
+
+
+class Scenario:
+    """Slotted scenario: emotion code, opponent grid indices (bytes) and result bits
+
+    scenario['emotion'], ['opponents'], ['results'], ['id'], ['name'] and
+    ['description'] work as for the generator's dicts, so records stream through
+    simulate_stream and the scripts' reports unchanged.
+    """
+
+    __slots__ = ('id', 'emotion_code', 'opponent_indices', 'result_bits')
+
+    def __init__(self, id, emotion_code, opponent_indices, result_bits):
+        self.id = id
+        self.emotion_code = emotion_code
+        self.opponent_indices = bytes(opponent_indices)
+        self.result_bits = result_bits
+
+    @property
+    def rounds(self):
+        return len(self.opponent_indices)
+
+    @property
+    def name(self):
+        return f'Scenario {self.id}'
+
+    @property
+    def emotion(self):
+        return EMOTIONS[self.emotion_code]
+
+    @property
+    def opponents(self):
+        return [RATING_GRID[i] for i in self.opponent_indices]
+
+    @property
+    def results(self):
+        return unpack_results(self.result_bits, self.rounds)
+
+    @property
+    def description(self):
+        """Not stored: rebuilt from the emotion and the results"""
+        return f'{self.emotion} movie, {sum(self.results)}/{self.rounds} battles won'
+
+    def __getitem__(self, key):
+        if key not in ('id', 'name', 'emotion', 'opponents', 'results', 'description'):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __eq__(self, other):
+        return isinstance(other, Scenario) and all(getattr(self, k) == getattr(other, k) for k in self.__slots__)
+
+    @classmethod
+    def from_dict(cls, scenario):
+        return cls(
+            scenario['id'],
+            EMOTION_CODES[scenario['emotion']],
+            [rating_index(rating) for rating in scenario['opponents']],
+            pack_results(scenario['results'])
+        )
+
+    def as_dict(self):
+        return {
+            'id': self.id,
+            'name': self.name,
+            'emotion': self.emotion,
+            'opponents': self.opponents,
+            'results': self.results
+        }
+
+
+class ScenarioBatch:
+    """Struct-of-arrays scenarios: ids, emotion codes, opponent grid indices, result bits
+
+    About 13 bytes per 3-round scenario against roughly a kilobyte for the
+    generator's dict (strings, lists and floats included).
+    """
+
+    def __init__(self, ids, emotion_codes, opponent_indices, result_bits):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.emotion_codes = np.asarray(emotion_codes, dtype=np.uint8)
+        self.opponent_indices = np.asarray(opponent_indices, dtype=np.uint8)
+        self.result_bits = np.asarray(result_bits, dtype=result_dtype(self.rounds))
+
+    @property
+    def rounds(self):
+        return self.opponent_indices.shape[1]
+
+    @property
+    def nbytes(self):
+        return self.ids.nbytes + self.emotion_codes.nbytes + self.opponent_indices.nbytes + self.result_bits.nbytes
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, i):
+        return Scenario(int(self.ids[i]), int(self.emotion_codes[i]),
+                        self.opponent_indices[i].tobytes(), int(self.result_bits[i]))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def opponent_ratings(self):
+        """(n, rounds) float64 opponent ratings"""
+        return GRID_RATINGS[self.opponent_indices]
+
+    def result_matrix(self):
+        """(n, rounds) bool, True where the new movie won"""
+        return (self.result_bits[:, None] >> np.arange(self.rounds, dtype=self.result_bits.dtype)) & 1 == 1
+
+    @classmethod
+    def from_scenarios(cls, scenarios, rounds=3, count=None):
+        """Pack dict or Scenario records; pass `count` to stream without a temporary list"""
+        if count is None:
+            scenarios = list(scenarios)
+            count = len(scenarios)
+        ids = np.empty(count, dtype=np.int64)
+        emotion_codes = np.empty(count, dtype=np.uint8)
+        opponent_indices = np.empty((count, rounds), dtype=np.uint8)
+        result_bits = np.empty(count, dtype=result_dtype(rounds))
+        filled = 0
+        for i, scenario in enumerate(scenarios):
+            record = scenario if isinstance(scenario, Scenario) else Scenario.from_dict(scenario)
+            ids[i] = record.id
+            emotion_codes[i] = record.emotion_code
+            opponent_indices[i] = np.frombuffer(record.opponent_indices, dtype=np.uint8)
+            result_bits[i] = record.result_bits
+            filled = i + 1
+        return cls(ids[:filled], emotion_codes[:filled], opponent_indices[:filled], result_bits[:filled])
+
+    @classmethod
+    def generate(cls, count, seed=0, rounds=3, start=0):
+        """Packed equivalent of generate_scenarios(count, seed, rounds, start)"""
+        return cls.from_scenarios(generate_scenarios(count, seed, rounds, start), rounds, count)
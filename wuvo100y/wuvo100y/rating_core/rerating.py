@@ -0,0 +1,120 @@
+# RE-RATING: Recompute a library from its comparison history under a changed RatingConfig
+# One recorded replay keeps every row's input state; a new config only re-runs the rows whose
+# result it changes plus the rows downstream of them, everything else is read from the record
+
+from collections import namedtuple
+
+import numpy as np
+
+from .batch import adjust_ratings_batch
+from .config import DEFAULT_CONFIG
+from .kernels import DECISIVE, DERIVED_LOSER, DERIVED_WINNER, replay_changed_rows, replay_comparisons
+
+# Fields that only enter through the K-factor ladder or the baseline-free first round
+K_FIELDS = ('k_factors', 'k_thresholds')
+OFFSET_FIELDS = ('first_round_offset',)
+
+# first_changed_row == rows when the change affects nothing; replayed counts the log rows re-run
+RerateResult = namedtuple('RerateResult', ['ratings', 'games', 'first_changed_row', 'replayed', 'movies_changed'])
+
+
+def _derived(anchor, offset):
+    return np.rint(np.clip(anchor + offset, 1, 10) * 10) / 10
+
+
+def row_outputs(states, outcomes, config):
+    """(new winner rating, new loser rating) of each row from its recorded input state
+
+    Ties leave both ratings alone; derived rows only set the unrated side.
+    """
+    winner, loser, winner_games, loser_games = states.T
+    new_winner, new_loser = adjust_ratings_batch(winner, loser, winner_games.astype(np.int64),
+                                                 loser_games.astype(np.int64), config)
+    offset = config.first_round_offset
+    new_winner = np.where(outcomes == DECISIVE, new_winner,
+                          np.where(outcomes == DERIVED_WINNER, _derived(loser, offset), winner))
+    new_loser = np.where(outcomes == DECISIVE, new_loser,
+                         np.where(outcomes == DERIVED_LOSER, _derived(winner, -offset), loser))
+    return new_winner, new_loser
+
+
+class Rerater:
+    """Incremental re-rating of one ComparisonLog from a fixed starting state
+
+    The recorded (ratings, games) going into every row are checkpoints at
+    row granularity. Games played never depend on the rules, so a row whose
+    recorded inputs give the same result under the new config, and whose
+    movies no re-run row has touched yet, is skipped. A K-factor change that
+    only touches the games >= 10 tiers therefore never replays a movie's
+    first rounds, and a change that alters no rounded result replays nothing.
+    """
+
+    def __init__(self, log, ratings, games, config=DEFAULT_CONFIG, jit=None):
+        self.log = log
+        self.start_ratings = np.array(ratings, dtype=np.float64)
+        self.start_games = np.array(games, dtype=np.int64)
+        self.jit = jit
+        self.config = config
+        self.ratings, self.games, self.states = replay_comparisons(
+            log.winners, log.losers, log.outcomes, self.start_ratings, self.start_games, config, jit, record=True)
+        self.outputs = row_outputs(self.states, log.outcomes, config)
+        self._tiers = {}
+
+    def row_tiers(self, k_thresholds):
+        """(n, 2) K-ladder tier of each row's winner and loser; games are fixed, so cached per ladder"""
+        if k_thresholds not in self._tiers:
+            games = np.ascontiguousarray(self.states[:, 2:]).astype(np.int64)
+            self._tiers[k_thresholds] = np.searchsorted(np.array(k_thresholds), games, side='right').astype(np.uint8)
+        return self._tiers[k_thresholds]
+
+    @property
+    def rows(self):
+        return len(self.log)
+
+    def candidate_rows(self, config):
+        """Rows whose result `config` could change at all, judged from which fields differ
+
+        A K-ladder change only reaches decisive rows where either side's K
+        moves (a games >= 10 tier change leaves every earlier round alone); a
+        first-round offset change only reaches derived rows.
+        """
+        changed = {name for name in config._fields if getattr(config, name) != getattr(self.config, name)}
+        outcomes = self.log.outcomes
+        candidates = np.zeros(self.rows, dtype=np.bool_)
+        if changed - set(K_FIELDS) - set(OFFSET_FIELDS):
+            candidates |= outcomes == DECISIVE
+        elif changed & set(K_FIELDS):
+            old = np.array(self.config.k_factors)[self.row_tiers(self.config.k_thresholds)]
+            new = np.array(config.k_factors)[self.row_tiers(config.k_thresholds)]
+            candidates |= (outcomes == DECISIVE) & (old != new).any(axis=1)
+        if changed & set(OFFSET_FIELDS):
+            candidates |= (outcomes == DERIVED_WINNER) | (outcomes == DERIVED_LOSER)
+        return candidates
+
+    def changed_rows(self, config):
+        """Mask of rows whose result differs under `config` given their recorded inputs"""
+        rows = np.flatnonzero(self.candidate_rows(config))
+        new = row_outputs(self.states[rows], self.log.outcomes[rows], config)
+        changed = np.zeros(self.rows, dtype=np.bool_)
+        changed[rows] = (new[0] != self.outputs[0][rows]) | (new[1] != self.outputs[1][rows])
+        return changed
+
+    def first_changed_row(self, config):
+        """Earliest log row whose result differs under `config` (self.rows if none does)"""
+        changed = np.flatnonzero(self.changed_rows(config))
+        return int(changed[0]) if changed.size else self.rows
+
+    def rerate(self, config, adopt=False):
+        """RerateResult for the whole log under `config`
+
+        adopt=True makes `config` the recorded baseline for later calls.
+        """
+        changed = self.changed_rows(config)
+        first = int(np.argmax(changed)) if changed.any() else self.rows
+        ratings, replayed = replay_changed_rows(self.log.winners, self.log.losers, self.log.outcomes, self.states, changed,
+                                                self.ratings, config, first, self.jit, record=adopt)
+        movies_changed = int(np.count_nonzero(ratings != self.ratings))
+        if adopt:
+            self.config, self.ratings = config, ratings
+            self.outputs = row_outputs(self.states, self.log.outcomes, config)
+        return RerateResult(ratings.copy(), self.games.copy(), first, replayed, movies_changed)
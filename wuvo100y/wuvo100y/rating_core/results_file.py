@@ -0,0 +1,116 @@
+# RESULTS FILE: Fixed-width binary per-scenario outputs, appended by the runner and memory-mapped back
+# Re-analyzing a finished run reads the file in chunks instead of re-simulating or loading it into RAM
+
+import json
+import os
+import struct
+from collections import namedtuple
+
+import numpy as np
+
+from .streaming import ResultsAnalysis
+
+MAGIC = b'WUVORES1'
+HEADER_ALIGN = 64
+FORMAT_VERSION = 1
+
+ResultsFile = namedtuple('ResultsFile', ['records', 'rounds', 'metadata'])
+
+
+def result_record_dtype(rounds):
+    """One packed little-endian row per scenario (25 + 8 * rounds bytes)
+
+    Finals are float64 so they compare exactly with the engines; the per-round
+    trajectories are float32, which is plenty for plotting and convergence checks.
+    """
+    return np.dtype([
+        ('id', '<i8'),
+        ('emotion', 'u1'),
+        ('home', '<f8'),
+        ('wildcard', '<f8'),
+        ('home_trajectory', '<f4', (rounds,)),
+        ('wildcard_trajectory', '<f4', (rounds,))
+    ])
+
+
+def make_records(ids, emotion_codes, home, wildcard, home_trajectory, wildcard_trajectory):
+    """Pack matching per-scenario arrays into result_record_dtype rows"""
+    home_trajectory = np.asarray(home_trajectory)
+    records = np.empty(len(ids), dtype=result_record_dtype(home_trajectory.shape[1]))
+    records['id'] = ids
+    records['emotion'] = emotion_codes
+    records['home'] = home
+    records['wildcard'] = wildcard
+    records['home_trajectory'] = home_trajectory
+    records['wildcard_trajectory'] = wildcard_trajectory
+    return records
+
+
+def _header(rounds, metadata):
+    body = json.dumps({'version': FORMAT_VERSION, 'rounds': rounds, 'metadata': metadata or {}}).encode()
+    size = len(MAGIC) + 4 + len(body)
+    return MAGIC + struct.pack('<I', len(body)) + body + b' ' * (-size % HEADER_ALIGN)
+
+
+def _read_header(handle):
+    if handle.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"{handle.name} is not a results file")
+    (length,) = struct.unpack('<I', handle.read(4))
+    header = json.loads(handle.read(length))
+    if header['version'] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported results file version {header['version']}")
+    size = len(MAGIC) + 4 + length
+    return header, size + (-size % HEADER_ALIGN)
+
+
+class ResultWriter:
+    """Append-only writer; each write() goes straight to disk as raw rows"""
+
+    def __init__(self, path, rounds, metadata=None):
+        self.path = path
+        self.dtype = result_record_dtype(rounds)
+        self.count = 0
+        self._file = open(path, 'wb')
+        self._file.write(_header(rounds, metadata))
+
+    def write(self, records):
+        if records.dtype != self.dtype:
+            raise ValueError(f"Expected records of dtype {self.dtype}, got {records.dtype}")
+        self._file.write(records.tobytes())
+        self.count += len(records)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_results(path):
+    """Memory-map a results file read-only: ResultsFile(records, rounds, metadata)
+
+    `records` is a zero-copy np.memmap; a partly written last row (from an
+    interrupted run) is ignored.
+    """
+    with open(path, 'rb') as handle:
+        header, offset = _read_header(handle)
+    dtype = result_record_dtype(header['rounds'])
+    count = (os.path.getsize(path) - offset) // dtype.itemsize
+    if count == 0:
+        records = np.empty(0, dtype=dtype)
+    else:
+        records = np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=(count,))
+    return ResultsFile(records, header['rounds'], header['metadata'])
+
+
+def analyze_results_file(path, chunk_size=1_000_000, analysis=None):
+    """ResultsAnalysis of a results file, folded chunk by chunk (memory stays flat)"""
+    analysis = ResultsAnalysis() if analysis is None else analysis
+    records = open_results(path).records
+    for start in range(0, len(records), chunk_size):
+        chunk = records[start:start + chunk_size]
+        analysis.add_arrays(chunk['emotion'], chunk['wildcard'], chunk['home'])
+    return analysis
@@ -0,0 +1,106 @@
+# MONTE CARLO RUNNER: Fan scenario chunks across a process pool
+# Each worker returns a constant-size ResultsAnalysis; the parent merges them
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .bradley_terry import bradley_terry_simulate_batch
+from .counters import RuleCounters
+from .engines import DEFAULT_HOME_ENGINE, HOME_ENGINES
+from .records import ScenarioBatch
+from .results_file import ResultWriter, make_records
+from .scenarios import generate_scenarios
+from .streaming import ResultsAnalysis, analyze_stream, simulate_stream
+from .transitions import TABULATED_HOME_ENGINES, tabulated_trajectories, tabulated_wildcard_simulation
+
+
+def run_chunk(seed, start, count, rounds=3, home_engine=DEFAULT_HOME_ENGINE, count_rules=False):
+    """Simulate one chunk of scenarios through both systems (runs inside a worker)
+
+    Generated scenarios stay on the 0.1 grid, so both systems run as
+    transition-table lookups instead of recomputing every adjustment
+    (Home engines without a table, like Bradley-Terry, run directly).
+    count_rules switches to the batch path and attaches RuleCounters.
+    """
+    if count_rules:
+        return run_record_chunk(seed, start, count, rounds, home_engine, count_rules)[0]
+    records = simulate_stream(
+        generate_scenarios(count, seed=seed, rounds=rounds, start=start),
+        home_system=TABULATED_HOME_ENGINES.get(home_engine, HOME_ENGINES[home_engine]),
+        wildcard_system=tabulated_wildcard_simulation
+    )
+    return analyze_stream(records)
+
+
+def run_record_chunk(seed, start, count, rounds=3, home_engine=DEFAULT_HOME_ENGINE, count_rules=False):
+    """run_chunk on the packed batch path, also returning per-scenario result records"""
+    batch = ScenarioBatch.generate(count, seed=seed, rounds=rounds, start=start)
+    counters = RuleCounters() if count_rules else None
+    if home_engine == 'bradley_terry':
+        home = bradley_terry_simulate_batch(batch, trajectory=True)
+    else:
+        home = tabulated_trajectories(batch, home_engine, counters=counters)
+    wildcard = tabulated_trajectories(batch, 'wildcard', counters=counters)
+    analysis = ResultsAnalysis().add_arrays(batch.emotion_codes, wildcard[:, -1], home[:, -1])
+    analysis.rules = counters
+    return analysis, make_records(batch.ids, batch.emotion_codes, home[:, -1], wildcard[:, -1], home, wildcard)
+
+
+def chunk_bounds(total, chunk_size):
+    """(start, count) pairs covering range(total)"""
+    return [(start, min(chunk_size, total - start)) for start in range(0, total, chunk_size)]
+
+
+def run_monte_carlo(total, seed=0, rounds=3, workers=None, chunk_size=50_000,
+                    home_engine=DEFAULT_HOME_ENGINE, on_progress=None, results_path=None, count_rules=False):
+    """Run `total` generated scenarios and return the merged ResultsAnalysis
+
+    Results depend only on (total, seed, rounds, chunk_size, home_engine),
+    never on the number of workers. workers=1 runs in-process without a pool.
+    on_progress(merged, total) is called after each chunk is merged.
+    With results_path every scenario's finals and trajectories are also
+    appended to that file in id order (see rating_core.results_file).
+    With count_rules every worker counts rule firings (both engines' table
+    lookups) and the merged counters land in the result's `rules`.
+    """
+    if results_path is None:
+        return _run_chunks(run_chunk, total, seed, rounds, workers, chunk_size, home_engine, on_progress,
+                           count_rules=count_rules)
+    metadata = {'scenarios': total, 'seed': seed, 'chunk_size': chunk_size, 'home_engine': home_engine}
+    with ResultWriter(results_path, rounds, metadata) as writer:
+        return _run_chunks(run_record_chunk, total, seed, rounds, workers, chunk_size, home_engine,
+                           on_progress, writer, count_rules)
+
+
+def _run_chunks(chunk_function, total, seed, rounds, workers, chunk_size, home_engine, on_progress, writer=None,
+                count_rules=False):
+    chunks = chunk_bounds(total, chunk_size)
+    workers = workers or os.cpu_count() or 1
+    merged = ResultsAnalysis()
+
+    def collect(result):
+        if writer is not None:
+            result, records = result
+            writer.write(records)
+        merged.merge(result)
+        if on_progress:
+            on_progress(merged, total)
+
+    if workers == 1 or len(chunks) <= 1:
+        for start, count in chunks:
+            collect(chunk_function(seed, start, count, rounds, home_engine, count_rules))
+        return merged
+
+    # Keep a bounded window of chunks in flight and merge them in chunk order,
+    # so memory stays flat and floating-point sums are reproducible
+    max_workers = min(workers, len(chunks))
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for start, count in chunks:
+            pending.append(executor.submit(chunk_function, seed, start, count, rounds, home_engine, count_rules))
+            if len(pending) >= 2 * max_workers:
+                collect(pending.popleft().result())
+        while pending:
+            collect(pending.popleft().result())
+    return merged
@@ -0,0 +1,81 @@
+# SCENARIO GENERATOR: Seeded random battle scenarios for Monte Carlo runs
+# Covers emotions, opponent-rating distributions and win/loss patterns
+
+import math
+import random
+
+from .engines import EMOTION_BASELINES, EMOTIONS
+
+# Opponent rating distributions (all values land on the 0.1 grid in [1, 10])
+OPPONENT_DISTRIBUTIONS = ('uniform', 'bell', 'emotion_band', 'extremes')
+
+# Win/loss patterns for the new movie
+RESULT_PATTERNS = ('coin_flip', 'elo_expected', 'all_wins', 'all_losses', 'streaky')
+
+# Emotion percentile bands (rating ranges) used by the 'emotion_band' distribution
+EMOTION_BANDS = {
+    'LOVED': (8.0, 10.0),
+    'LIKED': (6.0, 8.0),
+    'AVERAGE': (4.0, 6.0),
+    'DISLIKED': (1.0, 4.0)
+}
+
+
+def _to_grid(value):
+    """Clamp to [1, 10] and round to the 0.1 rating grid"""
+    return round(min(10, max(1, value)) * 10) / 10
+
+
+def _draw_opponent(rng, distribution, emotion):
+    if distribution == 'uniform':
+        return rng.randint(10, 100) / 10
+    if distribution == 'bell':
+        return _to_grid(rng.gauss(6.5, 1.8))
+    if distribution == 'emotion_band':
+        low, high = EMOTION_BANDS[emotion]
+        return rng.randint(int(low * 10), int(high * 10)) / 10
+    # extremes: mostly terrible or excellent opponents
+    if rng.random() < 0.5:
+        return rng.randint(10, 25) / 10
+    return rng.randint(85, 100) / 10
+
+
+def _draw_results(rng, pattern, emotion, opponents):
+    rounds = len(opponents)
+    if pattern == 'coin_flip':
+        return [rng.random() < 0.5 for _ in range(rounds)]
+    if pattern == 'elo_expected':
+        # Win probability follows the same logistic curve as the rating engine
+        baseline = EMOTION_BASELINES[emotion]
+        return [rng.random() < 1 / (1 + math.pow(10, (o - baseline) / 4)) for o in opponents]
+    if pattern == 'all_wins':
+        return [True] * rounds
+    if pattern == 'all_losses':
+        return [False] * rounds
+    # streaky: each round repeats the previous outcome 75% of the time
+    results = [rng.random() < 0.5]
+    for _ in range(rounds - 1):
+        results.append(results[-1] if rng.random() < 0.75 else not results[-1])
+    return results
+
+
+def generate_scenarios(count, seed=0, rounds=3, start=0):
+    """Yield `count` random scenarios shaped like the hand-written ones
+
+    The same (seed, start) always produces the same scenarios, so chunks
+    of a large run can be generated independently in worker processes.
+    """
+    rng = random.Random(f'{seed}-{start}')
+    for scenario_id in range(start, start + count):
+        emotion = rng.choice(EMOTIONS)
+        distribution = rng.choice(OPPONENT_DISTRIBUTIONS)
+        pattern = rng.choice(RESULT_PATTERNS)
+        opponents = [_draw_opponent(rng, distribution, emotion) for _ in range(rounds)]
+        yield {
+            'id': scenario_id,
+            'name': f'Scenario {scenario_id}',
+            'emotion': emotion,
+            'opponents': opponents,
+            'results': _draw_results(rng, pattern, emotion, opponents),
+            'description': f'{emotion} movie, {distribution} opponents, {pattern} results'
+        }
@@ -0,0 +1,291 @@
+# STREAMING ANALYSIS: Constant-memory aggregation of Wildcard vs Home results
+# Scenarios stream through both systems into online aggregators instead of result lists
+
+import math
+
+import numpy as np
+
+from .counters import RuleCounters
+from .engines import DEFAULT_HOME_ENGINE, EMOTIONS, HOME_ENGINES, wildcard_simulation
+
+# analyze_results difference categories: (name, inclusive upper bound)
+DIFFERENCE_CATEGORIES = (
+    ('perfect', 0.0),
+    ('excellent', 0.1),
+    ('acceptable', 0.5),
+    ('significant', math.inf)
+)
+
+
+class RunningStats:
+    """Welford mean/variance plus min/max; mergeable across workers"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    @classmethod
+    def from_array(cls, values):
+        """Stats of a whole NumPy chunk at once (two-pass, then mergeable as usual)"""
+        stats = cls()
+        if len(values):
+            stats.count = len(values)
+            stats.mean = float(values.mean())
+            stats.m2 = float(((values - stats.mean) ** 2).sum())
+            stats.minimum = float(values.min())
+            stats.maximum = float(values.max())
+        return stats
+
+    def merge(self, other):
+        """Chan et al. parallel combination"""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.minimum, self.maximum = other.minimum, other.maximum
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    @property
+    def variance(self):
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def stddev(self):
+        return math.sqrt(self.variance)
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'stddev': self.stddev,
+            'min': self.minimum if self.count else None,
+            'max': self.maximum if self.count else None
+        }
+
+
+class Histogram:
+    """Fixed-bin histogram with underflow/overflow counters (bounded memory)"""
+
+    def __init__(self, low, high, bins):
+        self.low = low
+        self.high = high
+        self.bins = bins
+        self.width = (high - low) / bins
+        self.counts = [0] * bins
+        self.underflow = 0
+        self.overflow = 0
+
+    def add(self, value):
+        if value < self.low:
+            self.underflow += 1
+        elif value >= self.high:
+            self.overflow += 1
+        else:
+            self.counts[min(int((value - self.low) / self.width), self.bins - 1)] += 1
+
+    def add_array(self, values):
+        """Vectorized add() for a NumPy chunk"""
+        inside = (values >= self.low) & (values < self.high)
+        self.underflow += int(np.count_nonzero(values < self.low))
+        self.overflow += int(np.count_nonzero(values >= self.high))
+        bins = np.minimum(((values[inside] - self.low) / self.width).astype(np.int64), self.bins - 1)
+        self.counts = [a + int(b) for a, b in zip(self.counts, np.bincount(bins, minlength=self.bins))]
+
+    def merge(self, other):
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        return self
+
+    def bin_center(self, i):
+        return self.low + (i + 0.5) * self.width
+
+    def quantile(self, q):
+        """Approximate quantile (bin center resolution)"""
+        total = sum(self.counts) + self.underflow + self.overflow
+        if total == 0:
+            return None
+        target = q * total - self.underflow
+        if target <= 0:
+            return self.low
+        running = 0
+        for i, count in enumerate(self.counts):
+            running += count
+            if running >= target:
+                return self.bin_center(i)
+        return self.high
+
+    def as_dict(self):
+        return {
+            'low': self.low,
+            'high': self.high,
+            'bins': self.bins,
+            'counts': list(self.counts),
+            'underflow': self.underflow,
+            'overflow': self.overflow
+        }
+
+
+def grid_histogram(low, high):
+    """Histogram with one bin per 0.1 step, centered on the rating grid"""
+    return Histogram(low - 0.05, high + 0.05, int(round((high - low) * 10)) + 1)
+
+
+class ResultsAnalysis:
+    """Online replacement for the wildcard_results/home_results/differences lists
+
+    Keeps at most `keep_details` per-scenario records for printing detailed
+    reports; everything else is O(1) memory regardless of scenario count.
+    `rules` holds the RuleCounters of runs that counted rule firings.
+    """
+
+    def __init__(self, keep_details=0):
+        self.differences = RunningStats()
+        self.wildcard = RunningStats()
+        self.home = RunningStats()
+        self.categories = {name: 0 for name, _ in DIFFERENCE_CATEGORIES}
+        self.home_higher = 0
+        self.wildcard_higher = 0
+        self.emotions = {}
+        self.difference_histogram = grid_histogram(0.0, 9.0)
+        self.keep_details = keep_details
+        self.details = []
+        self.rules = None
+
+    @property
+    def count(self):
+        return self.differences.count
+
+    def add(self, emotion, wildcard_result, home_result, scenario=None):
+        diff = abs(wildcard_result - home_result)
+        self.differences.add(diff)
+        self.wildcard.add(wildcard_result)
+        self.home.add(home_result)
+        self.difference_histogram.add(diff)
+
+        for name, upper in DIFFERENCE_CATEGORIES:
+            if diff <= upper:
+                self.categories[name] += 1
+                break
+
+        if home_result > wildcard_result:
+            self.home_higher += 1
+        elif wildcard_result > home_result:
+            self.wildcard_higher += 1
+
+        bucket = self.emotions.get(emotion)
+        if bucket is None:
+            bucket = self.emotions[emotion] = RunningStats()
+        bucket.add(diff)
+
+        if len(self.details) < self.keep_details:
+            self.details.append((scenario, wildcard_result, home_result, diff))
+
+    def add_arrays(self, emotion_codes, wildcard_results, home_results):
+        """Vectorized add() for NumPy chunks (EMOTION_CODES, float ratings); keeps no details
+
+        Means and variances agree with per-scenario add() up to float rounding.
+        """
+        diff = np.abs(wildcard_results - home_results)
+        self.differences.merge(RunningStats.from_array(diff))
+        self.wildcard.merge(RunningStats.from_array(wildcard_results))
+        self.home.merge(RunningStats.from_array(home_results))
+        self.difference_histogram.add_array(diff)
+
+        lower = -math.inf
+        for name, upper in DIFFERENCE_CATEGORIES:
+            self.categories[name] += int(np.count_nonzero((diff > lower) & (diff <= upper)))
+            lower = upper
+        self.home_higher += int(np.count_nonzero(home_results > wildcard_results))
+        self.wildcard_higher += int(np.count_nonzero(wildcard_results > home_results))
+
+        for code in np.unique(emotion_codes).tolist():
+            stats = RunningStats.from_array(diff[emotion_codes == code])
+            self.emotions.setdefault(EMOTIONS[code], RunningStats()).merge(stats)
+        return self
+
+    def merge(self, other):
+        self.differences.merge(other.differences)
+        self.wildcard.merge(other.wildcard)
+        self.home.merge(other.home)
+        self.difference_histogram.merge(other.difference_histogram)
+        for name, count in other.categories.items():
+            self.categories[name] += count
+        self.home_higher += other.home_higher
+        self.wildcard_higher += other.wildcard_higher
+        for emotion, stats in other.emotions.items():
+            self.emotions.setdefault(emotion, RunningStats()).merge(stats)
+        if other.rules is not None:
+            self.rules = (self.rules or RuleCounters()).merge(other.rules)
+        room = self.keep_details - len(self.details)
+        if room > 0:
+            self.details.extend(other.details[:room])
+        return self
+
+    def summary(self):
+        summary = {
+            'scenarios': self.count,
+            'perfect_matches': self.categories['perfect'],
+            'minor_differences': self.categories['excellent'] + self.categories['acceptable'],
+            'major_differences': self.categories['significant'],
+            'categories': dict(self.categories),
+            'home_higher': self.home_higher,
+            'wildcard_higher': self.wildcard_higher,
+            'average_difference': self.differences.mean,
+            'stddev_difference': self.differences.stddev,
+            'minimum_difference': self.differences.minimum if self.count else 0.0,
+            'maximum_difference': self.differences.maximum if self.count else 0.0,
+            'median_difference': self.difference_histogram.quantile(0.5),
+            'p95_difference': self.difference_histogram.quantile(0.95),
+            'wildcard': self.wildcard.as_dict(),
+            'home': self.home.as_dict(),
+            'emotions': {emotion: stats.as_dict() for emotion, stats in self.emotions.items()},
+            'difference_histogram': self.difference_histogram.as_dict()
+        }
+        if self.rules is not None:
+            summary['rules'] = self.rules.summary()
+        return summary
+
+
+def simulate_stream(scenarios, home_system=None, wildcard_system=wildcard_simulation):
+    """Yield (scenario, wildcard_result, home_result) one scenario at a time"""
+    if home_system is None:
+        home_system = HOME_ENGINES[DEFAULT_HOME_ENGINE]
+    for scenario in scenarios:
+        emotion, opponents, results = scenario['emotion'], scenario['opponents'], scenario['results']
+        yield scenario, wildcard_system(emotion, opponents, results), home_system(emotion, opponents, results)
+
+
+def analyze_stream(records, analysis=None, progress_every=0, on_progress=None):
+    """Fold (scenario, wildcard_result, home_result) records into a ResultsAnalysis
+
+    Calls on_progress(analysis) every `progress_every` scenarios.
+    """
+    if analysis is None:
+        analysis = ResultsAnalysis()
+    for scenario, wildcard_result, home_result in records:
+        analysis.add(scenario['emotion'], wildcard_result, home_result, scenario)
+        if progress_every and on_progress and analysis.count % progress_every == 0:
+            on_progress(analysis)
+    return analysis
@@ -0,0 +1,145 @@
+# PARAMETER SWEEP: Grid-search the rating constants for Home vs Wildcard divergence
+# Each RatingConfig runs one packed scenario batch through both systems; results are cached per config
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+
+import numpy as np
+
+from .cache import ResultCache
+from .config import DEFAULT_CONFIG, make_config
+from .engines import DEFAULT_HOME_ENGINE
+from .records import ScenarioBatch
+from .streaming import DIFFERENCE_CATEGORIES
+from .transitions import tabulated_simulate_batch
+
+# (metric, direction) pairs ranked by pareto_front; -1 = lower is better
+DEFAULT_OBJECTIVES = (
+    ('average_difference', -1),
+    ('major_fraction', -1),
+    ('rating_spread', 1)
+)
+
+# Results of evaluate_config keyed by (config, count, seed, rounds, home_engine), LRU-bounded
+SWEEP_CACHE_SIZE = 1024
+_RESULT_CACHE = ResultCache(maxsize=SWEEP_CACHE_SIZE)
+
+
+def parameter_grid(**axes):
+    """Every RatingConfig in the cartesian product of the given field values
+
+    parameter_grid(logistic_scale=[3, 4, 5], max_change=[0.5, 0.7]) yields six
+    configs. The extra 'k_scale' axis multiplies all four K-factors at once.
+    """
+    names = list(axes)
+    for values in itertools.product(*(axes[name] for name in names)):
+        overrides = dict(zip(names, values))
+        k_scale = overrides.pop('k_scale', None)
+        if k_scale is not None:
+            base = overrides.get('k_factors', DEFAULT_CONFIG.k_factors)
+            overrides['k_factors'] = tuple(k * k_scale for k in base)
+        yield make_config(**overrides)
+
+
+@lru_cache(maxsize=8)
+def _scenario_batch(count, seed, rounds):
+    """Every config in a sweep sees the same scenarios"""
+    return ScenarioBatch.generate(count, seed=seed, rounds=rounds)
+
+
+def divergence_metrics(wildcard, home):
+    """analyze_results-style metrics over two arrays of final ratings"""
+    diff = np.abs(wildcard - home)
+    count = len(diff)
+    categories = {}
+    lower = -np.inf
+    for name, upper in DIFFERENCE_CATEGORIES:
+        categories[name] = int(np.count_nonzero((diff > lower) & (diff <= upper)))
+        lower = upper
+    return {
+        'scenarios': count,
+        'perfect_matches': categories['perfect'],
+        'minor_differences': categories['excellent'] + categories['acceptable'],
+        'major_differences': categories['significant'],
+        'categories': categories,
+        'home_higher': int(np.count_nonzero(home > wildcard)),
+        'wildcard_higher': int(np.count_nonzero(wildcard > home)),
+        'average_difference': float(diff.mean()) if count else 0.0,
+        'maximum_difference': float(diff.max()) if count else 0.0,
+        'major_fraction': categories['significant'] / count if count else 0.0,
+        # How much of the 1-10 scale the less discriminating system still uses
+        'rating_spread': float(min(wildcard.std(), home.std())) if count else 0.0
+    }
+
+
+def evaluate_config(config, count=20_000, seed=0, rounds=3, home_engine=DEFAULT_HOME_ENGINE):
+    """Divergence metrics for one config (runs inside a worker)"""
+    batch = _scenario_batch(count, seed, rounds)
+    wildcard = tabulated_simulate_batch(batch, 'wildcard', config)
+    home = tabulated_simulate_batch(batch, home_engine, config)
+    return divergence_metrics(wildcard, home)
+
+
+def run_sweep(configs, count=20_000, seed=0, rounds=3, home_engine=DEFAULT_HOME_ENGINE,
+              workers=None, cache=None, on_result=None):
+    """Evaluate every config and return [(config, metrics)] in input order
+
+    Configs already in `cache` (the module-level LRU ResultCache by
+    default, or any dict) are not re-run. workers=1 runs in-process without
+    a pool. on_result(config, metrics) is called as each result is known:
+    cached configs first, then the rest in completion order.
+    """
+    if cache is None:
+        cache = _RESULT_CACHE
+    store = cache.put if isinstance(cache, ResultCache) else cache.__setitem__
+    configs = list(dict.fromkeys(configs))
+    keys = {config: (config, count, seed, rounds, home_engine) for config in configs}
+    # Held here as well, since a bounded cache may evict part of a large sweep before it returns
+    found = {config: cache.get(keys[config]) for config in configs}
+    missing = [config for config in configs if found[config] is None]
+    workers = workers or os.cpu_count() or 1
+
+    def finish(config, metrics):
+        found[config] = metrics
+        store(keys[config], metrics)
+        if on_result:
+            on_result(config, metrics)
+
+    if on_result:
+        for config in configs:
+            if found[config] is not None:
+                on_result(config, found[config])
+
+    if workers == 1 or len(missing) <= 1:
+        for config in missing:
+            finish(config, evaluate_config(config, count, seed, rounds, home_engine))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(missing))) as executor:
+            futures = {executor.submit(evaluate_config, config, count, seed, rounds, home_engine): config
+                       for config in missing}
+            for future in as_completed(futures):
+                finish(futures[future], future.result())
+
+    return [(config, found[config]) for config in configs]
+
+
+def dominates(first, second, objectives=DEFAULT_OBJECTIVES):
+    """True when `first` is no worse on every objective and better on one"""
+    better = False
+    for metric, direction in objectives:
+        a, b = first[metric] * direction, second[metric] * direction
+        if a < b:
+            return False
+        if a > b:
+            better = True
+    return better
+
+
+def pareto_front(results, objectives=DEFAULT_OBJECTIVES):
+    """The (config, metrics) pairs no other result dominates, in input order"""
+    return [
+        (config, metrics) for config, metrics in results
+        if not any(dominates(other, metrics, objectives) for _, other in results)
+    ]
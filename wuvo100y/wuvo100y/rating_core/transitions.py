@@ -0,0 +1,239 @@
+# TRANSITION TABLE: Precomputed wildcard_adjust_rating over the 0.1 rating grid
+# Ratings always land on 1.0, 1.1, ..., 10.0, so every battle outcome can be looked up
+# instead of recomputed, and whole scenario families can be enumerated exactly
+
+from functools import lru_cache
+
+import numpy as np
+
+from .batch import adjust_ratings_masked
+from .config import DEFAULT_CONFIG, games_tier, tier_games
+from .elo import get_rule_counters
+from .engines import BASELINE_BY_CODE, DEFAULT_BASELINE, EMOTION_BASELINES, FIRST_ROUND_OFFSET
+
+GRID_SIZE = 91
+RATING_GRID = tuple((i + 10) / 10 for i in range(GRID_SIZE))
+
+# Representative games-played count for each K-factor tier (0.5, 0.25, 0.125, 0.1)
+TIER_GAMES = tier_games(DEFAULT_CONFIG)
+OPPONENT_GAMES = 5
+
+WIN, LOSS = 0, 1
+
+
+def rating_index(rating):
+    """Grid index of a rating; raises ValueError for ratings off the 0.1 grid"""
+    index = round(rating * 10) - 10
+    if not 0 <= index < GRID_SIZE or RATING_GRID[index] != rating:
+        raise ValueError(f"Rating {rating} is not on the 0.1 grid in [1, 10]")
+    return index
+
+
+class TransitionTable:
+    """new_index[outcome, own_tier, opponent_tier, rating, opponent] for the new movie
+
+    `opponent_index` holds the opponent's rating index after the same battle and
+    `rule_mask` the elo.RULE_FLAGS that fired in it, so lookups can be counted.
+    Built from a RatingConfig (default: the production constants).
+    """
+
+    def __init__(self, config=DEFAULT_CONFIG):
+        self.config = config
+        games = tier_games(config)
+        shape = (2, len(games), len(games), GRID_SIZE, GRID_SIZE)
+        self.new_index = np.empty(shape, dtype=np.uint8)
+        self.opponent_index = np.empty(shape, dtype=np.uint8)
+        self.rule_mask = np.empty(shape, dtype=np.uint8)
+
+        grid = np.array(RATING_GRID)
+        own = np.repeat(grid, GRID_SIZE)
+        opponent = np.tile(grid, GRID_SIZE)
+        for own_tier, own_games in enumerate(games):
+            for opponent_tier, opponent_games in enumerate(games):
+                won_own, won_opponent, won_mask = adjust_ratings_masked(own, opponent, own_games, opponent_games, config)
+                lost_opponent, lost_own, lost_mask = adjust_ratings_masked(opponent, own, opponent_games, own_games, config)
+                for outcome, own_after, opponent_after, mask in ((WIN, won_own, won_opponent, won_mask),
+                                                                 (LOSS, lost_own, lost_opponent, lost_mask)):
+                    self.new_index[outcome, own_tier, opponent_tier] = _to_index(own_after).reshape(GRID_SIZE, GRID_SIZE)
+                    self.opponent_index[outcome, own_tier, opponent_tier] = _to_index(opponent_after).reshape(GRID_SIZE, GRID_SIZE)
+                    self.rule_mask[outcome, own_tier, opponent_tier] = mask.reshape(GRID_SIZE, GRID_SIZE)
+
+        # Flat Python lists for scalar lookups: [outcome][own_tier] -> list indexed by rating * 91 + opponent
+        self.opponent_tier = games_tier(OPPONENT_GAMES, config)
+        self._flat = [
+            [self.new_index[outcome, tier, self.opponent_tier].ravel().tolist() for tier in range(len(games))]
+            for outcome in (WIN, LOSS)
+        ]
+
+    def next_rating(self, rating, opponent_rating, new_movie_won, games_played, opponent_games=OPPONENT_GAMES):
+        """Table lookup equivalent of one engine round"""
+        outcome = WIN if new_movie_won else LOSS
+        index = self.new_index[outcome, games_tier(games_played, self.config), games_tier(opponent_games, self.config),
+                               rating_index(rating), rating_index(opponent_rating)]
+        return RATING_GRID[index]
+
+    def count_matrix(self, outcome, own_tier, opponent_weights, opponent_tier=None):
+        """counts[r, t]: weighted number of opponents taking rating index r to t"""
+        if opponent_tier is None:
+            opponent_tier = self.opponent_tier
+        targets = self.new_index[outcome, own_tier, opponent_tier].astype(np.intp)
+        counts = np.zeros((GRID_SIZE, GRID_SIZE), dtype=object)
+        for r in range(GRID_SIZE):
+            for o in np.flatnonzero(opponent_weights):
+                counts[r, targets[r, o]] += int(opponent_weights[o])
+        return counts
+
+
+def _to_index(ratings):
+    return (np.rint(ratings * 10) - 10).astype(np.uint8)
+
+
+def get_transition_table(config=DEFAULT_CONFIG):
+    """Build each config's table once per process (a fraction of a second)"""
+    return _cached_table(config)
+
+
+@lru_cache(maxsize=64)
+def _cached_table(config):
+    return TransitionTable(config)
+
+
+# TABLE-DRIVEN ENGINES: same results as rating_core.engines for on-grid scenarios
+
+def _play_rounds(index, opponents, results, first_round):
+    table = get_transition_table()
+    if get_rule_counters() is not None:
+        return _play_rounds_counted(table, index, opponents, results, first_round)
+    flat = table._flat
+    for i in range(first_round, len(opponents)):
+        index = flat[WIN if results[i] else LOSS][games_tier(i)][index * GRID_SIZE + rating_index(opponents[i])]
+    return RATING_GRID[index]
+
+
+def _play_rounds_counted(table, index, opponents, results, first_round):
+    """_play_rounds that also reports each looked-up battle's rule mask to the installed counters"""
+    counters = get_rule_counters()
+    for i in range(first_round, len(opponents)):
+        key = (WIN if results[i] else LOSS, games_tier(i), table.opponent_tier, index, rating_index(opponents[i]))
+        counters.count(int(table.rule_mask[key]))
+        index = int(table.new_index[key])
+    return RATING_GRID[index]
+
+
+def tabulated_wildcard_simulation(emotion, opponents, results):
+    """Table lookup version of engines.wildcard_simulation"""
+    return _play_rounds(rating_index(EMOTION_BASELINES.get(emotion, DEFAULT_BASELINE)), opponents, results, 0)
+
+
+# Home Screen's unknown-vs-known round 1 is the same lookup as Wildcard's
+tabulated_home_screen_unknown_vs_known = tabulated_wildcard_simulation
+
+
+def tabulated_home_screen_system(emotion, opponents, results):
+    """Table lookup version of engines.home_screen_system (baseline-free)"""
+    if results[0]:
+        derived_rating = min(10, opponents[0] + FIRST_ROUND_OFFSET)
+    else:
+        derived_rating = max(1, opponents[0] - FIRST_ROUND_OFFSET)
+    return _play_rounds(rating_index(round(derived_rating * 10) / 10), opponents, results, 1)
+
+
+TABULATED_HOME_ENGINES = {
+    'baseline_free': tabulated_home_screen_system,
+    'unknown_vs_known': tabulated_home_screen_unknown_vs_known
+}
+
+
+def tabulated_simulate_batch(batch, engine='wildcard', config=DEFAULT_CONFIG, counters=None):
+    """Final ratings for a whole ScenarioBatch with one table gather per round
+
+    `engine` is 'wildcard', 'unknown_vs_known' or 'baseline_free'; returns a
+    float64 array equal to running the matching scalar engine per scenario
+    (with `config`'s constants in place of the production ones). `counters`
+    (a rating_core.counters.RuleCounters) tallies the rules behind every lookup.
+    """
+    return np.array(RATING_GRID)[_simulate_indices(batch, engine, config, counters=counters)]
+
+
+def tabulated_trajectories(batch, engine='wildcard', config=DEFAULT_CONFIG, counters=None):
+    """(n, rounds) ratings after each round; the last column is tabulated_simulate_batch"""
+    trajectory = np.empty((len(batch), batch.rounds), dtype=np.intp)
+    _simulate_indices(batch, engine, config, trajectory, counters)
+    return np.array(RATING_GRID)[trajectory]
+
+
+def _simulate_indices(batch, engine, config, trajectory=None, counters=None):
+    """Final rating indices, optionally filling trajectory[:, i] after each round"""
+    table = get_transition_table(config)
+    opponents = batch.opponent_indices.astype(np.intp)
+    outcomes = np.where(batch.result_matrix(), WIN, LOSS)
+
+    if engine in ('wildcard', 'unknown_vs_known'):
+        baselines = np.array([rating_index(b) for b in BASELINE_BY_CODE], dtype=np.intp)
+        index, first_round = baselines[batch.emotion_codes], 0
+    elif engine == 'baseline_free':
+        offset = np.where(outcomes[:, 0] == WIN, config.first_round_offset, -config.first_round_offset)
+        derived = np.clip(np.array(RATING_GRID)[opponents[:, 0]] + offset, 1, 10)
+        index, first_round = _to_index(derived).astype(np.intp), 1
+        if trajectory is not None and batch.rounds:
+            trajectory[:, 0] = index
+    else:
+        raise ValueError(f"Unknown engine: {engine}")
+
+    for i in range(first_round, batch.rounds):
+        key = (outcomes[:, i], games_tier(i, config), table.opponent_tier, index, opponents[:, i])
+        if counters is not None:
+            counters.add_masks(table.rule_mask[key])
+        index = table.new_index[key].astype(np.intp)
+        if trajectory is not None:
+            trajectory[:, i] = index
+    return index
+
+
+# EXACT ENUMERATION: final-rating distribution over every opponent/result combination
+
+def _initial_state(engine, emotion, opponent_weights):
+    """(state vector over rating indices, first simulated round) before the ELO rounds"""
+    state = np.zeros(GRID_SIZE, dtype=object)
+    if engine in ('wildcard', 'unknown_vs_known'):
+        state[rating_index(EMOTION_BASELINES.get(emotion, DEFAULT_BASELINE))] = 1
+        return state, 0
+    if engine == 'baseline_free':
+        for o in np.flatnonzero(opponent_weights):
+            opponent = RATING_GRID[o]
+            state[rating_index(round(min(10, opponent + FIRST_ROUND_OFFSET) * 10) / 10)] += int(opponent_weights[o])
+            state[rating_index(round(max(1, opponent - FIRST_ROUND_OFFSET) * 10) / 10)] += int(opponent_weights[o])
+        return state, 1
+    raise ValueError(f"Unknown engine: {engine}")
+
+
+def enumerate_final_ratings(engine, emotion, rounds=3, opponent_weights=None):
+    """Exact count of scenarios ending at each final rating
+
+    Every round the opponent ranges over the grid (weighted by the integer
+    `opponent_weights`, default one of each rating) and the result over
+    win/loss. Dynamic programming over the 91 rating states replaces the
+    91**rounds * 2**rounds brute-force enumeration. Returns {rating: count}.
+    """
+    if opponent_weights is None:
+        opponent_weights = np.ones(GRID_SIZE, dtype=np.int64)
+    opponent_weights = np.asarray(opponent_weights)
+    table = get_transition_table()
+
+    state, first_round = _initial_state(engine, emotion, opponent_weights)
+    matrices = {}
+    for i in range(first_round, rounds):
+        tier = games_tier(i)
+        if tier not in matrices:
+            matrices[tier] = (table.count_matrix(WIN, tier, opponent_weights)
+                              + table.count_matrix(LOSS, tier, opponent_weights))
+        state = state.dot(matrices[tier])
+
+    return {RATING_GRID[i]: int(count) for i, count in enumerate(state) if count}
+
+
+def final_rating_distribution(engine, emotion, rounds=3, opponent_weights=None):
+    """enumerate_final_ratings normalised to probabilities"""
+    counts = enumerate_final_ratings(engine, emotion, rounds, opponent_weights)
+    total = sum(counts.values())
+    return {rating: count / total for rating, count in counts.items()}
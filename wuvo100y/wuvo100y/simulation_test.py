@@ -1,59 +1,18 @@
 # SIMULATION: Wildcard vs Home Screen Logic
 # Let's simulate the exact same scenario in both systems
 
-# Wildcard's adjustRating function (simplified for testing)
-def wildcard_adjust_rating(winner_rating, loser_rating, winner_won, winner_games_played=0, loser_games_played=0):
-    """Wildcard's exact ELO logic"""
-    import math
-    
-    # Calculate K-factor (Wildcard's logic)
-    def calculate_k_factor(games_played):
-        if games_played < 5:
-            return 0.5
-        elif games_played < 10:
-            return 0.25
-        elif games_played < 20:
-            return 0.125
-        return 0.1
-    
-    rating_difference = abs(winner_rating - loser_rating)
-    expected_win_probability = 1 / (1 + math.pow(10, (loser_rating - winner_rating) / 4))
-    
-    winner_k = calculate_k_factor(winner_games_played)
-    loser_k = calculate_k_factor(loser_games_played)
-    
-    winner_increase = max(0.1, winner_k * (1 - expected_win_probability))
-    loser_decrease = max(0.1, loser_k * (1 - expected_win_probability))
-    
-    # Underdog bonus
-    if winner_rating < loser_rating:
-        winner_increase *= 1.2
-    
-    # Major upset bonus
-    is_major_upset = winner_rating < loser_rating and rating_difference > 3.0
-    if is_major_upset:
-        winner_increase += 3.0
-        print(f"🚨 MAJOR UPSET! Winner ({winner_rating}) defeated Loser ({loser_rating}). +3.0 bonus!")
-    
-    # Apply limits
-    MAX_RATING_CHANGE = 0.7
-    if not is_major_upset:
-        winner_increase = min(MAX_RATING_CHANGE, winner_increase)
-        loser_decrease = min(MAX_RATING_CHANGE, loser_decrease)
-    
-    new_winner_rating = winner_rating + winner_increase
-    new_loser_rating = loser_rating - loser_decrease
-    
-    # Bounds enforcement
-    new_winner_rating = round(min(10, max(1, new_winner_rating)) * 10) / 10
-    new_loser_rating = round(min(10, max(1, new_loser_rating)) * 10) / 10
-    
-    return new_winner_rating, new_loser_rating
+from rating_core import set_trace_hook, wildcard_adjust_rating
+from rating_core.engines import DEFAULT_BASELINE, EMOTION_BASELINES
+from rating_core.output import ROUND, SCENARIO, SUMMARY, emit, emit_record, get_reporter, parse_output_args
+
+def print_major_upset(trace):
+    """Console trace for the major upset bonus"""
+    if trace.is_major_upset:
+        emit(ROUND, f"🚨 MAJOR UPSET! Winner ({trace.winner_rating}) defeated Loser ({trace.loser_rating}). +3.0 bonus!")
 
 # Home Screen's logic - Unknown vs Known approach
 def home_screen_unknown_vs_known(emotion, opponents, results):
     """Home Screen's Unknown vs Known then Known vs Known approach"""
-    import math
     
     # FIRST COMPARISON: Unknown vs Known
     # For unknown movie, we need to establish initial rating through comparison
@@ -61,13 +20,7 @@ def home_screen_unknown_vs_known(emotion, opponents, results):
     new_movie_won = results[0]
     
     # Use emotion as a baseline for the unknown movie in the comparison
-    emotion_baselines = {
-        'LOVED': 8.5,
-        'LIKED': 7.0,
-        'AVERAGE': 5.5,
-        'DISLIKED': 3.0
-    }
-    emotion_baseline = emotion_baselines.get(emotion, 7.0)
+    emotion_baseline = EMOTION_BASELINES.get(emotion, DEFAULT_BASELINE)
     
     # For unknown vs known, we estimate what the rating should be after comparison
     # This is like reverse-engineering from the comparison result
@@ -93,7 +46,7 @@ def home_screen_unknown_vs_known(emotion, opponents, results):
         )
         current_rating = new_loser_rating
     
-    print(f"Home Screen Round 1 (Unknown vs Known): {current_rating}")
+    emit(ROUND, f"Home Screen Round 1 (Unknown vs Known): {current_rating}")
     
     # SUBSEQUENT COMPARISONS: Known vs Known
     for i in range(1, len(opponents)):
@@ -110,66 +63,118 @@ def home_screen_unknown_vs_known(emotion, opponents, results):
         )
         
         current_rating = new_winner_rating if new_movie_won else new_loser_rating
-        print(f"Home Screen Round {i+1} (Known vs Known): {current_rating}")
+        emit(ROUND, f"Home Screen Round {i+1} (Known vs Known): {current_rating}")
     
     return current_rating
 
-print("=== SIMULATION TEST CASES ===")
-print()
-
-# TEST CASE 1: "LIKED" movie vs [10.0, 10.0, 10.0], loses all
-print("TEST 1: 'LIKED' movie vs [10.0, 10.0, 10.0], loses all")
-print("WILDCARD APPROACH:")
-wildcard_rating = 7.0  # LIKED emotion baseline
-for i, opponent in enumerate([10.0, 10.0, 10.0]):
-    new_winner_rating, new_loser_rating = wildcard_adjust_rating(opponent, wildcard_rating, True, 5, i)
-    wildcard_rating = new_loser_rating  # New movie lost
-    print(f"Wildcard Round {i+1}: {wildcard_rating}")
-
-print("\nHOME SCREEN APPROACH (Unknown vs Known):")
-home_rating = home_screen_unknown_vs_known('LIKED', [10.0, 10.0, 10.0], [False, False, False])
-
-print(f"\nRESULT: Wildcard={wildcard_rating}, Home={home_rating}, Difference={abs(wildcard_rating - home_rating):.1f}")
-print()
-
-# TEST CASE 2: "DISLIKED" movie vs [8.0, 8.5, 9.0], wins all (major upsets)
-print("TEST 2: 'DISLIKED' movie vs [8.0, 8.5, 9.0], wins all (major upsets)")
-print("WILDCARD APPROACH:")
-wildcard_rating = 3.0  # DISLIKED emotion baseline
-for i, opponent in enumerate([8.0, 8.5, 9.0]):
-    new_winner_rating, new_loser_rating = wildcard_adjust_rating(wildcard_rating, opponent, True, i, 5)
-    wildcard_rating = new_winner_rating  # New movie won
-    print(f"Wildcard Round {i+1}: {wildcard_rating}")
-
-print("\nHOME SCREEN APPROACH (Unknown vs Known):")
-home_rating = home_screen_unknown_vs_known('DISLIKED', [8.0, 8.5, 9.0], [True, True, True])
-
-print(f"\nRESULT: Wildcard={wildcard_rating}, Home={home_rating}, Difference={abs(wildcard_rating - home_rating):.1f}")
-print()
-
-# TEST CASE 3: "LOVED" movie vs [3.0, 4.0, 5.0], mixed results
-print("TEST 3: 'LOVED' movie vs [3.0, 4.0, 5.0], mixed results (Win, Lose, Win)")
-print("WILDCARD APPROACH:")
-wildcard_rating = 8.5  # LOVED emotion baseline
-results = [True, False, True]  # Win, Lose, Win
-for i, (opponent, result) in enumerate(zip([3.0, 4.0, 5.0], results)):
-    if result:  # New movie won
-        new_winner_rating, new_loser_rating = wildcard_adjust_rating(wildcard_rating, opponent, True, i, 5)
-        wildcard_rating = new_winner_rating
-    else:  # New movie lost
+def run_simulation_tests():
+    """Run the three hand-written Wildcard vs Home Screen test cases"""
+    test_results = []
+    
+    emit(SUMMARY, "=== SIMULATION TEST CASES ===")
+    emit(SUMMARY)
+
+    # TEST CASE 1: "LIKED" movie vs [10.0, 10.0, 10.0], loses all
+    emit(SCENARIO, "TEST 1: 'LIKED' movie vs [10.0, 10.0, 10.0], loses all")
+    emit(ROUND, "WILDCARD APPROACH:")
+    wildcard_rating = 7.0  # LIKED emotion baseline
+    for i, opponent in enumerate([10.0, 10.0, 10.0]):
         new_winner_rating, new_loser_rating = wildcard_adjust_rating(opponent, wildcard_rating, True, 5, i)
-        wildcard_rating = new_loser_rating
-    print(f"Wildcard Round {i+1}: {wildcard_rating}")
+        wildcard_rating = new_loser_rating  # New movie lost
+        emit(ROUND, f"Wildcard Round {i+1}: {wildcard_rating}")
+
+    emit(ROUND, "\nHOME SCREEN APPROACH (Unknown vs Known):")
+    home_rating = home_screen_unknown_vs_known('LIKED', [10.0, 10.0, 10.0], [False, False, False])
+    test_results.append(dict(
+        emotion='LIKED',
+        opponents=[10.0, 10.0, 10.0],
+        results=[False, False, False],
+        wildcard=wildcard_rating,
+        home=home_rating,
+        difference=abs(wildcard_rating - home_rating)
+    ))
+    emit_record(SCENARIO, 'scenario', **test_results[-1])
+
+    emit(SCENARIO, f"\nRESULT: Wildcard={wildcard_rating}, Home={home_rating}, Difference={abs(wildcard_rating - home_rating):.1f}")
+    emit(SCENARIO)
+
+    # TEST CASE 2: "DISLIKED" movie vs [8.0, 8.5, 9.0], wins all (major upsets)
+    emit(SCENARIO, "TEST 2: 'DISLIKED' movie vs [8.0, 8.5, 9.0], wins all (major upsets)")
+    emit(ROUND, "WILDCARD APPROACH:")
+    wildcard_rating = 3.0  # DISLIKED emotion baseline
+    for i, opponent in enumerate([8.0, 8.5, 9.0]):
+        new_winner_rating, new_loser_rating = wildcard_adjust_rating(wildcard_rating, opponent, True, i, 5)
+        wildcard_rating = new_winner_rating  # New movie won
+        emit(ROUND, f"Wildcard Round {i+1}: {wildcard_rating}")
+
+    emit(ROUND, "\nHOME SCREEN APPROACH (Unknown vs Known):")
+    home_rating = home_screen_unknown_vs_known('DISLIKED', [8.0, 8.5, 9.0], [True, True, True])
+    test_results.append(dict(
+        emotion='DISLIKED',
+        opponents=[8.0, 8.5, 9.0],
+        results=[True, True, True],
+        wildcard=wildcard_rating,
+        home=home_rating,
+        difference=abs(wildcard_rating - home_rating)
+    ))
+    emit_record(SCENARIO, 'scenario', **test_results[-1])
+
+    emit(SCENARIO, f"\nRESULT: Wildcard={wildcard_rating}, Home={home_rating}, Difference={abs(wildcard_rating - home_rating):.1f}")
+    emit(SCENARIO)
+
+    # TEST CASE 3: "LOVED" movie vs [3.0, 4.0, 5.0], mixed results
+    emit(SCENARIO, "TEST 3: 'LOVED' movie vs [3.0, 4.0, 5.0], mixed results (Win, Lose, Win)")
+    emit(ROUND, "WILDCARD APPROACH:")
+    wildcard_rating = 8.5  # LOVED emotion baseline
+    results = [True, False, True]  # Win, Lose, Win
+    for i, (opponent, result) in enumerate(zip([3.0, 4.0, 5.0], results)):
+        if result:  # New movie won
+            new_winner_rating, new_loser_rating = wildcard_adjust_rating(wildcard_rating, opponent, True, i, 5)
+            wildcard_rating = new_winner_rating
+        else:  # New movie lost
+            new_winner_rating, new_loser_rating = wildcard_adjust_rating(opponent, wildcard_rating, True, 5, i)
+            wildcard_rating = new_loser_rating
+        emit(ROUND, f"Wildcard Round {i+1}: {wildcard_rating}")
+
+    emit(ROUND, "\nHOME SCREEN APPROACH (Unknown vs Known):")
+    home_rating = home_screen_unknown_vs_known('LOVED', [3.0, 4.0, 5.0], [True, False, True])
+    test_results.append(dict(
+        emotion='LOVED',
+        opponents=[3.0, 4.0, 5.0],
+        results=[True, False, True],
+        wildcard=wildcard_rating,
+        home=home_rating,
+        difference=abs(wildcard_rating - home_rating)
+    ))
+    emit_record(SCENARIO, 'scenario', **test_results[-1])
+
+    emit(SCENARIO, f"\nRESULT: Wildcard={wildcard_rating}, Home={home_rating}, Difference={abs(wildcard_rating - home_rating):.1f}")
+    emit(SCENARIO)
+
+    differences = [result['difference'] for result in test_results]
+    emit_record(
+        SUMMARY, 'summary',
+        scenarios=len(test_results),
+        average_difference=sum(differences) / len(differences),
+        maximum_difference=max(differences)
+    )
+
+    emit(SUMMARY, "=== ANALYSIS ===")
+    emit(SUMMARY, "The systems are fundamentally different:")
+    emit(SUMMARY, "1. Wildcard: Pairwise comparisons with existing ratings")
+    emit(SUMMARY, "2. Home: Sequential evolution starting from 7.0")
+    emit(SUMMARY, "3. Different K-factor calculations")
+    emit(SUMMARY, "4. Different starting points for new movies")
+    
+    return test_results
+
 
-print("\nHOME SCREEN APPROACH (Unknown vs Known):")
-home_rating = home_screen_unknown_vs_known('LOVED', [3.0, 4.0, 5.0], [True, False, True])
+def main(argv=None):
+    parse_output_args("Wildcard vs Home Screen simulation test cases", argv)
+    if get_reporter().text_enabled(ROUND):
+        set_trace_hook(print_major_upset)
+    return run_simulation_tests()
 
-print(f"\nRESULT: Wildcard={wildcard_rating}, Home={home_rating}, Difference={abs(wildcard_rating - home_rating):.1f}")
-print()
 
-print("=== ANALYSIS ===")
-print("The systems are fundamentally different:")
-print("1. Wildcard: Pairwise comparisons with existing ratings")
-print("2. Home: Sequential evolution starting from 7.0")
-print("3. Different K-factor calculations")
-print("4. Different starting points for new movies")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# SWEEP SIMULATION: Grid-search the Wildcard / Home Screen constants
+# Every parameter combination runs the same seeded scenarios; the Pareto-best configs are reported
+
+import argparse
+import os
+import time
+
+from rating_core.config import DEFAULT_CONFIG
+from rating_core.engines import DEFAULT_HOME_ENGINE
+from rating_core.output import SCENARIO, SUMMARY, add_output_arguments, configure_output, emit, emit_record, get_reporter
+from rating_core.sweep import DEFAULT_OBJECTIVES, parameter_grid, pareto_front, run_sweep
+from rating_core.transitions import TABULATED_HOME_ENGINES
+
+# Swept when no --param is given: a few values around each production constant
+DEFAULT_GRID = {
+    'logistic_scale': [3, 4, 5],
+    'max_change': [0.5, 0.7, 0.9],
+    'first_round_offset': [0.3, 0.5, 0.7],
+    'upset_bonus': [0.0, 3.0]
+}
+
+
+def parse_param(text):
+    """'max_change=0.5,0.7' -> ('max_change', [0.5, 0.7])"""
+    name, _, values = text.partition('=')
+    if name != 'k_scale' and name not in DEFAULT_CONFIG._fields:
+        raise argparse.ArgumentTypeError(f"unknown parameter {name!r}")
+    if name in ('k_factors', 'k_thresholds'):
+        raise argparse.ArgumentTypeError(f"{name} is a tuple; sweep k_scale instead")
+    try:
+        return name, [float(value) for value in values.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"bad values in {text!r}")
+
+
+def changed_fields(config):
+    """Only the constants that differ from production, for compact printing"""
+    return {
+        name: value for name, value in config._asdict().items()
+        if value != getattr(DEFAULT_CONFIG, name)
+    }
+
+
+def describe(config):
+    fields = changed_fields(config)
+    return ', '.join(f"{name}={value}" for name, value in fields.items()) or 'production defaults'
+
+
+def print_result(config, metrics):
+    emit(SCENARIO, f"   {describe(config)}: avg diff {metrics['average_difference']:.4f}, "
+                   f"major {metrics['major_fraction']:.2%}, spread {metrics['rating_spread']:.3f}")
+    emit_record(SCENARIO, 'config', config=config._asdict(), **metrics)
+    get_reporter().flush()
+
+
+def print_pareto(front, total, elapsed):
+    emit(SUMMARY, "=" * 80)
+    emit(SUMMARY, f"🏆 PARETO-BEST CONFIGURATIONS ({len(front)} of {total})")
+    emit(SUMMARY, "=" * 80)
+    objectives = ', '.join(f"{'min' if direction < 0 else 'max'} {metric}" for metric, direction in DEFAULT_OBJECTIVES)
+    emit(SUMMARY, f"Objectives: {objectives}")
+    for config, metrics in sorted(front, key=lambda result: result[1]['average_difference']):
+        emit(SUMMARY, f"\n⭐ {describe(config)}")
+        emit(SUMMARY, f"   Average difference: {metrics['average_difference']:.4f}")
+        emit(SUMMARY, f"   Major differences: {metrics['major_differences']:,} ({metrics['major_fraction']:.2%})")
+        emit(SUMMARY, f"   Rating spread: {metrics['rating_spread']:.3f}")
+        emit_record(SUMMARY, 'pareto', config=config._asdict(), **metrics)
+    emit(SUMMARY, f"\n⏱️  {elapsed:.2f}s for {total} configurations")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parameter sweep over the rating constants")
+    parser.add_argument('--param', type=parse_param, action='append', default=[],
+                        help="name=v1,v2,... (repeatable); RatingConfig fields or k_scale")
+    parser.add_argument('--scenarios', type=int, default=20_000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--workers', type=int, default=None, help="defaults to the CPU count")
+    parser.add_argument('--home-engine', choices=sorted(TABULATED_HOME_ENGINES), default=DEFAULT_HOME_ENGINE)
+    add_output_arguments(parser)
+    args = parser.parse_args(argv)
+    configure_output(args)
+
+    axes = dict(args.param) or DEFAULT_GRID
+    configs = list(parameter_grid(**axes))
+
+    emit(SUMMARY, "🔍🎬 PARAMETER SWEEP: Wildcard vs Home Screen constants")
+    emit(SUMMARY, f"{len(configs)} configurations × {args.scenarios:,} scenarios, seed {args.seed}, "
+                  f"{args.rounds} rounds, Home engine: {args.home_engine}, {args.workers or os.cpu_count()} worker(s)")
+
+    start = time.perf_counter()
+    results = run_sweep(configs, args.scenarios, args.seed, args.rounds, args.home_engine,
+                        workers=args.workers, on_result=print_result)
+    elapsed = time.perf_counter() - start
+
+    front = pareto_front(results)
+    print_pareto(front, len(results), elapsed)
+    return front
+
+
+if __name__ == "__main__":
+    main()
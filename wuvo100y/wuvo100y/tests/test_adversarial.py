@@ -0,0 +1,89 @@
+# Tests for the branch-and-bound worst-case search
+
+import itertools
+
+import numpy as np
+import pytest
+
+from rating_core.adversarial import (OBJECTIVES, SEARCH_HOME_ENGINES, WorstCaseSearch, divergence_bound,
+                                     find_worst_cases, step_bounds)
+from rating_core.config import DEFAULT_CONFIG, games_tier
+from rating_core.transitions import (GRID_SIZE, LOSS, RATING_GRID, TABULATED_HOME_ENGINES, WIN, get_transition_table,
+                                     tabulated_wildcard_simulation)
+
+EMOTIONS = ('LOVED', 'DISLIKED')
+
+
+def brute_force(rounds, objective, home_engine, emotions):
+    """Every scenario scored with the scalar tabulated engines, best first"""
+    score, home_system, values = OBJECTIVES[objective], TABULATED_HOME_ENGINES[home_engine], []
+    for emotion in emotions:
+        for battles in itertools.product(RATING_GRID, repeat=rounds):
+            for results in itertools.product((True, False), repeat=rounds):
+                wildcard = tabulated_wildcard_simulation(emotion, list(battles), list(results))
+                home = home_system(emotion, list(battles), list(results))
+                values.append(round(float(score(wildcard, home)), 9))
+    return sorted(values, reverse=True)
+
+
+@pytest.mark.parametrize('home_engine', SEARCH_HOME_ENGINES)
+@pytest.mark.parametrize('objective', sorted(OBJECTIVES))
+def test_one_round_matches_brute_force(objective, home_engine):
+    cases, _ = WorstCaseSearch(1, objective, home_engine).search(k=15)
+    assert [case.value for case in cases] == brute_force(1, objective, home_engine, ('LOVED', 'LIKED', 'ACCEPTABLE', 'DISLIKED'))[:15]
+
+
+@pytest.mark.parametrize('emotion', EMOTIONS)
+def test_two_rounds_match_brute_force(emotion):
+    cases, _ = WorstCaseSearch(2, emotions=(emotion,)).search(k=20)
+    assert [case.value for case in cases] == brute_force(2, 'abs_difference', 'baseline_free', (emotion,))[:20]
+
+
+@pytest.mark.parametrize('objective', sorted(OBJECTIVES))
+def test_pruning_keeps_the_exact_top_k(objective):
+    search = WorstCaseSearch(3, objective)
+    pruned, stats = search.search(k=8)
+    unpruned, _ = search.search(k=8, prune=False)
+    assert [case.value for case in pruned] == [case.value for case in unpruned]
+    assert stats.pruned > 0 and stats.expanded < stats.brute_force
+
+
+@pytest.mark.parametrize('home_engine', SEARCH_HOME_ENGINES)
+def test_cases_replay_through_the_scalar_engines(home_engine):
+    cases, _ = find_worst_cases(k=10, rounds=3, home_engine=home_engine)
+    assert len(cases) == 10
+    assert [case.value for case in cases] == sorted((case.value for case in cases), reverse=True)
+    for case in cases:
+        wildcard = tabulated_wildcard_simulation(case.emotion, case.opponents, case.results)
+        home = TABULATED_HOME_ENGINES[home_engine](case.emotion, case.opponents, case.results)
+        assert (case.wildcard, case.home) == (wildcard, home)
+        assert case.value == pytest.approx(abs(home - wildcard))
+
+
+def test_signed_objectives_point_opposite_ways():
+    (up,), _ = WorstCaseSearch(3, 'home_minus_wildcard').search(k=1)
+    (down,), _ = WorstCaseSearch(3, 'wildcard_minus_home').search(k=1)
+    assert up.home > up.wildcard and down.wildcard > down.home
+
+
+@pytest.mark.parametrize('round_index', range(6))
+def test_step_bounds_cover_every_table_move(round_index):
+    table = get_transition_table(DEFAULT_CONFIG)
+    tier = games_tier(round_index, DEFAULT_CONFIG)
+    grid = np.array(RATING_GRID)
+    moves = {outcome: grid[table.new_index[outcome, tier, table.opponent_tier]] - grid[:, None]
+             for outcome in (WIN, LOSS)}
+    normal_rise, upset_rise, fall = step_bounds(round_index)
+    assert moves[WIN].max() <= upset_rise
+    assert -moves[LOSS].min() <= fall
+    assert divergence_bound(round_index) >= max(moves[WIN].max(), -moves[LOSS].min())
+    assert normal_rise <= upset_rise and moves[WIN].shape == (GRID_SIZE, GRID_SIZE)
+
+
+def test_rejects_unknown_settings():
+    with pytest.raises(ValueError):
+        WorstCaseSearch(objective='largest')
+    with pytest.raises(ValueError):
+        WorstCaseSearch(home_engine='bradley_terry')
+    with pytest.raises(ValueError):
+        WorstCaseSearch(rounds=0)
@@ -0,0 +1,53 @@
+# Parity tests: batch engine vs the scalar wildcard_adjust_rating
+
+import random
+
+from rating_core import wildcard_adjust_rating
+from rating_core.batch import adjust_ratings_batch, k_factor_batch
+
+GRID = [round(r * 0.1, 1) for r in range(10, 101)]
+GAMES = [0, 4, 5, 9, 10, 19, 20, 25]
+
+
+def assert_parity(winners, losers, winner_games, loser_games):
+    expected = [
+        wildcard_adjust_rating(w, l, True, wg, lg)
+        for w, l, wg, lg in zip(winners, losers, winner_games, loser_games)
+    ]
+    new_winners, new_losers = adjust_ratings_batch(winners, losers, winner_games, loser_games)
+    assert new_winners.tolist() == [e[0] for e in expected]
+    assert new_losers.tolist() == [e[1] for e in expected]
+
+
+def test_k_factor_tiers():
+    assert k_factor_batch(GAMES).tolist() == [0.5, 0.5, 0.25, 0.25, 0.125, 0.125, 0.1, 0.1]
+
+
+def test_full_grid_parity():
+    winners, losers, winner_games, loser_games = [], [], [], []
+    for wg, lg in [(0, 5), (5, 0), (1, 5), (12, 25), (25, 12)]:
+        for w in GRID:
+            for l in GRID:
+                winners.append(w)
+                losers.append(l)
+                winner_games.append(wg)
+                loser_games.append(lg)
+    assert_parity(winners, losers, winner_games, loser_games)
+
+
+def test_off_grid_parity():
+    rng = random.Random(1234)
+    n = 20000
+    winners = [rng.uniform(0.5, 10.5) for _ in range(n)]
+    losers = [rng.uniform(0.5, 10.5) for _ in range(n)]
+    winner_games = [rng.choice(GAMES) for _ in range(n)]
+    loser_games = [rng.choice(GAMES) for _ in range(n)]
+    assert_parity(winners, losers, winner_games, loser_games)
+
+
+def test_scalar_inputs_broadcast():
+    opponents = [8.0, 8.5, 9.0]
+    new_winners, new_losers = adjust_ratings_batch(3.0, opponents, 0, 5)
+    expected = [wildcard_adjust_rating(3.0, l, True, 0, 5) for l in opponents]
+    assert new_winners.shape == (3,)
+    assert list(zip(new_winners.tolist(), new_losers.tolist())) == expected
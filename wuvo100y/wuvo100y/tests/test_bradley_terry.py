@@ -0,0 +1,97 @@
+# Tests for the Bradley-Terry port, its batch path and the full-library MM refit
+
+import numpy as np
+import pytest
+
+from rating_core import bradley_terry as bt
+from rating_core.engines import HOME_ENGINES
+from rating_core.records import ScenarioBatch
+from rating_core.runner import run_monte_carlo
+
+
+def test_conversions_match_js_examples():
+    assert bt.rating_to_theta(8.5) == pytest.approx(1.735, abs=1e-3)
+    assert bt.rating_to_theta(5.0) == 0.0
+    assert bt.rating_to_theta(3.0) == pytest.approx(-0.847, abs=1e-3)
+    assert bt.theta_to_rating(bt.rating_to_theta(7.3)) == pytest.approx(7.3)
+    assert bt.theta_to_rating(-50) == 1.0
+    assert bt.bradley_terry_probability(1.0, 1.0) == 0.5
+
+
+def test_update_after_comparison_follows_js_formula():
+    movie = bt.new_movie('LOVED')
+    assert bt.theta_to_rating(movie.theta) == pytest.approx(0.7 * 10 + 0.3 * 6)
+    opponent = bt.rating_to_theta(6.0)
+    updated = bt.update_after_comparison(movie, opponent, False)
+
+    predicted = 1 / (1 + np.exp(opponent - movie.theta))
+    theta_mle = movie.theta + 1.3 * (0 - predicted)
+    assert updated.theta == pytest.approx((1 * theta_mle + 0.15 * movie.theta) / 1.15)
+    assert (updated.comparisons, updated.wins, updated.losses) == (1, 0, 1)
+    assert bt.apply_shrinkage(3.0, 1.0, 0) == 1.0
+
+
+def test_confidence_and_early_stop():
+    assert bt.theta_confidence_interval(0.0, 0).width == 4
+    assert bt.theta_confidence_interval(0.0, 4).width == pytest.approx(2 * 1.96)
+    # One tie among four comparisons counts as 3.75 effective comparisons
+    assert bt.theta_confidence_interval(0.0, 4, 2.5).width == pytest.approx(4 * 1.96 / np.sqrt(3.75))
+    assert bt.confidence_percent(0.5) == 80 and bt.confidence_percent(4.0) == 16
+    assert not bt.should_stop_early(2, 80)
+    assert bt.should_stop_early(3, 80) and not bt.should_stop_early(4, 79)
+
+
+def test_batch_path_matches_scalar_engine():
+    batch = ScenarioBatch.generate(3000, seed=5, rounds=6)
+    expected = [bt.bradley_terry_simulation(s.emotion, s.opponents, s.results) for s in batch]
+    assert np.allclose(bt.bradley_terry_simulate_batch(batch), expected, rtol=0, atol=1e-12)
+
+
+def test_plugs_into_scenario_runner():
+    assert HOME_ENGINES['bradley_terry'] is bt.bradley_terry_simulation
+    summary = run_monte_carlo(2000, seed=1, workers=1, chunk_size=500, home_engine='bradley_terry').summary()
+    assert summary['scenarios'] == 2000
+    assert 1 <= summary['home']['min'] <= summary['home']['max'] <= 10
+
+
+def random_history(size, games, seed):
+    rng = np.random.default_rng(seed)
+    strengths = rng.normal(0, 1, size)
+    first = rng.integers(0, size, games)
+    second = (first + rng.integers(1, size, games)) % size
+    won = rng.random(games) < 1 / (1 + np.exp(strengths[second] - strengths[first]))
+    return strengths, np.where(won, first, second), np.where(won, second, first)
+
+
+def test_comparison_matrix_counts():
+    matrix = bt.ComparisonMatrix(3, [0, 0, 1, 2, 2], [1, 1, 0, 0, 1], ties=[False, False, False, False, True])
+    assert matrix.pairs == 3
+    assert matrix.wins.tolist() == [2.0, 1.5, 1.5]
+    assert matrix.games_played().tolist() == [4.0, 4.0, 2.0]
+
+
+def test_refit_recovers_strengths():
+    strengths, winners, losers = random_history(300, 12_000, seed=2)
+    thetas, iterations = bt.refit_thetas(bt.ComparisonMatrix(300, winners, losers))
+    assert iterations < 1000
+    assert np.corrcoef(thetas, strengths)[0, 1] > 0.9
+
+
+def test_accelerated_refit_reaches_plain_mm_fixed_point():
+    _, winners, losers = random_history(60, 200, seed=3)
+    matrix = bt.ComparisonMatrix(60, winners, losers)
+    priors = bt.rating_to_theta_batch(np.linspace(2, 9, 60))
+    fast, fast_iterations = bt.refit_thetas(matrix, priors)
+    slow, slow_iterations = bt.refit_thetas(matrix, priors, accelerate=False, tolerance=1e-12, max_iterations=100_000)
+    assert fast_iterations * 10 < slow_iterations
+    assert np.allclose(fast, slow, atol=1e-6)
+    assert bt.log_posterior(matrix, fast, priors) >= bt.log_posterior(matrix, priors, priors)
+
+
+def test_refit_ratings_keep_unbeaten_and_winless_finite():
+    # Movie 0 beats everyone, movie 3 loses to everyone
+    winners = [0, 0, 0, 1, 1, 2]
+    losers = [1, 2, 3, 2, 3, 3]
+    ratings = bt.refit_ratings(4, winners, losers, prior_ratings=[6, 6, 6, 6])
+    assert np.isfinite(ratings).all()
+    assert list(np.argsort(-ratings)) == [0, 1, 2, 3]
@@ -0,0 +1,74 @@
+# Tests for the fingerprint-keyed result cache
+
+import io
+
+import extended_simulation
+from rating_core import engines
+from rating_core.cache import ResultCache, fingerprint
+from rating_core.config import make_config
+from rating_core.output import SUMMARY, Reporter, set_reporter
+from rating_core.scenarios import generate_scenarios
+from rating_core.streaming import analyze_stream, simulate_stream
+
+
+def test_fingerprint_is_canonical():
+    assert fingerprint('wildcard', 'LOVED', [5, 6], [1, 0]) == fingerprint('wildcard', 'LOVED', (5.0, 6.0), (True, False))
+    assert fingerprint('wildcard', 'LOVED', [5.0], [True]) != fingerprint('wildcard', 'LIKED', [5.0], [True])
+    # The baseline-free Home Screen ignores the emotion
+    assert fingerprint('baseline_free', 'LOVED', [5.0], [True]) == fingerprint('baseline_free', 'LIKED', [5.0], [True])
+    config = make_config(max_change=0.5)
+    assert fingerprint('wildcard', 'LOVED', [5.0], [True], config) != fingerprint('wildcard', 'LOVED', [5.0], [True])
+
+
+def test_lru_eviction():
+    cache = ResultCache(maxsize=2)
+    cache.put('a', 1.0)
+    cache.put('b', 2.0)
+    assert cache.get('a') == 1.0
+    cache.put('c', 3.0)
+    assert 'b' not in cache and 'a' in cache and 'c' in cache
+    assert len(cache) == 2
+
+
+def test_disk_store_survives_restart(tmp_path):
+    path = str(tmp_path / 'ratings.db')
+    key = fingerprint('wildcard', 'LOVED', [9.0, 8.0], [False, True])
+    first = ResultCache(path=path)
+    assert first.get_or_compute(key, lambda: 7.3) == 7.3
+    first.close()
+
+    second = ResultCache(path=path)
+    assert second.get_or_compute(key, lambda: 0.0) == 7.3
+    assert second.stats()['disk_hits'] == 1 and second.misses == 0
+    second.close()
+
+
+def test_wrapped_engines_never_recompute():
+    cache = ResultCache()
+    calls = []
+
+    def counting(emotion, opponents, results):
+        calls.append(1)
+        return engines.wildcard_simulation(emotion, opponents, results)
+
+    scenarios = list(generate_scenarios(500, seed=3))
+    plain = analyze_stream(simulate_stream(scenarios)).summary()
+    wrapped = dict(home_system=cache.wrap('baseline_free', engines.home_screen_system),
+                   wildcard_system=cache.wrap('wildcard', counting))
+    assert analyze_stream(simulate_stream(scenarios, **wrapped)).summary() == plain
+    computed = len(calls)
+    assert analyze_stream(simulate_stream(scenarios, **wrapped)).summary() == plain
+    assert len(calls) == computed
+
+
+def test_extended_pattern_analysis_reuses_first_pass():
+    cache = ResultCache()
+    previous = set_reporter(Reporter(verbosity=SUMMARY, stream=io.StringIO()))
+    try:
+        extended_simulation.run_extended_simulation(cache=cache)
+    finally:
+        set_reporter(previous)
+    scenarios = len(extended_simulation.extended_scenarios)
+    # One miss per system in the first pass, only hits in the second
+    assert cache.misses == 2 * scenarios
+    assert cache.hits == 2 * scenarios
@@ -0,0 +1,79 @@
+# Tests for the early-stopping convergence simulation
+
+import numpy as np
+import pytest
+
+import convergence_simulation
+from rating_core.convergence import (CONVERGENCE_ENGINES, STOPPING_RULES, bt_rule_fires, convergence_simulate,
+                                     convergence_summary, draw_population)
+from rating_core.engines import EMOTIONS, HOME_ENGINES, wildcard_simulation
+from rating_core.information_gain import SENTIMENT_RANGES
+
+SCALAR_ENGINES = {'wildcard': wildcard_simulation, **HOME_ENGINES}
+
+
+def test_population_stays_in_sentiment_ranges():
+    codes, true_ratings = draw_population(5000, seed=1)
+    for code, emotion in enumerate(EMOTIONS):
+        low, high = SENTIMENT_RANGES[emotion]
+        rows = true_ratings[codes == code]
+        assert len(rows) and rows.min() >= low and rows.max() <= high
+
+
+@pytest.mark.parametrize('engine', CONVERGENCE_ENGINES)
+def test_fixed_battles_match_scalar_engines(engine):
+    codes, true_ratings = draw_population(1000, seed=2)
+    rng = np.random.default_rng(3)
+    opponents = rng.integers(10, 101, (1000, 4)) / 10
+    results = rng.random((1000, 4)) < 0.5
+    result = convergence_simulate(engine, codes, true_ratings, rules=('ci_width',), max_comparisons=4,
+                                  target_width=0.0, opponents=opponents, results=results)['ci_width']
+    expected = [SCALAR_ENGINES[engine](EMOTIONS[code], list(o), list(r)) for code, o, r in zip(codes, opponents, results)]
+    assert np.allclose(result.ratings, expected, rtol=0, atol=1e-12)
+    assert (result.comparisons == 4).all() and not result.converged.any()
+
+
+def test_bt_rule_is_the_modal_stop():
+    assert [bt_rule_fires(n) for n in range(1, 7)] == [False, False, False, False, True, True]
+
+
+def test_rules_stop_independently_and_summaries_add_up():
+    codes, true_ratings = draw_population(20_000, seed=4)
+    results = convergence_simulate('wildcard', codes, true_ratings, max_comparisons=30, seed=5)
+    assert set(results) == set(STOPPING_RULES)
+    assert (results['bt_early_stop'].comparisons == 5).all()
+    stable = results['stable']
+    assert stable.comparisons.min() >= 3 and stable.converged.mean() > 0.95
+
+    summary = convergence_summary(results['ci_width'], true_ratings, 30)
+    assert sum(summary['histogram']) == 20_000 and len(summary['histogram']) == 30
+    assert summary['converged_fraction'] == pytest.approx(results['ci_width'].converged.mean())
+    assert summary['median_comparisons'] <= summary['p90_comparisons'] <= summary['p99_comparisons'] <= 30
+
+    # A noisier win model needs more battles for the same interval width
+    noisy = convergence_simulate('wildcard', codes, true_ratings, ('ci_width',), 30, noise_scale=4, seed=5)
+    assert noisy['ci_width'].comparisons.mean() > results['ci_width'].comparisons.mean()
+
+
+def test_same_seed_gives_every_engine_the_same_battles():
+    codes, true_ratings = draw_population(500, seed=6)
+    first = convergence_simulate('unknown_vs_known', codes, true_ratings, seed=7)
+    second = convergence_simulate('wildcard', codes, true_ratings, seed=7)
+    for rule in STOPPING_RULES:
+        assert np.array_equal(first[rule].comparisons, second[rule].comparisons)
+    with pytest.raises(ValueError):
+        convergence_simulate('wildcard', codes, true_ratings, rules=('forever',))
+
+
+@pytest.mark.parametrize('argv', [['--movies', '0'], ['--max-comparisons', '0'], ['--movies', 'many']])
+def test_empty_runs_are_usage_errors(argv, capsys):
+    with pytest.raises(SystemExit) as error:
+        convergence_simulation.main(argv)
+    assert error.value.code == 2
+    assert capsys.readouterr().out == ''
+
+
+def test_unstopped_movies_have_no_stop_rating():
+    codes, true_ratings = draw_population(50, seed=8)
+    results = convergence_simulate('wildcard', codes, true_ratings, max_comparisons=0, seed=9)
+    assert all(np.isnan(result.ratings).all() for result in results.values())
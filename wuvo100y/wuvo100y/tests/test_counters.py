@@ -0,0 +1,82 @@
+# Tests for the rule-firing counters
+
+import itertools
+
+import numpy as np
+
+from rating_core import RULE_FLAGS, get_rule_counters, wildcard_adjust_rating
+from rating_core.batch import adjust_ratings_batch, adjust_ratings_masked
+from rating_core.config import make_config
+from rating_core.counters import RuleCounters, counting_rules
+from rating_core.engines import EMOTIONS, HOME_ENGINES, wildcard_simulation
+from rating_core.records import ScenarioBatch
+from rating_core.runner import run_monte_carlo
+from rating_core.transitions import RATING_GRID, tabulated_simulate_batch, tabulated_wildcard_simulation
+
+GRID = np.array(RATING_GRID)
+
+
+def test_scalar_masks_match_batch_masks():
+    winners, losers = np.repeat(GRID, len(GRID)), np.tile(GRID, len(GRID))
+    for winner_games, loser_games in itertools.product((0, 7, 30), repeat=2):
+        _, _, masks = adjust_ratings_masked(winners, losers, winner_games, loser_games)
+        with counting_rules() as counters:
+            for w, l in zip(winners.tolist(), losers.tolist()):
+                wildcard_adjust_rating(w, l, True, winner_games, loser_games)
+        assert counters.masks == RuleCounters().add_masks(masks).masks
+
+
+def test_known_branches():
+    flags = {}
+    for case, (winner, loser) in {'upset': (2.0, 9.0), 'favourite': (9.0, 2.0), 'top': (10.0, 9.0)}.items():
+        _, _, mask = adjust_ratings_masked(winner, loser)
+        flags[case] = {rule for bit, rule in enumerate(RULE_FLAGS) if int(mask) >> bit & 1}
+    assert flags['upset'] == {'underdog', 'major_upset'}
+    assert flags['favourite'] == {'winner_floor', 'loser_floor'}
+    assert 'winner_clamp' in flags['top'] and 'underdog' not in flags['top']
+
+
+def test_cap_fires_when_k_allows_it():
+    config = make_config(k_factors=(2.0, 1.0, 0.5, 0.1))
+    counters = RuleCounters()
+    adjust_ratings_batch(5.0, 5.0, config=config, counters=counters)
+    assert counters.rule_counts()['winner_cap'] == 1 and counters.rule_counts()['loser_cap'] == 1
+
+
+def test_table_lookups_count_like_the_scalar_engine():
+    batch = ScenarioBatch.generate(2000, seed=5)
+    scenarios = [(EMOTIONS[code], list(o), list(r)) for code, o, r in
+                 zip(batch.emotion_codes, batch.opponent_ratings(), batch.result_matrix())]
+    with counting_rules() as scalar:
+        for scenario in scenarios:
+            wildcard_simulation(*scenario)
+    with counting_rules() as tabulated:
+        for scenario in scenarios:
+            tabulated_wildcard_simulation(*scenario)
+    vectorized = RuleCounters()
+    tabulated_simulate_batch(batch, counters=vectorized)
+    assert scalar.masks == tabulated.masks == vectorized.masks
+    assert scalar.adjustments == 2000 * 3
+
+
+def test_disabled_by_default_and_restored():
+    assert get_rule_counters() is None
+    with counting_rules():
+        HOME_ENGINES['baseline_free']('LOVED', [5.0, 6.0], [True, False])
+    assert get_rule_counters() is None
+
+
+def test_counters_merge_across_workers():
+    serial = run_monte_carlo(6000, seed=2, workers=1, chunk_size=1500, home_engine='baseline_free', count_rules=True)
+    pooled = run_monte_carlo(6000, seed=2, workers=2, chunk_size=1500, home_engine='baseline_free', count_rules=True)
+    assert serial.rules.masks == pooled.rules.masks
+    # Wildcard plays 3 rounds, baseline-free Home 2
+    assert serial.summary()['rules']['adjustments'] == 6000 * 5
+    assert 'rules' not in run_monte_carlo(100, workers=1).summary()
+
+
+def test_round_trip():
+    counters = RuleCounters().add_masks([0, 3, 3, 12])
+    restored = RuleCounters.from_dict(counters.as_dict())
+    assert restored.masks == counters.masks
+    assert restored.summary()['counts']['winner_floor'] == 2 and restored.summary()['untouched'] == 1
@@ -0,0 +1,38 @@
+# Tests for the shared scalar engine and its tracing hook
+
+from rating_core import calculate_k_factor, set_trace_hook, wildcard_adjust_rating
+
+
+def test_k_factor_ladder():
+    assert [calculate_k_factor(g) for g in (0, 4, 5, 9, 10, 19, 20)] == [0.5, 0.5, 0.25, 0.25, 0.125, 0.125, 0.1]
+
+
+def test_known_adjustments():
+    # Favourite wins: capped small gain, 0.1 floor on the loser
+    assert wildcard_adjust_rating(8.5, 4.0, True, 0, 5) == (8.6, 3.9)
+    # Major upset: +3.0 bonus, no cap
+    assert wildcard_adjust_rating(3.0, 8.5, True, 0, 5) == (6.6, 8.3)
+    # Largest possible upset
+    assert wildcard_adjust_rating(1.0, 10.0, True, 0, 0) == (4.6, 9.5)
+
+
+def test_fast_path_is_silent(capsys):
+    wildcard_adjust_rating(3.0, 9.5, True, 0, 5)
+    assert capsys.readouterr().out == ''
+
+
+def test_trace_hook_receives_each_adjustment():
+    traces = []
+    previous = set_trace_hook(traces.append)
+    try:
+        result = wildcard_adjust_rating(3.0, 9.5, True, 0, 5)
+    finally:
+        set_trace_hook(previous)
+
+    assert len(traces) == 1
+    trace = traces[0]
+    assert trace.is_underdog and trace.is_major_upset
+    assert (trace.new_winner_rating, trace.new_loser_rating) == result
+
+    wildcard_adjust_rating(3.0, 9.5, True, 0, 5)
+    assert len(traces) == 1
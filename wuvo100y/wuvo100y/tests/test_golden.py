@@ -0,0 +1,118 @@
+# Tests for the golden-vector corpus and the batch JS parity checker
+
+import random
+import shutil
+
+import pytest
+
+import golden_parity
+from rating_core import wildcard_adjust_rating
+from rating_core.golden import JS_SOURCE, check_parity, read_corpus, write_corpus
+from rating_core.output import get_reporter, set_reporter
+from rating_core.transitions import RATING_GRID
+
+needs_node = pytest.mark.skipif(shutil.which('node') is None, reason="node is not installed")
+
+# The Python engine transcribed to JS; ROUND is swapped to compare rounding modes
+MIRROR_JS = """
+export const calculateKFactor = (gamesPlayed) => {
+  if (gamesPlayed < 5) return 0.5;
+  if (gamesPlayed < 10) return 0.25;
+  if (gamesPlayed < 20) return 0.125;
+  return 0.1;
+};
+
+export const adjustRatingWildcard = (winnerRating, loserRating, winnerWon, winnerGamesPlayed = 0, loserGamesPlayed = 0) => {
+  const roundHalfEven = (x) => {
+    const r = Math.round(x);
+    return x % 1 === 0.5 && r % 2 !== 0 ? r - 1 : r;
+  };
+  const expected = 1 / (1 + Math.pow(10, (loserRating - winnerRating) / 4));
+  let winnerIncrease = Math.max(0.1, calculateKFactor(winnerGamesPlayed) * (1 - expected));
+  let loserDecrease = Math.max(0.1, calculateKFactor(loserGamesPlayed) * (1 - expected));
+  const isUnderdog = winnerRating < loserRating;
+  if (isUnderdog) winnerIncrease *= 1.2;
+  const isMajorUpset = isUnderdog && loserRating - winnerRating > 3.0;
+  if (isMajorUpset) {
+    winnerIncrease += BONUS;
+  } else {
+    winnerIncrease = Math.min(0.7, winnerIncrease);
+    loserDecrease = Math.min(0.7, loserDecrease);
+  }
+  return {
+    updatedSeenContent: ROUND(Math.min(10, Math.max(1, winnerRating + winnerIncrease)) * 10) / 10,
+    updatedNewContent: ROUND(Math.min(10, Math.max(1, loserRating - loserDecrease)) * 10) / 10
+  };
+};
+"""
+
+
+@pytest.fixture(scope='module')
+def corpus(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('golden') / 'corpus.bin')
+    write_corpus(path, max_games=11)
+    return path
+
+
+def mirror(tmp_path, rounding='roundHalfEven', bonus='3.0'):
+    path = tmp_path / 'mirror.js'
+    path.write_text(MIRROR_JS.replace('ROUND', rounding).replace('BONUS', bonus))
+    return str(path)
+
+
+def test_corpus_holds_the_scalar_engine(corpus):
+    golden = read_corpus(corpus)
+    columns = golden.columns
+    assert len(columns['winner']) == 91 * 91 * 12 * 12
+    assert golden.k_factors == [0.5] * 5 + [0.25] * 5 + [0.125] * 2
+    for i in random.Random(0).sample(range(len(columns['winner'])), 2000):
+        expected = wildcard_adjust_rating(RATING_GRID[columns['winner'][i]], RATING_GRID[columns['loser'][i]], True,
+                                          int(columns['winner_games'][i]), int(columns['loser_games'][i]))
+        assert (RATING_GRID[columns['new_winner'][i]], RATING_GRID[columns['new_loser'][i]]) == expected
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'other.bin'
+    path.write_bytes(b'not a corpus')
+    with pytest.raises(ValueError):
+        read_corpus(str(path))
+
+
+@needs_node
+def test_faithful_port_has_parity(corpus, tmp_path):
+    report = check_parity(corpus, mirror(tmp_path))
+    assert report.mismatches == 0 and report.k_factor_mismatches == [] and report.examples == []
+
+
+@needs_node
+def test_mismatches_are_reported_in_bulk_by_rule(corpus, tmp_path):
+    report = check_parity(corpus, mirror(tmp_path, bonus='2.0'), examples=3)
+    assert report.mismatches == report.winner_mismatches == report.by_rule['major_upset'][1] > 0
+    assert report.loser_mismatches == 0 and report.max_error == 1.0 and len(report.examples) == 3
+
+
+@needs_node
+def test_math_round_differs_only_on_half_ties(corpus, tmp_path):
+    # Python's round() sends x.5 to even, JS Math.round sends it up: a one-step difference on exact ties
+    report = check_parity(corpus, mirror(tmp_path, rounding='Math.round'))
+    assert report.mismatches > 0 and report.max_error == 0.1
+    assert report.by_rule['major_upset'][1] == 0
+
+
+@needs_node
+def test_app_source_loads(corpus):
+    report = check_parity(corpus, JS_SOURCE)
+    assert report.vectors == 91 * 91 * 12 * 12 and report.k_factor_mismatches == []
+
+
+def test_corpus_is_rewritten_for_another_max_games(tmp_path):
+    path = str(tmp_path / 'corpus.bin')
+    previous = get_reporter()
+    try:
+        golden_parity.main(['--corpus', path, '--max-games', '3', '--no-check', '--silent'])
+        assert read_corpus(path).metadata['max_games'] == 3
+        golden_parity.main(['--corpus', path, '--max-games', '5', '--no-check', '--silent'])
+        assert read_corpus(path).metadata['max_games'] == 5
+    finally:
+        set_reporter(previous)
+    assert golden_parity.DEFAULT_CORPUS != 'wildcard_golden.bin'
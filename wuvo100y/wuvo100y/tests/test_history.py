@@ -0,0 +1,83 @@
+# Tests for the columnar comparison log and its CSR / replay / refit views
+
+import numpy as np
+import pytest
+
+from rating_core import wildcard_adjust_rating
+from rating_core.bradley_terry import refit_thetas
+from rating_core.history import DECISIVE, TIE, ComparisonLog
+from rating_core.kernels import HAVE_NUMBA
+from rating_core.population import Population
+
+JIT_MODES = [False, pytest.param(True, marks=pytest.mark.skipif(not HAVE_NUMBA, reason="numba not installed"))]
+
+
+def random_log(size, count, seed):
+    rng = np.random.default_rng(seed)
+    winners = rng.integers(0, size, count)
+    losers = (winners + rng.integers(1, size, count)) % size
+    return ComparisonLog.from_arrays(winners, losers, np.arange(count) // 10), winners, losers
+
+
+def test_append_grows_and_exposes_views():
+    log = ComparisonLog(capacity=2)
+    for i in range(5000):
+        log.append(i % 7, (i + 1) % 7, timestamp=i)
+    log.extend([1, 2], [3, 4], timestamps=[9000, 9001], outcomes=TIE)
+    assert len(log) == 5002
+    assert log.winners[:3].tolist() == [0, 1, 2]
+    assert log.timestamps[-1] == 9001 and log.outcomes[-1] == TIE and log.outcomes[0] == DECISIVE
+    assert log.nbytes == 5002 * 17
+    with pytest.raises(ValueError):
+        log.append(-1, 2)
+    with pytest.raises(ValueError):
+        log.append(2**40, 2)
+
+
+def test_adjacency_lists_every_comparison_in_order():
+    log, winners, losers = random_log(50, 2000, seed=1)
+    indptr, neighbors, edges = log.adjacency()
+    assert indptr[-1] == 2 * len(log)
+    for movie in range(50):
+        rows = [e for e in range(len(log)) if movie in (winners[e], losers[e])]
+        opponents, log_rows = log.comparisons_of(movie)
+        assert log_rows.tolist() == rows
+        assert opponents.tolist() == [losers[e] if winners[e] == movie else winners[e] for e in rows]
+    assert log.degrees().sum() == 2 * len(log)
+    assert len(log.comparisons_of(99)[0]) == 0
+
+
+@pytest.mark.parametrize('jit', JIT_MODES)
+def test_replay_reproduces_population(jit):
+    log = ComparisonLog()
+    population = Population(120, 80, seed=4, log=log)
+    ratings, games = population.ratings.ravel().copy(), population.games.ravel().copy()
+    population.run(6, rebattles_per_step=2)
+    assert len(log) == population.battles
+    replayed_ratings, replayed_games = log.replay(ratings, games, jit=jit)
+    assert np.array_equal(replayed_ratings, population.ratings.ravel())
+    assert np.array_equal(replayed_games, population.games.ravel())
+
+
+def test_replay_matches_scalar_engine():
+    log, winners, losers = random_log(30, 500, seed=5)
+    ratings = list(np.random.default_rng(0).integers(10, 101, 30) / 10)
+    games = [0] * 30
+    for w, l in zip(winners, losers):
+        ratings[w], ratings[l] = wildcard_adjust_rating(ratings[w], ratings[l], True, games[w], games[l])
+        games[w] += 1
+        games[l] += 1
+    replayed, _ = log.replay(np.random.default_rng(0).integers(10, 101, 30) / 10, np.zeros(30, dtype=int))
+    assert replayed.tolist() == ratings
+
+
+def test_comparison_matrix_and_select():
+    log, _, _ = random_log(40, 3000, seed=6)
+    log.extend([0], [1], timestamps=10_000, outcomes=TIE)
+    matrix = log.comparison_matrix()
+    assert matrix.wins.sum() == len(log)
+    thetas, _ = refit_thetas(matrix)
+    assert np.isfinite(thetas).all()
+
+    recent = log.select(log.timestamps >= 250)
+    assert len(recent) == 501 and (recent.timestamps >= 250).all()
@@ -0,0 +1,106 @@
+# Tests for the information-gain opponent selection port and its bucketed index
+
+import math
+import random
+
+import pytest
+
+from rating_core.information_gain import (InformationGainIndex, comparisons_to_confidence, glicko_update,
+                                          information_gain, select_optimal_opponent)
+from rating_core.opponents import PERCENTILE_RANGES
+
+
+def make_library(n, seed=0, with_stats=True):
+    rng = random.Random(seed)
+    return [{'id': i, 'title': f'Movie {i}', 'rating': rng.randint(10, 100) / 10,
+             'standard_error': rng.choice([0.3, 0.5, round(rng.uniform(0.2, 1.5), 3)]) if with_stats else None}
+            for i in range(n)]
+
+
+def brute_force_top(rating, movies, exclude, k=3):
+    valid = [m for m in movies if m['id'] not in exclude and m['standard_error'] is not None]
+    return sorted(valid, key=lambda m: -information_gain(rating, 1.0, m['rating'], m['standard_error']))[:k]
+
+
+def test_information_gain_matches_js_formula():
+    p = 1 / (1 + 10 ** ((6.0 - 7.0) / 10))
+    assert information_gain(7.0, 2.0, 6.0, 0.5) == pytest.approx(4 * p * (1 - p) / 1.5)
+    assert information_gain(5.0, 2.0, 5.0, 0.0) == 1.0
+
+
+def test_index_finds_brute_force_top_three():
+    movies = make_library(3000, seed=1)
+    index = InformationGainIndex(movies)
+    rng = random.Random(2)
+    for _ in range(300):
+        rating = rng.randint(10, 100) / 10
+        exclude = rng.sample(range(3000), 10)
+        expected = brute_force_top(rating, movies, exclude)
+        assert [movie['id'] for _, movie in index.best(rating, exclude)] == [movie['id'] for movie in expected]
+
+
+def test_select_draws_like_the_app():
+    movies = make_library(500, seed=3)
+    index = InformationGainIndex(movies)
+    for seed in range(20):
+        expected = select_optimal_opponent(6.3, 1.0, movies, [1, 2], random.Random(seed))
+        assert index.select(6.3, [1, 2], random.Random(seed)) is expected
+
+
+def test_updates_and_fallback():
+    movies = make_library(200, seed=4)
+    index = InformationGainIndex(movies)
+    rng = random.Random(5)
+    for _ in range(500):
+        movie_id = rng.randrange(200)
+        index.update(movie_id, rng.randint(10, 100) / 10, rng.choice([None, round(rng.uniform(0.1, 2), 2)]))
+    index.remove(7)
+    movies = [m for m in movies if m['id'] != 7]
+    for rating in (1.0, 5.5, 10.0):
+        expected = brute_force_top(rating, movies, ())
+        assert [m['id'] for _, m in index.best(rating)] == [m['id'] for m in expected]
+
+    no_stats = InformationGainIndex(make_library(5, with_stats=False))
+    assert no_stats.best(5.0) == []
+    assert no_stats.select(5.0, [0, 1, 2, 3], random.Random(0))['id'] == 4
+    assert no_stats.select(5.0, range(5)) is None
+
+
+def test_glicko_update_shrinks_uncertainty():
+    mean, error = glicko_update(5.0, 2.0, 5.0, 0.0, 1.0, scale=4)
+    q = math.log(10) / 4
+    assert error == pytest.approx(1 / math.sqrt(1 / 4 + q * q / 4))
+    assert mean > 5.0
+
+
+def test_information_gain_reaches_confidence_sooner():
+    index = InformationGainIndex(make_library(2000, seed=6))
+    rng = random.Random(7)
+    totals = {'percentile': 0, 'information_gain': 0}
+    for i in range(200):
+        true_rating = rng.uniform(1.5, 9.5)
+        for strategy in totals:
+            totals[strategy] += comparisons_to_confidence(index, 'LIKED', true_rating, strategy,
+                                                          rng=random.Random(i))[0]
+    assert totals['information_gain'] < 0.8 * totals['percentile']
+
+
+def test_add_after_mutating_a_shared_movie():
+    movies = make_library(200, seed=6)
+    index = InformationGainIndex(movies)
+    rng = random.Random(7)
+    for movie in rng.sample(movies, 60):
+        movie['rating'] = rng.randint(10, 100) / 10
+        movie['standard_error'] = round(rng.uniform(0.2, 1.5), 3)
+        index.add(movie)
+    assert len(index) == 200
+    for rating in (2.0, 5.5, 9.1):
+        assert [movie['id'] for _, movie in index.best(rating)] == [movie['id'] for movie in brute_force_top(rating, movies, ())]
+    # The percentile band still sees every movie exactly once, at its new rating
+    ranked = sorted(movies, key=lambda m: m['rating'], reverse=True)
+    for emotion, (low, high) in PERCENTILE_RANGES.items():
+        band = ranked[int(low * 200):max(int(high * 200), int(low * 200) + 1)]
+        assert index.select_initial(emotion, random.Random(8)) is random.Random(8).choice(band)
+    for movie in movies[:100]:
+        index.remove(movie['id'])
+    assert len(index) == 100
@@ -0,0 +1,60 @@
+# Parity tests for the compiled battle-loop kernel and its pure-Python fallback
+
+import numpy as np
+import pytest
+
+from rating_core import engines
+from rating_core.config import make_config
+from rating_core.kernels import HAVE_NUMBA, kernel_simulate, kernel_simulate_batch, run_battle_loop
+from rating_core.records import ScenarioBatch
+from rating_core.transitions import tabulated_simulate_batch
+
+SCALAR_ENGINES = {
+    'wildcard': engines.wildcard_simulation,
+    'unknown_vs_known': engines.home_screen_unknown_vs_known,
+    'baseline_free': engines.home_screen_system,
+}
+JIT_MODES = [False, pytest.param(True, marks=pytest.mark.skipif(not HAVE_NUMBA, reason="numba not installed"))]
+
+
+def off_grid_scenarios(n, rounds, seed):
+    rng = np.random.default_rng(seed)
+    emotions = [engines.EMOTIONS[code] for code in rng.integers(0, len(engines.EMOTIONS), n)]
+    return emotions, rng.uniform(1, 10, (n, rounds)), rng.random((n, rounds)) < 0.5
+
+
+@pytest.mark.parametrize('jit', JIT_MODES)
+@pytest.mark.parametrize('engine', sorted(SCALAR_ENGINES))
+def test_kernel_matches_scalar_engines(engine, jit):
+    batch = ScenarioBatch.generate(2000, seed=11, rounds=7)
+    expected = [SCALAR_ENGINES[engine](s.emotion, s.opponents, s.results) for s in batch]
+    assert kernel_simulate_batch(batch, engine, jit=jit).tolist() == expected
+
+
+@pytest.mark.parametrize('jit', JIT_MODES)
+@pytest.mark.parametrize('engine', sorted(SCALAR_ENGINES))
+def test_kernel_matches_scalar_engines_off_grid(engine, jit):
+    emotions, opponents, results = off_grid_scenarios(2000, 4, seed=12)
+    expected = [SCALAR_ENGINES[engine](e, o, r) for e, o, r in zip(emotions, opponents.tolist(), results.tolist())]
+    assert kernel_simulate(emotions, opponents, results, engine, jit=jit).tolist() == expected
+
+
+@pytest.mark.parametrize('jit', JIT_MODES)
+def test_kernel_honours_config(jit):
+    config = make_config(k_factors=(0.8, 0.4, 0.2, 0.05), k_thresholds=(2, 4, 6), max_change=1.0,
+                         first_round_offset=0.3)
+    batch = ScenarioBatch.generate(2000, seed=13, rounds=8)
+    for engine in SCALAR_ENGINES:
+        expected = tabulated_simulate_batch(batch, engine, config)
+        assert np.array_equal(kernel_simulate_batch(batch, engine, config, jit=jit), expected)
+
+
+@pytest.mark.skipif(HAVE_NUMBA, reason="numba is installed")
+def test_jit_requires_numba():
+    with pytest.raises(RuntimeError):
+        run_battle_loop([7.0], [[5.0]], [[True]], jit=True)
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        kernel_simulate(['LOVED'], [[5.0]], [[True]], engine='elo')
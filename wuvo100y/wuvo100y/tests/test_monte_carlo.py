@@ -0,0 +1,59 @@
+# Tests for the scenario generator, print-free engines and process-pool runner
+
+import contextlib
+import io
+
+import extended_simulation
+import mega_simulation
+import monte_carlo_simulation
+from rating_core.engines import home_screen_baseline_free, home_screen_unknown_vs_known, wildcard_simulation
+from rating_core.output import SUMMARY, Reporter, set_reporter
+from rating_core.runner import run_chunk, run_monte_carlo
+from rating_core.scenarios import generate_scenarios
+
+
+def test_generator_is_seeded_and_on_grid():
+    first = list(generate_scenarios(200, seed=7))
+    assert first == list(generate_scenarios(200, seed=7))
+    assert first != list(generate_scenarios(200, seed=8))
+    for scenario in first:
+        assert len(scenario['opponents']) == len(scenario['results']) == 3
+        for rating in scenario['opponents']:
+            assert 1 <= rating <= 10 and round(rating * 10) / 10 == rating
+
+
+def test_engines_match_mega_simulation():
+    with contextlib.redirect_stdout(io.StringIO()):
+        for scenario in generate_scenarios(500, seed=3):
+            args = (scenario['emotion'], scenario['opponents'], scenario['results'])
+            assert wildcard_simulation(*args) == mega_simulation.wildcard_simulation(*args)
+            assert home_screen_unknown_vs_known(*args) == mega_simulation.home_screen_unknown_vs_known(*args)
+            assert home_screen_baseline_free(*args[1:]) == extended_simulation.home_screen_system(*args[1:], False)
+
+
+def test_pool_matches_serial_run():
+    serial = run_monte_carlo(3000, seed=11, workers=1, chunk_size=700).summary()
+    pooled = run_monte_carlo(3000, seed=11, workers=2, chunk_size=700).summary()
+    assert serial == pooled
+    assert serial['scenarios'] == 3000
+    assert sum(stats['count'] for stats in serial['emotions'].values()) == 3000
+
+
+def test_merge_adds_chunk_aggregates():
+    first, second = run_chunk(5, 0, 400), run_chunk(5, 400, 600)
+    expected_perfect = first.categories['perfect'] + second.categories['perfect']
+    expected_max = max(first.differences.maximum, second.differences.maximum)
+    merged = first.merge(second)
+    assert merged.count == 1000
+    assert merged.categories['perfect'] == expected_perfect
+    assert merged.differences.maximum == expected_max
+
+
+def test_empty_run_prints_a_summary():
+    stream = io.StringIO()
+    previous = set_reporter(Reporter(verbosity=SUMMARY, stream=stream))
+    try:
+        monte_carlo_simulation.print_summary(run_monte_carlo(0, workers=1).summary(), 0.5, 1)
+    finally:
+        set_reporter(previous)
+    assert "Median / p95 difference: n/a" in stream.getvalue()
@@ -0,0 +1,89 @@
+# Tests for the persistent percentile opponent index
+
+import random
+
+import pytest
+
+from rating_core.opponents import PERCENTILE_RANGES, OpponentIndex
+
+
+def make_library(n, seed=0):
+    rng = random.Random(seed)
+    return [{'id': i, 'title': f'Movie {i}', 'rating': rng.randint(10, 100) / 10} for i in range(n)]
+
+
+def legacy_percentile_candidates(movies, emotion):
+    """The slice simulate_opponent_selection used to build by re-sorting"""
+    sorted_movies = sorted(movies, key=lambda x: x['rating'], reverse=True)
+    low, high = PERCENTILE_RANGES[emotion]
+    start_idx = int(low * len(sorted_movies))
+    end_idx = int(high * len(sorted_movies))
+    return sorted_movies[start_idx:max(end_idx, start_idx + 1)]
+
+
+@pytest.mark.parametrize('n', [1, 4, 16, 500])
+def test_percentile_bands_match_sorted_slices(n):
+    movies = make_library(n)
+    index = OpponentIndex(movies)
+    for emotion in PERCENTILE_RANGES:
+        assert index.percentile_movies(*PERCENTILE_RANGES[emotion]) == legacy_percentile_candidates(movies, emotion)
+
+
+def test_first_opponent_matches_random_choice():
+    movies = make_library(300)
+    index = OpponentIndex(movies)
+    for emotion in PERCENTILE_RANGES:
+        expected = random.Random(5).choice(legacy_percentile_candidates(movies, emotion))
+        assert index.choose_in_percentile(*PERCENTILE_RANGES[emotion], rng=random.Random(5)) is expected
+
+
+def test_incremental_updates_keep_order():
+    rng = random.Random(1)
+    movies = make_library(200)
+    index = OpponentIndex(movies[:100])
+    for movie in movies[100:]:
+        index.add(movie)
+    for _ in range(300):
+        index.update_rating(rng.randrange(200), rng.randint(10, 100) / 10)
+    for movie_id in rng.sample(range(200), 50):
+        index.remove(movie_id)
+
+    remaining = [movie for movie in movies if movie['id'] in index]
+    assert len(index) == len(remaining) == 150
+    assert list(index) == sorted(remaining, key=lambda x: x['rating'], reverse=True)
+    for emotion in PERCENTILE_RANGES:
+        assert index.percentile_movies(*PERCENTILE_RANGES[emotion]) == legacy_percentile_candidates(remaining, emotion)
+
+
+@pytest.mark.parametrize('n', [3, 5, 1000])
+def test_select_opponents_are_distinct(n):
+    index = OpponentIndex(make_library(n))
+    rng = random.Random(2)
+    for emotion in list(PERCENTILE_RANGES) * 25:
+        opponents = index.select_opponents(emotion, rng=rng)
+        assert len({opponent['id'] for opponent in opponents}) == 3
+        assert opponents[0] in index.percentile_movies(*PERCENTILE_RANGES[emotion])
+
+
+def test_sample_is_uniform_and_respects_exclusions():
+    index = OpponentIndex(make_library(10))
+    rng = random.Random(3)
+    counts = [0] * 10
+    for _ in range(20_000):
+        for movie in index.sample(2, exclude=(0,), rng=rng):
+            counts[movie['id']] += 1
+    assert counts[0] == 0
+    assert all(abs(count - 40_000 / 9) < 300 for count in counts[1:])
+    with pytest.raises(ValueError):
+        index.sample(10, exclude=(0,))
+
+
+def test_add_after_mutating_a_shared_movie():
+    movies = [{'id': i, 'title': f'Movie {i}', 'rating': rating} for i, rating in enumerate([3.0, 8.0, 5.0, 9.0])]
+    index = OpponentIndex(movies)
+    for movie_id, rating in [(1, 4.0), (2, 9.5), (0, 3.0)]:
+        movies[movie_id]['rating'] = rating
+        index.add(movies[movie_id])
+        assert list(index) == sorted(movies, key=lambda x: x['rating'], reverse=True)
+    index.remove(2)
+    assert [movie['id'] for movie in index] == [3, 1, 0]
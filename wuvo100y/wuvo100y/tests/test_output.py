@@ -0,0 +1,88 @@
+# Tests for the shared verbosity / JSON Lines output layer
+
+import argparse
+import io
+import json
+
+import pytest
+
+from rating_core import output
+from rating_core.output import (
+    ROUND,
+    SCENARIO,
+    SUMMARY,
+    Reporter,
+    add_output_arguments,
+    emit,
+    emit_record,
+    set_reporter,
+)
+
+
+@pytest.fixture
+def capture():
+    """Install a reporter writing to a StringIO; restore the previous one afterwards"""
+    installed = []
+
+    def install(**kwargs):
+        stream = io.StringIO()
+        installed.append(set_reporter(Reporter(stream=stream, **kwargs)))
+        return stream
+
+    yield install
+    for previous in installed[:1]:
+        set_reporter(previous)
+
+
+def test_verbosity_filters_text(capture):
+    stream = capture(verbosity=SUMMARY)
+    emit(SUMMARY, "summary line")
+    emit(SCENARIO, "scenario line")
+    emit(ROUND, "round line")
+    assert stream.getvalue() == "summary line\n"
+
+
+def test_jsonl_writes_records_only(capture):
+    stream = capture(verbosity=SCENARIO, format='jsonl')
+    emit(SUMMARY, "text is suppressed")
+    emit_record(SCENARIO, 'scenario', emotion='LOVED', home=8.4)
+    emit_record(ROUND, 'round', rating=7.0)
+    lines = stream.getvalue().splitlines()
+    assert [json.loads(line) for line in lines] == [{'type': 'scenario', 'emotion': 'LOVED', 'home': 8.4}]
+
+
+def test_buffered_reporter_writes_on_flush():
+    stream = io.StringIO()
+    reporter = Reporter(stream=stream, buffer_lines=10)
+    reporter.text(SUMMARY, "a")
+    reporter.text(SUMMARY, "b")
+    assert stream.getvalue() == ""
+    reporter.flush()
+    assert stream.getvalue() == "a\nb\n"
+
+
+@pytest.mark.parametrize('argv, expected', [
+    ([], 'round'),
+    (['-q'], 'summary'),
+    (['--silent'], 'silent'),
+    (['--verbosity', 'scenario'], 'scenario'),
+])
+def test_output_arguments(argv, expected):
+    args = add_output_arguments(argparse.ArgumentParser()).parse_args(argv)
+    assert args.verbosity == expected
+    assert args.format == 'text'
+
+
+def test_configure_output_keeps_one_exit_flush(monkeypatch):
+    registered = []
+    monkeypatch.setattr(output.atexit, 'register', registered.append)
+    monkeypatch.setattr(output.atexit, 'unregister', registered.remove)
+    monkeypatch.setattr(output, '_exit_reporter', None)
+    args = add_output_arguments(argparse.ArgumentParser()).parse_args(['--silent'])
+    previous = output.get_reporter()
+    try:
+        first = output.configure_output(args)
+        second = output.configure_output(args)
+    finally:
+        set_reporter(previous)
+    assert registered == [second.flush] and first is not second
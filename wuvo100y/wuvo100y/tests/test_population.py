@@ -0,0 +1,79 @@
+# Tests for the array-backed multi-user population simulator
+
+import numpy as np
+import pytest
+
+from rating_core import wildcard_adjust_rating
+from rating_core.engines import EMOTIONS
+from rating_core.opponents import PERCENTILE_RANGES
+from rating_core.population import Population
+
+
+def test_initial_libraries():
+    population = Population(50, 100, seed=1, initial_library=10)
+    assert (population.library_sizes() == 10).all()
+    ratings = population.ratings[population.rated]
+    assert ((ratings >= 1) & (ratings <= 10)).all()
+    assert np.array_equal(np.rint(ratings * 10) / 10, ratings)
+
+
+def test_battle_matches_scalar_engine():
+    population = Population(200, 30, seed=2)
+    rng = np.random.default_rng(0)
+    users = np.arange(200)
+    titles, opponents = population.select_opponents(users, np.zeros(200, dtype=np.int64), 2).T
+    population.games[users, titles] = rng.integers(0, 25, 200)
+    won = rng.random(200) < 0.5
+
+    before_ratings = population.ratings.copy()
+    before_games = population.games.copy()
+    population.battle(users, titles, opponents, won)
+
+    for u, t, o, w in zip(users, titles, opponents, won):
+        winner, loser = (t, o) if w else (o, t)
+        expected = wildcard_adjust_rating(before_ratings[u, winner], before_ratings[u, loser], True,
+                                          before_games[u, winner], before_games[u, loser])
+        assert (population.ratings[u, winner], population.ratings[u, loser]) == expected
+        assert population.games[u, winner] == before_games[u, winner] + 1
+
+
+def test_select_opponents_uses_percentile_band():
+    population = Population(300, 80, seed=3, initial_library=40)
+    users = np.arange(300)
+    for code, emotion in enumerate(EMOTIONS):
+        opponents = population.select_opponents(users, np.full(300, code), 3)
+        assert all(len(set(row)) == 3 for row in opponents.tolist())
+        assert population.rated[users[:, None], opponents].all()
+        low, high = PERCENTILE_RANGES[emotion]
+        for u, first in zip(users, opponents[:, 0]):
+            ranked = sorted(np.flatnonzero(population.rated[u]), key=lambda t: -population.ratings[u, t])
+            band = [population.ratings[u, t] for t in ranked[int(low * 40):int(high * 40)]]
+            assert min(band) <= population.ratings[u, first] <= max(band)
+
+
+def test_rate_new_movies_moves_opponents():
+    population = Population(100, 60, seed=4)
+    ratings, games = population.ratings.copy(), population.games.copy()
+    users, titles = population.rate_new_movies()
+    assert len(users) == 100
+    assert (population.library_sizes() == 21).all()
+    assert population.rated[users, titles].all()
+    # The new movie took part in three battles, its opponents in one each
+    assert (population.games[users, titles] == 3).all()
+    assert (population.games.sum() - games.sum()) == 100 * 6
+    changed = (population.ratings != ratings) & population.rated
+    changed[users, titles] = False
+    assert changed.any()
+
+
+def test_run_is_seeded():
+    first = Population(40, 50, seed=5).run(5, rebattles_per_step=2).summary()
+    second = Population(40, 50, seed=5).run(5, rebattles_per_step=2).summary()
+    assert first == second
+    assert first['battles'] == 5 * 40 * 3 + 5 * 2 * 40
+    assert first['rated_movies'] == 40 * 25
+
+
+def test_library_must_fit_catalog():
+    with pytest.raises(ValueError):
+        Population(10, 5, initial_library=10)
@@ -0,0 +1,118 @@
+# Tests for the Fenwick-tree grid quantiles
+
+import numpy as np
+import pytest
+
+from rating_core.population import Population
+from rating_core.quantiles import GridQuantiles, grid_index
+from rating_core.transitions import GRID_SIZE, RATING_GRID
+
+
+def random_counts(rows, seed=0, high=4):
+    return np.random.default_rng(seed).integers(0, high, (rows, GRID_SIZE))
+
+
+def descending_bins(counts):
+    """Grid index of every descending position of a count row"""
+    return np.repeat(np.arange(GRID_SIZE)[::-1], counts[::-1])
+
+
+def js_categories(ratings):
+    """calculateDynamicRatingCategories' ranges, straight from a sorted list"""
+    ratings = sorted(ratings)
+    unique = sorted(set(ratings))
+    lowest, highest = unique[0], unique[-1]
+    if len(unique) < 4 or len(ratings) < 4:
+        midpoint = np.floor((lowest + highest) / 2 * 10 + 0.5) / 10
+        if highest - lowest < 1.0:
+            p25, p50, p75 = lowest, midpoint, highest
+        else:
+            p25 = p50 = p75 = midpoint
+    else:
+        p25, p50, p75 = (ratings[int(len(ratings) * f)] for f in (0.25, 0.50, 0.75))
+        if p25 == p50:
+            p50 = min(p25 + 0.1, p75)
+        if p50 == p75:
+            p75 = min(p50 + 0.1, highest)
+    return {'LOVED': (p75, highest), 'LIKED': (p50, p75), 'AVERAGE': (p25, p50), 'DISLIKED': (lowest, p25)}
+
+
+def test_select_walks_the_sorted_library():
+    counts = random_counts(4)
+    quantiles = GridQuantiles.from_counts(counts)
+    for row in range(4):
+        expected = descending_bins(counts[row])
+        positions = np.arange(len(expected))
+        bins, offsets = quantiles.select(np.full(len(expected), row), positions)
+        assert np.array_equal(bins, expected)
+        # Offset among ties: distance from the first position holding that grid point
+        first = np.searchsorted(-expected, -expected)
+        assert np.array_equal(offsets, positions - first)
+
+
+def test_incremental_updates_match_a_rebuild():
+    rng = np.random.default_rng(1)
+    counts = random_counts(6, seed=1)
+    quantiles = GridQuantiles.from_counts(counts)
+    for _ in range(200):
+        rows = rng.integers(0, 6, 10)
+        old = np.array([rng.choice(np.flatnonzero(counts[r])) for r in rows])
+        new = rng.integers(0, GRID_SIZE, 10)
+        for r, o, n in zip(rows, old, new):
+            counts[r, o] -= 1
+            counts[r, n] += 1
+        quantiles.move(rows, old, new)
+    rebuilt = GridQuantiles.from_counts(counts)
+    assert np.array_equal(quantiles.tree, rebuilt.tree)
+    assert np.array_equal(quantiles.sizes, counts.sum(axis=1))
+    for row in range(6):
+        assert np.array_equal(quantiles.counts(row), counts[row])
+
+
+def test_count_above_and_merge():
+    first, second = random_counts(3, seed=2), random_counts(3, seed=3)
+    merged = GridQuantiles.from_counts(first).merge(GridQuantiles.from_counts(second))
+    assert np.array_equal(merged.tree, GridQuantiles.from_counts(first + second).tree)
+    rows, bins = np.repeat(np.arange(3), GRID_SIZE), np.tile(np.arange(GRID_SIZE), 3)
+    expected = [(first + second)[r, b + 1:].sum() for r, b in zip(rows, bins)]
+    assert merged.count_above(rows, bins).tolist() == expected
+
+
+@pytest.mark.parametrize('ratings', [
+    [7.0], [5.0, 9.0], [8.8, 9.0, 9.2], [2.0, 2.0, 8.0, 8.0, 9.0],
+    [6.0, 6.0, 6.0, 6.0, 7.0, 8.0, 9.0, 9.0], [4.5, 4.5, 4.5, 4.6, 4.7, 9.9]
+])
+def test_category_boundaries_edge_cases(ratings):
+    quantiles = GridQuantiles(1)
+    quantiles.add(np.zeros(len(ratings)), grid_index(ratings))
+    assert quantiles.category_boundaries(0) == js_categories(ratings)
+
+
+def test_category_boundaries_follow_rating_changes():
+    rng = np.random.default_rng(4)
+    ratings = list(rng.integers(10, 101, 500) / 10)
+    quantiles = GridQuantiles(1)
+    quantiles.add(np.zeros(len(ratings)), grid_index(ratings))
+    for _ in range(300):
+        i, rating = rng.integers(len(ratings)), RATING_GRID[rng.integers(GRID_SIZE)]
+        quantiles.move(np.array([0]), grid_index([ratings[i]]), grid_index([rating]))
+        ratings[i] = rating
+        assert quantiles.category_boundaries(0) == js_categories(ratings)
+    assert GridQuantiles(2).category_boundaries(1) is None
+
+
+def test_population_trees_track_every_rating_change():
+    population = Population(60, 80, seed=6).run(15, rebattles_per_step=2)
+    rebuilt = GridQuantiles.from_ratings(population.ratings, population.rated)
+    assert np.array_equal(population.quantiles.tree, rebuilt.tree)
+    assert np.array_equal(population.quantiles.sizes, population.library_sizes())
+
+
+def test_titles_at_matches_a_stable_sort():
+    population = Population(40, 300, seed=7, initial_library=120).run(5, rebattles_per_step=1)
+    users = np.arange(40)
+    keys = np.where(population.rated, population.ratings, -np.inf)
+    order = np.argsort(-keys, axis=1, kind='stable')
+    sizes = population.library_sizes()
+    positions = (np.random.default_rng(0).random((40, 5)) * sizes[:, None]).astype(np.int64)
+    assert np.array_equal(population.titles_at(users, positions), np.take_along_axis(order, positions, axis=1))
@@ -0,0 +1,117 @@
+# Tests for threshold re-analysis from per-emotion difference counts
+
+import io
+
+import pytest
+
+import mega_simulation
+from rating_core.output import SUMMARY, Reporter, set_reporter
+from rating_core.reanalysis import (
+    CONTINUOUS_RESOLUTION,
+    DEFAULT_THRESHOLDS,
+    DifferenceCounts,
+    Thresholds,
+    difference_category,
+    verdict,
+)
+from rating_core.records import ScenarioBatch
+from rating_core.runner import run_monte_carlo
+from rating_core.streaming import ResultsAnalysis
+from rating_core.transitions import tabulated_simulate_batch
+
+
+@pytest.fixture(scope='module')
+def results():
+    batch = ScenarioBatch.generate(4000, seed=3)
+    return batch, tabulated_simulate_batch(batch, 'wildcard'), tabulated_simulate_batch(batch, 'baseline_free')
+
+
+def test_default_thresholds_match_streaming_analysis(results):
+    batch, wildcard, home = results
+    analysis, counts = ResultsAnalysis(), DifferenceCounts()
+    for scenario, w, h in zip(batch, wildcard.tolist(), home.tolist()):
+        analysis.add(scenario.emotion, w, h)
+        counts.add(scenario.emotion, w, h)
+    expected, summary = analysis.summary(), counts.summary()
+    for key in ('scenarios', 'perfect_matches', 'minor_differences', 'major_differences', 'categories'):
+        assert summary[key] == expected[key]
+    assert summary['average_difference'] == pytest.approx(expected['average_difference'])
+    assert summary['maximum_difference'] == expected['maximum_difference']
+    for emotion, stats in expected['emotions'].items():
+        assert summary['emotions'][emotion]['count'] == stats['count']
+        assert summary['emotions'][emotion]['max'] == stats['max']
+    # Grid engines leave a handful of distinct differences per emotion
+    assert max(len(bucket) for bucket in counts.buckets.values()) < 200
+
+
+def test_new_thresholds_match_reclassifying_every_scenario(results):
+    batch, wildcard, home = results
+    counts = DifferenceCounts().add_arrays(batch.emotion_codes, wildcard, home)
+    thresholds = Thresholds(perfect=0.1, excellent=0.3, acceptable=1.5, excellent_matches=3000, good_matches=1000)
+    summary = counts.summary(thresholds)
+    diffs = [abs(w - h) for w, h in zip(wildcard.tolist(), home.tolist())]
+    for name in ('perfect', 'excellent', 'acceptable', 'significant'):
+        assert summary['categories'][name] == sum(difference_category(d, thresholds) == name for d in diffs)
+    assert summary['verdict'] == verdict(summary['perfect_matches'], summary['major_differences'], thresholds)
+
+
+def test_verdict_cut_offs():
+    assert verdict(8, 5) == 'excellent' and verdict(6, 5) == 'good'
+    assert verdict(0, 0) == 'acceptable' and verdict(0, 1) == 'investigate'
+    assert verdict(8, 5, DEFAULT_THRESHOLDS._replace(excellent_matches=9)) == 'good'
+
+
+def test_counts_round_trip_and_merge(tmp_path, results):
+    batch, wildcard, home = results
+    half = len(batch) // 2
+    merged = DifferenceCounts().add_arrays(batch.emotion_codes[:half], wildcard[:half], home[:half])
+    merged.merge(DifferenceCounts().add_arrays(batch.emotion_codes[half:], wildcard[half:], home[half:]))
+    whole = DifferenceCounts().add_arrays(batch.emotion_codes, wildcard, home)
+    assert merged.buckets == whole.buckets
+
+    whole.save(tmp_path / 'counts.json')
+    assert DifferenceCounts.load(tmp_path / 'counts.json').buckets == whole.buckets
+
+    snapped = DifferenceCounts(resolution=0.5).add_arrays(batch.emotion_codes, wildcard, home)
+    assert snapped.count == len(batch)
+    assert all(value * 2 == round(value * 2) for bucket in snapped.buckets.values() for value in bucket)
+
+
+def test_counts_from_results_file(tmp_path):
+    path = tmp_path / 'run.bin'
+    expected = run_monte_carlo(3000, seed=8, workers=1, chunk_size=1000, results_path=path).summary()
+    summary = DifferenceCounts.from_results_file(path, chunk_size=700).summary()
+    assert summary['categories'] == expected['categories']
+
+
+def test_mega_from_stats_reproduces_live_run(tmp_path):
+    path = str(tmp_path / 'stats.json')
+    previous = set_reporter(Reporter(verbosity=SUMMARY, stream=io.StringIO()))
+    try:
+        live = mega_simulation.main(['--scenarios', '2000', '--home-engine', 'baseline_free', '--acceptable', '1.0',
+                                     '--quiet', '--save-stats', path])
+        again = mega_simulation.main(['--from-stats', path, '--acceptable', '1.0', '--quiet'])
+        default = mega_simulation.main(['--from-stats', path, '--quiet'])
+    finally:
+        set_reporter(previous)
+    for key in ('perfect_matches', 'minor_differences', 'major_differences', 'verdict'):
+        assert again[key] == live[key]
+    assert again['average_difference'] == pytest.approx(live['average_difference'])
+    assert default['major_differences'] > live['major_differences']
+
+
+def test_bradley_terry_counts_stay_bounded(tmp_path):
+    path = str(tmp_path / 'stats.json')
+    previous = set_reporter(Reporter(verbosity=SUMMARY, stream=io.StringIO()))
+    try:
+        mega_simulation.main(['--scenarios', '20000', '--home-engine', 'bradley_terry', '--quiet', '--save-stats', path])
+    finally:
+        set_reporter(previous)
+    counts = DifferenceCounts.load(path)
+    assert counts.resolution == CONTINUOUS_RESOLUTION and counts.count == 20000
+    # Differences snap to a 0.001 grid over [0, 9], so keys are bounded however many scenarios run
+    for bucket in counts.buckets.values():
+        assert len(bucket) <= 9001
+        assert all(abs(key * 1000 - round(key * 1000)) < 1e-6 for key in bucket)
+    assert sum(len(bucket) for bucket in counts.buckets.values()) < 20000 // 2
+    assert DifferenceCounts.for_engine('baseline_free').resolution is None
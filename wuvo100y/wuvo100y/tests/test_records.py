@@ -0,0 +1,86 @@
+# Tests for the slotted records and packed scenario batches
+
+import io
+import tracemalloc
+
+import pytest
+
+import mega_simulation
+from rating_core import engines
+from rating_core.output import SCENARIO, Reporter, set_reporter
+from rating_core.opponents import OpponentIndex
+from rating_core.records import Movie, Scenario, ScenarioBatch, pack_results, unpack_results
+from rating_core.scenarios import generate_scenarios
+from rating_core.streaming import analyze_stream, simulate_stream
+from rating_core.transitions import tabulated_simulate_batch
+
+KEYS = ('id', 'name', 'emotion', 'opponents', 'results')
+
+
+def test_result_bits_round_trip():
+    for results in ([True, False, True], [False] * 5, [True] * 20, []):
+        assert unpack_results(pack_results(results), len(results)) == results
+
+
+@pytest.mark.parametrize('rounds', [1, 3, 9, 17])
+def test_batch_round_trips_generated_scenarios(rounds):
+    scenarios = list(generate_scenarios(500, seed=6, rounds=rounds))
+    batch = ScenarioBatch.generate(500, seed=6, rounds=rounds)
+    assert len(batch) == 500
+    assert [record.as_dict() for record in batch] == [{k: s[k] for k in KEYS} for s in scenarios]
+    assert batch.result_matrix().tolist() == [s['results'] for s in scenarios]
+    assert batch.opponent_ratings().tolist() == [s['opponents'] for s in scenarios]
+    assert Scenario.from_dict(scenarios[7]) == batch[7]
+
+
+def test_records_stream_like_dicts():
+    dicts = analyze_stream(simulate_stream(generate_scenarios(300, seed=8))).summary()
+    packed = analyze_stream(simulate_stream(ScenarioBatch.generate(300, seed=8))).summary()
+    assert dicts == packed
+
+
+def test_records_run_through_mega_simulation_reports():
+    batch = ScenarioBatch.generate(50, seed=9)
+    assert batch[0]['description'] == f"{batch[0].emotion} movie, {sum(batch[0].results)}/3 battles won"
+    stream = io.StringIO()
+    previous = set_reporter(Reporter(verbosity=SCENARIO, stream=stream))
+    try:
+        packed = mega_simulation.run_mega_simulation(batch)
+        assert f"Description: {batch[49]['description']}" in stream.getvalue()
+        dicts = mega_simulation.run_mega_simulation(generate_scenarios(50, seed=9))
+    finally:
+        set_reporter(previous)
+    assert packed['average_difference'] == dicts['average_difference']
+
+
+@pytest.mark.parametrize('engine, scalar', [
+    ('wildcard', engines.wildcard_simulation),
+    ('unknown_vs_known', engines.home_screen_unknown_vs_known),
+    ('baseline_free', engines.home_screen_system),
+])
+@pytest.mark.parametrize('rounds', [3, 6])
+def test_tabulated_batch_matches_scalar_engines(engine, scalar, rounds):
+    batch = ScenarioBatch.generate(3000, seed=9, rounds=rounds)
+    expected = [scalar(s.emotion, s.opponents, s.results) for s in batch]
+    assert tabulated_simulate_batch(batch, engine).tolist() == expected
+
+
+def test_packed_batch_is_an_order_of_magnitude_smaller():
+    tracemalloc.start()
+    scenarios = list(generate_scenarios(5000, seed=10))
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del scenarios
+    assert ScenarioBatch.generate(5000, seed=10).nbytes * 10 < dict_bytes
+
+
+def test_movies_work_in_opponent_index():
+    movies = [Movie(i, f'Movie {i}', (i % 91 + 10) / 10) for i in range(200)]
+    index = OpponentIndex(movies)
+    index.update_rating(5, 9.9)
+    assert movies[5].rating == 9.9
+    # Behind the two 10.0s; ties keep insertion order, so ahead of the other 9.9s
+    assert list(index)[2] is movies[5]
+    assert Movie.from_dict({'id': 1, 'title': 'A', 'rating': 7.0}) == Movie(1, 'A', 7.0)
+    with pytest.raises(AttributeError):
+        movies[0].year = 1999
@@ -0,0 +1,98 @@
+# Tests for incremental re-rating of a comparison history
+
+import numpy as np
+import pytest
+
+import rerate_history
+from rating_core.config import DEFAULT_CONFIG, make_config
+from rating_core.history import ComparisonLog
+from rating_core.kernels import HAVE_NUMBA, replay_comparisons
+from rating_core.population import Population
+from rating_core.rerating import Rerater
+
+JIT_MODES = [False, pytest.param(True, marks=pytest.mark.skipif(not HAVE_NUMBA, reason="numba not installed"))]
+
+CHANGES = [
+    make_config(k_factors=(0.5, 0.25, 0.2, 0.15)),
+    make_config(k_thresholds=(4, 10, 20)),
+    make_config(upset_bonus=2.0),
+    make_config(logistic_scale=5),
+    make_config(first_round_offset=0.6),
+    make_config(max_change=0.4, min_change=0.2)
+]
+
+
+@pytest.fixture(scope='module')
+def history():
+    log = ComparisonLog()
+    population = Population(60, 60, seed=3, log=log)
+    ratings, games = population.ratings.ravel().copy(), population.games.ravel().copy()
+    population.run(15, rebattles_per_step=2)
+    return log, ratings, games
+
+
+def test_recorded_states_are_each_rows_inputs(history):
+    log, ratings, games = history
+    final, final_games, states = replay_comparisons(log.winners, log.losers, log.outcomes, ratings, games, record=True)
+    middle = len(log) // 2
+    ratings_mid, games_mid = replay_comparisons(log.winners[:middle], log.losers[:middle], log.outcomes[:middle],
+                                                ratings, games)
+    w, l = log.winners[middle], log.losers[middle]
+    assert states[middle].tolist() == [ratings_mid[w], ratings_mid[l], games_mid[w], games_mid[l]]
+    assert np.array_equal(final, replay_comparisons(log.winners, log.losers, log.outcomes, ratings, games)[0])
+
+
+@pytest.mark.parametrize('jit', JIT_MODES)
+@pytest.mark.parametrize('config', CHANGES, ids=lambda c: ','.join(f for f in c._fields if getattr(c, f) != getattr(DEFAULT_CONFIG, f)))
+def test_rerate_matches_full_replay(history, config, jit):
+    log, ratings, games = history
+    result = Rerater(log, ratings, games, jit=jit).rerate(config)
+    full_ratings, full_games = log.replay(ratings, games, config, jit=jit)
+    assert np.array_equal(result.ratings, full_ratings) and np.array_equal(result.games, full_games)
+    assert 0 < result.replayed < len(log) - result.first_changed_row + 1
+
+
+def test_late_tier_change_skips_early_rounds(history):
+    log, ratings, games = history
+    rerater = Rerater(log, ratings, games)
+    config = make_config(k_factors=(0.5, 0.25, 0.2, 0.15))
+    late = rerater.states[:, 2:].max(axis=1) >= 10
+    candidates = rerater.candidate_rows(config)
+    assert candidates.any() and not (candidates & ~late).any()
+    assert rerater.first_changed_row(config) >= np.argmax(late)
+    assert rerater.rerate(config).replayed < len(log) // 2
+
+
+def test_unchanged_results_replay_nothing(history):
+    log, ratings, games = history
+    rerater = Rerater(log, ratings, games)
+    for config in (DEFAULT_CONFIG, make_config(k_factors=(0.5, 0.25, 0.125, 0.1000001))):
+        result = rerater.rerate(config)
+        assert result.replayed == 0 and result.first_changed_row == len(log) and result.movies_changed == 0
+        assert np.array_equal(result.ratings, rerater.ratings)
+
+
+def test_adopt_moves_the_baseline(history):
+    log, ratings, games = history
+    rerater = Rerater(log, ratings, games)
+    original = rerater.ratings.copy()
+    bonus, scale = make_config(upset_bonus=2.0), make_config(upset_bonus=2.0, logistic_scale=5)
+    rerater.rerate(bonus, adopt=True)
+    assert rerater.config == bonus
+    assert np.array_equal(rerater.rerate(scale).ratings, log.replay(ratings, games, scale)[0])
+    assert np.array_equal(Rerater(log, ratings, games, bonus).states, rerater.states)
+    assert np.array_equal(rerater.rerate(DEFAULT_CONFIG, adopt=True).ratings, original)
+
+
+def test_parse_change_builds_a_validated_config():
+    text = 'upset_bonus=2:k_factors=0.5,0.25,0.2,0.15'
+    assert rerate_history.parse_change(text) == (text, make_config(upset_bonus=2.0, k_factors=(0.5, 0.25, 0.2, 0.15)))
+
+
+@pytest.mark.parametrize('change', ['upset_bonus', 'k_factors=0.5', 'k_thresholds=9,5,20', 'upset_bonus=1,2',
+                                    'logistic_scale=0', 'warp=1'])
+def test_bad_changes_are_usage_errors(change, capsys):
+    with pytest.raises(SystemExit) as error:
+        rerate_history.main(['--change', change])
+    assert error.value.code == 2
+    assert capsys.readouterr().out == ''
@@ -0,0 +1,95 @@
+# Tests for the binary per-scenario results file and zero-copy re-analysis
+
+import io
+
+import numpy as np
+import pytest
+
+import monte_carlo_simulation
+from rating_core.bradley_terry import bradley_terry_simulate_batch
+from rating_core.output import SUMMARY, Reporter, set_reporter
+from rating_core.records import ScenarioBatch
+from rating_core.results_file import (ResultWriter, analyze_results_file, make_records, open_results,
+                                      result_record_dtype)
+from rating_core.runner import run_monte_carlo
+from rating_core.streaming import ResultsAnalysis
+from rating_core.transitions import tabulated_simulate_batch, tabulated_trajectories
+
+
+def assert_summaries_close(actual, expected):
+    for key, value in expected.items():
+        if isinstance(value, dict):
+            assert_summaries_close(actual[key], value)
+        else:
+            assert actual[key] == pytest.approx(value, rel=1e-12, abs=1e-12), key
+
+
+def test_round_trip_is_zero_copy(tmp_path):
+    path = tmp_path / 'results.bin'
+    rounds = 4
+    with ResultWriter(path, rounds, {'seed': 3}) as writer:
+        for start in (0, 10):
+            ids = np.arange(start, start + 10)
+            path_values = np.tile(np.linspace(1, 10, rounds), (10, 1))
+            writer.write(make_records(ids, ids % 4, ids / 10, ids / 5, path_values, path_values))
+    assert result_record_dtype(rounds).itemsize == 25 + 8 * rounds
+
+    results = open_results(path)
+    assert isinstance(results.records, np.memmap) and not results.records.flags.writeable
+    assert results.rounds == rounds and results.metadata == {'seed': 3}
+    assert results.records['id'].tolist() == list(range(20))
+    assert results.records['wildcard'][7] == 7 / 5
+    assert results.records['home_trajectory'][3, -1] == 10
+
+    # A row cut short by an interrupted run is ignored
+    with open(path, 'ab') as handle:
+        handle.write(b'\0' * 5)
+    assert len(open_results(path).records) == 20
+
+
+def test_trajectories_end_at_final_ratings():
+    batch = ScenarioBatch.generate(2000, seed=1, rounds=5)
+    for engine in ('wildcard', 'baseline_free', 'unknown_vs_known'):
+        trajectory = tabulated_trajectories(batch, engine)
+        assert trajectory.shape == (2000, 5)
+        assert np.array_equal(trajectory[:, -1], tabulated_simulate_batch(batch, engine))
+    assert np.array_equal(bradley_terry_simulate_batch(batch, trajectory=True)[:, -1],
+                          bradley_terry_simulate_batch(batch))
+
+
+def test_add_arrays_matches_per_scenario_add():
+    batch = ScenarioBatch.generate(3000, seed=2)
+    wildcard = tabulated_simulate_batch(batch, 'wildcard')
+    home = tabulated_simulate_batch(batch, 'baseline_free')
+    expected = ResultsAnalysis()
+    for scenario, w, h in zip(batch, wildcard.tolist(), home.tolist()):
+        expected.add(scenario.emotion, w, h)
+    assert_summaries_close(ResultsAnalysis().add_arrays(batch.emotion_codes, wildcard, home).summary(),
+                           expected.summary())
+
+
+def test_runner_writes_every_scenario_and_reanalysis_matches(tmp_path):
+    path = tmp_path / 'run.bin'
+    expected = run_monte_carlo(5000, seed=4, workers=1, chunk_size=1200).summary()
+    written = run_monte_carlo(5000, seed=4, workers=1, chunk_size=1200, results_path=path).summary()
+    assert_summaries_close(written, expected)
+
+    results = open_results(path)
+    assert results.metadata['scenarios'] == 5000
+    assert np.array_equal(results.records['id'], np.arange(5000))
+    assert_summaries_close(analyze_results_file(path, chunk_size=777).summary(), expected)
+
+    pooled = tmp_path / 'pooled.bin'
+    run_monte_carlo(5000, seed=4, workers=2, chunk_size=1200, results_path=pooled)
+    assert pooled.read_bytes() == path.read_bytes()
+
+
+def test_cli_reanalyzes_without_simulating(tmp_path):
+    path = str(tmp_path / 'cli.bin')
+    previous = set_reporter(Reporter(verbosity=SUMMARY, stream=io.StringIO()))
+    try:
+        simulated = monte_carlo_simulation.main(['--scenarios', '3000', '--workers', '1', '--quiet', '--results-file', path])
+        reanalyzed = monte_carlo_simulation.main(['--from-results', path, '--quiet'])
+    finally:
+        set_reporter(previous)
+    assert_summaries_close(reanalyzed.summary(), simulated.summary())
@@ -0,0 +1,80 @@
+# Tests that the simulation scripts import cleanly and expose reusable run functions
+
+import contextlib
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+
+import baseline_free_simulation
+import comprehensive_simulation
+import extended_simulation
+import home_vs_wildcard_comparison
+import homescreen_workflow_demo
+import homescreen_workflow_simulation
+import simulation_test
+from rating_core.engines import wildcard_simulation
+
+SCRIPTS = [
+    'baseline_free_simulation',
+    'comprehensive_simulation',
+    'extended_simulation',
+    'home_vs_wildcard_comparison',
+    'homescreen_workflow_demo',
+    'homescreen_workflow_simulation',
+    'mega_simulation',
+    'simulation_test',
+    'monte_carlo_simulation',
+    'population_simulation',
+    'sweep_simulation',
+    'opponent_selection_simulation',
+    'convergence_simulation',
+    'worst_case_search',
+    'golden_parity',
+    'rerate_history'
+]
+SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize('module', SCRIPTS)
+def test_import_has_no_output(module):
+    result = subprocess.run([sys.executable, '-c', f'import {module}'], cwd=SCRIPT_DIR,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout == ''
+
+
+def quietly(run, *args):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return run(*args)
+
+
+@pytest.mark.parametrize('run, scenarios', [
+    (comprehensive_simulation.run_comprehensive_simulation, comprehensive_simulation.test_scenarios),
+    (baseline_free_simulation.run_baseline_free_simulation, baseline_free_simulation.test_scenarios),
+    (home_vs_wildcard_comparison.run_comparison, home_vs_wildcard_comparison.test_scenarios),
+    (extended_simulation.run_extended_simulation, extended_simulation.extended_scenarios),
+])
+def test_run_functions_return_summary(run, scenarios):
+    summary = quietly(run)
+    assert summary['scenarios'] == len(scenarios)
+    assert summary == quietly(run, scenarios[:])
+    assert quietly(run, scenarios[:1])['scenarios'] == 1
+
+
+def test_simulation_test_cases_are_reproducible():
+    for record in quietly(simulation_test.run_simulation_tests):
+        args = (record['emotion'], record['opponents'], record['results'])
+        assert record['wildcard'] == wildcard_simulation(*args)
+        assert record['home'] == quietly(simulation_test.home_screen_unknown_vs_known, *args)
+
+
+@pytest.mark.parametrize('run, demos', [
+    (homescreen_workflow_demo.run_workflow_demos, homescreen_workflow_demo.workflow_demos),
+    (homescreen_workflow_simulation.run_workflow_simulation, homescreen_workflow_simulation.workflow_demos),
+])
+def test_workflow_demos_rate_every_movie(run, demos):
+    final_ratings = quietly(run)
+    assert len(final_ratings) == len(demos)
+    assert all(1 <= rating <= 10 for rating in final_ratings)
@@ -0,0 +1,61 @@
+# Tests for the constant-memory streaming aggregators
+
+import contextlib
+import io
+import random
+import statistics
+
+import pytest
+
+import mega_simulation
+from rating_core.scenarios import generate_scenarios
+from rating_core.streaming import Histogram, ResultsAnalysis, RunningStats
+
+
+def test_running_stats_matches_statistics_module():
+    rng = random.Random(4)
+    values = [rng.uniform(0, 9) for _ in range(1000)]
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+    assert stats.mean == pytest.approx(statistics.fmean(values))
+    assert stats.variance == pytest.approx(statistics.pvariance(values))
+    assert (stats.minimum, stats.maximum) == (min(values), max(values))
+
+
+def test_running_stats_merge_equals_sequential():
+    values = [i * 0.37 % 9 for i in range(500)]
+    whole, left, right = RunningStats(), RunningStats(), RunningStats()
+    for i, value in enumerate(values):
+        whole.add(value)
+        (left if i < 180 else right).add(value)
+    left.merge(right)
+    assert left.count == whole.count
+    assert left.mean == pytest.approx(whole.mean)
+    assert left.m2 == pytest.approx(whole.m2)
+
+
+def test_histogram_bounds_and_quantile():
+    histogram = Histogram(0.0, 10.0, 10)
+    for value in [-1, 0.5, 1.5, 1.6, 9.99, 10.0, 42]:
+        histogram.add(value)
+    assert (histogram.underflow, histogram.overflow) == (1, 2)
+    assert histogram.counts[1] == 2
+    assert histogram.quantile(0.5) == 1.5
+
+
+def test_details_are_bounded():
+    analysis = ResultsAnalysis(keep_details=5)
+    for i in range(1000):
+        analysis.add('LIKED', 7.0, 7.0 + (i % 3) / 10, {'id': i})
+    assert analysis.count == 1000
+    assert len(analysis.details) == 5
+    assert analysis.categories['perfect'] == 334
+
+
+def test_mega_simulation_streams_generated_scenarios():
+    with contextlib.redirect_stdout(io.StringIO()) as out:
+        report = mega_simulation.run_mega_simulation(generate_scenarios(250, seed=9), progress_every=100)
+    assert report['perfect_matches'] == 250
+    assert len(report['differences']) == mega_simulation.DETAIL_LIMIT
+    assert out.getvalue().count('⏳') == 2
@@ -0,0 +1,139 @@
+# Tests for the rating config and parameter sweep engine
+
+import numpy as np
+import pytest
+
+from rating_core import batch, elo, sweep
+from rating_core.cache import ResultCache
+from rating_core.config import DEFAULT_CONFIG, games_tier, make_config
+from rating_core.records import ScenarioBatch
+from rating_core.streaming import analyze_stream, simulate_stream
+from rating_core.sweep import dominates, parameter_grid, pareto_front, run_sweep
+from rating_core.transitions import TransitionTable, get_transition_table, tabulated_simulate_batch
+
+
+def scalar_adjust(config, winner, loser, winner_games, loser_games):
+    """Straight transcription of wildcard_adjust_rating with config constants"""
+    def k(games):
+        return config.k_factors[games_tier(games, config)]
+
+    difference = abs(winner - loser)
+    expected = 1 / (1 + 10 ** ((loser - winner) / config.logistic_scale))
+    change = max(config.min_change, k(winner_games) * (1 - expected))
+    loser_change = max(config.min_change, k(loser_games) * (1 - expected))
+    if winner < loser:
+        change *= config.underdog_multiplier
+    if winner < loser and difference > config.upset_threshold:
+        change += config.upset_bonus
+    else:
+        change = min(config.max_change, change)
+        loser_change = min(config.max_change, loser_change)
+    return (round(min(10, max(1, winner + change)) * 10) / 10,
+            round(min(10, max(1, loser - loser_change)) * 10) / 10)
+
+
+def test_default_config_reproduces_production_engine():
+    pairs = np.array([(a, b) for a in range(10, 101, 3) for b in range(10, 101, 7)]) / 10
+    for games in (0, 6, 12, 30):
+        default = batch.adjust_ratings_batch(pairs[:, 0], pairs[:, 1], games, 3)
+        explicit = batch.adjust_ratings_batch(pairs[:, 0], pairs[:, 1], games, 3, DEFAULT_CONFIG)
+        expected = [elo.wildcard_adjust_rating(a, b, True, games, 3) for a, b in pairs]
+        assert list(zip(*default)) == list(zip(*explicit)) == expected
+    assert get_transition_table() is get_transition_table(DEFAULT_CONFIG)
+
+
+def test_custom_config_matches_scalar_transcription():
+    config = make_config(k_factors=(0.8, 0.4, 0.2, 0.05), k_thresholds=(3, 8, 15), logistic_scale=5,
+                         max_change=1.2, upset_threshold=2.0, upset_bonus=0.5)
+    table = TransitionTable(config)
+    rng = np.random.default_rng(0)
+    for _ in range(500):
+        winner, loser = rng.integers(10, 101, 2) / 10
+        winner_games, loser_games = rng.integers(0, 25, 2)
+        expected = scalar_adjust(config, winner, loser, winner_games, loser_games)
+        assert batch.adjust_ratings_batch(winner, loser, winner_games, loser_games, config) == expected
+        assert table.next_rating(winner, loser, True, winner_games, loser_games) == expected[0]
+
+
+def test_make_config_validates():
+    with pytest.raises(ValueError):
+        make_config(k_factors=(0.5, 0.25))
+    with pytest.raises(ValueError):
+        make_config(k_thresholds=(10, 5, 20))
+    with pytest.raises(ValueError):
+        make_config(logistic_scale=0)
+
+
+def test_parameter_grid():
+    configs = list(parameter_grid(logistic_scale=[3, 4], k_scale=[1, 2]))
+    assert len(configs) == 4
+    assert configs[0].k_factors == DEFAULT_CONFIG.k_factors
+    assert configs[1].k_factors == (1.0, 0.5, 0.25, 0.2)
+    assert configs[2] == DEFAULT_CONFIG
+
+
+def test_default_sweep_matches_streaming_analysis():
+    (config, metrics), = run_sweep([DEFAULT_CONFIG], count=2000, seed=3, workers=1, cache={})
+    expected = analyze_stream(simulate_stream(ScenarioBatch.generate(2000, seed=3))).summary()
+    for key in ('perfect_matches', 'minor_differences', 'major_differences', 'categories',
+                'home_higher', 'wildcard_higher', 'maximum_difference'):
+        assert metrics[key] == expected[key]
+    assert metrics['average_difference'] == pytest.approx(expected['average_difference'])
+
+
+def test_offset_sweep_matches_scalar_engine():
+    config = make_config(first_round_offset=0.7)
+    scenarios = ScenarioBatch.generate(1000, seed=4)
+    expected = []
+    for s in scenarios:
+        opponent = s.opponents[0]
+        rating = min(10, opponent + 0.7) if s.results[0] else max(1, opponent - 0.7)
+        rating = round(rating * 10) / 10
+        for i in range(1, 3):
+            rating = get_transition_table(config).next_rating(rating, s.opponents[i], s.results[i], i)
+        expected.append(rating)
+    assert tabulated_simulate_batch(scenarios, 'baseline_free', config).tolist() == expected
+
+
+def test_sweep_caches_and_pools_reproducibly():
+    configs = list(parameter_grid(max_change=[0.5, 0.7], first_round_offset=[0.3, 0.5]))
+    cache = {}
+    serial = run_sweep(configs, count=1000, workers=1, cache=cache)
+    assert len(cache) == 4
+    seen = []
+    cached = run_sweep(configs, count=1000, workers=1, cache=cache, on_result=lambda c, m: seen.append(c))
+    assert cached == serial and seen == configs
+    assert run_sweep(configs, count=1000, workers=2, cache={}) == serial
+
+
+def test_on_result_fires_as_results_arrive():
+    configs = list(parameter_grid(max_change=[0.5, 0.6, 0.7]))
+    cache, sizes = {}, []
+    run_sweep(configs, count=500, workers=1, cache=cache, on_result=lambda c, m: sizes.append(len(cache)))
+    assert sizes == [1, 2, 3]
+
+    seen = {}
+    pooled = run_sweep(configs, count=500, workers=2, cache={}, on_result=seen.__setitem__)
+    assert [config for config, _ in pooled] == configs
+    assert seen == dict(pooled)
+
+
+def test_default_sweep_cache_is_bounded(monkeypatch):
+    configs = list(parameter_grid(max_change=[0.5, 0.6, 0.7]))
+    monkeypatch.setattr(sweep, '_RESULT_CACHE', ResultCache(maxsize=2))
+    first = run_sweep(configs, count=500, workers=1)
+    assert len(sweep._RESULT_CACHE) == 2
+    assert run_sweep(configs, count=500, workers=1) == first
+    assert run_sweep(configs, count=500, workers=1, cache={}) == first
+
+
+def test_pareto_front():
+    results = [
+        ('a', {'average_difference': 1.0, 'major_fraction': 0.5, 'rating_spread': 2.0}),
+        ('b', {'average_difference': 0.8, 'major_fraction': 0.6, 'rating_spread': 2.0}),
+        ('c', {'average_difference': 1.0, 'major_fraction': 0.5, 'rating_spread': 1.5}),
+        ('d', {'average_difference': 1.2, 'major_fraction': 0.7, 'rating_spread': 1.0}),
+    ]
+    assert [name for name, _ in pareto_front(results)] == ['a', 'b']
+    assert dominates(results[0][1], results[2][1])
+    assert not dominates(results[0][1], results[0][1])
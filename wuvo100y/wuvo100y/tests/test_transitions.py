@@ -0,0 +1,59 @@
+# Tests for the 0.1-grid transition table and the exact enumerator
+
+import itertools
+
+import pytest
+
+from rating_core import engines
+from rating_core.scenarios import generate_scenarios
+from rating_core.transitions import (
+    RATING_GRID,
+    GRID_SIZE,
+    enumerate_final_ratings,
+    final_rating_distribution,
+    get_transition_table,
+    rating_index,
+    tabulated_home_screen_system,
+    tabulated_wildcard_simulation,
+)
+
+
+def test_rating_index_rejects_off_grid():
+    assert rating_index(1.0) == 0
+    assert rating_index(10) == GRID_SIZE - 1
+    with pytest.raises(ValueError):
+        rating_index(5.55)
+
+
+def test_next_rating_matches_engine_round():
+    table = get_transition_table()
+    for rating, opponent, won, games in [(8.5, 4.0, True, 0), (3.0, 9.5, True, 7), (7.0, 7.0, False, 12), (9.9, 1.0, False, 30)]:
+        assert table.next_rating(rating, opponent, won, games) == engines.play_round(rating, opponent, won, games)
+
+
+def test_tabulated_engines_match_scalar_engines():
+    for scenario in generate_scenarios(3000, seed=2, rounds=25):
+        args = (scenario['emotion'], scenario['opponents'], scenario['results'])
+        assert tabulated_wildcard_simulation(*args) == engines.wildcard_simulation(*args)
+        assert tabulated_home_screen_system(*args) == engines.home_screen_system(*args)
+
+
+@pytest.mark.parametrize('engine', ['wildcard', 'baseline_free'])
+def test_enumeration_matches_brute_force(engine):
+    pool = [1.0, 3.0, 5.5, 8.5, 10.0]
+    weights = [1 if rating in pool else 0 for rating in RATING_GRID]
+    run = engines.wildcard_simulation if engine == 'wildcard' else engines.home_screen_system
+
+    expected = {}
+    for opponents in itertools.product(pool, repeat=3):
+        for results in itertools.product([True, False], repeat=3):
+            final = run('DISLIKED', list(opponents), list(results))
+            expected[final] = expected.get(final, 0) + 1
+
+    assert enumerate_final_ratings(engine, 'DISLIKED', rounds=3, opponent_weights=weights) == expected
+
+
+def test_full_grid_distribution_sums_to_one():
+    counts = enumerate_final_ratings('unknown_vs_known', 'LIKED', rounds=3)
+    assert sum(counts.values()) == (GRID_SIZE * 2) ** 3
+    assert abs(sum(final_rating_distribution('unknown_vs_known', 'LIKED').values()) - 1) < 1e-12
@@ -0,0 +1,58 @@
+# WORST CASE SEARCH: Provable top-k Home vs Wildcard divergences over the 0.1 rating grid
+# Finds the inputs the hand-written scenarios never tried, then puts them through the devil's advocate review
+
+import argparse
+import time
+
+from comprehensive_simulation import devils_advocate_review
+from rating_core.adversarial import OBJECTIVES, SEARCH_HOME_ENGINES, WorstCaseSearch
+from rating_core.output import SCENARIO, SUMMARY, add_output_arguments, configure_output, emit, emit_record
+
+
+def print_case(rank, case):
+    results = ['WIN' if r else 'LOSS' for r in case.results]
+    emit(SUMMARY, f"{rank:>3}. {case.value:.1f}  {case.emotion:<9} opponents {case.opponents}  results {results}  "
+                  f"→ Wildcard {case.wildcard} | Home {case.home}")
+    emit_record(SUMMARY, 'worst_case', rank=rank, **case._asdict())
+
+
+def print_summary(stats, elapsed):
+    emit(SUMMARY, f"\n🌳 Expanded {stats.expanded:,} states, generated {stats.generated:,} children, "
+                  f"pruned {stats.pruned:,} (incumbent {stats.incumbent:.1f})")
+    emit(SUMMARY, f"   Brute force would score {stats.brute_force:,} scenarios")
+    emit(SUMMARY, f"\n⏱️  {elapsed:.2f}s")
+    emit_record(SUMMARY, 'summary', elapsed=elapsed, **stats._asdict())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Branch-and-bound search for worst-case Home vs Wildcard scenarios")
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--objective', choices=sorted(OBJECTIVES), default='abs_difference')
+    parser.add_argument('--home-engine', choices=SEARCH_HOME_ENGINES, default='baseline_free')
+    parser.add_argument('--beam', type=int, default=256, help="states kept by the pass that sets the pruning incumbent")
+    parser.add_argument('--review', action='store_true', help="run each case through the devil's advocate review")
+    add_output_arguments(parser)
+    args = parser.parse_args(argv)
+    configure_output(args)
+
+    emit(SUMMARY, "😈🎬 WORST CASE SEARCH: Home Screen vs Wildcard")
+    emit(SUMMARY, f"Top {args.top} by {args.objective} over {args.rounds} rounds, Home engine: {args.home_engine}\n")
+
+    start = time.perf_counter()
+    cases, stats = WorstCaseSearch(args.rounds, args.objective, args.home_engine).search(args.top, args.beam)
+    elapsed = time.perf_counter() - start
+
+    for rank, case in enumerate(cases, 1):
+        print_case(rank, case)
+    if args.review:
+        for rank, case in enumerate(cases, 1):
+            devils_advocate_review(f"Worst case #{rank}", case.emotion, case.opponents, case.results,
+                                   case.wildcard, case.home)
+        emit(SCENARIO)
+    print_summary(stats, elapsed)
+    return cases, stats
+
+
+if __name__ == "__main__":
+    main()